@@ -6,7 +6,7 @@ LLM 모델 관리 API - Wave 2 개선: Circuit Breaker 패턴 적용
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, false
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, TimeoutError
 from typing import List, Optional
 from pydantic import BaseModel
@@ -18,6 +18,10 @@ from ..models.llm_chat import MAXLLM_Model, MAXLLM_Model_Permission, ModelType,
 from ..models.user import User, Group
 from ..routers.auth import get_current_user
 from ..utils.circuit_breaker import circuit_breaker, CircuitBreakerError
+from ..utils.cache import CacheEvents
+from ..services.llm_model_access import (
+    build_accessible_models_query, get_accessible_models as resolve_accessible_models, get_accessible_model_ids
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,47 +75,18 @@ class ModelUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 # 권한 확인 헬퍼 함수들
-def _check_model_access(db: Session, model: MAXLLM_Model, user_id: str) -> bool:
-    """사용자가 특정 모델에 접근 권한이 있는지 확인"""
+def _check_model_access(model: MAXLLM_Model, user_id: str, group_id, accessible_ids: set) -> bool:
+    """사용자가 특정 모델에 접근 권한이 있는지 확인 (캐시된 접근 가능 모델 ID 사용)"""
     # 모델 소유자인 경우
     if model.owner_type == OwnerType.USER and model.owner_id == user_id:
         return True
     
-    # 사용자 그룹 조회
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return False
-    
     # 그룹 소유 모델인 경우
-    if model.owner_type == OwnerType.GROUP and user.group_id and str(user.group_id) == model.owner_id:
+    if model.owner_type == OwnerType.GROUP and group_id and str(group_id) == model.owner_id:
         return True
     
-    # 직접 권한 부여된 경우
-    user_permission = db.query(MAXLLM_Model_Permission).filter(
-        and_(
-            MAXLLM_Model_Permission.model_id == model.id,
-            MAXLLM_Model_Permission.grantee_type == OwnerType.USER,
-            MAXLLM_Model_Permission.grantee_id == user_id
-        )
-    ).first()
-    
-    if user_permission:
-        return True
-    
-    # 그룹 권한이 있는 경우
-    if user.group_id:
-        group_permission = db.query(MAXLLM_Model_Permission).filter(
-            and_(
-                MAXLLM_Model_Permission.model_id == model.id,
-                MAXLLM_Model_Permission.grantee_type == OwnerType.GROUP,
-                MAXLLM_Model_Permission.grantee_id == str(user.group_id)
-            )
-        ).first()
-        
-        if group_permission:
-            return True
-    
-    return False
+    # 직접/그룹 권한 부여된 경우
+    return model.id in accessible_ids
 
 def _check_model_manage_permission(db: Session, model: MAXLLM_Model, user_id: str) -> bool:
     """사용자가 특정 모델을 관리할 권한이 있는지 확인"""
@@ -138,54 +113,23 @@ def _get_user_accessible_models(db: Session, user_id: str):
     """사용자가 접근 가능한 모델 목록 조회"""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
-        return []
-    
-    # 기본 쿼리: 활성화된 모델들
-    base_query = db.query(MAXLLM_Model).filter(MAXLLM_Model.is_active == True)
-    
-    # 접근 가능한 모델 조건들
-    access_conditions = []
-    
-    # 1. 사용자 소유 모델
-    access_conditions.append(
-        and_(
-            MAXLLM_Model.owner_type == OwnerType.USER,
-            MAXLLM_Model.owner_id == user_id
-        )
-    )
-    
-    # 2. 사용자 그룹 소유 모델
-    if user.group_id:
-        access_conditions.append(
-            and_(
-                MAXLLM_Model.owner_type == OwnerType.GROUP,
-                MAXLLM_Model.owner_id == str(user.group_id)
-            )
-        )
-    
-    # 3. 직접 권한이 부여된 모델
-    user_permission_subquery = db.query(MAXLLM_Model_Permission.model_id).filter(
-        and_(
-            MAXLLM_Model_Permission.grantee_type == OwnerType.USER,
-            MAXLLM_Model_Permission.grantee_id == user_id
-        )
-    ).subquery()
-    
-    access_conditions.append(MAXLLM_Model.id.in_(user_permission_subquery))
+        return db.query(MAXLLM_Model).filter(false())
     
-    # 4. 그룹 권한이 부여된 모델
-    if user.group_id:
-        group_permission_subquery = db.query(MAXLLM_Model_Permission.model_id).filter(
-            and_(
-                MAXLLM_Model_Permission.grantee_type == OwnerType.GROUP,
-                MAXLLM_Model_Permission.grantee_id == str(user.group_id)
-            )
-        ).subquery()
-        
-        access_conditions.append(MAXLLM_Model.id.in_(group_permission_subquery))
+    return build_accessible_models_query(db, user_id, [user.group_id])
+
+def _get_owner_names(db: Session, models) -> dict:
+    """(owner_type, owner_id) -> 소유자 이름 (사용자/그룹 각각 한 번의 쿼리)"""
+    user_ids = {model.owner_id for model in models if model.owner_type == OwnerType.USER}
+    group_ids = {model.owner_id for model in models if model.owner_type == OwnerType.GROUP}
     
-    # 조건들을 OR로 결합
-    return base_query.filter(or_(*access_conditions))
+    names = {}
+    if user_ids:
+        for owner_id, real_name in db.query(User.id, User.real_name).filter(User.id.in_(user_ids)).all():
+            names[(OwnerType.USER, str(owner_id))] = real_name
+    if group_ids:
+        for owner_id, name in db.query(Group.id, Group.name).filter(Group.id.in_(group_ids)).all():
+            names[(OwnerType.GROUP, str(owner_id))] = name
+    return names
 
 # API 엔드포인트들
 @router.get("/", response_model=List[ModelResponse])
@@ -217,24 +161,29 @@ async def get_models(
                 detail="모델 목록 조회 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
             )
         
+        user_id = str(current_user.id)
+        accessible_ids = await get_accessible_model_ids(user_id, [current_user.group_id])
+        
+        # 권한 개수 / 소유자 이름 일괄 조회 (모델별 쿼리 대신)
+        model_ids = [model.id for model in models]
+        permission_counts = dict(
+            db.query(MAXLLM_Model_Permission.model_id, func.count(MAXLLM_Model_Permission.id))
+            .filter(MAXLLM_Model_Permission.model_id.in_(model_ids))
+            .group_by(MAXLLM_Model_Permission.model_id)
+            .all()
+        ) if model_ids else {}
+        owner_names = _get_owner_names(db, models)
+        
         result = []
         for model in models:
             # 권한 개수 계산
-            permissions_count = db.query(MAXLLM_Model_Permission).filter(
-                MAXLLM_Model_Permission.model_id == model.id
-            ).count()
+            permissions_count = permission_counts.get(model.id, 0)
             
             # 사용자 접근 권한 확인
-            has_permission = _check_model_access(db, model, str(current_user.id))
+            has_permission = _check_model_access(model, user_id, current_user.group_id, accessible_ids)
             
             # 소유자 이름 조회
-            owner_name = None
-            if model.owner_type == OwnerType.USER:
-                owner = db.query(User).filter(User.id == model.owner_id).first()
-                owner_name = owner.real_name if owner else model.owner_id
-            elif model.owner_type == OwnerType.GROUP:
-                owner = db.query(Group).filter(Group.id == model.owner_id).first()
-                owner_name = owner.name if owner else model.owner_id
+            owner_name = owner_names.get((model.owner_type, model.owner_id), model.owner_id)
             
             result.append(ModelResponse(
                 id=model.id,
@@ -267,22 +216,21 @@ async def get_accessible_models(
 ):
     """사용자가 접근 가능한 모델 목록 조회 (채팅에서 사용)"""
     try:
-        query = _get_user_accessible_models(db, str(current_user.id))
-        models = query.all()
+        models = await resolve_accessible_models(str(current_user.id), [current_user.group_id])
         
         result = []
         for model in models:
             result.append(ModelResponse(
-                id=model.id,
-                model_name=model.model_name,
-                model_type=model.model_type,
-                model_id=model.model_id,
-                description=model.description,
-                owner_type=model.owner_type,
-                owner_id=model.owner_id,
-                is_active=model.is_active,
-                created_at=model.created_at.isoformat(),
-                updated_at=model.updated_at.isoformat(),
+                id=model["id"],
+                model_name=model["model_name"],
+                model_type=model["model_type"],
+                model_id=model["model_id"],
+                description=model["description"],
+                owner_type=model["owner_type"],
+                owner_id=model["owner_id"],
+                is_active=model["is_active"],
+                created_at=model["created_at"].isoformat(),
+                updated_at=model["updated_at"].isoformat(),
                 has_permission=True
             ))
         
@@ -490,6 +438,10 @@ async def grant_model_permission(
         db.add(new_permission)
         db.commit()
         db.refresh(new_permission)
+        await CacheEvents.on_permission_granted(
+            model_id,
+            permission_data.grantee_id if permission_data.grantee_type == OwnerType.USER else None
+        )
         
         # 응답 데이터 구성
         grantee_name = None
@@ -558,8 +510,10 @@ async def revoke_model_permission(
             )
         
         # 권한 삭제
+        grantee_user_id = permission.grantee_id if permission.grantee_type == OwnerType.USER else None
         db.delete(permission)
         db.commit()
+        await CacheEvents.on_permission_revoked(model_id, grantee_user_id)
         
         return {"message": "권한이 성공적으로 취소되었습니다"}
         
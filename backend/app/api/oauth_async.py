@@ -0,0 +1,715 @@
+"""
+OAuth 2.0 Token Endpoint for MAX Platform (async variant)
+Runs the authorization_code, refresh_token and client_credentials grants on the
+asyncpg engine (AsyncSessionLocal) so token requests do not hold a threadpool
+slot for their database round-trips.
+
+Enabled per deployment with OAUTH_ASYNC_TOKEN_ENDPOINT=true; the sync handler
+in oauth_simple.py is used otherwise. Both variants issue identical tokens.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from urllib.parse import urlparse
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Form
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import text
+
+from ..database import AsyncSessionLocal, get_async_session
+from ..models import User
+from ..config import settings
+from ..utils.auth import create_access_token
+from ..utils.logging_config import get_oauth_logger, log_oauth_event
+from ..utils.token_revocation import token_revocation_index
+from .oauth_simple import (
+    TokenResponse,
+    generate_token_hash,
+    generate_refresh_token,
+    calculate_refresh_token_expiry,
+    verify_code_challenge,
+)
+
+logger = get_oauth_logger()
+
+router = APIRouter()
+
+CLIENT_COLUMNS = """
+    id, client_id, client_secret, client_name, description, redirect_uris,
+    allowed_scopes, is_confidential, is_active
+"""
+
+
+# Helper functions
+async def fetch_client(client_id: str, db: AsyncSession) -> Optional[dict]:
+    """Load an active OAuth client as a dict"""
+    result = await db.execute(
+        text(f"SELECT {CLIENT_COLUMNS} FROM oauth_clients WHERE client_id = :client_id AND is_active = true"),
+        {"client_id": client_id}
+    )
+    row = result.mappings().first()
+    return dict(row) if row else None
+
+
+def is_registered_redirect_uri(redirect_uri: str, registered_uris) -> bool:
+    """Redirect URI check (same normalization as oauth_simple.validate_client: query/fragment ignored)"""
+    redirect_base_uri = urlparse(redirect_uri)._replace(query='', fragment='').geturl()
+    return redirect_base_uri in [
+        urlparse(uri)._replace(query='', fragment='').geturl() for uri in (registered_uris or [])
+    ]
+
+
+async def check_client_oidc_status(client_id: str, db: AsyncSession) -> bool:
+    """Check if client has OIDC enabled"""
+    try:
+        result = await db.execute(
+            text("SELECT oidc_enabled FROM oauth_clients WHERE client_id = :client_id"),
+            {"client_id": client_id}
+        )
+        row = result.first()
+        if row and row[0] is not None:
+            return row[0]
+    except Exception as e:
+        logger.debug(f"Could not check OIDC status for client {client_id}: {e}")
+        await db.rollback()
+    return getattr(settings, 'oidc_dual_mode', True)
+
+
+async def log_oauth_action(
+    action: str,
+    client_id: Optional[str],
+    user_id: Optional[str],
+    success: bool,
+    error_code: Optional[str] = None,
+    error_description: Optional[str] = None,
+    request: Optional[Request] = None
+):
+    """Log OAuth actions for audit trail in an independent session/transaction"""
+    ip_address = None
+    user_agent = None
+    if request:
+        ip_address = request.client.host if request.client else None
+        user_agent = request.headers.get("User-Agent")
+
+    try:
+        async with AsyncSessionLocal() as audit_db:
+            await audit_db.execute(
+                text("""
+                    INSERT INTO oauth_audit_logs
+                    (action, client_id, user_id, ip_address, user_agent, success,
+                     error_code, error_description)
+                    VALUES (:action, :client_id, :user_id, :ip_address, :user_agent,
+                            :success, :error_code, :error_description)
+                """),
+                {
+                    "action": action,
+                    "client_id": client_id,
+                    "user_id": user_id,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                    "success": success,
+                    "error_code": error_code,
+                    "error_description": error_description
+                }
+            )
+            await audit_db.commit()
+    except Exception as e:
+        # Don't fail the main operation due to logging issues
+        logger.error(f"Audit log error: {str(e)}")
+
+
+async def load_token_claims(user_id: str, db: AsyncSession) -> Optional[dict]:
+    """Load the user/group/role fields embedded in access tokens with one join"""
+    result = await db.execute(
+        text("""
+            SELECT u.id, u.email, u.is_admin, u.group_id, g.name AS group_name,
+                   u.role_id, r.name AS role_name
+            FROM users u
+            LEFT JOIN groups g ON g.id = u.group_id
+            LEFT JOIN roles r ON r.id = u.role_id
+            WHERE u.id = :user_id
+        """),
+        {"user_id": user_id}
+    )
+    row = result.mappings().first()
+    if not row:
+        return None
+
+    token_data = {
+        "sub": str(row["id"]),
+        "email": row["email"],
+        "is_admin": row["is_admin"],
+        "user_id": str(row["id"])
+    }
+    if row["group_id"] and row["group_name"]:
+        token_data.update({
+            "group_id": str(row["group_id"]),
+            "group_name": row["group_name"]
+        })
+    if row["role_id"] and row["role_name"]:
+        token_data.update({
+            "role_id": str(row["role_id"]),
+            "role_name": row["role_name"]
+        })
+    return token_data
+
+
+async def create_id_token(db: AsyncSession, user_id: str, refresh: bool = False, **kwargs) -> Optional[str]:
+    """
+    Create an OIDC ID token through the sync IDTokenService
+
+    The claims service walks ORM relationships, so it runs inside run_sync on
+    the same asyncpg connection rather than on a threadpool session.
+    """
+    from ..services.id_token_service import id_token_service
+
+    def _create(sync_db: Session) -> Optional[str]:
+        user = sync_db.query(User).options(
+            joinedload(User.group),
+            joinedload(User.role)
+        ).filter(User.id == user_id).first()
+        if not user:
+            return None
+        if refresh:
+            return id_token_service.refresh_id_token(user=user, db=sync_db, **kwargs)
+        return id_token_service.create_id_token(user=user, db=sync_db, **kwargs)
+
+    return await db.run_sync(_create)
+
+
+async def store_access_token(
+    token_hash: str,
+    client_id: str,
+    user_id: Optional[str],
+    scope: Optional[str],
+    expires_at: datetime,
+    db: AsyncSession,
+    refresh_token_hash: Optional[str] = None
+):
+    """Store access token hash for revocation (caller commits)"""
+    await db.execute(
+        text("""
+            INSERT INTO oauth_access_tokens
+            (token_hash, client_id, user_id, scope, expires_at, refresh_token_hash)
+            VALUES (:token_hash, :client_id, :user_id, :scope, :expires_at, :refresh_token_hash)
+            ON CONFLICT (token_hash) DO UPDATE SET
+                expires_at = EXCLUDED.expires_at,
+                revoked_at = NULL,
+                created_at = NOW()
+        """),
+        {
+            "token_hash": token_hash,
+            "client_id": client_id,
+            "user_id": user_id,
+            "scope": scope,
+            "expires_at": expires_at,
+            "refresh_token_hash": refresh_token_hash
+        }
+    )
+
+
+async def create_refresh_token_record(
+    user_id: str,
+    client_id: str,
+    scope: str,
+    access_token_hash: str,
+    request: Request,
+    db: AsyncSession
+) -> str:
+    """Create and store a new refresh token"""
+    refresh_token = generate_refresh_token()
+    refresh_token_hash = generate_token_hash(refresh_token)
+    client_ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent", "")
+
+    try:
+        await db.execute(
+            text("""
+                INSERT INTO oauth_refresh_tokens
+                (token_hash, client_id, user_id, scope, access_token_hash,
+                 expires_at, client_ip, user_agent, rotation_count)
+                VALUES (:token_hash, :client_id, :user_id, :scope, :access_token_hash,
+                        :expires_at, :client_ip, :user_agent, 0)
+            """),
+            {
+                "token_hash": refresh_token_hash,
+                "client_id": client_id,
+                "user_id": user_id,
+                "scope": scope,
+                "access_token_hash": access_token_hash,
+                "expires_at": calculate_refresh_token_expiry(),
+                "client_ip": client_ip,
+                "user_agent": user_agent
+            }
+        )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        log_oauth_event(
+            event_type="refresh_token_created",
+            client_id=client_id,
+            user_id=str(user_id),
+            scope=scope,
+            success=False,
+            error=f"Failed to create refresh token: {str(e)}",
+            ip_address=client_ip,
+            user_agent=user_agent
+        )
+        raise HTTPException(status_code=500, detail="Failed to create refresh token")
+
+    log_oauth_event(
+        event_type="refresh_token_created",
+        client_id=client_id,
+        user_id=str(user_id),
+        scope=scope,
+        success=True,
+        ip_address=client_ip,
+        user_agent=user_agent
+    )
+    return refresh_token
+
+
+async def validate_refresh_token(refresh_token: str, client_id: str, db: AsyncSession) -> Optional[dict]:
+    """Validate refresh token with a single indexed lookup (supports graceful rotation)"""
+    result = await db.execute(
+        text("""
+            SELECT token_hash, client_id, user_id, scope, revoked_at, token_status,
+                   expires_at > NOW() AS is_unexpired,
+                   (token_status = 'rotating' AND rotation_grace_expires_at > NOW()) AS in_grace_period
+            FROM oauth_refresh_tokens
+            WHERE token_hash = :token_hash
+        """),
+        {"token_hash": generate_token_hash(refresh_token)}
+    )
+    record = result.mappings().first()
+    status = (record["token_status"] or 'active') if record else None
+
+    if (
+        not record
+        or record["client_id"] != client_id
+        or record["revoked_at"] is not None
+        or not record["is_unexpired"]
+        or status not in ('active', 'rotating')
+        or (status == 'rotating' and not record["in_grace_period"])
+    ):
+        log_oauth_event(
+            event_type="refresh_token_validation",
+            client_id=client_id,
+            success=False,
+            error=f"Refresh token not found or invalid for client_id: {client_id}"
+        )
+        return None
+
+    return dict(record)
+
+
+async def rotate_refresh_token(
+    old_refresh_token_hash: str,
+    user_id: str,
+    client_id: str,
+    scope: str,
+    request: Request,
+    db: AsyncSession
+) -> tuple[str, str]:
+    """Rotate refresh token with graceful rotation"""
+    new_refresh_token = generate_refresh_token()
+    new_refresh_token_hash = generate_token_hash(new_refresh_token)
+    new_access_token = create_access_token(data={"sub": str(user_id), "client_id": client_id, "scope": scope})
+    new_access_token_hash = generate_token_hash(new_access_token)
+    grace_expires_at = datetime.utcnow() + timedelta(seconds=10)  # 10-second grace period
+
+    try:
+        await db.execute(
+            text("""
+                UPDATE oauth_refresh_tokens
+                SET token_status = 'rotating',
+                    rotation_grace_expires_at = :grace_expires_at,
+                    last_used_at = NOW()
+                WHERE token_hash = :old_token_hash
+            """),
+            {"grace_expires_at": grace_expires_at, "old_token_hash": old_refresh_token_hash}
+        )
+        await db.execute(
+            text("""
+                INSERT INTO oauth_refresh_tokens
+                (token_hash, client_id, user_id, scope, access_token_hash, expires_at,
+                 client_ip, user_agent, rotation_count, parent_token_hash, token_status)
+                SELECT :new_token_hash, client_id, user_id, scope, :new_access_token_hash, :expires_at,
+                       :client_ip, :user_agent, rotation_count + 1, :old_token_hash, 'active'
+                FROM oauth_refresh_tokens
+                WHERE token_hash = :old_token_hash
+            """),
+            {
+                "new_token_hash": new_refresh_token_hash,
+                "new_access_token_hash": new_access_token_hash,
+                "expires_at": calculate_refresh_token_expiry(),
+                "client_ip": request.client.host if request.client else None,
+                "user_agent": request.headers.get("user-agent", ""),
+                "old_token_hash": old_refresh_token_hash
+            }
+        )
+        await store_access_token(
+            new_access_token_hash, client_id, user_id, scope,
+            datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes),
+            db, refresh_token_hash=new_refresh_token_hash
+        )
+        revoked = await db.execute(
+            text("""
+                UPDATE oauth_access_tokens
+                SET revoked_at = NOW()
+                WHERE refresh_token_hash = :old_token_hash
+                RETURNING token_hash, expires_at
+            """),
+            {"old_token_hash": old_refresh_token_hash}
+        )
+        revoked_access_tokens = revoked.fetchall()
+        await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to rotate refresh token: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to rotate tokens")
+
+    # revoke_tokens publishes through the sync Redis client
+    await asyncio.to_thread(token_revocation_index.revoke_tokens, revoked_access_tokens)
+    return new_access_token, new_refresh_token
+
+
+# Grant handlers
+async def handle_authorization_code_grant(
+    code: str,
+    redirect_uri: str,
+    client_id: str,
+    client_secret: Optional[str],
+    code_verifier: Optional[str],
+    request: Request,
+    db: AsyncSession
+) -> dict:
+    """Handle authorization_code grant type"""
+    if not code or not redirect_uri:
+        raise HTTPException(status_code=400, detail="Missing required parameters")
+
+    result = await db.execute(
+        text("""
+            SELECT client_id, user_id, redirect_uri, scope, code_challenge,
+                   code_challenge_method, expires_at, nonce, auth_time, created_at
+            FROM authorization_codes
+            WHERE code = :code AND used_at IS NULL
+        """),
+        {"code": code}
+    )
+    auth_code = result.mappings().first()
+
+    if not auth_code:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_grant", "Invalid or expired authorization code", request
+        )
+        raise HTTPException(status_code=400, detail="Invalid authorization code")
+
+    user_id = auth_code["user_id"]
+
+    if auth_code["expires_at"] < datetime.utcnow():
+        await log_oauth_action(
+            "token", client_id, user_id, False,
+            "invalid_grant", "Authorization code expired", request
+        )
+        raise HTTPException(status_code=400, detail="Authorization code expired")
+
+    # The code must have been issued to this client
+    if auth_code["client_id"] != client_id:
+        await log_oauth_action(
+            "token", client_id, user_id, False,
+            "invalid_grant", "Authorization code was issued to another client", request
+        )
+        raise HTTPException(status_code=400, detail="Invalid authorization code")
+
+    # Validate client (same rules as oauth_simple.validate_client)
+    client = await fetch_client(client_id, db)
+    if not client:
+        raise HTTPException(status_code=400, detail="Client validation failed: Invalid client_id")
+    if not is_registered_redirect_uri(redirect_uri, client["redirect_uris"]):
+        logger.warning(f"Redirect URI validation failed - Requested: {redirect_uri}, Registered: {client['redirect_uris']}")
+        raise HTTPException(status_code=400, detail="Client validation failed: Invalid redirect_uri")
+    if client["is_confidential"] and client_secret is not None and client_secret != client["client_secret"]:
+        raise HTTPException(status_code=401, detail="Invalid client_secret")
+
+    if redirect_uri != auth_code["redirect_uri"]:
+        await log_oauth_action(
+            "token", client_id, user_id, False,
+            "invalid_grant", "Redirect URI mismatch", request
+        )
+        raise HTTPException(status_code=400, detail="Redirect URI mismatch")
+
+    if auth_code["code_challenge"]:
+        if not code_verifier:
+            await log_oauth_action(
+                "token", client_id, user_id, False,
+                "invalid_grant", "Missing code_verifier", request
+            )
+            raise HTTPException(status_code=400, detail="Missing code_verifier")
+
+        if not verify_code_challenge(
+            code_verifier,
+            auth_code["code_challenge"],
+            auth_code["code_challenge_method"] or "S256"
+        ):
+            await log_oauth_action(
+                "token", client_id, user_id, False,
+                "invalid_grant", "Invalid code_verifier", request
+            )
+            raise HTTPException(status_code=400, detail="Invalid code_verifier")
+
+    # Mark code as used (atomically, so a replayed code loses the race)
+    claimed = await db.execute(
+        text("UPDATE authorization_codes SET used_at = NOW() WHERE code = :code AND used_at IS NULL"),
+        {"code": code}
+    )
+    if claimed.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid authorization code")
+
+    token_data = await load_token_claims(user_id, db)
+    if not token_data:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="User not found")
+
+    access_token = create_access_token(data=token_data)
+    token_hash = generate_token_hash(access_token)
+    scope = auth_code["scope"] or "read:profile"
+
+    try:
+        await store_access_token(
+            token_hash, client_id, user_id, auth_code["scope"],
+            datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes),
+            db
+        )
+        await db.commit()
+    except Exception as token_error:
+        logger.error(f"Token storage error: {str(token_error)}")
+        await db.rollback()
+        await log_oauth_action(
+            "token", client_id, user_id, False,
+            "server_error", f"Token storage failed: {str(token_error)}", request
+        )
+        raise HTTPException(status_code=500, detail="Token creation failed")
+
+    await log_oauth_action("token", client_id, user_id, True, None, None, request)
+
+    refresh_token = await create_refresh_token_record(user_id, client_id, scope, token_hash, request, db)
+
+    response_data = {
+        "access_token": access_token,
+        "token_type": "Bearer",
+        "expires_in": settings.access_token_expire_minutes * 60,
+        "scope": scope,
+        "refresh_token": refresh_token,
+        "refresh_expires_in": 30 * 24 * 60 * 60  # 30 days in seconds
+    }
+
+    scopes = auth_code["scope"].split() if auth_code["scope"] else []
+    if "openid" in scopes and await check_client_oidc_status(client_id, db):
+        response_data["id_token"] = await create_id_token(
+            db, user_id,
+            client_id=client_id,
+            nonce=auth_code["nonce"],
+            auth_time=auth_code["auth_time"] or auth_code["created_at"] or datetime.utcnow(),
+            scopes=scopes,
+            access_token=access_token,
+            authorization_code=code
+        )
+        logger.info(f"ID token generated for user {user_id} with client {client_id}")
+
+    return response_data
+
+
+async def handle_refresh_token_grant(
+    refresh_token: str,
+    client_id: str,
+    client_secret: Optional[str],
+    request: Request,
+    db: AsyncSession
+) -> TokenResponse:
+    """Handle refresh_token grant type (RFC 6749 Section 6)"""
+    if not refresh_token:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_request", "Missing refresh_token parameter", request
+        )
+        raise HTTPException(status_code=400, detail="Missing refresh_token parameter")
+
+    client = await fetch_client(client_id, db)
+    if not client or (client["is_confidential"] and client_secret != client["client_secret"]):
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_client", "Client authentication failed", request
+        )
+        raise HTTPException(status_code=401, detail="Invalid client credentials")
+
+    token_info = await validate_refresh_token(refresh_token, client_id, db)
+    if not token_info:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_grant", "Invalid or expired refresh token", request
+        )
+        raise HTTPException(status_code=400, detail="Invalid or expired refresh token")
+
+    user_id = token_info["user_id"]
+    new_access_token, new_refresh_token = await rotate_refresh_token(
+        token_info["token_hash"], user_id, client_id, token_info["scope"], request, db
+    )
+
+    await log_oauth_action("token", client_id, user_id, True, None, None, request)
+
+    response_data = {
+        "access_token": new_access_token,
+        "token_type": "Bearer",
+        "expires_in": settings.access_token_expire_minutes * 60,
+        "scope": token_info["scope"],
+        "refresh_token": new_refresh_token,
+        "refresh_expires_in": 30 * 24 * 60 * 60  # 30 days in seconds
+    }
+
+    scopes = token_info["scope"].split() if token_info["scope"] else []
+    if "openid" in scopes and await check_client_oidc_status(client_id, db):
+        id_token = await create_id_token(
+            db, user_id, refresh=True,
+            client_id=client_id,
+            scopes=scopes,
+            original_auth_time=None
+        )
+        if id_token:
+            response_data["id_token"] = id_token
+
+    return TokenResponse(**response_data)
+
+
+async def handle_client_credentials_grant(
+    client_id: str,
+    client_secret: Optional[str],
+    scope: Optional[str],
+    request: Request,
+    db: AsyncSession
+) -> TokenResponse:
+    """Handle client_credentials grant type for service authentication"""
+    if not client_secret:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_request", "Missing client_secret for confidential client", request
+        )
+        raise HTTPException(status_code=400, detail="client_secret required for client_credentials grant")
+
+    client = await fetch_client(client_id, db)
+    if not client:
+        await log_oauth_action("token", client_id, None, False, "invalid_client", "Client not found", request)
+        raise HTTPException(status_code=401, detail="Invalid client_id")
+
+    if not client["is_confidential"]:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "unauthorized_client", "Public clients cannot use client_credentials grant", request
+        )
+        raise HTTPException(status_code=401, detail="Only confidential clients can use client_credentials grant")
+
+    if client_secret != client["client_secret"]:
+        await log_oauth_action("token", client_id, None, False, "invalid_client", "Invalid client_secret", request)
+        raise HTTPException(status_code=401, detail="Invalid client_secret")
+
+    # Default scopes for service clients (admin-level access)
+    default_service_scopes = ["admin:oauth", "admin:users", "admin:system"]
+    requested_scopes = scope.split() if scope else list(default_service_scopes)
+    allowed_scopes = list(client["allowed_scopes"] or [])
+    allowed_scopes += [s for s in default_service_scopes if s not in allowed_scopes]
+
+    invalid_scopes = [s for s in requested_scopes if s not in allowed_scopes]
+    if invalid_scopes:
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "invalid_scope", f"Invalid scopes: {', '.join(invalid_scopes)}", request
+        )
+        raise HTTPException(status_code=400, detail=f"Invalid scope(s): {', '.join(invalid_scopes)}")
+
+    granted_scope = " ".join(requested_scopes)
+    service_token_expire_hours = 24
+    service_token_expires_delta = timedelta(hours=service_token_expire_hours)
+    access_token = create_access_token(
+        data={
+            "sub": f"service:{client_id}",  # Service identifier
+            "client_id": client_id,
+            "scope": granted_scope,
+            "token_type": "service",
+            "iss": "maxplatform"
+        },
+        expires_delta=service_token_expires_delta
+    )
+
+    try:
+        await store_access_token(
+            generate_token_hash(access_token), client_id, None, granted_scope,
+            datetime.utcnow() + service_token_expires_delta, db
+        )
+        await db.commit()
+    except Exception as e:
+        logger.error(f"Service token creation failed for client {client_id}: {str(e)}")
+        await db.rollback()
+        await log_oauth_action(
+            "token", client_id, None, False,
+            "server_error", f"Service token creation failed: {str(e)}", request
+        )
+        raise HTTPException(status_code=500, detail="Service token creation failed")
+
+    await log_oauth_action(
+        "token", client_id, None, True,
+        None, f"Service token created with scopes: {granted_scope}", request
+    )
+
+    return TokenResponse(
+        access_token=access_token,
+        token_type="Bearer",
+        expires_in=service_token_expire_hours * 3600,
+        scope=granted_scope,
+        refresh_token=None,  # No refresh token for client_credentials grant
+        refresh_expires_in=None
+    )
+
+
+@router.post("/token", response_model=TokenResponse)
+async def token(
+    grant_type: str = Form(...),
+    code: Optional[str] = Form(None),
+    redirect_uri: Optional[str] = Form(None),
+    client_id: str = Form(...),
+    client_secret: Optional[str] = Form(None),
+    code_verifier: Optional[str] = Form(None),
+    refresh_token: Optional[str] = Form(None),
+    scope: Optional[str] = Form(None),
+    request: Request = None,
+    db: AsyncSession = Depends(get_async_session)
+):
+    """
+    OAuth 2.0 Token Endpoint (RFC 6749 Compliant, asyncpg)
+    Supports authorization_code, refresh_token and client_credentials grants
+    """
+    try:
+        if grant_type == "authorization_code":
+            return await handle_authorization_code_grant(
+                code, redirect_uri, client_id, client_secret,
+                code_verifier, request, db
+            )
+        elif grant_type == "refresh_token":
+            return await handle_refresh_token_grant(
+                refresh_token, client_id, client_secret, request, db
+            )
+        elif grant_type == "client_credentials":
+            return await handle_client_credentials_grant(
+                client_id, client_secret, scope, request, db
+            )
+        else:
+            raise HTTPException(status_code=400, detail="Unsupported grant_type")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Token endpoint error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -11,7 +11,7 @@ from typing import Optional, List
 from urllib.parse import urlparse, parse_qs
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Query, Form
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from pydantic import BaseModel, Field, HttpUrl
@@ -19,8 +19,9 @@ from pydantic import BaseModel, Field, HttpUrl
 from ..database import get_db
 from ..models import User, Group
 from ..config import settings
-from ..utils.auth import get_current_user_optional, get_current_user_silent, verify_password, create_access_token
+from ..utils.auth import get_current_user_optional, get_current_user_silent, get_current_principal_optional, verify_password, create_access_token
 from ..utils.logging_config import get_oauth_logger, log_oauth_event, SecurityDataFilter
+from ..utils.token_revocation import token_revocation_index
 from ..services.user_switch_security_service import user_switch_security_service
 
 logger = get_oauth_logger()
@@ -91,39 +92,6 @@ def calculate_refresh_token_expiry() -> datetime:
     return datetime.utcnow() + timedelta(days=30)
 
 
-def cleanup_expired_tokens(db: Session) -> int:
-    """Clean up expired and revoked tokens"""
-    try:
-        # Clean up access tokens
-        access_result = db.execute(
-            text("""
-                DELETE FROM oauth_access_tokens 
-                WHERE expires_at < NOW() OR revoked_at IS NOT NULL
-            """)
-        )
-        
-        # Clean up refresh tokens
-        refresh_result = db.execute(
-            text("""
-                DELETE FROM oauth_refresh_tokens 
-                WHERE expires_at < NOW() OR revoked_at IS NOT NULL
-            """)
-        )
-        
-        total_deleted = access_result.rowcount + refresh_result.rowcount
-        db.commit()
-        
-        if total_deleted > 0:
-            logger.info(f"Cleaned up {total_deleted} expired/revoked tokens")
-        
-        return total_deleted
-        
-    except Exception as e:
-        logger.error(f"Token cleanup error: {str(e)}")
-        db.rollback()
-        return 0
-
-
 def verify_code_challenge(code_verifier: str, code_challenge: str, method: str = "S256") -> bool:
     """Verify PKCE code challenge"""
     if method == "plain":
@@ -223,114 +191,76 @@ def validate_refresh_token(
     )
     
     try:
-        # First, clean up expired grace period tokens
-        cleanup_count = db.execute(
-            text("""
-                UPDATE oauth_refresh_tokens 
-                SET token_status = 'revoked', revoked_at = NOW()
-                WHERE token_status = 'rotating' 
-                AND rotation_grace_expires_at < NOW()
-            """)
-        ).rowcount
-        
-        if cleanup_count > 0:
-            logger.info(f"Cleaned up {cleanup_count} expired grace period tokens")
-        
-        # Validate token (including 'rotating' tokens within grace period)
+        # Single point lookup on the unique token_hash index. Expiry and the
+        # rotation grace period are evaluated at read time; flipping expired
+        # 'rotating' rows to 'revoked' is left to the background reaper.
         result = db.execute(
             text("""
-                SELECT * FROM oauth_refresh_tokens 
-                WHERE token_hash = :token_hash 
-                AND client_id = :client_id 
-                AND revoked_at IS NULL 
-                AND expires_at > NOW()
-                AND (
-                    token_status = 'active' 
-                    OR (token_status = 'rotating' AND rotation_grace_expires_at > NOW())
-                )
+                SELECT id, token_hash, client_id, user_id, scope, access_token_hash,
+                       expires_at, created_at, revoked_at, last_used_at, client_ip,
+                       user_agent, rotation_count, token_status, parent_token_hash,
+                       rotation_grace_expires_at,
+                       expires_at > NOW() AS is_unexpired,
+                       (token_status = 'rotating' AND rotation_grace_expires_at > NOW()) AS in_grace_period
+                FROM oauth_refresh_tokens 
+                WHERE token_hash = :token_hash
             """),
-            {
-                "token_hash": refresh_token_hash,
-                "client_id": client_id
-            }
+            {"token_hash": refresh_token_hash}
         )
-        token_record = result.first()
+        token_record = result.mappings().first()
+        
+        status = (token_record["token_status"] or 'active') if token_record else None
+        error_msg = None
         
         if not token_record:
-            error_msg = f"Refresh token not found or invalid for client_id: {client_id}"
-            
-            # Enhanced debugging for graceful rotation
-            check_result = db.execute(
-                text("""
-                    SELECT token_status, revoked_at, expires_at, rotation_grace_expires_at, client_id 
-                    FROM oauth_refresh_tokens 
-                    WHERE token_hash = :token_hash
-                """),
-                {"token_hash": refresh_token_hash}
-            )
-            check_record = check_result.first()
-            
-            debug_info = {}
-            if check_record:
-                status, revoked_at, expires_at, grace_expires_at, found_client_id = check_record
-                debug_info = {
-                    "found_status": status,
-                    "revoked_at": str(revoked_at) if revoked_at else None,
-                    "expires_at": str(expires_at) if expires_at else None,
-                    "grace_expires_at": str(grace_expires_at) if grace_expires_at else None,
-                    "found_client_id": found_client_id,
-                    "expected_client_id": client_id
-                }
-                
-                if status == 'rotating' and grace_expires_at and grace_expires_at < datetime.utcnow():
-                    error_msg += " - Token was in rotating status but grace period expired"
-                elif status == 'revoked':
-                    error_msg += " - Token has been revoked"
-                elif found_client_id != client_id:
-                    error_msg += f" - Client ID mismatch"
-            else:
-                error_msg += " - Token hash not found in database"
-            
+            error_msg = " - Token hash not found in database"
+        elif token_record["client_id"] != client_id:
+            error_msg = " - Client ID mismatch"
+        elif token_record["revoked_at"] is not None or status == 'revoked':
+            error_msg = " - Token has been revoked"
+        elif not token_record["is_unexpired"]:
+            error_msg = " - Token has expired"
+        elif status == 'rotating' and not token_record["in_grace_period"]:
+            error_msg = " - Token was in rotating status but grace period expired"
+        elif status not in ('active', 'rotating'):
+            error_msg = f" - Token status is {status}"
+        
+        if error_msg:
             # Log validation failure
             log_oauth_event(
                 event_type="refresh_token_validation",
                 client_id=client_id,
                 success=False,
-                error=error_msg
+                error=f"Refresh token not found or invalid for client_id: {client_id}{error_msg}"
             )
             
             return None
-            
-        # Get the current column count to handle the new fields
-        status = token_record[13] if len(token_record) > 13 else 'active'  # token_status
-        parent_hash = token_record[14] if len(token_record) > 14 else None  # parent_token_hash
-        grace_expires = token_record[15] if len(token_record) > 15 else None  # rotation_grace_expires_at
         
         # Log successful validation
         log_oauth_event(
             event_type="refresh_token_validation",
             client_id=client_id,
-            user_id=str(token_record[3]),
+            user_id=str(token_record["user_id"]),
             success=True
         )
         
         return {
-            'id': token_record[0],
-            'token_hash': token_record[1],
-            'client_id': token_record[2],
-            'user_id': token_record[3],
-            'scope': token_record[4],
-            'access_token_hash': token_record[5],
-            'expires_at': token_record[6],
-            'created_at': token_record[7],
-            'revoked_at': token_record[8],
-            'last_used_at': token_record[9],
-            'client_ip': token_record[10],
-            'user_agent': token_record[11],
-            'rotation_count': token_record[12],
+            'id': token_record["id"],
+            'token_hash': token_record["token_hash"],
+            'client_id': token_record["client_id"],
+            'user_id': token_record["user_id"],
+            'scope': token_record["scope"],
+            'access_token_hash': token_record["access_token_hash"],
+            'expires_at': token_record["expires_at"],
+            'created_at': token_record["created_at"],
+            'revoked_at': token_record["revoked_at"],
+            'last_used_at': token_record["last_used_at"],
+            'client_ip': token_record["client_ip"],
+            'user_agent': token_record["user_agent"],
+            'rotation_count': token_record["rotation_count"],
             'token_status': status,
-            'parent_token_hash': parent_hash,
-            'rotation_grace_expires_at': grace_expires
+            'parent_token_hash': token_record["parent_token_hash"],
+            'rotation_grace_expires_at': token_record["rotation_grace_expires_at"]
         }
         
     except Exception as e:
@@ -446,16 +376,18 @@ def rotate_refresh_token(
         )
         
         # Step 4: Revoke old access token if exists
-        db.execute(
+        revoked_access_tokens = db.execute(
             text("""
                 UPDATE oauth_access_tokens 
                 SET revoked_at = NOW() 
                 WHERE refresh_token_hash = :old_token_hash
+                RETURNING token_hash, expires_at
             """),
             {"old_token_hash": old_refresh_token_hash}
-        )
+        ).fetchall()
         
         db.commit()
+        token_revocation_index.revoke_tokens(revoked_access_tokens)
         logger.info(f"Graceful rotation completed - old token has {grace_expires_at} grace period")
         logger.info(f"Token family: {old_refresh_token_hash[:10]}... → {new_refresh_token_hash[:10]}...")
         
@@ -1437,7 +1369,6 @@ def token_options():
     """Handle CORS preflight requests for token endpoint"""
     return {}
 
-@router.post("/token", response_model=TokenResponse)
 def token(
     grant_type: str = Form(...),
     code: Optional[str] = Form(None),
@@ -1458,9 +1389,7 @@ def token(
     - client_credentials grant type: Service-to-service authentication
     """
     try:
-        # Clean up expired tokens periodically
-        cleanup_expired_tokens(db)
-        
+        # Expired/revoked tokens are purged by the background reaper (tasks/token_cleanup.py)
         if grant_type == "authorization_code":
             return handle_authorization_code_grant(
                 code, redirect_uri, client_id, client_secret, 
@@ -1484,6 +1413,11 @@ def token(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+# The async variant in oauth_async.py serves /token when OAUTH_ASYNC_TOKEN_ENDPOINT is enabled
+if not settings.oauth_async_token_endpoint:
+    token = router.post("/token", response_model=TokenResponse)(token)
+
+
 def handle_authorization_code_grant(
     code: str,
     redirect_uri: str, 
@@ -2045,25 +1979,26 @@ def handle_client_credentials_grant(
 @router.get("/userinfo")
 def userinfo(
     request: Request,
-    current_user: User = Depends(get_current_user_optional),
+    principal = Depends(get_current_principal_optional),
     db: Session = Depends(get_db)
 ):
     """
     OAuth 2.0 / OIDC UserInfo Endpoint
     Returns information about the authenticated user based on granted scopes
     """
-    if not current_user:
+    if not principal:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Get user's groups with eager loading for better performance
+    # Authentication came from the principal cache; load the full user with its
+    # group/role in a single query for the claims
     from sqlalchemy.orm import joinedload
     user_with_relations = db.query(User).options(
         joinedload(User.group),
         joinedload(User.role)
-    ).filter(User.id == current_user.id).first()
+    ).filter(User.id == principal.id).first()
     
     if not user_with_relations:
-        user_with_relations = current_user
+        raise HTTPException(status_code=401, detail="Not authenticated")
     
     # Try to get scopes from access token
     scopes = []
@@ -2168,7 +2103,7 @@ def revoke(
                 UPDATE oauth_access_tokens 
                 SET revoked_at = NOW() 
                 WHERE token_hash = :token_hash AND client_id = :client_id
-                RETURNING user_id
+                RETURNING user_id, token_hash, expires_at
             """),
             {"token_hash": token_hash, "client_id": client_id}
         )
@@ -2176,6 +2111,9 @@ def revoke(
         revoked = result.first()
         db.commit()
         
+        if revoked:
+            token_revocation_index.revoke_tokens([(revoked.token_hash, revoked.expires_at)])
+        
         log_oauth_action(
             "revoke", client_id, revoked.user_id if revoked else None, True,
             None, None, request, db
@@ -2295,16 +2233,27 @@ def openid_configuration():
 
 
 @router.get("/jwks")
-def jwks(db: Session = Depends(get_db)):
+def jwks(request: Request, db: Session = Depends(get_db)):
     """
     JSON Web Key Set (JWKS) Endpoint
     Returns public keys for ID token verification
+    
+    Served from the in-process signing keyring with an ETag so relying
+    parties can revalidate with If-None-Match instead of refetching.
     """
     from ..services.jwks_service import jwks_service
     
     try:
-        jwks_data = jwks_service.get_public_keys_jwks(db)
-        return jwks_data
+        jwks_data, etag = jwks_service.get_public_keys_jwks_with_etag(db)
+        headers = {
+            "Cache-Control": f"public, max-age={settings.oidc_jwks_max_age_seconds}",
+        }
+        if etag:
+            headers["ETag"] = etag
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+        
+        return JSONResponse(content=jwks_data, headers=headers)
     except Exception as e:
         logger.error(f"JWKS endpoint error: {str(e)}")
         raise HTTPException(
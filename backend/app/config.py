@@ -25,6 +25,17 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
     
+    # Redis (캐시, 토큰 해지 pub/sub)
+    redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    
+    # 2단계 캐시 (L1 in-process + L2 Redis)
+    cache_l1_max_entries: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "5000"))
+    cache_l1_ttl_seconds: int = int(os.getenv("CACHE_L1_TTL_SECONDS", "10"))  # 다른 프로세스의 무효화 반영 최대 지연
+    cache_stale_ttl_seconds: int = int(os.getenv("CACHE_STALE_TTL_SECONDS", "60"))  # 만료 후 stale 응답 허용 시간 (백그라운드 갱신)
+    cache_serializer: str = os.getenv("CACHE_SERIALIZER", "msgpack")  # msgpack | orjson | json
+    cache_compression: str = os.getenv("CACHE_COMPRESSION", "zlib")  # none | zlib | lz4
+    cache_compression_threshold: int = int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))  # bytes
+    
     # Service Token Configuration
     service_token: str = os.getenv("SERVICE_TOKEN", "")
     service_client_id: str = os.getenv("SERVICE_CLIENT_ID", "maxplatform-service")
@@ -93,6 +104,23 @@ class Settings(BaseSettings):
     # Ollama 설정
     ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     ollama_default_model: str = os.getenv("OLLAMA_DEFAULT_MODEL", "llama3.2")
+    ollama_tags_refresh_seconds: int = int(os.getenv("OLLAMA_TAGS_REFRESH_SECONDS", "30"))  # /api/tags 모델 목록 캐시 갱신 주기
+    
+    # 임베딩 설정 (RAG 문서/질의 공통 모델)
+    embedding_model: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))  # SentenceTransformer 인코딩 배치 크기
+    embedding_device: str = os.getenv("EMBEDDING_DEVICE", "")  # cpu | cuda | mps (비우면 자동 선택)
+    chroma_add_batch_size: int = int(os.getenv("CHROMA_ADD_BATCH_SIZE", "512"))  # ChromaDB add 한 번에 넣는 청크 수
+    
+    # RAG 문서 수집 파이프라인
+    rag_extract_workers: int = int(os.getenv("RAG_EXTRACT_WORKERS", "0"))  # 텍스트 추출 프로세스 수 (0이면 min(4, CPU 수))
+    rag_ingest_batch_size: int = int(os.getenv("RAG_INGEST_BATCH_SIZE", "256"))  # 임베딩 + upsert 한 번에 처리하는 청크 수
+    rag_ingest_queue_size: int = int(os.getenv("RAG_INGEST_QUEUE_SIZE", "2"))  # 추출 완료 후 임베딩 대기 파일 수 상한 (백프레셔)
+    rag_pdf_pages_per_task: int = int(os.getenv("RAG_PDF_PAGES_PER_TASK", "8"))  # PDF를 나눠 추출 프로세스에 넘기는 페이지 범위 크기
+    rag_ingest_job_workers: int = int(os.getenv("RAG_INGEST_JOB_WORKERS", "2"))  # 수집 작업을 동시에 처리하는 워커 수 (API 프로세스당, 0이면 비활성화)
+    rag_ingest_poll_seconds: float = float(os.getenv("RAG_INGEST_POLL_SECONDS", "5"))  # 대기열이 비었을 때 다시 조회하는 주기
+    rag_ingest_job_stale_seconds: int = int(os.getenv("RAG_INGEST_JOB_STALE_SECONDS", "120"))  # 이 시간 동안 heartbeat가 없는 RUNNING 작업은 다시 가져감
+    rag_ingest_job_max_attempts: int = int(os.getenv("RAG_INGEST_JOB_MAX_ATTEMPTS", "3"))  # 작업 최대 처리 시도 횟수
     
     # LLM 일반 설정
     default_llm_provider: str = os.getenv("DEFAULT_LLM_PROVIDER", "ollama")  # "azure" 또는 "ollama"
@@ -131,6 +159,12 @@ class Settings(BaseSettings):
     # 키 로테이션 주기 (일)
     oidc_key_rotation_days: int = int(os.getenv("OIDC_KEY_ROTATION_DAYS", "90"))
     
+    # 서명 키 in-process 캐시 TTL (초) - 다른 프로세스의 키 로테이션 반영 주기
+    oidc_keyring_ttl_seconds: int = int(os.getenv("OIDC_KEYRING_TTL_SECONDS", "300"))
+    
+    # /jwks 응답 Cache-Control max-age (초)
+    oidc_jwks_max_age_seconds: int = int(os.getenv("OIDC_JWKS_MAX_AGE_SECONDS", "3600"))
+    
     # ID Token 만료 시간 (분)
     oidc_id_token_expire_minutes: int = int(os.getenv("OIDC_ID_TOKEN_EXPIRE_MINUTES", "60"))
     
@@ -140,6 +174,47 @@ class Settings(BaseSettings):
     oidc_legacy_hs256_support: bool = os.getenv("OIDC_LEGACY_HS256", "true").lower() == "true"  # 전환 기간 동안 HS256 지원
     oidc_migration_grace_period_days: int = int(os.getenv("OIDC_GRACE_PERIOD_DAYS", "90"))
     
+    # =================
+    # 인증 주체(Principal) 캐시
+    # =================
+    principal_cache_ttl_seconds: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))  # 다른 프로세스의 변경 반영 최대 지연
+    principal_cache_max_entries: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+    
+    # =================
+    # OAuth 토큰 정리 (백그라운드 reaper)
+    # =================
+    token_cleanup_interval_seconds: int = int(os.getenv("TOKEN_CLEANUP_INTERVAL_SECONDS", "300"))
+    token_cleanup_batch_size: int = int(os.getenv("TOKEN_CLEANUP_BATCH_SIZE", "1000"))
+    token_cleanup_max_batches: int = int(os.getenv("TOKEN_CLEANUP_MAX_BATCHES", "50"))  # 테이블당 1회 실행 시 최대 배치 수
+    
+    # /api/oauth/token 을 asyncpg 기반 async 핸들러로 처리 (app/api/oauth_async.py)
+    oauth_async_token_endpoint: bool = os.getenv("OAUTH_ASYNC_TOKEN_ENDPOINT", "false").lower() == "true"
+
+    # =================
+    # LLMOps 플로우 실행
+    # =================
+    flow_node_timeout_seconds: float = float(os.getenv("FLOW_NODE_TIMEOUT_SECONDS", "120"))  # 노드별 기본 타임아웃 (fieldValues.timeout 으로 재정의)
+    flow_plan_cache_max_entries: int = int(os.getenv("FLOW_PLAN_CACHE_MAX_ENTRIES", "256"))  # 컴파일된 실행 계획 캐시 크기
+    flow_trace_buffer_size: int = int(os.getenv("FLOW_TRACE_BUFFER_SIZE", "256"))  # 최근 실행 레코드(노드 span) 보관 개수
+    flow_sync_pool_size: int = int(os.getenv("FLOW_SYNC_POOL_SIZE", "16"))  # 동기 전용 컴포넌트 실행 스레드 수 (워커 프로세스당)
+    flow_worker_http_connections: int = int(os.getenv("FLOW_WORKER_HTTP_CONNECTIONS", "32"))  # API -> 워커 연결 풀 크기 (워커당)
+    flow_worker_keepalive_seconds: float = float(os.getenv("FLOW_WORKER_KEEPALIVE_SECONDS", "30"))  # 워커 HTTP keep-alive 유지 시간
+    flow_warm_pool_size: int = int(os.getenv("FLOW_WARM_POOL_SIZE", "2"))  # 컴포넌트를 미리 임포트해 둔 대기 워커 프로세스 수 (0이면 비활성화)
+    flow_worker_ready_timeout_seconds: float = float(os.getenv("FLOW_WORKER_READY_TIMEOUT_SECONDS", "30"))  # 워커 ready 이벤트 대기 시간
+    flow_worker_heartbeat_seconds: float = float(os.getenv("FLOW_WORKER_HEARTBEAT_SECONDS", "10"))  # 워커 헬스 체크 주기 (요청 경로 밖)
+    flow_worker_heartbeat_failures: int = int(os.getenv("FLOW_WORKER_HEARTBEAT_FAILURES", "3"))  # 연속 실패 시 비정상 판정 횟수
+    flow_worker_mode: str = os.getenv("FLOW_WORKER_MODE", "per_flow")  # per_flow (플로우당 프로세스) | multi (고정 N개 워커에 여러 플로우 상주)
+    flow_multi_workers: int = int(os.getenv("FLOW_MULTI_WORKERS", "0"))  # multi 모드 워커 수 (0이면 CPU 코어 수)
+    flow_worker_memory_budget_mb: int = int(os.getenv("FLOW_WORKER_MEMORY_BUDGET_MB", "1024"))  # multi 모드 워커당 상주 플로우 메모리 예산
+    flow_worker_max_resident_flows: int = int(os.getenv("FLOW_WORKER_MAX_RESIDENT_FLOWS", "200"))  # multi 모드 워커당 최대 상주 플로우 수
+    flow_worker_eviction_grace_seconds: float = float(os.getenv("FLOW_WORKER_EVICTION_GRACE_SECONDS", "60"))  # 최근 사용 플로우는 이 시간 동안 내보내지 않음
+    flow_admission_max_concurrent: int = int(os.getenv("FLOW_ADMISSION_MAX_CONCURRENT", "64"))  # 플로우 실행 전역 동시 실행 한도 (API 프로세스당)
+    flow_admission_per_flow: int = int(os.getenv("FLOW_ADMISSION_PER_FLOW", "16"))  # 플로우별 동시 실행 한도
+    flow_admission_per_tenant: int = int(os.getenv("FLOW_ADMISSION_PER_TENANT", "32"))  # 테넌트(그룹, 없으면 사용자)별 동시 실행 한도
+    flow_admission_max_queue: int = int(os.getenv("FLOW_ADMISSION_MAX_QUEUE", "256"))  # 한도 초과 요청 대기열 길이 (넘으면 429)
+    flow_admission_queue_timeout_seconds: float = float(os.getenv("FLOW_ADMISSION_QUEUE_TIMEOUT_SECONDS", "30"))  # 대기 한도 (예상 대기가 넘으면 즉시 429)
+    flow_admission_memory_high_percent: float = float(os.getenv("FLOW_ADMISSION_MEMORY_HIGH_PERCENT", "0"))  # 호스트 메모리 사용률 임계치 (넘으면 429, 0이면 비활성화)
+
     # 지원되는 OIDC Claims
     oidc_supported_claims: list = [
         "sub", "name", "given_name", "family_name", "middle_name", "nickname",
@@ -69,9 +69,18 @@ def get_database_engine():
 # 데이터베이스 엔진 생성
 engine = get_database_engine()
 
-# 비동기 엔진 생성 (마이그레이션용)
+# 비동기 엔진 생성 (마이그레이션 및 async OAuth 토큰 엔드포인트용)
 async_database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-async_engine = create_async_engine(async_database_url, echo=False)
+async_engine = create_async_engine(
+    async_database_url,
+    echo=False,
+    connect_args={"server_settings": {"timezone": "UTC"}},
+    pool_size=20,
+    max_overflow=30,
+    pool_recycle=3600,
+    pool_pre_ping=True,
+    pool_timeout=30
+)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
@@ -0,0 +1,292 @@
+"""
+Admission Control for LLMOps
+
+플로우 실행 요청을 워커로 보내기 전에 승인하는 컨트롤러 (API 프로세스 단위)
+
+- 전역 / 플로우별 / 테넌트별 동시 실행 한도
+- 한도를 넘은 요청은 크기가 제한된 FIFO 대기열에서 대기 (앞선 요청이 다른 플로우 한도에 막혀 있으면 건너뜀)
+- 대기열이 가득 찼거나, 예상 대기 시간이 대기 한도(deadline)를 넘거나, 호스트 메모리가 임계치를 넘으면
+  기다리지 않고 즉시 거절 -> 라우터가 429 + Retry-After로 응답
+- 대기열 길이, 대기 시간, 실행 시간(EWMA), 거절 사유별 횟수를 get_stats()로 노출해 워커 풀 크기 산정에 사용
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from ..config import settings
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+    logging.warning("psutil을 가져올 수 없습니다. 메모리 기반 승인 제어를 비활성화합니다.")
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """승인 거절 (라우터에서 429 + Retry-After로 변환)"""
+
+    def __init__(self, reason: str, retry_after: float, detail: str):
+        super().__init__(detail)
+        self.reason = reason
+        self.retry_after = retry_after
+        self.detail = detail
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After 헤더 값 (정수 초, 최소 1초)"""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class AdmissionTicket:
+    """승인된 실행 슬롯 (release는 여러 번 호출해도 한 번만 반영)"""
+
+    def __init__(self, controller: "AdmissionController", flow_id: str, tenant_id: str, wait_seconds: float):
+        self._controller = controller
+        self.flow_id = flow_id
+        self.tenant_id = tenant_id
+        self.wait_seconds = wait_seconds
+        self.started_at = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(self)
+
+
+class _Waiter:
+    __slots__ = ("flow_id", "tenant_id", "future", "enqueued_at")
+
+    def __init__(self, flow_id: str, tenant_id: str, future: asyncio.Future):
+        self.flow_id = flow_id
+        self.tenant_id = tenant_id
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionController:
+    """
+    동시 실행 한도 기반 승인 컨트롤러
+
+    asyncio 단일 스레드에서만 사용하므로 별도 락 없이 카운터를 갱신함
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 64,
+        per_flow_limit: int = 16,
+        per_tenant_limit: int = 32,
+        max_queue: int = 256,
+        queue_timeout_seconds: float = 30.0,
+        memory_high_percent: float = 0.0
+    ):
+        """
+        Args:
+            max_concurrent: 전역 동시 실행 한도
+            per_flow_limit: 플로우별 동시 실행 한도
+            per_tenant_limit: 테넌트(그룹, 없으면 사용자)별 동시 실행 한도
+            max_queue: 대기열 최대 길이 (0이면 대기 없이 즉시 거절)
+            queue_timeout_seconds: 대기 한도 (이 시간 안에 승인되지 않으면 거절)
+            memory_high_percent: 호스트 메모리 사용률이 이 값을 넘으면 새 요청 거절 (0이면 비활성화)
+        """
+        self.max_concurrent = max_concurrent
+        self.per_flow_limit = per_flow_limit
+        self.per_tenant_limit = per_tenant_limit
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.memory_high_percent = memory_high_percent
+
+        self.active = 0
+        self.active_by_flow: Dict[str, int] = defaultdict(int)
+        self.active_by_tenant: Dict[str, int] = defaultdict(int)
+        self._waiters: Deque[_Waiter] = deque()
+
+        # 지표
+        self.admitted = 0
+        self.queued = 0
+        self.rejected: Dict[str, int] = defaultdict(int)
+        self._service_ewma = 1.0  # 실행 시간 EWMA (초) - 예상 대기 시간 계산용
+        self._recent_waits: Deque[float] = deque(maxlen=1024)
+
+    def _fits(self, flow_id: str, tenant_id: str) -> bool:
+        return (
+            self.active < self.max_concurrent
+            and self.active_by_flow[flow_id] < self.per_flow_limit
+            and self.active_by_tenant[tenant_id] < self.per_tenant_limit
+        )
+
+    def _take(self, flow_id: str, tenant_id: str) -> None:
+        self.active += 1
+        self.active_by_flow[flow_id] += 1
+        self.active_by_tenant[tenant_id] += 1
+        self.admitted += 1
+
+    def estimated_wait(self, queue_position: Optional[int] = None) -> float:
+        """대기열 위치 기준 예상 대기 시간 (실행 시간 EWMA x 앞선 요청 수 / 전역 한도)"""
+        position = len(self._waiters) if queue_position is None else queue_position
+        return self._service_ewma * (position + 1) / max(self.max_concurrent, 1)
+
+    def _reject(self, reason: str, retry_after: float, detail: str) -> AdmissionRejected:
+        self.rejected[reason] += 1
+        logger.warning(f"플로우 실행 거절 ({reason}): {detail}")
+        return AdmissionRejected(reason, retry_after, detail)
+
+    def _memory_pressure(self) -> Optional[float]:
+        if not self.memory_high_percent or psutil is None:
+            return None
+        percent = psutil.virtual_memory().percent
+        return percent if percent >= self.memory_high_percent else None
+
+    async def acquire(self, flow_id: str, tenant_id: str) -> AdmissionTicket:
+        """
+        실행 슬롯을 승인받음 (필요하면 대기)
+
+        Raises:
+            AdmissionRejected: 대기열 초과, 예상 대기 시간 초과, 대기 타임아웃, 메모리 부족
+        """
+        memory_percent = self._memory_pressure()
+        if memory_percent is not None:
+            raise self._reject(
+                "memory",
+                self._service_ewma,
+                f"호스트 메모리 사용률 {memory_percent:.0f}% (임계치 {self.memory_high_percent:.0f}%)"
+            )
+
+        if self._fits(flow_id, tenant_id):
+            self._take(flow_id, tenant_id)
+            self._recent_waits.append(0.0)
+            return AdmissionTicket(self, flow_id, tenant_id, 0.0)
+
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject(
+                "queue_full",
+                self.estimated_wait(),
+                f"대기열 가득 참: {flow_id} ({len(self._waiters)}/{self.max_queue})"
+            )
+
+        # 예상 대기 시간이 대기 한도를 넘으면 기다려도 실패하므로 바로 거절
+        expected = self.estimated_wait()
+        if expected > self.queue_timeout_seconds:
+            raise self._reject(
+                "deadline",
+                expected,
+                f"예상 대기 {expected:.1f}초 > 한도 {self.queue_timeout_seconds:.1f}초: {flow_id}"
+            )
+
+        waiter = _Waiter(flow_id, tenant_id, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            self._drop_waiter(waiter)
+            if not waiter.future.done():
+                raise self._reject(
+                    "timeout",
+                    self.estimated_wait(),
+                    f"대기 {self.queue_timeout_seconds:.1f}초 내 승인되지 않음: {flow_id}"
+                )
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소 - 이미 승인됐으면 슬롯 반환
+            self._drop_waiter(waiter)
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release_counts(flow_id, tenant_id)
+                self._dispatch()
+            raise
+
+        wait_seconds = time.monotonic() - waiter.enqueued_at
+        self._recent_waits.append(wait_seconds)
+        return AdmissionTicket(self, flow_id, tenant_id, wait_seconds)
+
+    @asynccontextmanager
+    async def admit(self, flow_id: str, tenant_id: str) -> AsyncIterator[AdmissionTicket]:
+        """승인 후 블록 실행, 종료 시 슬롯 반환"""
+        ticket = await self.acquire(flow_id, tenant_id)
+        try:
+            yield ticket
+        finally:
+            ticket.release()
+
+    def _drop_waiter(self, waiter: _Waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _release_counts(self, flow_id: str, tenant_id: str) -> None:
+        self.active -= 1
+        self.active_by_flow[flow_id] -= 1
+        if self.active_by_flow[flow_id] <= 0:
+            del self.active_by_flow[flow_id]
+        self.active_by_tenant[tenant_id] -= 1
+        if self.active_by_tenant[tenant_id] <= 0:
+            del self.active_by_tenant[tenant_id]
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        service_seconds = time.monotonic() - ticket.started_at
+        self._service_ewma = 0.8 * self._service_ewma + 0.2 * service_seconds
+        self._release_counts(ticket.flow_id, ticket.tenant_id)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """대기 순서대로 한도에 맞는 요청을 승인 (막힌 요청은 건너뜀)"""
+        if not self._waiters:
+            return
+        for waiter in list(self._waiters):
+            if self.active >= self.max_concurrent:
+                break
+            if waiter.future.done() or not self._fits(waiter.flow_id, waiter.tenant_id):
+                continue
+            self._waiters.remove(waiter)
+            self._take(waiter.flow_id, waiter.tenant_id)
+            waiter.future.set_result(True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """승인 제어 지표 (워커 풀 크기 산정용)"""
+        waits = sorted(self._recent_waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(len(waits) * p))] * 1000, 3)
+
+        return {
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "per_flow": self.per_flow_limit,
+                "per_tenant": self.per_tenant_limit,
+                "max_queue": self.max_queue,
+                "queue_timeout_seconds": self.queue_timeout_seconds,
+                "memory_high_percent": self.memory_high_percent
+            },
+            "active": self.active,
+            "active_flows": len(self.active_by_flow),
+            "active_tenants": len(self.active_by_tenant),
+            "queue_depth": len(self._waiters),
+            "oldest_wait_ms": round((time.monotonic() - self._waiters[0].enqueued_at) * 1000, 3) if self._waiters else 0.0,
+            "wait_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99)},
+            "service_ewma_ms": round(self._service_ewma * 1000, 3),
+            "estimated_wait_ms": round(self.estimated_wait() * 1000, 3),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": dict(self.rejected)
+        }
+
+
+# 전역 승인 컨트롤러
+admission_controller = AdmissionController(
+    max_concurrent=settings.flow_admission_max_concurrent,
+    per_flow_limit=settings.flow_admission_per_flow,
+    per_tenant_limit=settings.flow_admission_per_tenant,
+    max_queue=settings.flow_admission_max_queue,
+    queue_timeout_seconds=settings.flow_admission_queue_timeout_seconds,
+    memory_high_percent=settings.flow_admission_memory_high_percent
+)
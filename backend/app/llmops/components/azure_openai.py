@@ -50,9 +50,35 @@ except ImportError:
             intermediate = self.first.invoke(input_data)
             return self.second.invoke(intermediate)
 
+from ..runtime import llm_runnable
+
 logger = logging.getLogger(__name__)
 
 
+def build_chat_messages(input_data: Any, default_system_message: Optional[str] = None) -> Any:
+    """
+    업스트림 출력(Prompt 딕셔너리/문자열)을 채팅 모델 입력으로 변환합니다.
+
+    system_message가 있으면 (system, human) 메시지 목록을, 없으면 프롬프트 문자열을 반환합니다.
+    """
+    system_message = default_system_message
+    if isinstance(input_data, dict):
+        prompt_text = (
+            input_data.get("prompt") or
+            input_data.get("text") or
+            input_data.get("input") or
+            input_data.get("message") or
+            str(input_data)
+        )
+        system_message = input_data.get("system_message") or system_message
+    else:
+        prompt_text = str(input_data) if input_data is not None else ""
+
+    if system_message:
+        return [("system", str(system_message)), ("human", str(prompt_text))]
+    return str(prompt_text)
+
+
 class AzureOpenAIComponent:
     """
     Azure OpenAI 컴포넌트
@@ -82,7 +108,7 @@ class AzureOpenAIComponent:
                       }
         
         Returns:
-            AzureChatOpenAI 인스턴스
+            AzureChatOpenAI를 감싼 ComponentRunnable (응답은 본문 문자열)
         """
         try:
             # 노드 데이터에서 Azure OpenAI 설정 추출
@@ -115,10 +141,10 @@ class AzureOpenAIComponent:
             # 필수값 검증
             if not all([azure_endpoint, api_key, deployment_name]):
                 logger.warning("Azure OpenAI 필수 설정값이 부족합니다. 시뮬레이션 모드로 실행됩니다.")
-                return AzureChatOpenAI(
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens
+                return llm_runnable(
+                    "AzureOpenAI",
+                    AzureChatOpenAI(model=model, temperature=temperature, max_tokens=max_tokens),
+                    lambda input_data: build_chat_messages(input_data, field_values.get("system_message"))
                 )
             
             # AzureChatOpenAI 인스턴스 생성
@@ -134,7 +160,11 @@ class AzureOpenAIComponent:
             )
             
             logger.info(f"Azure OpenAI 컴포넌트 생성 완료: {deployment_name} (temp={temperature})")
-            return azure_openai
+            return llm_runnable(
+                "AzureOpenAI",
+                azure_openai,
+                lambda input_data: build_chat_messages(input_data, field_values.get("system_message"))
+            )
             
         except ValueError as e:
             logger.error(f"Azure OpenAI 설정값 오류: {e}")
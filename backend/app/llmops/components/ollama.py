@@ -50,6 +50,8 @@ except ImportError:
             intermediate = self.first.invoke(input_data)
             return self.second.invoke(intermediate)
 
+from ..runtime import llm_runnable
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,7 +84,7 @@ class OllamaComponent:
                       }
         
         Returns:
-            Ollama 인스턴스
+            Ollama를 감싼 ComponentRunnable
         """
         try:
             # 노드 데이터에서 Ollama 설정 추출
@@ -153,15 +155,11 @@ class OllamaComponent:
                     logger.error(f"Ollama 입력 처리 실패: {e}")
                     return str(input_data) if input_data else ""
             
-            # RunnableLambda로 입력 변환 후 Ollama 호출
-            from langchain_core.runnables import RunnableLambda
-            
-            # 입력 변환 -> Ollama 호출의 체인 생성
-            input_processor = RunnableLambda(process_ollama_input)
-            ollama_chain = input_processor | ollama
+            # 입력 변환 -> Ollama 호출 (ainvoke/astream은 네이티브 async로 실행)
+            ollama_runnable = llm_runnable("Ollama", ollama, process_ollama_input)
             
             logger.info(f"Ollama 컴포넌트 생성 완료: {model} @ {base_url}")
-            return ollama_chain
+            return ollama_runnable
             
         except ValueError as e:
             logger.error(f"Ollama 설정값 오류: {e}")
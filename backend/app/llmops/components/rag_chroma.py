@@ -60,6 +60,8 @@ except ImportError:
             intermediate = self.first.invoke(input_data)
             return self.second.invoke(intermediate)
 
+from ..runtime import ComponentRunnable, run_sync
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,7 +90,7 @@ class RAGChromaComponent:
                       }
         
         Returns:
-            RunnableLambda 인스턴스
+            ComponentRunnable 인스턴스 (ainvoke 시 Chroma 검색만 스레드 풀에서 실행)
         """
         try:
             # 노드 데이터에서 RAG 설정 추출
@@ -107,128 +109,141 @@ class RAGChromaComponent:
                 logger.error(f"ChromaService 인스턴스를 가져올 수 없습니다: {e}")
                 chroma_service = None
             
-            def rag_process(input_data: Dict[str, Any]) -> Dict[str, Any]:
+            def empty_result(query: str, error: str) -> Dict[str, Any]:
+                return {
+                    "query": query,
+                    "context": "",
+                    "documents": [],
+                    "_component_type": "RAGChroma",
+                    "_error": error
+                }
+            
+            def extract_query(input_data: Any) -> str:
+                """입력 데이터에서 검색 쿼리를 추출합니다."""
+                if isinstance(input_data, str):
+                    return input_data
+                if isinstance(input_data, dict):
+                    return input_data.get("input", "") or input_data.get("query", "") or input_data.get("question", "") or input_data.get("text", "")
+                return str(input_data)
+            
+            def search(query: str) -> List[Dict[str, Any]]:
+                """ChromaService 하이브리드 검색 (동기/블로킹 구간)"""
+                if not chroma_service:
+                    logger.warning("ChromaService를 사용할 수 없어 빈 응답을 반환합니다")
+                    return []
+                try:
+                    return chroma_service.hybrid_search(
+                        collection_name=collection_name,
+                        query=query,
+                        n_results=n_results
+                    )
+                except Exception as e:
+                    logger.error(f"ChromaService 문서 검색 실패: {e}")
+                    return []
+            
+            def build_result(input_data: Any, query: str, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
                 """
-                RAG 처리를 수행하는 내부 함수
+                검색 결과로 컨텍스트와 문서 목록을 구성합니다.
                 
                 Args:
-                    input_data: 입력 데이터 딕셔너리
+                    input_data: 입력 데이터
+                    query: 검색 쿼리
+                    search_results: hybrid_search 결과
                     
                 Returns:
                     검색된 문서와 컨텍스트가 포함된 데이터
                 """
-                try:
-                    # 쿼리 추출
-                    if isinstance(input_data, str):
-                        query = input_data
-                    elif isinstance(input_data, dict):
-                        query = input_data.get("input", "") or input_data.get("query", "") or input_data.get("question", "") or input_data.get("text", "")
-                    else:
-                        query = str(input_data)
-                    
-                    if not query:
-                        logger.warning("RAG 처리를 위한 쿼리가 비어있습니다")
-                        return {
-                            "query": "",
-                            "context": "",
-                            "documents": [],
-                            "_component_type": "RAGChroma",
-                            "_error": "쿼리가 비어있습니다"
-                        }
+                documents_data = []
+                context_parts = []
+                
+                for i, result in enumerate(search_results):
+                    # ChromaService의 hybrid_search 결과 구조에 맞춤
+                    content = result.get('content', '') or result.get('document', '')
+                    metadata = result.get('metadata', {})
+                    similarity = result.get('similarity', 0.0)
                     
-                    # ChromaService를 이용한 문서 검색
-                    documents_data = []
-                    context_parts = []
+                    # 메타데이터에서 파일 정보 추출
+                    filename = metadata.get('filename', '알 수 없는 파일')
+                    chunk_index = metadata.get('chunk_index', 0)
+                    total_chunks = metadata.get('total_chunks', 1)
+                    page_number = metadata.get('page_number')
+                    uploaded_by = metadata.get('uploaded_by', '알 수 없음')
+                    upload_time = metadata.get('upload_time', '알 수 없음')
                     
-                    if chroma_service:
-                        try:
-                            # hybrid_search 메서드를 사용하여 문서 검색
-                            search_results = chroma_service.hybrid_search(
-                                collection_name=collection_name,
-                                query=query,
-                                n_results=n_results
-                            )
-                            
-                            # 검색 결과 처리
-                            for i, result in enumerate(search_results):
-                                # ChromaService의 hybrid_search 결과 구조에 맞춤
-                                content = result.get('content', '') or result.get('document', '')
-                                metadata = result.get('metadata', {})
-                                similarity = result.get('similarity', 0.0)
-                                
-                                # 메타데이터에서 파일 정보 추출
-                                filename = metadata.get('filename', '알 수 없는 파일')
-                                chunk_index = metadata.get('chunk_index', 0)
-                                total_chunks = metadata.get('total_chunks', 1)
-                                uploaded_by = metadata.get('uploaded_by', '알 수 없음')
-                                upload_time = metadata.get('upload_time', '알 수 없음')
-                                
-                                # 출처 정보 생성
-                                source_info = f"📄 파일: {filename} | 📝 청크: {chunk_index + 1}/{total_chunks} | 👤 업로드: {uploaded_by} | 📅 시간: {upload_time}"
-                                
-                                # 컨텍스트에 출처 정보와 함께 추가
-                                context_parts.append(f"[문서 {i+1}]\n{source_info}\n내용: {content}")
-                                
-                                # 문서 정보 구성 (더 자세한 정보 포함)
-                                doc_info = {
-                                    "content": content,
-                                    "index": i + 1,
-                                    "similarity": similarity,
-                                    "source": {
-                                        "filename": filename,
-                                        "chunk_index": chunk_index,
-                                        "total_chunks": total_chunks,
-                                        "uploaded_by": uploaded_by,
-                                        "upload_time": upload_time
-                                    }
-                                }
-                                
-                                if include_metadata:
-                                    doc_info["metadata"] = metadata
-                                
-                                documents_data.append(doc_info)
-                            
-                            logger.info(f"ChromaService를 통한 RAG 처리 완료: {len(documents_data)}개 문서 검색됨")
-                            
-                        except Exception as e:
-                            logger.error(f"ChromaService 문서 검색 실패: {e}")
-                    else:
-                        logger.warning("ChromaService를 사용할 수 없어 빈 응답을 반환합니다")
+                    # 출처 정보 생성
+                    source_info = f"📄 파일: {filename} | 📝 청크: {chunk_index + 1}/{total_chunks} | 👤 업로드: {uploaded_by} | 📅 시간: {upload_time}"
+                    if page_number is not None:
+                        source_info += f" | 📑 페이지: {page_number}"
                     
-                    # 최종 컨텍스트 생성
-                    context = "\n\n".join(context_parts)
+                    # 컨텍스트에 출처 정보와 함께 추가
+                    context_parts.append(f"[문서 {i+1}]\n{source_info}\n내용: {content}")
                     
-                    # 결과 구성
-                    result = {
-                        "query": query,
-                        "context": context,
-                        "documents": documents_data,
-                        "document_count": len(documents_data),
-                        "_component_type": "RAGChroma",
-                        "_collection_name": collection_name
+                    # 문서 정보 구성 (더 자세한 정보 포함)
+                    doc_info = {
+                        "content": content,
+                        "index": i + 1,
+                        "similarity": similarity,
+                        "source": {
+                            "filename": filename,
+                            "chunk_index": chunk_index,
+                            "total_chunks": total_chunks,
+                            "page_number": page_number,
+                            "uploaded_by": uploaded_by,
+                            "upload_time": upload_time
+                        }
                     }
                     
-                    # 원본 입력 데이터도 포함
-                    if isinstance(input_data, dict):
-                        for key, value in input_data.items():
-                            if key not in result:
-                                result[key] = value
-                    
-                    logger.info(f"RAG 처리 완료: {len(documents_data)}개 문서 검색됨")
-                    return result
+                    if include_metadata:
+                        doc_info["metadata"] = metadata
                     
+                    documents_data.append(doc_info)
+                
+                # 결과 구성
+                result = {
+                    "query": query,
+                    "context": "\n\n".join(context_parts),
+                    "documents": documents_data,
+                    "document_count": len(documents_data),
+                    "_component_type": "RAGChroma",
+                    "_collection_name": collection_name
+                }
+                
+                # 원본 입력 데이터도 포함
+                if isinstance(input_data, dict):
+                    for key, value in input_data.items():
+                        if key not in result:
+                            result[key] = value
+                
+                logger.info(f"RAG 처리 완료: {len(documents_data)}개 문서 검색됨")
+                return result
+            
+            def rag_process(input_data: Dict[str, Any]) -> Dict[str, Any]:
+                """RAG 처리 (동기 실행)"""
+                query = ""
+                try:
+                    query = extract_query(input_data)
+                    if not query:
+                        logger.warning("RAG 처리를 위한 쿼리가 비어있습니다")
+                        return empty_result("", "쿼리가 비어있습니다")
+                    return build_result(input_data, query, search(query))
                 except Exception as e:
                     logger.error(f"RAG 처리 실패: {e}")
-                    return {
-                        "query": query if 'query' in locals() else "",
-                        "context": "",
-                        "documents": [],
-                        "_component_type": "RAGChroma",
-                        "_error": str(e)
-                    }
+                    return empty_result(query, str(e))
+            
+            async def arag_process(input_data: Dict[str, Any]) -> Dict[str, Any]:
+                """RAG 처리 (비동기 실행, 블로킹 검색만 제한된 스레드 풀에서 수행)"""
+                query = ""
+                try:
+                    query = extract_query(input_data)
+                    if not query:
+                        logger.warning("RAG 처리를 위한 쿼리가 비어있습니다")
+                        return empty_result("", "쿼리가 비어있습니다")
+                    return build_result(input_data, query, await run_sync(search, query))
+                except Exception as e:
+                    logger.error(f"RAG 처리 실패: {e}")
+                    return empty_result(query, str(e))
             
-            # RunnableLambda로 RAG 처리 함수를 래핑
-            runnable = RunnableLambda(rag_process)
+            runnable = ComponentRunnable("RAGChroma", rag_process, afunc=arag_process)
             
             logger.info(f"RAG Chroma 컴포넌트 생성 완료: {collection_name} (n_results={n_results})")
             return runnable
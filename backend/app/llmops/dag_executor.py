@@ -0,0 +1,380 @@
+"""
+DAG Executor for FlowRunner Pro
+
+위상 정렬된 플로우 그래프를 asyncio로 실행하는 엔진
+선행 노드가 모두 끝난 노드부터 동시에 실행하므로 플로우 지연 시간은
+모든 노드 실행 시간의 합이 아니라 임계 경로(critical path)의 길이가 됨
+
+노드 출력은 엣지의 sourceHandle/targetHandle을 따라 전달되고,
+여러 엣지가 모이는 노드(fan-in)는 입력을 하나의 딕셔너리로 병합하여 받음
+
+astream은 결과를 만드는 LLM 노드(스트리밍 노드)의 토큰을 생성 즉시 전달하므로
+첫 토큰까지의 시간(TTFT)이 전체 실행 시간이 아니라 스트리밍 노드의 첫 토큰 시점이 됨
+(청크 대기열은 크기가 제한되어 있어 소비자가 느리면 스트리밍 노드도 기다림)
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+try:
+    from langchain_core.runnables.base import Runnable
+except ImportError:
+    # langchain 라이브러리가 없는 경우 대체 구현
+    class Runnable:
+        """Runnable 기본 클래스 대체 구현"""
+        def invoke(self, input_data: Any) -> Any:
+            return input_data
+
+from .runtime import ainvoke_runnable
+from .tracing import (
+    ExecutionTrace,
+    NodeSpan,
+    estimate_size,
+    is_verbose,
+    log_node_input,
+    log_node_output,
+    trace_buffer,
+)
+
+logger = logging.getLogger(__name__)
+
+# 출력 내용을 바꾸지 않고 포맷만 하는 노드 (스트리밍 노드 탐색 시 거슬러 올라감)
+STREAM_PASSTHROUGH_TYPES = {"ChatOutput"}
+
+# astream에서 소비자에게 아직 전달되지 않은 청크 수 상한 (백프레셔)
+STREAM_QUEUE_SIZE = 64
+
+ChunkCallback = Callable[[Any], Awaitable[None]]
+
+
+class NodeExecutionError(RuntimeError):
+    """결과를 만드는 경로의 노드가 실패/타임아웃되어 플로우 결과를 낼 수 없음"""
+
+    def __init__(self, node_id: str, status: str, error: str):
+        self.node_id = node_id
+        self.status = status
+        super().__init__(f"노드 실행 실패: {node_id} ({status}) - {error}")
+
+
+@dataclass(frozen=True)
+class DAGEdge:
+    """노드 사이의 연결 (핸들이 없으면 None)"""
+    source: str
+    target: str
+    source_handle: Optional[str] = None
+    target_handle: Optional[str] = None
+
+
+def route_output(output: Any, source_handle: Optional[str]) -> Any:
+    """
+    sourceHandle에 해당하는 출력 값을 꺼냅니다.
+
+    딕셔너리 출력에 핸들 이름의 키가 있으면 그 값을, 그 외(문자열 LLM 응답 등)에는
+    출력 전체를 반환합니다.
+    """
+    if source_handle and isinstance(output, dict) and source_handle in output:
+        return output[source_handle]
+    return output
+
+
+class DAGExecutor(Runnable):
+    """
+    플로우 그래프 실행기
+
+    - 진입 엣지가 없는 노드는 플로우 입력을 받음
+    - 선행 노드가 모두 완료되면 즉시 실행 (독립 분기는 동시 실행)
+    - 결과 노드와 그 선행 노드가 타임아웃/실패하면 남은 실행을 취소하고 NodeExecutionError 발생
+      (사용자 입력이 모델 응답처럼 결과로 전달되지 않도록)
+    - 결과와 무관한 분기의 노드는 실패해도 입력을 그대로 전달하고 span에만 기록
+    - 결과는 출력 엣지가 없는 마지막 노드(끝 노드)의 출력
+    - 실행마다 노드별 span을 모아 trace_buffer에 하나의 레코드로 기록
+    - astream은 스트리밍 노드의 청크를 그대로 전달 (없으면 최종 결과 1회)
+    """
+
+    is_async_native = True
+
+    def __init__(
+        self,
+        nodes: Dict[str, Runnable],
+        edges: List[Dict[str, Any]],
+        execution_order: List[str],
+        timeouts: Optional[Dict[str, Optional[float]]] = None,
+        flow_id: Optional[str] = None,
+        node_types: Optional[Dict[str, str]] = None,
+        node_fields: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
+        """
+        Args:
+            nodes: 노드 ID -> Runnable
+            edges: Flow JSON 엣지 목록
+            execution_order: 위상 정렬된 노드 ID 리스트
+            timeouts: 노드 ID -> 타임아웃(초), None이면 제한 없음
+            flow_id: 실행 레코드에 남길 플로우 ID
+            node_types: 노드 ID -> 컴포넌트 타입 (span 표시용)
+            node_fields: 노드 ID -> fieldValues (verbose 모드 템플릿 로그용)
+        """
+        self.nodes = nodes
+        self.execution_order = [node_id for node_id in execution_order if node_id in nodes]
+        self.timeouts = timeouts or {}
+        self.flow_id = flow_id
+        self.node_types = node_types or {}
+        self.node_fields = node_fields or {}
+
+        self.incoming: Dict[str, List[DAGEdge]] = {node_id: [] for node_id in self.execution_order}
+        self.predecessors: Dict[str, List[str]] = {node_id: [] for node_id in self.execution_order}
+        has_outgoing = set()
+
+        for edge in edges:
+            source, target = edge.get("source"), edge.get("target")
+            if source not in nodes or target not in nodes:
+                continue
+            self.incoming[target].append(DAGEdge(
+                source=source,
+                target=target,
+                source_handle=edge.get("sourceHandle"),
+                target_handle=edge.get("targetHandle")
+            ))
+            if source not in self.predecessors[target]:
+                self.predecessors[target].append(source)
+            has_outgoing.add(source)
+
+        self.start_nodes = [node_id for node_id in self.execution_order if not self.incoming[node_id]]
+        self.end_nodes = [node_id for node_id in self.execution_order if node_id not in has_outgoing]
+        # 기존 선형 체인과 같이 실행 순서상 마지막 끝 노드의 출력을 결과로 사용
+        self.output_node = self.end_nodes[-1] if self.end_nodes else self.execution_order[-1]
+        self.stream_node = self._find_stream_node()
+        self.required_nodes = self._ancestors(self.output_node)
+
+    def _ancestors(self, node_id: str) -> set:
+        """노드와 그 노드로 이어지는 모든 선행 노드"""
+        found, pending = set(), [node_id]
+        while pending:
+            current = pending.pop()
+            if current not in found:
+                found.add(current)
+                pending.extend(self.predecessors[current])
+        return found
+
+    def _find_stream_node(self) -> Optional[str]:
+        """
+        토큰을 스트리밍할 노드를 찾습니다.
+
+        출력 노드가 스트리밍을 지원하면 출력 노드를, ChatOutput 같은 포맷 노드이면
+        단일 선행 노드를 따라 거슬러 올라가며 처음 만나는 스트리밍 지원 노드를 반환합니다.
+        """
+        node_id = self.output_node
+        while True:
+            if getattr(self.nodes[node_id], "supports_streaming", False):
+                return node_id
+            predecessors = self.predecessors[node_id]
+            if self.node_types.get(node_id) not in STREAM_PASSTHROUGH_TYPES or len(predecessors) != 1:
+                return None
+            node_id = predecessors[0]
+
+    def gather_inputs(self, node_id: str, flow_input: Any, results: Dict[str, Any]) -> Any:
+        """
+        노드 입력을 구성합니다.
+
+        - 시작 노드: 플로우 입력
+        - 진입 엣지 1개 + 딕셔너리가 아닌 출력: 그대로 전달
+        - 그 외: 선행 노드의 딕셔너리 출력을 병합한 뒤 targetHandle 키에
+          sourceHandle로 라우팅한 값을 설정 (핸들 값이 일반 키보다 우선)
+        """
+        incoming = self.incoming[node_id]
+        if not incoming:
+            return flow_input
+
+        if len(incoming) == 1 and not isinstance(results[incoming[0].source], dict):
+            return results[incoming[0].source]
+
+        merged: Dict[str, Any] = {}
+        for edge in incoming:
+            output = results[edge.source]
+            if isinstance(output, dict):
+                merged.update(output)
+
+        for edge in incoming:
+            output = results[edge.source]
+            if edge.target_handle:
+                merged[edge.target_handle] = route_output(output, edge.source_handle)
+            elif not isinstance(output, dict):
+                merged[edge.source] = output
+        return merged
+
+    async def _run_node(
+        self,
+        node_id: str,
+        node_input: Any,
+        config: Optional[Any],
+        trace: ExecutionTrace,
+        verbose: bool,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> Any:
+        runnable = self.nodes[node_id]
+        timeout = self.timeouts.get(node_id)
+        status, error, failure = "ok", None, None
+        emitted = False
+
+        async def forward_chunk(chunk: Any) -> None:
+            nonlocal emitted
+            emitted = True
+            await on_chunk(chunk)
+
+        if verbose:
+            log_node_input(node_id, node_input, self.node_fields.get(node_id, {}))
+
+        started_at, started = time.time(), time.perf_counter()
+        try:
+            if on_chunk is not None:
+                coro = self._consume_stream(runnable, node_input, config, forward_chunk)
+            else:
+                coro = ainvoke_runnable(runnable, node_input, config)
+            result = await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError as e:
+            # 동기 컴포넌트는 스레드 풀에서 계속 실행될 수 있지만 결과는 사용하지 않음
+            logger.error(f"⏱️ 노드 실행 타임아웃: {node_id} ({timeout}초)")
+            status, error, result = "timeout", f"timeout after {timeout}s", node_input
+            failure = e
+        except Exception as e:
+            logger.error(f"❌ 노드 실행 실패: {node_id} - {e}")
+            status, error, result = "error", f"{type(e).__name__}: {e}", node_input
+            failure = e
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        trace.add_span(NodeSpan(
+            node_id=node_id,
+            node_type=self.node_types.get(node_id, ""),
+            started_at=started_at,
+            duration_ms=round(duration_ms, 3),
+            input_bytes=estimate_size(node_input),
+            output_bytes=estimate_size(result),
+            status=status,
+            error=error
+        ))
+        if failure is not None and (emitted or node_id in self.required_nodes):
+            # 결과 경로의 노드는 입력으로 대체하지 않음 (이미 청크를 보낸 스트리밍 노드도 잘린 응답이 정상 완료로 보이지 않도록)
+            raise NodeExecutionError(node_id, status, error) from failure
+        if verbose:
+            log_node_output(node_id, result, duration_ms)
+        return result
+
+    @staticmethod
+    async def _consume_stream(
+        runnable: Runnable,
+        node_input: Any,
+        config: Optional[Any],
+        on_chunk: ChunkCallback
+    ) -> Any:
+        """노드 스트림을 소비하며 청크를 전달하고, 누적 결과(문자열 청크는 이어 붙임)를 반환합니다."""
+        chunks: List[Any] = []
+        async for chunk in runnable.astream(node_input, config):
+            chunks.append(chunk)
+            await on_chunk(chunk)
+        if chunks and all(isinstance(chunk, str) for chunk in chunks):
+            return "".join(chunks)
+        return chunks[-1] if chunks else None
+
+    async def _execute(
+        self,
+        input: Any,
+        config: Optional[Any],
+        stream_node: Optional[str] = None,
+        on_chunk: Optional[ChunkCallback] = None
+    ) -> Any:
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        trace = ExecutionTrace(flow_id=self.flow_id)
+        verbose = is_verbose()
+
+        async def run(node_id: str) -> None:
+            predecessors = self.predecessors[node_id]
+            if predecessors:
+                await asyncio.gather(*(tasks[source] for source in predecessors))
+            node_input = self.gather_inputs(node_id, input, results)
+            results[node_id] = await self._run_node(
+                node_id, node_input, config, trace, verbose,
+                on_chunk=record_chunk if node_id == stream_node else None
+            )
+
+        async def record_chunk(chunk: Any) -> None:
+            if trace.first_token_ms is None:
+                trace.mark_first_token()
+            await on_chunk(chunk)
+
+        # 위상 순서로 생성하므로 선행 노드의 태스크는 항상 먼저 존재
+        for node_id in self.execution_order:
+            tasks[node_id] = asyncio.create_task(run(node_id))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException as e:
+            for task in tasks.values():
+                task.cancel()
+            trace.finish("cancelled" if isinstance(e, asyncio.CancelledError) else "error")
+            trace_buffer.record(trace)
+            raise
+
+        trace.finish()
+        trace_buffer.record(trace)
+        return results[self.output_node]
+
+    async def ainvoke(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Any:
+        return await self._execute(input, config)
+
+    def invoke(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Any:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ainvoke(input, config))
+
+        # 이벤트 루프 안에서 동기 호출된 경우 별도 스레드의 루프에서 실행 (verbose 설정 유지)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            context = contextvars.copy_context()
+            return pool.submit(context.run, asyncio.run, self.ainvoke(input, config)).result()
+
+    async def astream(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        if self.stream_node is None:
+            yield await self.ainvoke(input, config)
+            return
+
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        done = object()
+
+        async def execute() -> Any:
+            try:
+                result = await self._execute(input, config, self.stream_node, queue.put)
+            except asyncio.CancelledError:
+                # 소비자가 떠나 취소된 경우 종료 표시를 넣지 않음 (가득 찬 대기열에서 멈추지 않도록)
+                raise
+            except BaseException:
+                await queue.put(done)
+                raise
+            await queue.put(done)
+            return result
+
+        task = asyncio.create_task(execute())
+        emitted = False
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is done:
+                    break
+                emitted = True
+                yield chunk
+            # 결과 경로의 노드가 실패하면 여기서 NodeExecutionError가 전달됨
+            result = await task
+            # 스트리밍 노드가 청크 없이 끝난 경우 최종 결과 전달
+            if not emitted:
+                yield result
+        finally:
+            # 소비자가 중간에 끊으면(클라이언트 연결 종료 등) 남은 실행 취소
+            if not task.done():
+                task.cancel()
+
+    def stream(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Iterator[Any]:
+        yield self.invoke(input, config)
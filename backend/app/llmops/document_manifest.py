@@ -0,0 +1,171 @@
+"""
+RAG 문서 매니페스트
+
+데이터소스별 "원본 파일명 -> (파일 해시, 청크 ID 목록)" 기록으로 증분 재색인을 지원합니다.
+
+- 청크 ID는 데이터소스 식별자, 원본 파일명, 정규화한 청크 텍스트의 SHA-256
+  -> 같은 파일을 다시 올리면 바뀌지 않은 청크는 같은 ID가 되어 재임베딩하지 않음
+  -> 파일마다 ID가 달라 청크 메타데이터(출처 파일/페이지)는 항상 그 청크를 가진 파일 하나를 가리킴
+- 청크 참조 수를 집계해, 파일이 바뀌었을 때 더 이상 참조되지 않는 청크만 삭제 대상으로 반환
+- DB 접근은 asyncio.to_thread로 수행 (수집 파이프라인이 이벤트 루프에서 호출)
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .models import RAGDocumentManifest
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ID_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def normalize_chunk_text(text: str) -> str:
+    """청크 해시용 정규화 (유니코드 NFC + 공백 축약)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_chunk_id(namespace: str, source_key: str, text: str) -> str:
+    """데이터소스 + 원본 파일 범위의 content-addressed 청크 ID"""
+    digest = hashlib.sha256()
+    digest.update(namespace.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(source_key.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_chunk_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_chunk_id(value: str) -> bool:
+    """make_chunk_id 형식 여부 (매니페스트 이전의 "{filename}_{i}_{uuid}" 청크 구분용)"""
+    return CHUNK_ID_PATTERN.fullmatch(value) is not None
+
+
+class ManifestEntry:
+    """매니페스트 항목 스냅샷 (세션 commit 후에도 다시 조회하지 않도록 ORM 객체 대신 사용)"""
+
+    __slots__ = ("source_key", "file_hash", "chunk_ids", "file_path")
+
+    def __init__(self, source_key: str, file_hash: str, chunk_ids: List[str], file_path: Optional[str]):
+        self.source_key = source_key
+        self.file_hash = file_hash
+        self.chunk_ids = chunk_ids
+        self.file_path = file_path
+
+
+class DocumentManifest:
+    """
+    데이터소스 매니페스트 (작업 시작 시 한 번 읽어 메모리에서 참조 수를 관리)
+
+    같은 데이터소스의 수집 작업은 IngestionJobRunner가 한 번에 하나만 처리하므로 스냅샷 기준으로 계산함
+    load()로 생성하며, 세션은 record()가 잠금 아래에서 한 스레드씩만 사용함
+    """
+
+    def __init__(self, db: Session, datasource_id: int):
+        self.db = db
+        self.datasource_id = datasource_id
+        self.entries: Dict[str, ManifestEntry] = {}
+        self._by_hash: Dict[str, str] = {}
+        self._refs: Counter = Counter()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def load(cls, db: Session, datasource_id: int) -> "DocumentManifest":
+        manifest = cls(db, datasource_id)
+        rows = await asyncio.to_thread(manifest._fetch_rows)
+        for source_key, file_hash, chunk_ids, file_path in rows:
+            manifest._set_entry(ManifestEntry(source_key, file_hash, list(chunk_ids or []), file_path))
+        return manifest
+
+    def _fetch_rows(self) -> list:
+        return self.db.query(
+            RAGDocumentManifest.source_key,
+            RAGDocumentManifest.file_hash,
+            RAGDocumentManifest.chunk_ids,
+            RAGDocumentManifest.file_path
+        ).filter(RAGDocumentManifest.datasource_id == self.datasource_id).all()
+
+    def _set_entry(self, entry: ManifestEntry) -> None:
+        previous = self.entries.get(entry.source_key)
+        if previous is not None:
+            self._refs.subtract(set(previous.chunk_ids))
+            if self._by_hash.get(previous.file_hash) == entry.source_key:
+                del self._by_hash[previous.file_hash]
+        self.entries[entry.source_key] = entry
+        self._by_hash.setdefault(entry.file_hash, entry.source_key)
+        self._refs.update(set(entry.chunk_ids))
+
+    def get(self, source_key: str) -> Optional[ManifestEntry]:
+        return self.entries.get(source_key)
+
+    def is_referenced(self, chunk_id: str) -> bool:
+        """매니페스트 항목 중 하나라도 참조하는 청크인지"""
+        return self._refs[chunk_id] > 0
+
+    def find_by_hash(self, file_hash: str) -> Optional[ManifestEntry]:
+        """같은 내용으로 색인된 파일 (파일명만 바뀐 재업로드 등)"""
+        source_key = self._by_hash.get(file_hash)
+        return self.entries.get(source_key) if source_key is not None else None
+
+    async def record(
+        self,
+        source_key: str,
+        file_hash: str,
+        chunk_ids: List[str],
+        stored_filename: Optional[str] = None,
+        file_path: Optional[str] = None
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        파일 색인 결과를 기록
+
+        Returns:
+            (더 이상 참조되지 않는 청크 ID 목록, 대체된 이전 저장 파일 경로)
+        """
+        async with self._lock:
+            previous = self.entries.get(source_key)
+            previous_ids = set(previous.chunk_ids) if previous else set()
+            previous_path = previous.file_path if previous else None
+
+            await asyncio.to_thread(self._save, source_key, file_hash, chunk_ids, stored_filename, file_path)
+
+            self._set_entry(ManifestEntry(source_key, file_hash, list(chunk_ids), file_path))
+            orphans = [chunk_id for chunk_id in previous_ids - set(chunk_ids) if self._refs[chunk_id] <= 0]
+            for chunk_id in orphans:
+                del self._refs[chunk_id]
+
+        replaced_path = previous_path if previous_path and previous_path != file_path else None
+        return orphans, replaced_path
+
+    def _save(
+        self,
+        source_key: str,
+        file_hash: str,
+        chunk_ids: List[str],
+        stored_filename: Optional[str],
+        file_path: Optional[str]
+    ) -> None:
+        """매니페스트 행 upsert (블로킹 - 스레드에서 호출)"""
+        try:
+            row = self.db.query(RAGDocumentManifest).filter(
+                RAGDocumentManifest.datasource_id == self.datasource_id,
+                RAGDocumentManifest.source_key == source_key
+            ).first()
+            if row is None:
+                row = RAGDocumentManifest(datasource_id=self.datasource_id, source_key=source_key)
+                self.db.add(row)
+            row.file_hash = file_hash
+            row.chunk_ids = list(chunk_ids)
+            row.chunk_count = len(chunk_ids)
+            row.stored_filename = stored_filename
+            row.file_path = file_path
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
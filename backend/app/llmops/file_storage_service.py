@@ -21,6 +21,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_COPY_BLOCK_SIZE = 1024 * 1024  # 업로드 파일 저장 시 한 번에 읽는 크기
+
 class FileStorageService:
     """파일 저장 관리 서비스"""
     
@@ -80,10 +82,15 @@ class FileStorageService:
             
             file_path = storage_path / final_filename
             
-            # 파일 저장
-            content = await file.read()
+            # 파일 저장 (청크 단위로 복사해 업로드 전체를 메모리에 올리지 않음)
+            file_size = 0
             with open(file_path, "wb") as f:
-                f.write(content)
+                while True:
+                    block = await file.read(UPLOAD_COPY_BLOCK_SIZE)
+                    if not block:
+                        break
+                    f.write(block)
+                    file_size += len(block)
             
             # 파일 정보 반환
             relative_path = str(file_path.relative_to(self.base_storage_path))
@@ -93,7 +100,7 @@ class FileStorageService:
                 "stored_filename": final_filename,
                 "file_path": str(file_path),
                 "relative_path": relative_path,
-                "file_size": len(content),
+                "file_size": file_size,
                 "content_type": file.content_type,
                 "upload_time": datetime.now().isoformat(),
                 "uploaded_by": str(current_user.id),
@@ -0,0 +1,335 @@
+"""
+Compiled Flow Plan for FlowRunner Pro
+
+Flow JSON을 한 번만 해석하여 만든 불변 실행 계획과 그 캐시
+검증, 노드 타입 해석, 컴포넌트 클래스 로드, 엣지 분석, 위상 정렬을 미리 수행하므로
+같은 플로우를 다시 빌드(워커 시작, 핫 리로드, /test-flow 반복 실행)할 때는
+컴포넌트 인스턴스화만 남음
+
+캐시 키는 (flow_id, 배포 버전, flow_data_snapshot 내용 해시)이며,
+내용 해시가 키에 포함되므로 같은 버전의 스냅샷이 바뀌어도 오래된 계획이 쓰이지 않음
+"""
+
+import copy
+import hashlib
+import importlib
+import json
+import logging
+import threading
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .component_registry import get_component_class, COMPONENT_REGISTRY
+from .dag_executor import DAGEdge
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+PlanKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """실행 계획의 노드 (component_class가 None이면 패스스루로 실행)"""
+    node_id: str
+    node_type: str
+    class_path: Optional[str]
+    component_class: Optional[type]
+    node_data: Dict[str, Any]
+    timeout: Optional[float]
+
+
+@dataclass(frozen=True)
+class CompiledFlowPlan:
+    """
+    컴파일된 플로우 실행 계획
+
+    nodes는 위상 정렬 순서이며, edges는 DAGExecutor의 라우팅 테이블로 그대로 사용
+    """
+    content_hash: str
+    nodes: Tuple[PlanNode, ...]
+    edges: Tuple[DAGEdge, ...]
+
+    @property
+    def execution_order(self) -> List[str]:
+        return [node.node_id for node in self.nodes]
+
+    @property
+    def timeouts(self) -> Dict[str, Optional[float]]:
+        return {node.node_id: node.timeout for node in self.nodes}
+
+    def edge_dicts(self) -> List[Dict[str, Any]]:
+        """Flow JSON 형식의 엣지 목록"""
+        return [
+            {
+                "source": edge.source,
+                "target": edge.target,
+                "sourceHandle": edge.source_handle,
+                "targetHandle": edge.target_handle
+            }
+            for edge in self.edges
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """워커 프로세스로 전달할 수 있는 JSON 직렬화 형태"""
+        return {
+            "content_hash": self.content_hash,
+            "nodes": [
+                {
+                    "node_id": node.node_id,
+                    "node_type": node.node_type,
+                    "class_path": node.class_path,
+                    "node_data": node.node_data,
+                    "timeout": node.timeout
+                }
+                for node in self.nodes
+            ],
+            "edges": self.edge_dicts()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompiledFlowPlan":
+        """
+        to_dict() 결과로부터 계획을 복원합니다.
+        컴포넌트 클래스는 레지스트리 조회 없이 저장된 클래스 경로로 바로 로드합니다.
+        """
+        nodes = []
+        for node in data["nodes"]:
+            nodes.append(PlanNode(
+                node_id=node["node_id"],
+                node_type=node["node_type"],
+                class_path=node.get("class_path"),
+                component_class=_load_class(node.get("class_path")),
+                node_data=node.get("node_data", {}),
+                timeout=node.get("timeout")
+            ))
+        edges = tuple(
+            DAGEdge(
+                source=edge["source"],
+                target=edge["target"],
+                source_handle=edge.get("sourceHandle"),
+                target_handle=edge.get("targetHandle")
+            )
+            for edge in data.get("edges", [])
+        )
+        return cls(content_hash=data["content_hash"], nodes=tuple(nodes), edges=edges)
+
+
+def _load_class(class_path: Optional[str]) -> Optional[type]:
+    if not class_path:
+        return None
+    try:
+        module_path, class_name = class_path.rsplit(".", 1)
+        return getattr(importlib.import_module(module_path), class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        logger.error(f"컴포넌트 클래스 로드 실패: {class_path} - {e}")
+        return None
+
+
+def flow_content_hash(flow_data: Dict[str, Any]) -> str:
+    """노드/엣지 구성의 내용 해시 (키 순서와 무관)"""
+    canonical = json.dumps(
+        {"nodes": flow_data.get("nodes", []), "edges": flow_data.get("edges", [])},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def validate_flow_data(flow_data: Any) -> None:
+    """
+    플로우 데이터의 유효성을 검증합니다.
+
+    Raises:
+        ValueError: 플로우 데이터가 유효하지 않은 경우
+    """
+    if not isinstance(flow_data, dict):
+        raise ValueError("flow_data는 딕셔너리여야 합니다")
+
+    if "nodes" not in flow_data:
+        raise ValueError("flow_data에 'nodes' 키가 없습니다")
+
+    if "edges" not in flow_data:
+        raise ValueError("flow_data에 'edges' 키가 없습니다")
+
+    nodes = flow_data["nodes"]
+    if not isinstance(nodes, list) or len(nodes) == 0:
+        raise ValueError("최소 하나 이상의 노드가 필요합니다")
+
+
+def resolve_node_type(node_data: Dict[str, Any]) -> Optional[str]:
+    """
+    노드의 컴포넌트 타입을 결정합니다.
+
+    data.type (ChatInput, Ollama 등)을 우선 사용하고, data.id (chat_input 등)는
+    PascalCase로 변환하며, 마지막으로 React Flow 노드 타입을 사용합니다.
+    """
+    node_data_obj = node_data.get("data", {})
+    node_type = (
+        node_data_obj.get("type") or
+        node_data_obj.get("id") or
+        node_data.get("type")
+    )
+
+    if node_type and node_type == node_data_obj.get("id") and "_" in node_type:
+        # chat_input -> ChatInput
+        node_type = "".join(word.capitalize() for word in node_type.split("_"))
+    return node_type
+
+
+def resolve_node_timeout(node_id: str, node_data: Dict[str, Any]) -> Optional[float]:
+    """
+    노드 실행 타임아웃(초)을 반환합니다.
+
+    fieldValues.timeout 이 있으면 우선 사용하고, 0 이하이면 제한 없음(None)
+    """
+    field_values = node_data.get("data", {}).get("fieldValues", {})
+    timeout = field_values.get("timeout", settings.flow_node_timeout_seconds)
+    try:
+        timeout = float(timeout)
+    except (TypeError, ValueError):
+        logger.warning(f"노드 {node_id}의 timeout 값이 올바르지 않아 기본값을 사용합니다: {timeout}")
+        timeout = settings.flow_node_timeout_seconds
+    return timeout if timeout > 0 else None
+
+
+def compile_flow_plan(flow_data: Dict[str, Any], content_hash: Optional[str] = None) -> CompiledFlowPlan:
+    """
+    Flow JSON을 실행 계획으로 컴파일합니다.
+
+    Raises:
+        ValueError: 플로우 데이터가 유효하지 않은 경우
+        RuntimeError: 순환 참조가 있는 경우
+    """
+    validate_flow_data(flow_data)
+    # 캐시된 계획이 호출자의 flow_data 변경에 영향받지 않도록 복사
+    flow_data = copy.deepcopy(flow_data)
+
+    plan_nodes: Dict[str, PlanNode] = {}
+    for node_data in flow_data["nodes"]:
+        node_id = node_data.get("id")
+        if not node_id:
+            logger.warning("노드 ID가 없는 노드를 건너뜁니다")
+            continue
+
+        node_type = resolve_node_type(node_data)
+        if not node_type:
+            logger.warning(f"노드 {node_id}의 타입을 찾을 수 없습니다")
+            continue
+
+        try:
+            component_class = get_component_class(node_type)
+            class_path = COMPONENT_REGISTRY[node_type]
+        except (ValueError, ImportError, AttributeError) as e:
+            logger.error(f"노드 {node_id} (타입: {node_type}) 컴포넌트 로드 실패: {e}")
+            # 기본 패스스루 노드로 대체
+            component_class, class_path = None, None
+
+        plan_nodes[node_id] = PlanNode(
+            node_id=node_id,
+            node_type=node_type,
+            class_path=class_path,
+            component_class=component_class,
+            node_data=node_data,
+            timeout=resolve_node_timeout(node_id, node_data)
+        )
+
+    edges: List[DAGEdge] = []
+    adjacency_list: Dict[str, List[str]] = defaultdict(list)
+    in_degree: Dict[str, int] = {node_id: 0 for node_id in plan_nodes}
+    for edge in flow_data.get("edges", []):
+        source, target = edge.get("source"), edge.get("target")
+        if source not in plan_nodes or target not in plan_nodes:
+            logger.warning(f"알 수 없는 노드를 잇는 엣지를 건너뜁니다: {edge}")
+            continue
+        edges.append(DAGEdge(
+            source=source,
+            target=target,
+            source_handle=edge.get("sourceHandle"),
+            target_handle=edge.get("targetHandle")
+        ))
+        adjacency_list[source].append(target)
+        in_degree[target] += 1
+
+    # 칸의 위상 정렬 알고리즘
+    queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    order: List[str] = []
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        for neighbor in adjacency_list[current]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(order) != len(plan_nodes):
+        raise RuntimeError(f"플로우에 순환 참조가 있습니다. 처리되지 않은 노드: {set(plan_nodes) - set(order)}")
+
+    return CompiledFlowPlan(
+        content_hash=content_hash or flow_content_hash(flow_data),
+        nodes=tuple(plan_nodes[node_id] for node_id in order),
+        edges=tuple(edges)
+    )
+
+
+class FlowPlanCache:
+    """(flow_id, 배포 버전, 내용 해시) 단위의 컴파일된 계획 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[PlanKey, CompiledFlowPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(
+        self,
+        flow_data: Dict[str, Any],
+        flow_id: Optional[str] = None,
+        version: Optional[str] = None
+    ) -> CompiledFlowPlan:
+        """
+        캐시된 계획을 반환하거나 컴파일하여 저장합니다.
+        flow_id가 없는 임시 플로우(/test-flow)는 내용 해시만으로 구분됩니다.
+        """
+        validate_flow_data(flow_data)
+        content_hash = flow_content_hash(flow_data)
+        key: PlanKey = (flow_id or "", version or "", content_hash)
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = compile_flow_plan(flow_data, content_hash=content_hash)
+        logger.info(f"플로우 실행 계획 컴파일: {flow_id or 'ad-hoc'} v{version or '-'} ({len(plan.nodes)}개 노드)")
+
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return plan
+
+    def invalidate_flow(self, flow_id: str) -> None:
+        """플로우의 모든 버전 계획을 제거합니다."""
+        with self._lock:
+            for key in [key for key in self._plans if key[0] == flow_id]:
+                del self._plans[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._plans), "hits": self.hits, "misses": self.misses}
+
+
+# 전역 실행 계획 캐시
+flow_plan_cache = FlowPlanCache(max_entries=settings.flow_plan_cache_max_entries)
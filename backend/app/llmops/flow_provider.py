@@ -7,7 +7,7 @@ Flow Studio의 flows와 publishes 테이블에서 데이터를 조회하고 권
 
 import json
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 try:
@@ -74,6 +74,26 @@ class FlowProvider:
         Returns:
             권한이 있는 경우 flow_data_snapshot JSON 데이터, 없으면 None
         """
+        published = await self.get_published_flow_with_version(flow_id, user_id, user_groups)
+        return published[0] if published else None
+    
+    async def get_published_flow_with_version(
+        self, 
+        flow_id: str, 
+        user_id: str, 
+        user_groups: List[str]
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        게시된 Flow 데이터와 배포 버전을 함께 가져옵니다 (실행 계획 캐시 키용).
+        
+        Args:
+            flow_id: 플로우 ID
+            user_id: 요청 사용자 ID
+            user_groups: 사용자 소속 그룹 ID 리스트
+            
+        Returns:
+            권한이 있는 경우 (flow_data_snapshot JSON 데이터, 배포 버전), 없으면 None
+        """
         try:
             async with get_async_session() as session:
                 # 가장 최신 PUBLISHED 상태의 플로우 조회
@@ -122,7 +142,7 @@ class FlowProvider:
                         flow_data = publish_record.flow_data_snapshot
                     
                     logger.info(f"플로우 데이터 조회 성공: {flow_id}")
-                    return flow_data
+                    return flow_data, str(getattr(publish_record, 'version', '') or publish_record.id)
                     
                 except json.JSONDecodeError as e:
                     logger.error(f"플로우 데이터 JSON 파싱 실패: {flow_id} - {e}")
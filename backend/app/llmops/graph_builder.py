@@ -52,7 +52,8 @@ except ImportError:
             intermediate = self.first.invoke(input_data)
             return self.second.invoke(intermediate)
 
-from .component_registry import get_component_class
+from .dag_executor import DAGExecutor
+from .flow_plan import CompiledFlowPlan, flow_plan_cache
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,13 @@ class GraphBuilder:
     노드 인스턴스화, 엣지 분석, 위상 정렬, 체인 연결을 담당
     """
     
-    def __init__(self, flow_data: Dict[str, Any]):
+    def __init__(
+        self,
+        flow_data: Dict[str, Any],
+        flow_id: Optional[str] = None,
+        version: Optional[str] = None,
+        plan: Optional[CompiledFlowPlan] = None
+    ):
         """
         GraphBuilder 초기화
         
@@ -77,8 +84,14 @@ class GraphBuilder:
                           "viewport": {...},
                           ...
                       }
+            flow_id: 플로우 ID (실행 계획 캐시 키, 임시 플로우는 None)
+            version: 배포 버전 (실행 계획 캐시 키)
+            plan: 이미 컴파일된 실행 계획 (있으면 컴파일과 캐시 조회를 건너뜀)
         """
         self.flow_data = flow_data
+        self.flow_id = flow_id
+        self.version = version
+        self.plan: Optional[CompiledFlowPlan] = plan
         self.built_nodes: Dict[str, Runnable] = {}
         self.node_metadata: Dict[str, Dict[str, Any]] = {}
         self.edges: List[Dict[str, Any]] = []
@@ -95,25 +108,21 @@ class GraphBuilder:
             최종 실행 가능한 Runnable 체인
             
         Raises:
-            ValueError: 플로우 데이터가 유효하지 않은 경우
-            RuntimeError: 체인 빌드 과정에서 오류가 발생한 경우
+            RuntimeError: 플로우 데이터가 유효하지 않거나 체인 빌드 과정에서 오류가 발생한 경우
         """
         try:
             logger.info("체인 빌드 프로세스 시작")
             
-            # 1. 플로우 데이터 검증
-            self._validate_flow_data()
+            # 1. 실행 계획 조회 (검증, 컴포넌트 클래스 로드, 엣지 분석, 위상 정렬은 캐시됨)
+            if self.plan is None:
+                self.plan = flow_plan_cache.get_or_compile(self.flow_data, self.flow_id, self.version)
+            self._load_plan()
             
             # 2. 노드 인스턴스화
             self._instantiate_nodes()
             
-            # 3. 엣지 분석 및 그래프 구조 생성
-            self._analyze_edges()
-            
-            # 4. 위상 정렬을 통한 실행 순서 결정
-            execution_order = self._topological_sort()
-            
-            # 5. 체인 연결
+            # 3. 체인 연결
+            execution_order = [node_id for node_id in self.plan.execution_order if node_id in self.built_nodes]
             final_chain = self._build_chain(execution_order)
             
             logger.info("체인 빌드 완료")
@@ -123,118 +132,39 @@ class GraphBuilder:
             logger.error(f"체인 빌드 실패: {e}")
             raise RuntimeError(f"체인을 빌드할 수 없습니다: {e}") from e
     
-    def _validate_flow_data(self) -> None:
-        """플로우 데이터의 유효성을 검증합니다."""
-        if not isinstance(self.flow_data, dict):
-            raise ValueError("flow_data는 딕셔너리여야 합니다")
-        
-        if "nodes" not in self.flow_data:
-            raise ValueError("flow_data에 'nodes' 키가 없습니다")
-        
-        if "edges" not in self.flow_data:
-            raise ValueError("flow_data에 'edges' 키가 없습니다")
+    def _load_plan(self) -> None:
+        """실행 계획으로부터 그래프 구조와 노드 메타데이터를 구성합니다."""
+        for node in self.plan.nodes:
+            self.in_degree.setdefault(node.node_id, 0)
+            self.node_metadata[node.node_id] = {
+                "type": node.node_type,
+                "position": node.node_data.get("position", {}),
+                "data": node.node_data.get("data", {})
+            }
         
-        nodes = self.flow_data["nodes"]
-        if not isinstance(nodes, list) or len(nodes) == 0:
-            raise ValueError("최소 하나 이상의 노드가 필요합니다")
+        self.edges = self.plan.edge_dicts()
+        for edge in self.plan.edges:
+            self.adjacency_list[edge.source].append(edge.target)
+            self.in_degree[edge.target] += 1
         
-        logger.info("플로우 데이터 검증 완료")
+        logger.info(f"실행 계획 로드 완료: {len(self.plan.nodes)}개 노드, {len(self.edges)}개 엣지")
     
     def _instantiate_nodes(self) -> None:
-        """모든 노드를 인스턴스화합니다."""
-        nodes = self.flow_data["nodes"]
-        
-        for node_data in nodes:
-            try:
-                # 노드 기본 정보 추출
-                node_id = node_data.get("id")
-                if not node_id:
-                    logger.warning("노드 ID가 없는 노드를 건너뜁니다")
-                    continue
-                
-                # 노드 타입 추출 - data.type을 우선 사용 (이미 올바른 형식)
-                node_data_obj = node_data.get("data", {})
-                
-                node_type = (
-                    node_data_obj.get("type") or  # 컴포넌트 타입 (ChatInput, Ollama 등) - 우선 사용
-                    node_data_obj.get("id") or  # 컴포넌트 ID (chat_input, ollama 등)
-                    node_data.get("type")  # React Flow 노드 타입 (fallback)
-                )
-                
-                # data.id를 사용하는 경우 PascalCase로 변환
-                if node_type and node_type == node_data_obj.get("id"):
-                    # 언더스코어를 제거하고 PascalCase로 변환 (chat_input -> ChatInput)
-                    if "_" in node_type:
-                        parts = node_type.split("_")
-                        node_type = "".join(word.capitalize() for word in parts)
-                        logger.info(f"노드 {node_id}: {node_data_obj.get('id')} -> {node_type}")
-                
-                if not node_type:
-                    logger.warning(f"노드 {node_id}의 타입을 찾을 수 없습니다")
-                    continue
-                
-                # 컴포넌트 클래스 가져오기
-                try:
-                    component_class = get_component_class(node_type)
-                except (ValueError, ImportError, AttributeError) as e:
-                    logger.error(f"노드 {node_id} (타입: {node_type}) 컴포넌트 로드 실패: {e}")
-                    # 기본 패스스루 노드로 대체
-                    self.built_nodes[node_id] = RunnablePassthrough()
-                    continue
-                
-                # 컴포넌트 인스턴스 생성
-                component_instance = component_class()
-                
-                # Runnable 객체 생성
-                runnable = component_instance.get_runnable(node_data)
-                
-                # 빌드된 노드에 저장
-                self.built_nodes[node_id] = runnable
-                
-                # 메타데이터 저장
-                self.node_metadata[node_id] = {
-                    "type": node_type,
-                    "position": node_data.get("position", {}),
-                    "data": node_data.get("data", {})
-                }
-                
-                logger.info(f"노드 인스턴스화 완료: {node_id} ({node_type})")
-                
-            except Exception as e:
-                logger.error(f"노드 인스턴스화 실패: {node_data.get('id', 'unknown')} - {e}")
+        """실행 계획의 모든 노드를 인스턴스화합니다."""
+        for node in self.plan.nodes:
+            if node.component_class is None:
+                # 컴포넌트를 로드할 수 없는 노드는 패스스루로 대체
+                self.built_nodes[node.node_id] = RunnablePassthrough()
                 continue
-        
-        logger.info(f"총 {len(self.built_nodes)}개 노드 인스턴스화 완료")
-    
-    def _analyze_edges(self) -> None:
-        """엣지를 분석하여 그래프 구조를 생성합니다."""
-        edges = self.flow_data.get("edges", [])
-        
-        for edge in edges:
+            
             try:
-                source = edge.get("source")
-                target = edge.get("target")
-                
-                if not source or not target:
-                    logger.warning(f"엣지에 source 또는 target이 없습니다: {edge}")
-                    continue
-                
-                # 그래프 구조 업데이트
-                self.adjacency_list[source].append(target)
-                self.in_degree[target] += 1
-                
-                # 진입 차수가 없는 노드들의 진입 차수를 0으로 초기화
-                if source not in self.in_degree:
-                    self.in_degree[source] = 0
-                
-                # 엣지 저장
-                self.edges.append(edge)
-                logger.debug(f"엣지 추가: {source} -> {target}")
-                
+                runnable = node.component_class().get_runnable(node.node_data)
+                self.built_nodes[node.node_id] = runnable
+                logger.info(f"노드 인스턴스화 완료: {node.node_id} ({node.node_type})")
             except Exception as e:
-                logger.error(f"엣지 처리 실패: {edge} - {e}")
+                logger.error(f"노드 인스턴스화 실패: {node.node_id} - {e}")
         
-        logger.info(f"총 {len(self.edges)}개 엣지 분석 완료")
+        logger.info(f"총 {len(self.built_nodes)}개 노드 인스턴스화 완료")
     
     def _topological_sort(self) -> List[str]:
         """
@@ -268,8 +198,8 @@ class GraphBuilder:
                     queue.append(neighbor)
         
         # 순환 참조 검사
-        if len(result) != len(self.built_nodes):
-            missing_nodes = set(self.built_nodes.keys()) - set(result)
+        if len(result) != len(in_degree_copy):
+            missing_nodes = set(in_degree_copy.keys()) - set(result)
             raise RuntimeError(f"플로우에 순환 참조가 있습니다. 처리되지 않은 노드: {missing_nodes}")
         
         logger.info(f"위상 정렬 완료: {' -> '.join(result)}")
@@ -289,159 +219,42 @@ class GraphBuilder:
             logger.warning("실행할 노드가 없습니다. 패스스루 체인을 반환합니다")
             return RunnablePassthrough()
         
-        # 🔍 데이터 흐름 추적 로그
-        logger.info("=== 데이터 흐름 추적 시작 ===")
-        logger.info(f"실행 순서: {' → '.join(execution_order)}")
-        
-        # 각 노드의 입력/출력 연결 정보 로깅
-        for i, node_id in enumerate(execution_order):
-            incoming_edges = [edge for edge in self.edges if edge.get('target') == node_id]
-            outgoing_edges = [edge for edge in self.edges if edge.get('source') == node_id]
-            
-            logger.info(f"노드 {i+1}: {node_id}")
-            input_connections = [f"{edge.get('source')}:{edge.get('sourceHandle', 'default')}" for edge in incoming_edges]
-            output_connections = [f"{edge.get('target')}:{edge.get('targetHandle', 'default')}" for edge in outgoing_edges]
-            logger.info(f"  ↳ 입력: {input_connections}")
-            logger.info(f"  ↳ 출력: {output_connections}")
-            
-            # 노드 메타데이터 로깅
-            node_meta = self.node_metadata.get(node_id, {})
-            logger.info(f"  ↳ 타입: {node_meta.get('type', 'unknown')}")
-            logger.info(f"  ↳ 위치: {node_meta.get('position', {})}")
-        
-        # 단일 노드인 경우
-        if len(execution_order) == 1:
-            node_id = execution_order[0]
-            logger.info(f"단일 노드 체인: {node_id}")
-            return self._create_instrumented_node(node_id, self.built_nodes[node_id])
+        # 🔍 데이터 흐름 추적 로그 (빌드 시 1회, DEBUG 레벨에서만 포맷팅)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"실행 순서: {' → '.join(execution_order)}")
+            for i, node_id in enumerate(execution_order):
+                input_connections = [f"{edge.get('source')}:{edge.get('sourceHandle') or 'default'}" for edge in self.edges if edge.get('target') == node_id]
+                output_connections = [f"{edge.get('target')}:{edge.get('targetHandle') or 'default'}" for edge in self.edges if edge.get('source') == node_id]
+                node_meta = self.node_metadata.get(node_id, {})
+                logger.debug(
+                    f"노드 {i+1}: {node_id} ({node_meta.get('type', 'unknown')}) "
+                    f"입력: {input_connections} 출력: {output_connections}"
+                )
         
-        # 다중 노드 체인 빌드
+        # DAG 실행기 (독립 분기 동시 실행, 핸들 기반 입력 라우팅, 노드별 타임아웃)
         try:
-            # 시작 노드 (진입 차수가 0인 노드들 중 첫 번째)
-            start_nodes = [node_id for node_id in execution_order if self.in_degree[node_id] == 0]
-            
-            if not start_nodes:
-                # 모든 노드가 연결된 경우, 첫 번째 노드를 시작점으로 사용
-                start_node_id = execution_order[0]
-            else:
-                start_node_id = start_nodes[0]
-            
-            logger.info(f"시작 노드: {start_node_id}")
-            
-            # 체인 빌드: 선형 체인으로 단순화
-            chain = self._create_instrumented_node(start_node_id, self.built_nodes[start_node_id])
-            
-            # 나머지 노드들을 순서대로 연결
-            for node_id in execution_order[1:]:
-                if node_id != start_node_id:
-                    next_runnable = self._create_instrumented_node(node_id, self.built_nodes[node_id])
-                    chain = chain | next_runnable
-            
-            logger.info(f"체인 빌드 완료: {len(execution_order)}개 노드 연결")
-            logger.info("=== 데이터 흐름 추적 완료 ===")
-            return chain
+            executor = DAGExecutor(
+                nodes={node_id: self.built_nodes[node_id] for node_id in execution_order},
+                edges=self.edges,
+                execution_order=execution_order,
+                timeouts=self.plan.timeouts,
+                flow_id=self.flow_id,
+                node_types={node_id: meta["type"] for node_id, meta in self.node_metadata.items()},
+                node_fields={
+                    node_id: meta["data"].get("fieldValues", {})
+                    for node_id, meta in self.node_metadata.items()
+                }
+            )
+
+            logger.info(f"시작 노드: {executor.start_nodes}, 결과 노드: {executor.output_node}")
+            logger.info(f"체인 빌드 완료: {len(execution_order)}개 노드 DAG 실행기 구성")
+            return executor
             
         except Exception as e:
             logger.error(f"체인 빌드 실패: {e}")
             # 폴백: 모든 노드를 단순 순차 실행
             return self._build_fallback_chain(execution_order)
     
-    def _create_instrumented_node(self, node_id: str, runnable: Runnable) -> Runnable:
-        """
-        노드 실행을 계측하는 래퍼를 생성합니다.
-        
-        Args:
-            node_id: 노드 ID
-            runnable: 원본 Runnable
-            
-        Returns:
-            계측된 Runnable
-        """
-        def instrumented_invoke(input_data: Any) -> Any:
-            """계측된 노드 실행 함수"""
-            try:
-                # 🔍 노드 실행 시작 로그
-                logger.info(f"🚀 노드 실행 시작: {node_id}")
-                logger.info(f"  ↳ 입력 데이터 타입: {type(input_data).__name__}")
-                
-                # 입력 데이터 상세 로깅
-                if isinstance(input_data, dict):
-                    logger.info(f"  ↳ 입력 키: {list(input_data.keys())}")
-                    for key, value in input_data.items():
-                        if isinstance(value, str) and len(value) > 100:
-                            logger.info(f"  ↳ {key}: {value[:100]}... ({len(value)} 문자)")
-                        else:
-                            logger.info(f"  ↳ {key}: {value}")
-                else:
-                    logger.info(f"  ↳ 입력 값: {str(input_data)[:200]}...")
-                
-                # 🔍 템플릿 바인딩 로그 (노드 메타데이터에서 템플릿 정보 추출)
-                node_meta = self.node_metadata.get(node_id, {})
-                node_data = node_meta.get('data', {})
-                field_values = node_data.get('fieldValues', {})
-                
-                # 템플릿이 있는 필드들 검사
-                template_fields = ['system_message', 'prompt', 'template', 'instruction']
-                for field_name in template_fields:
-                    if field_name in field_values:
-                        template_value = field_values[field_name]
-                        if isinstance(template_value, str) and '{' in template_value:
-                            logger.info(f"📝 템플릿 바인딩 감지: {node_id}.{field_name}")
-                            logger.info(f"  ↳ 원본 템플릿: {template_value}")
-                            
-                            # 변수 추출 (간단한 정규식 사용)
-                            import re
-                            variables = re.findall(r'{([^}]+)}', template_value)
-                            logger.info(f"  ↳ 감지된 변수: {variables}")
-                            
-                            # 변수 바인딩 시도
-                            if isinstance(input_data, dict):
-                                bound_template = template_value
-                                for var in variables:
-                                    if var in input_data:
-                                        value = input_data[var]
-                                        var_placeholder = "{" + var + "}"
-                                        bound_template = bound_template.replace(var_placeholder, str(value))
-                                        logger.info(f"  ↳ {var} = {value}")
-                                
-                                logger.info(f"  ↳ 바인딩된 템플릿: {bound_template}")
-                
-                # 원본 Runnable 실행
-                import time
-                start_time = time.time()
-                result = runnable.invoke(input_data)
-                end_time = time.time()
-                
-                # 🔍 노드 실행 완료 로그
-                execution_time_ms = int((end_time - start_time) * 1000)
-                logger.info(f"✅ 노드 실행 완료: {node_id} ({execution_time_ms}ms)")
-                logger.info(f"  ↳ 출력 데이터 타입: {type(result).__name__}")
-                
-                # 출력 데이터 상세 로깅
-                if isinstance(result, dict):
-                    logger.info(f"  ↳ 출력 키: {list(result.keys())}")
-                    for key, value in result.items():
-                        if isinstance(value, str) and len(value) > 100:
-                            logger.info(f"  ↳ {key}: {value[:100]}... ({len(value)} 문자)")
-                        else:
-                            logger.info(f"  ↳ {key}: {value}")
-                elif isinstance(result, str):
-                    if len(result) > 200:
-                        logger.info(f"  ↳ 출력: {result[:200]}... ({len(result)} 문자)")
-                    else:
-                        logger.info(f"  ↳ 출력: {result}")
-                else:
-                    logger.info(f"  ↳ 출력: {str(result)[:200]}...")
-                
-                return result
-                
-            except Exception as e:
-                logger.error(f"❌ 노드 실행 실패: {node_id} - {e}")
-                # 실행 실패 시 입력 데이터 그대로 반환
-                return input_data
-        
-        return RunnableLambda(instrumented_invoke)
-    
     def _build_fallback_chain(self, execution_order: List[str]) -> Runnable:
         """
         폴백 체인을 빌드합니다 (단순 순차 실행).
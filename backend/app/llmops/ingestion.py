@@ -0,0 +1,512 @@
+"""
+RAG 문서 수집 파이프라인
+
+업로드된 파일을 단계별로 처리합니다:
+
+1. 추출: 텍스트 추출 + 청킹을 프로세스 풀에서 실행 (pdfplumber / OCR이 API 이벤트 루프를 막지 않음)
+   - PDF는 페이지 범위로 나눠 여러 프로세스에서 동시에 추출하고, 청크마다 출처 페이지를 메타데이터로 남김
+2. 대기열: 추출이 끝난 파일은 크기가 제한된 asyncio.Queue에 들어감
+   - 임베딩이 밀리면 put이 막혀 추출도 멈춤 (백프레셔) -> 메모리에는 최대 (추출 동시성 + 대기열 크기)개 파일의 청크만 존재
+3. 임베딩 + upsert: 청크 메타데이터를 배치 단위로 생성하는 제너레이터로 순회하며 ChromaDB에 upsert
+
+청크 ID는 원본 파일명과 청크 텍스트의 해시이므로 같은 파일을 다시 올리면 바뀌지 않은 청크는 다시 임베딩하지 않으며 (이미 있는 ID는 메타데이터만 갱신),
+DocumentManifest가 주어지면 파일 해시가 같은 파일은 추출부터 건너뛰고 (파일명만 다른 사본은 저장된 임베딩을 복사),
+바뀐 파일은 더 이상 참조되지 않는 청크를, 실패한 파일은 저장하다 만 청크를 삭제합니다.
+IngestionItem.resume_from 이후 청크만 처리해 중단된 수집을 이어서 진행할 수 있습니다.
+파일별 진행 상황은 FileProgress로 추적하고 on_progress 콜백으로 전달합니다.
+"""
+
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..config import settings
+from ..services.chroma_service import ChromaService
+from ..services.document_extraction import (
+    count_pdf_pages,
+    extract_and_split,
+    extract_pdf_pages,
+    get_file_type,
+    hash_file,
+    pdf_page_ranges,
+    split_pdf_pages,
+)
+from .document_manifest import DocumentManifest, is_chunk_id, make_chunk_id
+
+logger = logging.getLogger(__name__)
+
+
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """텍스트 추출 프로세스 풀 (최초 사용 시 생성)"""
+    global _extraction_pool
+    if _extraction_pool is None:
+        max_workers = settings.rag_extract_workers or min(4, os.cpu_count() or 1)
+        # API 프로세스는 스레드를 사용하므로 fork 대신 spawn으로 자식 프로세스 생성
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"Text extraction process pool started ({max_workers} workers)")
+    return _extraction_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """추출 프로세스 풀 종료"""
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        _extraction_pool = None
+
+
+def _reset_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """자식 프로세스가 비정상 종료돼 깨진 풀은 버리고 다음 요청에서 새로 생성"""
+    global _extraction_pool
+    if _extraction_pool is pool:
+        _extraction_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class IngestionItem:
+    """수집할 파일 하나 (FileStorageService.save_uploaded_file 결과 기반)"""
+
+    def __init__(self, file_info: Dict[str, Any], uploaded_by: str, resume_from: int = 0):
+        self.file_info = file_info
+        self.uploaded_by = uploaded_by
+        self.resume_from = resume_from  # 이미 저장된 청크 수 (이어서 처리)
+
+    @property
+    def filename(self) -> str:
+        return self.file_info["original_filename"]
+
+    @property
+    def stored_filename(self) -> str:
+        return self.file_info["stored_filename"]
+
+    @property
+    def source_key(self) -> str:
+        """매니페스트에서 같은 문서로 취급하는 기준 (원본 파일명)"""
+        return self.file_info["original_filename"]
+
+
+class FileProgress:
+    """파일별 수집 진행 상황"""
+
+    def __init__(self, item: IngestionItem):
+        self.filename = item.filename
+        self.stored_filename = item.stored_filename
+        self.status = "queued"  # queued | extracting | embedding | completed | unchanged | failed
+        self.file_hash: Optional[str] = None
+        self.chunks_total: Optional[int] = None
+        self.chunks_done = item.resume_from
+        self.chunks_written = 0  # 이번 실행에서 컬렉션에 새로 저장한 청크 수 (임베딩 또는 사본 복사)
+        self.chunks_skipped = 0  # 이미 컬렉션에 있어 임베딩을 건너뛴 청크 수
+        self.chunks_deleted = 0  # 파일 변경으로 더 이상 참조되지 않아 삭제한 청크 수
+        self.pages: Optional[int] = None  # PDF 페이지 수
+        self.ocr_pages: Optional[int] = None  # 텍스트 레이어가 없어 OCR한 페이지 수
+        self.obsolete_file_path: Optional[str] = None  # 더 이상 필요 없는 저장 파일 (재업로드 사본, 이전 버전)
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "stored_filename": self.stored_filename,
+            "status": self.status,
+            "chunks_total": self.chunks_total,
+            "chunks_done": self.chunks_done,
+            "chunks_written": self.chunks_written,
+            "chunks_skipped": self.chunks_skipped,
+            "chunks_deleted": self.chunks_deleted,
+            "pages": self.pages,
+            "ocr_pages": self.ocr_pages,
+            "error": self.error,
+            "elapsed_seconds": round((self.finished_at or time.monotonic()) - self.started_at, 3) if self.started_at else None
+        }
+
+
+ProgressCallback = Callable[[FileProgress], Union[None, Awaitable[None]]]
+
+
+class IngestionPipeline:
+    """추출 -> 청킹 -> 임베딩/upsert 단계형 수집 파이프라인"""
+
+    def __init__(
+        self,
+        chroma_service: ChromaService,
+        chroma_collection,
+        namespace: str,
+        manifest: Optional[DocumentManifest] = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        on_progress: Optional[ProgressCallback] = None,
+        extract_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None
+    ):
+        """
+        Args:
+            chroma_service: 임베딩 + upsert에 사용할 ChromaService
+            chroma_collection: 대상 ChromaDB 컬렉션 (ChromaService.get_chroma_collection 결과)
+            namespace: 청크 ID 해시에 포함하는 데이터소스 식별자
+            manifest: 데이터소스 매니페스트 (없으면 파일 단위 건너뛰기/고아 청크 삭제를 하지 않음)
+            on_progress: 파일 상태가 바뀌거나 배치가 저장될 때마다 호출 (동기/비동기 모두 가능)
+            extract_concurrency: 동시에 추출하는 파일 수 (기본: 추출 프로세스 수)
+            batch_size: 임베딩 + upsert 한 번에 처리하는 청크 수
+            queue_size: 추출이 끝나 임베딩을 기다리는 파일 수 상한
+        """
+        self.chroma_service = chroma_service
+        self.chroma_collection = chroma_collection
+        self.namespace = namespace
+        self.manifest = manifest
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.on_progress = on_progress
+        self.extract_concurrency = extract_concurrency or settings.rag_extract_workers or min(4, os.cpu_count() or 1)
+        self.batch_size = batch_size or settings.rag_ingest_batch_size
+        self.queue_size = queue_size or settings.rag_ingest_queue_size
+
+    async def _notify(self, progress: FileProgress) -> None:
+        if self.on_progress is None:
+            return
+        try:
+            result = self.on_progress(progress)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Ingestion progress callback failed for {progress.filename}: {str(e)}")
+
+    async def _fail(self, progress: FileProgress, error: str) -> None:
+        progress.status = "failed"
+        progress.error = error
+        progress.finished_at = time.monotonic()
+        logger.error(f"Failed to process file {progress.filename}: {error}")
+        await self._notify(progress)
+
+    async def _extract(self, item: IngestionItem) -> Dict[str, Any]:
+        pool = get_extraction_pool()
+        loop = asyncio.get_running_loop()
+        file_path = item.file_info["file_path"]
+        try:
+            if get_file_type(item.filename) == 'pdf':
+                page_count = await loop.run_in_executor(pool, count_pdf_pages, file_path)
+                ranges = pdf_page_ranges(page_count, settings.rag_pdf_pages_per_task)
+                if len(ranges) > 1:
+                    # 페이지 범위마다 따로 제출해 여러 추출 프로세스가 한 문서를 나눠 처리
+                    results = await asyncio.gather(*(
+                        loop.run_in_executor(pool, extract_pdf_pages, file_path, first_page, last_page)
+                        for first_page, last_page in ranges
+                    ))
+                    pages = [page for result in results for page in result]
+                    return await loop.run_in_executor(
+                        pool, split_pdf_pages, pages, self.chunk_size, self.chunk_overlap
+                    )
+
+            return await loop.run_in_executor(
+                pool,
+                extract_and_split,
+                file_path,
+                item.filename,
+                self.chunk_size,
+                self.chunk_overlap
+            )
+        except BrokenProcessPool:
+            _reset_broken_pool(pool)
+            raise Exception("텍스트 추출 프로세스가 비정상 종료되었습니다.")
+
+    async def _produce(
+        self,
+        item: IngestionItem,
+        progress: FileProgress,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue
+    ) -> None:
+        async with semaphore:
+            progress.started_at = time.monotonic()
+            try:
+                progress.file_hash = await asyncio.to_thread(hash_file, item.file_info["file_path"])
+                if self.manifest is not None and await self._reuse_indexed(item, progress):
+                    return
+            except Exception as e:
+                await self._fail(progress, str(e))
+                return
+
+            progress.status = "extracting"
+            await self._notify(progress)
+            try:
+                extracted = await self._extract(item)
+            except Exception as e:
+                await self._fail(progress, str(e))
+                return
+
+            if not extracted["chunks"]:
+                await self._fail(progress, "파일에서 텍스트를 추출할 수 없습니다.")
+                return
+
+            if "page_count" in extracted:
+                progress.pages = extracted["page_count"]
+                progress.ocr_pages = extracted["ocr_pages"]
+                logger.info(
+                    f"Extracted {progress.pages} pages from {item.filename} ({progress.ocr_pages} via OCR) "
+                    f"in {time.monotonic() - progress.started_at:.2f}s"
+                )
+
+            # 대기열이 가득 차면 세마포어를 쥔 채 대기 -> 다음 파일 추출도 멈춤 (백프레셔)
+            await queue.put((item, progress, extracted["chunks"], extracted.get("chunk_pages")))
+
+    async def _reuse_indexed(self, item: IngestionItem, progress: FileProgress) -> bool:
+        """
+        같은 내용이 이미 색인돼 있으면 추출/임베딩 없이 완료 처리
+
+        같은 파일명의 이전 버전 또는 파일명만 다른 사본의 해시가 같고, 매니페스트의 청크가 컬렉션에 모두 있을 때만 재사용
+        """
+        entry = self.manifest.get(item.source_key)
+        if entry is None or entry.file_hash != progress.file_hash:
+            entry = self.manifest.find_by_hash(progress.file_hash)
+        if entry is None:
+            return False
+
+        chunk_ids = list(entry.chunk_ids or [])
+        present = await self.chroma_service.existing_ids(self.chroma_collection, chunk_ids)
+        if len(present) != len(chunk_ids):
+            # 매니페스트와 컬렉션이 어긋남 (개별 청크 삭제 등) -> 다시 색인
+            logger.warning(f"Manifest for {entry.source_key} is out of sync with the collection, re-indexing {item.filename}")
+            return False
+
+        if entry.source_key == item.source_key:
+            # 같은 파일 재업로드: 새로 저장된 사본만 정리
+            if entry.file_path != item.file_info["file_path"]:
+                progress.obsolete_file_path = item.file_info["file_path"]
+            progress.chunks_skipped = len(chunk_ids)
+            logger.info(f"Skipped unchanged file {item.filename} ({len(chunk_ids)} chunks already indexed)")
+        else:
+            # 파일명만 다른 사본: 저장된 임베딩을 이 파일의 청크로 복사 (출처 메타데이터는 파일마다 따로 유지)
+            chunk_ids = await self._copy_chunks(item, progress, chunk_ids)
+            await self._record(item, progress, chunk_ids)
+            logger.info(f"Copied {len(chunk_ids)} indexed chunks of {entry.source_key} to {item.filename} without re-embedding")
+
+        progress.status = "unchanged"
+        progress.chunks_total = len(chunk_ids)
+        progress.chunks_done = len(chunk_ids)
+        progress.finished_at = time.monotonic()
+        await self._notify(progress)
+        return True
+
+    async def _copy_chunks(self, item: IngestionItem, progress: FileProgress, source_ids: List[str]) -> List[str]:
+        """다른 파일의 청크를 이 파일의 청크 ID/메타데이터로 복사하고 새 ID 목록 반환"""
+        stored = await self.chroma_service.get_chunks(self.chroma_collection, source_ids)
+        documents = list(stored.get("documents") or [])
+        file_metadata = self.file_metadata(item)
+        metadatas = [{**(metadata or {}), **file_metadata} for metadata in stored.get("metadatas") or []]
+        ids = [make_chunk_id(self.namespace, item.source_key, document) for document in documents]
+        await self._write_batch(progress, documents, metadatas, ids, stored.get("embeddings"))
+        return ids
+
+    async def _record(self, item: IngestionItem, progress: FileProgress, chunk_ids: List[str]) -> None:
+        """매니페스트에 색인 결과를 기록하고 더 이상 참조되지 않는 청크 삭제"""
+        first_index = self.manifest.get(item.source_key) is None
+        orphans, progress.obsolete_file_path = await self.manifest.record(
+            item.source_key, progress.file_hash, chunk_ids, item.stored_filename, item.file_info["file_path"]
+        )
+        await self._delete_orphans(progress, orphans)
+        if first_index:
+            await self._delete_legacy_chunks(item, progress)
+
+    async def _delete_orphans(self, progress: FileProgress, orphans: List[str]) -> None:
+        if orphans:
+            await self.chroma_service.delete_ids(self.chroma_collection, orphans)
+            progress.chunks_deleted += len(orphans)
+
+    async def _discard_partial(self, item: IngestionItem, progress: FileProgress, chunk_ids: List[str]) -> None:
+        """
+        실패한 파일이 저장하다 만 청크 삭제
+
+        매니페스트에 기록되지 않아 이후 정리/건너뛰기 대상이 되지 않으므로 검색되지 않도록 지움
+        (이전 버전 매니페스트가 참조하는 바뀌지 않은 청크는 유지)
+        """
+        partial = [chunk_id for chunk_id in chunk_ids if not self.manifest.is_referenced(chunk_id)]
+        if not partial:
+            return
+        try:
+            await self.chroma_service.delete_ids(self.chroma_collection, partial)
+            progress.chunks_deleted += len(partial)
+            logger.info(f"Removed {len(partial)} partially stored chunks of failed file {item.filename}")
+        except Exception as e:
+            logger.warning(f"Failed to remove partial chunks of {item.filename}: {str(e)}")
+
+    async def _delete_legacy_chunks(self, item: IngestionItem, progress: FileProgress) -> None:
+        """
+        매니페스트 도입 전 같은 파일명으로 저장된 청크 ("{filename}_{i}_{uuid}" ID) 삭제
+
+        매니페스트 항목이 없는 파일명의 첫 색인에서만 호출되며, 새 청크가 모두 저장된 뒤 이전 버전을 대체함
+        """
+        ids = await self.chroma_service.ids_where(self.chroma_collection, {"filename": item.source_key})
+        legacy_ids = [chunk_id for chunk_id in ids if not is_chunk_id(chunk_id)]
+        if legacy_ids:
+            await self.chroma_service.delete_ids(self.chroma_collection, legacy_ids)
+            progress.chunks_deleted += len(legacy_ids)
+            logger.info(f"Removed {len(legacy_ids)} pre-manifest chunks of {item.source_key}")
+
+    @staticmethod
+    def file_metadata(item: IngestionItem) -> Dict[str, Any]:
+        """청크 메타데이터 중 파일 단위 필드"""
+        file_info = item.file_info
+        return {
+            "filename": item.filename,
+            "stored_filename": item.stored_filename,
+            "uploaded_by": item.uploaded_by,
+            "upload_time": file_info.get("upload_time") or datetime.now().isoformat(),
+            "file_size": file_info["file_size"],
+            "file_type": get_file_type(item.filename),
+            "storage_path": file_info["relative_path"],
+            "original_file_path": file_info["file_path"]
+        }
+
+    def iter_batches(
+        self,
+        item: IngestionItem,
+        chunks: List[str],
+        chunk_ids: List[str],
+        positions: List[int],
+        chunk_pages: Optional[List[Tuple[int, int]]] = None
+    ) -> Iterator[Tuple[List[str], List[Dict[str, Any]], List[str]]]:
+        """
+        resume_from 이후 청크를 (documents, metadatas, ids) 배치로 생성
+
+        positions는 파일 안에서 중복을 제거한 청크 번호 목록이며,
+        메타데이터는 배치마다 만들어 파일 전체 청크의 dict를 한 번에 들고 있지 않음
+        chunk_pages가 있으면 (PDF) 청크가 시작/끝나는 페이지를 page_number / page_end로 기록
+        """
+        total_chunks = len(chunks)
+        file_metadata = self.file_metadata(item)
+
+        for start in range(item.resume_from, len(positions), self.batch_size):
+            documents, metadatas, ids = [], [], []
+            for i in positions[start:start + self.batch_size]:
+                documents.append(chunks[i])
+                metadata = {**file_metadata, "chunk_index": i, "total_chunks": total_chunks}
+                if chunk_pages is not None:
+                    metadata["page_number"], metadata["page_end"] = chunk_pages[i]
+                metadatas.append(metadata)
+                ids.append(chunk_ids[i])
+            yield documents, metadatas, ids
+
+    async def _write_batch(
+        self,
+        progress: FileProgress,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: Optional[List[Any]] = None
+    ) -> None:
+        """
+        새 청크만 임베딩 + upsert, 이미 있는 청크는 메타데이터만 갱신
+
+        청크 ID가 파일 단위라 이미 있는 청크는 같은 파일의 이전 버전이므로 메타데이터를 덮어써도 됨
+        embeddings가 주어지면 (사본 복사) 다시 임베딩하지 않고 그대로 저장
+        """
+        existing = await self.chroma_service.existing_ids(self.chroma_collection, ids)
+        new = [k for k, chunk_id in enumerate(ids) if chunk_id not in existing]
+        kept = [k for k, chunk_id in enumerate(ids) if chunk_id in existing]
+
+        if new and embeddings is not None:
+            await self.chroma_service.upsert_embedded(
+                self.chroma_collection,
+                [documents[k] for k in new],
+                [metadatas[k] for k in new],
+                [ids[k] for k in new],
+                [embeddings[k] for k in new]
+            )
+        elif new:
+            await self.chroma_service.upsert_batch(
+                self.chroma_collection,
+                [documents[k] for k in new],
+                [metadatas[k] for k in new],
+                [ids[k] for k in new]
+            )
+        if kept:
+            await self.chroma_service.update_metadatas(
+                self.chroma_collection,
+                [ids[k] for k in kept],
+                [metadatas[k] for k in kept]
+            )
+
+        progress.chunks_done += len(ids)
+        progress.chunks_written += len(new)
+        progress.chunks_skipped += len(kept)
+
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            item, progress, chunks, chunk_pages = entry
+            chunk_ids: List[str] = []
+            positions: List[int] = []
+            try:
+                chunk_ids = [make_chunk_id(self.namespace, item.source_key, chunk) for chunk in chunks]
+                # 파일 안에서 같은 내용의 청크는 첫 번째만 저장
+                first_position = {}
+                for i, chunk_id in enumerate(chunk_ids):
+                    first_position.setdefault(chunk_id, i)
+                positions = sorted(first_position.values())
+
+                progress.status = "embedding"
+                progress.chunks_total = len(positions)
+                await self._notify(progress)
+                for documents, metadatas, ids in self.iter_batches(item, chunks, chunk_ids, positions, chunk_pages):
+                    await self._write_batch(progress, documents, metadatas, ids)
+                    await self._notify(progress)
+
+                if self.manifest is not None:
+                    await self._record(item, progress, [chunk_ids[i] for i in positions])
+            except Exception as e:
+                if self.manifest is not None:
+                    await self._discard_partial(item, progress, [chunk_ids[i] for i in positions[:progress.chunks_done]])
+                await self._fail(progress, f"임베딩 저장 실패: {str(e)}")
+                continue
+
+            progress.status = "completed"
+            progress.finished_at = time.monotonic()
+            logger.info(
+                f"Processed file {item.filename}: {progress.chunks_total} chunks "
+                f"({progress.chunks_written} embedded, {progress.chunks_skipped} reused, "
+                f"{progress.chunks_deleted} removed), stored as {item.stored_filename}"
+            )
+            await self._notify(progress)
+
+    async def run(self, items: List[IngestionItem]) -> List[FileProgress]:
+        """파일 목록을 수집하고 파일별 진행 결과를 반환 (실패한 파일은 status="failed")"""
+        progresses = [FileProgress(item) for item in items]
+        if not items:
+            return progresses
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        semaphore = asyncio.Semaphore(self.extract_concurrency)
+        consumer = asyncio.create_task(self._consume(queue))
+        producers = [
+            asyncio.create_task(self._produce(item, progress, semaphore, queue))
+            for item, progress in zip(items, progresses)
+        ]
+
+        try:
+            await asyncio.gather(*producers)
+            await queue.put(None)
+            await consumer
+        finally:
+            # 요청 취소 등으로 중단되면 남은 단계 정리 (추출 프로세스에서 실행 중인 작업은 결과만 버려짐)
+            for task in producers + [consumer]:
+                if not task.done():
+                    task.cancel()
+
+        return progresses
@@ -0,0 +1,394 @@
+"""
+RAG 문서 수집 작업 처리기
+
+업로드 API는 파일을 저장하고 rag_ingestion_jobs에 작업을 등록만 하며,
+API 프로세스마다 실행되는 IngestionJobRunner 워커가 작업을 가져가 IngestionPipeline으로 처리합니다.
+
+- 대기열은 PostgreSQL 테이블: SELECT ... FOR UPDATE SKIP LOCKED로 가져가므로 별도 브로커 없이 여러 프로세스가 공유
+- 처리 중에는 heartbeat_at을 주기적으로 갱신하고, 갱신이 끊긴 RUNNING 작업(프로세스 재시작 등)은 다른 워커가 다시 가져감
+  (점유를 잃은 워커는 처리를 중단하고 작업 상태는 새 소유 워커에게 맡김)
+- 파일별 chunks_done부터 이어서 처리하므로 재시도해도 이미 저장된 청크를 다시 임베딩하지 않음
+- 파일/청크 진행 상황과 datasource.document_count는 배치가 저장될 때마다 갱신
+- DB 접근은 모두 asyncio.to_thread에서 짧은 세션으로 수행해 API 이벤트 루프를 막지 않음
+- 같은 데이터소스의 작업은 한 번에 하나만 처리 (DocumentManifest 갱신 직렬화)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import aliased, joinedload, selectinload
+
+from ..config import settings
+from ..database import SessionLocal
+from .ingestion import FileProgress, IngestionItem
+from .models import IngestionJobStatus, RAGDataSource, RAGIngestionFile, RAGIngestionJob
+
+logger = logging.getLogger(__name__)
+
+FINISHED_FILE_STATUSES = ("completed", "unchanged", "failed")
+
+
+class IngestionJobRunner:
+    """PostgreSQL 기반 수집 작업 대기열 워커"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        poll_seconds: float = 5.0,
+        stale_seconds: int = 120,
+        max_attempts: int = 3
+    ):
+        """
+        Args:
+            workers: 동시에 처리하는 작업 수
+            poll_seconds: 대기열이 비었을 때 다시 조회하는 주기 (다른 프로세스가 등록한 작업 감지)
+            stale_seconds: heartbeat가 이 시간 이상 끊긴 RUNNING 작업은 다시 가져감
+            max_attempts: 작업 최대 처리 시도 횟수 (초과 시 FAILURE)
+        """
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.max_attempts = max_attempts
+        self.heartbeat_seconds = max(1.0, stale_seconds / 4)
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """워커 시작 (이벤트 루프 안에서 호출)"""
+        if self._tasks or self.workers <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(f"{self.worker_prefix}:{index}"))
+            for index in range(self.workers)
+        ]
+        logger.info(f"Ingestion job runner started ({self.workers} workers)")
+
+    def notify(self) -> None:
+        """새 작업 등록 알림 (같은 프로세스의 워커를 폴링 주기 전에 깨움)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def shutdown(self) -> None:
+        """워커 종료 (처리 중이던 작업은 QUEUED로 되돌려 재시작 후 이어서 처리)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _worker_loop(self, worker_id: str) -> None:
+        while True:
+            try:
+                job_id = await asyncio.to_thread(self._claim_job, worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to claim ingestion job ({worker_id}): {str(e)}")
+                job_id = None
+
+            if job_id is None:
+                await self._wait_for_work()
+                continue
+
+            await self._process_job(job_id, worker_id)
+
+    async def _wait_for_work(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _claim_job(self, worker_id: str):
+        """대기 중이거나 heartbeat가 끊긴 작업 하나를 가져감 (블로킹 - 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            while True:
+                stale_before = func.now() - timedelta(seconds=self.stale_seconds)
+                # 같은 데이터소스에서 처리 중인 작업이 있으면 건너뜀 (매니페스트 갱신을 데이터소스 단위로 직렬화)
+                running = aliased(RAGIngestionJob)
+                datasource_busy = db.query(running.id).filter(
+                    running.datasource_id == RAGIngestionJob.datasource_id,
+                    running.id != RAGIngestionJob.id,
+                    running.status == IngestionJobStatus.RUNNING,
+                    running.heartbeat_at >= stale_before
+                ).exists()
+
+                job = db.query(RAGIngestionJob).filter(
+                    or_(
+                        RAGIngestionJob.status == IngestionJobStatus.QUEUED,
+                        and_(
+                            RAGIngestionJob.status == IngestionJobStatus.RUNNING,
+                            RAGIngestionJob.heartbeat_at < stale_before
+                        )
+                    ),
+                    ~datasource_busy
+                ).order_by(RAGIngestionJob.created_at).with_for_update(skip_locked=True).first()
+
+                if job is None:
+                    db.rollback()
+                    return None
+
+                if job.attempts >= self.max_attempts:
+                    job.status = IngestionJobStatus.FAILURE
+                    job.error_message = job.error_message or f"최대 처리 시도 횟수({self.max_attempts})를 초과했습니다."
+                    job.locked_by = None
+                    job.completed_at = func.now()
+                    db.commit()
+                    logger.error(f"Ingestion job {job.id} gave up after {job.attempts} attempts")
+                    continue
+
+                # 동시에 가져간 같은 데이터소스의 다른 작업과 경합하지 않도록 데이터소스 행을 잠근 뒤 다시 확인
+                datasource_locked = db.query(RAGDataSource.id).filter(
+                    RAGDataSource.id == job.datasource_id
+                ).with_for_update(skip_locked=True).first()
+                if datasource_locked is None or db.query(running.id).filter(
+                    running.datasource_id == job.datasource_id,
+                    running.id != job.id,
+                    running.status == IngestionJobStatus.RUNNING,
+                    running.heartbeat_at >= stale_before
+                ).first() is not None:
+                    db.rollback()
+                    return None
+
+                if job.status == IngestionJobStatus.RUNNING:
+                    logger.warning(f"Reclaiming stale ingestion job {job.id} from {job.locked_by}")
+                job.status = IngestionJobStatus.RUNNING
+                job.attempts += 1
+                job.locked_by = worker_id
+                job.locked_at = func.now()
+                job.heartbeat_at = func.now()
+                if job.started_at is None:
+                    job.started_at = func.now()
+                job_id = job.id
+                db.commit()
+                return job_id
+        finally:
+            db.close()
+
+    def _touch_job(self, job_id, worker_id: str) -> bool:
+        """heartbeat 갱신 (작업 점유를 잃었으면 False)"""
+        db = SessionLocal()
+        try:
+            updated = db.query(RAGIngestionJob).filter(
+                RAGIngestionJob.id == job_id,
+                RAGIngestionJob.locked_by == worker_id
+            ).update({RAGIngestionJob.heartbeat_at: func.now()}, synchronize_session=False)
+            db.commit()
+            return updated > 0
+        finally:
+            db.close()
+
+    async def _heartbeat_loop(self, job_id, worker_id: str, job_task: asyncio.Task) -> None:
+        """
+        OCR 등으로 배치 저장 사이가 길어도 작업이 stale로 보이지 않도록 별도로 갱신
+
+        점유를 잃으면 (stale로 판단돼 다른 워커가 가져감) 같은 데이터소스/매니페스트를 동시에 쓰지 않도록
+        처리 태스크를 취소하고 종료함
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                owned = await asyncio.to_thread(self._touch_job, job_id, worker_id)
+            except Exception as e:
+                logger.warning(f"Ingestion job heartbeat failed for {job_id}: {str(e)}")
+                continue
+            if not owned:
+                logger.warning(f"Ingestion job {job_id} is no longer owned by {worker_id}, stopping")
+                job_task.cancel()
+                return
+
+    def _requeue_job(self, job_id, worker_id: str, error: Optional[str] = None) -> None:
+        """처리를 끝내지 못한 작업을 대기열로 되돌림"""
+        db = SessionLocal()
+        try:
+            db.query(RAGIngestionJob).filter(
+                RAGIngestionJob.id == job_id,
+                RAGIngestionJob.locked_by == worker_id
+            ).update({
+                RAGIngestionJob.status: IngestionJobStatus.QUEUED,
+                RAGIngestionJob.locked_by: None,
+                RAGIngestionJob.error_message: error
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def _process_job(self, job_id, worker_id: str) -> None:
+        job_task = asyncio.create_task(self._run_job(job_id, worker_id))
+        heartbeat = asyncio.create_task(self._heartbeat_loop(job_id, worker_id, job_task))
+        try:
+            await job_task
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled():
+                # 점유를 잃어 중단: 작업 상태는 새로 가져간 워커가 관리하므로 바꾸지 않음
+                logger.warning(f"Stopped ingestion job {job_id} on {worker_id} after losing its claim")
+                return
+            await asyncio.shield(asyncio.to_thread(self._requeue_job, job_id, worker_id))
+            raise
+        except Exception as e:
+            logger.error(f"Ingestion job {job_id} failed: {str(e)}")
+            try:
+                await asyncio.to_thread(self._requeue_job, job_id, worker_id, str(e))
+            except Exception as requeue_error:
+                logger.error(f"Failed to requeue ingestion job {job_id}: {str(requeue_error)}")
+        finally:
+            heartbeat.cancel()
+
+    def _load_job(self, job_id) -> Optional[RAGIngestionJob]:
+        """작업을 파일/데이터소스와 함께 읽어 세션에서 분리 (블로킹 - 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            job = db.query(RAGIngestionJob).options(
+                selectinload(RAGIngestionJob.files),
+                joinedload(RAGIngestionJob.datasource)
+            ).filter(RAGIngestionJob.id == job_id).first()
+            if job is not None:
+                db.expunge_all()
+            return job
+        finally:
+            db.close()
+
+    def _save_progress(
+        self,
+        job: RAGIngestionJob,
+        row: RAGIngestionFile,
+        worker_id: str,
+        count_delta: int
+    ) -> bool:
+        """
+        파일/작업 진행 상황 저장 (블로킹 - 스레드에서 호출)
+
+        작업/파일 행은 점유 중일 때만 갱신하고 (False 반환 시 점유를 잃음),
+        문서 수는 청크가 이미 컬렉션에 저장됐으므로 점유 여부와 상관없이 반영
+        """
+        db = SessionLocal()
+        try:
+            owned = db.query(RAGIngestionJob).filter(
+                RAGIngestionJob.id == job.id,
+                RAGIngestionJob.locked_by == worker_id
+            ).update({
+                RAGIngestionJob.total_chunks: job.total_chunks,
+                RAGIngestionJob.processed_chunks: job.processed_chunks,
+                RAGIngestionJob.processed_files: job.processed_files,
+                RAGIngestionJob.failed_files: job.failed_files,
+                RAGIngestionJob.heartbeat_at: func.now()
+            }, synchronize_session=False) > 0
+            if owned:
+                db.query(RAGIngestionFile).filter(RAGIngestionFile.id == row.id).update({
+                    RAGIngestionFile.status: row.status,
+                    RAGIngestionFile.chunks_total: row.chunks_total,
+                    RAGIngestionFile.chunks_done: row.chunks_done,
+                    RAGIngestionFile.error_message: row.error_message
+                }, synchronize_session=False)
+            if count_delta:
+                # 같은 데이터소스의 다른 작업과 겹쳐도 안전하도록 SQL에서 더함
+                db.query(RAGDataSource).filter(RAGDataSource.id == job.datasource_id).update({
+                    RAGDataSource.document_count: RAGDataSource.document_count + count_delta,
+                    RAGDataSource.last_updated: func.now()
+                }, synchronize_session=False)
+            db.commit()
+            return owned
+        finally:
+            db.close()
+
+    def _finish_job(self, job_id, worker_id: str, status: IngestionJobStatus, error: Optional[str]) -> None:
+        """작업 완료 처리 (블로킹 - 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            db.query(RAGIngestionJob).filter(
+                RAGIngestionJob.id == job_id,
+                RAGIngestionJob.locked_by == worker_id
+            ).update({
+                RAGIngestionJob.status: status,
+                RAGIngestionJob.error_message: error,
+                RAGIngestionJob.locked_by: None,
+                RAGIngestionJob.completed_at: func.now()
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def _run_job(self, job_id, worker_id: str) -> None:
+        from .rag_service import RAGDataSourceService
+
+        job = await asyncio.to_thread(self._load_job, job_id)
+        if job is None:
+            return
+        datasource = job.datasource
+
+        # 세션에서 분리된 행을 메모리에서 갱신하고, 저장은 _save_progress가 스레드에서 수행
+        rows: Dict[str, RAGIngestionFile] = {
+            row.stored_filename: row for row in job.files if row.status not in FINISHED_FILE_STATUSES
+        }
+        items = [
+            IngestionItem(row.to_file_info(), uploaded_by=str(job.created_by), resume_from=row.chunks_done or 0)
+            for row in rows.values()
+        ]
+        net_written: Dict[str, int] = {}
+        save_lock = asyncio.Lock()
+
+        async def on_progress(progress: FileProgress) -> None:
+            row = rows[progress.stored_filename]
+            if progress.chunks_total is not None:
+                # 이어서 처리하는 파일은 이전 시도에서 이미 합산됨
+                if row.chunks_total is None:
+                    job.total_chunks += progress.chunks_total
+                row.chunks_total = progress.chunks_total
+            if progress.status in FINISHED_FILE_STATUSES and row.status not in FINISHED_FILE_STATUSES:
+                job.processed_files += 1
+                if progress.status == "failed":
+                    job.failed_files += 1
+
+            job.processed_chunks += progress.chunks_done - (row.chunks_done or 0)
+            row.status = progress.status
+            row.chunks_done = progress.chunks_done
+            row.error_message = progress.error
+
+            # 새로 저장된 청크 - 삭제된 고아 청크만큼 문서 수 반영
+            net = progress.chunks_written - progress.chunks_deleted
+            delta = net - net_written.get(progress.stored_filename, 0)
+            net_written[progress.stored_filename] = net
+
+            # 여러 파일의 진행 알림이 겹쳐도 저장 순서가 바뀌지 않도록 직렬화
+            async with save_lock:
+                if not await asyncio.to_thread(self._save_progress, job, row, worker_id, delta):
+                    logger.warning(f"Ingestion job {job.id} progress not saved: claim lost by {worker_id}")
+
+        logger.info(f"Processing ingestion job {job.id} ({len(items)} files, attempt {job.attempts}) on {worker_id}")
+        db = SessionLocal()
+        try:
+            service = RAGDataSourceService(db)
+            await service.run_ingestion(datasource, items, on_progress)
+        finally:
+            db.close()
+
+        statuses = [row.status for row in job.files]
+        failed = statuses.count("failed")
+        if failed == 0:
+            status = IngestionJobStatus.SUCCESS
+        elif failed == len(statuses):
+            status = IngestionJobStatus.FAILURE
+        else:
+            status = IngestionJobStatus.PARTIAL
+        await asyncio.to_thread(
+            self._finish_job, job.id, worker_id, status, f"{failed}개 파일 처리 실패" if failed else None
+        )
+        logger.info(f"Ingestion job {job.id} finished: {status.value} ({job.processed_chunks} chunks)")
+
+
+# 전역 수집 작업 처리기
+ingestion_job_runner = IngestionJobRunner(
+    workers=settings.rag_ingest_job_workers,
+    poll_seconds=settings.rag_ingest_poll_seconds,
+    stale_seconds=settings.rag_ingest_job_stale_seconds,
+    max_attempts=settings.rag_ingest_job_max_attempts
+)
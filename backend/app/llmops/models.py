@@ -6,10 +6,12 @@ LLMOps 모델 정의
 - Flow: 시각적 워크플로우 정의 (버전 관리 지원)
 - FlowExecutionLog: 플로우 실행 기록 및 로깅
 - Secret: 민감 정보 관리 (API 키 등)
+- RAGIngestionJob / RAGIngestionFile: RAG 문서 수집 백그라운드 작업 대기열
+- RAGDocumentManifest: 데이터소스별 파일 해시 -> 청크 ID 매니페스트 (증분 재색인)
 - 권한 기반 소유권 모델
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, JSON, Enum
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, JSON, Enum, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -34,6 +36,14 @@ class ExecutionStatus(PyEnum):
     SUCCESS = "SUCCESS" 
     FAILURE = "FAILURE"
 
+# 문서 수집 작업 상태 Enum 정의
+class IngestionJobStatus(PyEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCESS = "SUCCESS"
+    PARTIAL = "PARTIAL"  # 일부 파일 실패
+    FAILURE = "FAILURE"
+
 def generate_uuid():
     """UUID 생성 함수"""
     return uuid.uuid4()
@@ -84,6 +94,8 @@ class RAGDataSource(Base):
     # 관계 정의
     creator = relationship("User", foreign_keys=[created_by])
     flows = relationship("Flow", back_populates="rag_datasource")
+    ingestion_jobs = relationship("RAGIngestionJob", back_populates="datasource", cascade="all, delete-orphan")
+    document_manifests = relationship("RAGDocumentManifest", back_populates="datasource", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<RAGDataSource(id={self.id}, name='{self.name}', owner_type='{self.owner_type}')>"
@@ -248,6 +260,137 @@ class Secret(Base):
     def __repr__(self):
         return f"<Secret(id={self.id}, name='{self.name}', owner_type='{self.owner_type}')>"
 
+class RAGIngestionJob(Base):
+    """
+    RAG 문서 수집 작업 모델
+    
+    업로드 요청은 파일을 저장하고 작업만 등록하며, 추출/임베딩은 수집 워커가 처리합니다.
+    워커는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가므로 여러 API 프로세스가 같은 대기열을 공유하고,
+    heartbeat_at이 오래된 RUNNING 작업은 재시작 후 다른 워커가 이어서 처리합니다.
+    """
+    __tablename__ = "rag_ingestion_jobs"
+    __table_args__ = (
+        Index("idx_rag_ingestion_jobs_status_created", "status", "created_at"),
+    )
+    
+    # 기본 필드
+    id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid, index=True)
+    datasource_id = Column(Integer, ForeignKey('rag_datasources.id', ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(Enum(IngestionJobStatus), default=IngestionJobStatus.QUEUED,
+                   nullable=False, comment="작업 상태")
+    error_message = Column(Text, nullable=True, comment="에러 메시지 (실패 시)")
+    
+    # 작업 점유 정보
+    attempts = Column(Integer, default=0, nullable=False, comment="처리 시도 횟수")
+    locked_by = Column(String(200), nullable=True, comment="처리 중인 워커 식별자")
+    locked_at = Column(DateTime, nullable=True, comment="워커가 작업을 가져간 시간")
+    heartbeat_at = Column(DateTime, nullable=True, comment="워커 마지막 생존 신호 시간")
+    
+    # 진행 상황
+    total_files = Column(Integer, default=0, nullable=False, comment="전체 파일 수")
+    processed_files = Column(Integer, default=0, nullable=False, comment="처리 완료(성공+실패) 파일 수")
+    failed_files = Column(Integer, default=0, nullable=False, comment="실패 파일 수")
+    total_chunks = Column(Integer, default=0, nullable=False, comment="추출된 전체 청크 수")
+    processed_chunks = Column(Integer, default=0, nullable=False, comment="저장된 청크 수")
+    
+    # 시스템 정보
+    created_at = Column(DateTime, default=func.now(), comment="작업 등록 시간")
+    created_by = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    started_at = Column(DateTime, nullable=True, comment="처리 시작 시간")
+    completed_at = Column(DateTime, nullable=True, comment="처리 완료 시간")
+    
+    # 관계 정의
+    datasource = relationship("RAGDataSource", back_populates="ingestion_jobs")
+    creator = relationship("User", foreign_keys=[created_by])
+    files = relationship("RAGIngestionFile", back_populates="job", cascade="all, delete-orphan",
+                         order_by="RAGIngestionFile.id")
+
+    def __repr__(self):
+        return f"<RAGIngestionJob(id={self.id}, datasource_id={self.datasource_id}, status='{self.status}')>"
+
+class RAGIngestionFile(Base):
+    """
+    RAG 문서 수집 작업의 파일별 진행 상황
+    
+    chunks_done은 ChromaDB에 저장이 끝난 청크 수로, 작업을 다시 처리할 때 이 지점부터 이어서 진행합니다.
+    """
+    __tablename__ = "rag_ingestion_files"
+    
+    # 기본 필드
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey('rag_ingestion_jobs.id', ondelete="CASCADE"), nullable=False, index=True)
+    
+    # 저장된 파일 정보 (FileStorageService.save_uploaded_file 결과)
+    original_filename = Column(String(500), nullable=False, comment="원본 파일명")
+    stored_filename = Column(String(500), nullable=False, comment="저장 파일명")
+    file_path = Column(Text, nullable=False, comment="저장 경로")
+    relative_path = Column(Text, nullable=False, comment="저장소 기준 상대 경로")
+    file_size = Column(BigInteger, default=0, comment="파일 크기 (bytes)")
+    content_type = Column(String(200), nullable=True, comment="MIME 타입")
+    upload_time = Column(String(50), nullable=True, comment="업로드 시간 (ISO 형식)")
+    
+    # 진행 상황
+    status = Column(String(20), default="queued", nullable=False,
+                   comment="파일 상태: queued, extracting, embedding, completed, failed")
+    chunks_total = Column(Integer, nullable=True, comment="추출된 청크 수")
+    chunks_done = Column(Integer, default=0, nullable=False, comment="저장된 청크 수")
+    error_message = Column(Text, nullable=True, comment="에러 메시지 (실패 시)")
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # 관계 정의
+    job = relationship("RAGIngestionJob", back_populates="files")
+
+    def to_file_info(self) -> dict:
+        """IngestionItem에 넘길 저장 파일 정보"""
+        return {
+            "original_filename": self.original_filename,
+            "stored_filename": self.stored_filename,
+            "file_path": self.file_path,
+            "relative_path": self.relative_path,
+            "file_size": self.file_size,
+            "content_type": self.content_type,
+            "upload_time": self.upload_time
+        }
+
+    def __repr__(self):
+        return f"<RAGIngestionFile(id={self.id}, job_id={self.job_id}, status='{self.status}')>"
+
+class RAGDocumentManifest(Base):
+    """
+    RAG 문서 매니페스트
+    
+    데이터소스 안의 논리적 파일(원본 파일명)마다 마지막으로 색인한 파일 해시와 청크 ID 목록을 저장합니다.
+    청크 ID는 정규화된 청크 텍스트 + 데이터소스의 해시이므로, 재업로드 시 해시가 같으면 추출/임베딩을 건너뛰고
+    바뀐 파일은 새 청크만 임베딩한 뒤 더 이상 어떤 파일도 참조하지 않는 청크를 삭제합니다.
+    """
+    __tablename__ = "rag_document_manifests"
+    __table_args__ = (
+        UniqueConstraint("datasource_id", "source_key", name="uq_rag_document_manifests_source"),
+        Index("idx_rag_document_manifests_hash", "datasource_id", "file_hash"),
+    )
+    
+    # 기본 필드
+    id = Column(Integer, primary_key=True, index=True)
+    datasource_id = Column(Integer, ForeignKey('rag_datasources.id', ondelete="CASCADE"), nullable=False)
+    source_key = Column(String(500), nullable=False, comment="논리적 파일 식별자 (원본 파일명)")
+    
+    # 색인 정보
+    file_hash = Column(String(64), nullable=False, comment="파일 내용 SHA-256")
+    chunk_ids = Column(JSON, nullable=False, comment="청크 ID 목록 (문서 순서)")
+    chunk_count = Column(Integer, default=0, nullable=False, comment="청크 수")
+    stored_filename = Column(String(500), nullable=True, comment="색인에 사용한 저장 파일명")
+    file_path = Column(Text, nullable=True, comment="색인에 사용한 저장 경로")
+    
+    # 시스템 정보
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # 관계 정의
+    datasource = relationship("RAGDataSource", back_populates="document_manifests")
+
+    def __repr__(self):
+        return f"<RAGDocumentManifest(id={self.id}, datasource_id={self.datasource_id}, source_key='{self.source_key}')>"
+
 # 이전 FlowExecution 모델은 FlowExecutionLog로 대체됨
 class FlowExecution(Base):
     """
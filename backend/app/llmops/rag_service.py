@@ -11,20 +11,25 @@ from datetime import datetime
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status, UploadFile
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from ..models.user import User
-from .models import RAGDataSource, OwnerType
+from .models import RAGDataSource, OwnerType, RAGIngestionJob, RAGIngestionFile, IngestionJobStatus, RAGDocumentManifest
 from .auth import LLMOpsAuthService
 from ..services.chroma_service import ChromaService
-from ..schemas.chroma import ChromaCollectionCreate, ChromaDocumentAdd, ChromaQueryRequest
+from ..schemas.chroma import ChromaCollectionCreate, ChromaQueryRequest
 from .file_storage_service import FileStorageService
+from .ingestion import FileProgress, IngestionItem, IngestionPipeline, ProgressCallback
+from .document_manifest import DocumentManifest
 
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# 문서 청킹 설정
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+
 class RAGDataSourceService:
     """RAG 데이터소스 관리 서비스"""
     
@@ -33,11 +38,6 @@ class RAGDataSourceService:
         self.chroma_service = ChromaService()
         self.auth_service = LLMOpsAuthService(db)
         self.file_storage_service = FileStorageService()
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len,
-        )
     
     def _validate_datasource_name(self, name: str) -> None:
         """데이터소스 이름 검증"""
@@ -267,295 +267,155 @@ class RAGDataSourceService:
                 detail="데이터소스 목록 조회에 실패했습니다."
             )
     
-    async def upload_documents(
-        self, 
-        datasource: RAGDataSource, 
+    async def run_ingestion(
+        self,
+        datasource: RAGDataSource,
+        items: List[IngestionItem],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> List[FileProgress]:
+        """
+        저장된 파일들을 데이터소스 컬렉션에 증분 수집 (추출 -> 청킹 -> 임베딩/upsert)
+        
+        매니페스트 기준으로 내용이 같은 파일은 건너뛰고, 바뀐 파일은 새 청크만 임베딩한 뒤 고아 청크를 삭제합니다.
+        """
+        if not items:
+            return []
+        
+        # collection_name을 collection_id로 사용 (ChromaService에서 name으로도 검색 가능)
+        chroma_collection = await self.chroma_service.get_chroma_collection(datasource.chroma_collection_name)
+        pipeline = IngestionPipeline(
+            self.chroma_service,
+            chroma_collection,
+            namespace=f"rag_datasource:{datasource.id}",
+            manifest=await DocumentManifest.load(self.db, datasource.id),
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
+            on_progress=on_progress
+        )
+        progresses = await pipeline.run(items)
+        
+        # 재업로드된 동일 파일 사본과 대체된 이전 버전 파일 정리
+        for progress in progresses:
+            if progress.obsolete_file_path:
+                self.file_storage_service.delete_stored_file(progress.obsolete_file_path)
+        
+        return progresses
+    
+    async def enqueue_documents(
+        self,
+        datasource: RAGDataSource,
         files: List[UploadFile],
         current_user: User
     ) -> Dict[str, Any]:
-        """데이터소스에 문서 업로드 (파일 저장 관리 포함)"""
-        try:
-            uploaded_docs = []
-            failed_files = []
-            stored_files = []
-            
-            for file in files:
-                try:
-                    # 파일을 저장소에 저장
-                    file_info = await self.file_storage_service.save_uploaded_file(
-                        file, datasource, current_user
-                    )
-                    stored_files.append(file_info)
-                    
-                    # 파일 내용 읽기 (저장된 파일에서)
-                    with open(file_info["file_path"], "rb") as f:
-                        content = f.read()
-                    
-                    # 파일 타입에 따른 텍스트 추출
-                    text_content = self._extract_text_from_file(content, file.filename)
-                    
-                    if not text_content.strip():
-                        failed_files.append({
-                            "filename": file.filename, 
-                            "error": "파일에서 텍스트를 추출할 수 없습니다.",
-                            "stored_file": file_info["stored_filename"]
-                        })
-                        continue
-                    
-                    # 텍스트 청킹
-                    chunks = self.text_splitter.split_text(text_content)
-                    
-                    # 각 청크를 문서로 변환
-                    for i, chunk in enumerate(chunks):
-                        doc_id = f"{file.filename}_{i}_{uuid.uuid4().hex[:8]}"
-                        uploaded_docs.append({
-                            "id": doc_id,
-                            "content": chunk,
-                            "metadata": {
-                                "filename": file.filename,
-                                "stored_filename": file_info["stored_filename"],
-                                "chunk_index": i,
-                                "total_chunks": len(chunks),
-                                "uploaded_by": str(current_user.id),
-                                "upload_time": datetime.now().isoformat(),
-                                "file_size": len(content),
-                                "file_type": self._get_file_type(file.filename),
-                                "storage_path": file_info["relative_path"],
-                                "original_file_path": file_info["file_path"]
-                            }
-                        })
-                    
-                    logger.info(f"Processed file {file.filename}: {len(chunks)} chunks, stored as {file_info['stored_filename']}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process file {file.filename}: {str(e)}")
-                    failed_files.append({
-                        "filename": file.filename, 
-                        "error": str(e),
-                        "stored_file": None
-                    })
-            
-            # ChromaDB에 문서 추가
-            if uploaded_docs:
-                # ChromaDocumentAdd 객체 생성
-                documents_to_add = ChromaDocumentAdd(
-                    documents=[doc["content"] for doc in uploaded_docs],
-                    metadatas=[doc["metadata"] for doc in uploaded_docs],
-                    ids=[doc["id"] for doc in uploaded_docs]
-                )
-                
-                # collection_name을 collection_id로 사용 (ChromaService에서 name으로도 검색 가능)
-                await self.chroma_service.add_documents(
-                    datasource.chroma_collection_name,
-                    documents_to_add
-                )
-                
-                # 데이터소스 문서 수 업데이트
-                datasource.document_count += len(uploaded_docs)
-                datasource.last_updated = datetime.now()
-                self.db.commit()
-            
-            return {
-                "success": True,
-                "uploaded_documents": len(uploaded_docs),
-                "failed_files": failed_files,
-                "total_files_processed": len(files),
-                "stored_files": stored_files,
-                "storage_stats": self.file_storage_service.get_storage_stats(
-                    datasource.owner_type, 
-                    datasource.owner_id
+        """
+        문서 업로드 파일을 저장하고 수집 작업을 등록 (추출/임베딩은 IngestionJobRunner가 처리)
+        
+        Returns:
+            {"job": 등록된 작업 (저장된 파일이 없으면 None), "failed_files": 저장 실패 파일}
+        """
+        failed_files = []
+        job_files = []
+        
+        for file in files:
+            try:
+                file_info = await self.file_storage_service.save_uploaded_file(
+                    file, datasource, current_user
                 )
-            }
-            
+                job_files.append(RAGIngestionFile(
+                    original_filename=file_info["original_filename"],
+                    stored_filename=file_info["stored_filename"],
+                    file_path=file_info["file_path"],
+                    relative_path=file_info["relative_path"],
+                    file_size=file_info["file_size"],
+                    content_type=file_info["content_type"],
+                    upload_time=file_info["upload_time"]
+                ))
+            except Exception as e:
+                logger.error(f"Failed to store file {file.filename}: {str(e)}")
+                failed_files.append({
+                    "filename": file.filename,
+                    "error": str(e),
+                    "stored_file": None
+                })
+        
+        if not job_files:
+            return {"job": None, "failed_files": failed_files}
+        
+        try:
+            job = RAGIngestionJob(
+                datasource_id=datasource.id,
+                status=IngestionJobStatus.QUEUED,
+                total_files=len(job_files),
+                created_by=current_user.id,
+                files=job_files
+            )
+            self.db.add(job)
+            self.db.commit()
+            self.db.refresh(job)
         except Exception as e:
-            logger.error(f"Failed to upload documents to datasource {datasource.id}: {str(e)}")
+            self.db.rollback()
+            logger.error(f"Failed to enqueue ingestion job for datasource {datasource.id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="문서 업로드에 실패했습니다."
+                detail="문서 수집 작업 등록에 실패했습니다."
             )
+        
+        logger.info(f"Ingestion job queued: {job.id} ({len(job_files)} files) for datasource {datasource.id}")
+        return {"job": job, "failed_files": failed_files}
     
-    def _extract_text_from_file(self, content: bytes, filename: str) -> str:
-        """파일 타입에 따라 텍스트 추출"""
-        try:
-            file_extension = filename.lower().split('.')[-1] if '.' in filename else ''
-            
-            if file_extension == 'pdf':
-                return self._extract_text_from_pdf(content)
-            elif file_extension in ['txt', 'md', 'py', 'js', 'html', 'css', 'json', 'xml']:
-                # 텍스트 파일들은 여러 인코딩으로 시도
-                for encoding in ['utf-8', 'cp949', 'euc-kr', 'latin-1']:
-                    try:
-                        return content.decode(encoding)
-                    except UnicodeDecodeError:
-                        continue
-                # 모든 인코딩 실패 시 에러 처리
-                return content.decode('utf-8', errors='ignore')
-            else:
-                # 기본적으로 UTF-8로 시도, 실패하면 무시하고 디코딩
-                try:
-                    return content.decode('utf-8')
-                except UnicodeDecodeError:
-                    return content.decode('utf-8', errors='ignore')
-                    
-        except Exception as e:
-            logger.error(f"Failed to extract text from {filename}: {str(e)}")
-            raise Exception(f"텍스트 추출 실패: {str(e)}")
-    
-    def _extract_text_from_pdf(self, content: bytes) -> str:
-        """PDF 파일에서 텍스트 추출 (OCR 지원 포함)"""
-        try:
-            import io
-            import pdfplumber
-            from PyPDF2 import PdfReader
-            
-            # pdfplumber를 먼저 시도 (한글 지원이 더 좋음)
-            try:
-                with pdfplumber.open(io.BytesIO(content)) as pdf:
-                    text_parts = []
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(page_text)
-                    
-                    extracted_text = '\n'.join(text_parts)
-                    
-                    if len(extracted_text.strip()) > 50:
-                        logger.info(f"Successfully extracted {len(extracted_text)} characters using pdfplumber")
-                        return extracted_text
-                        
-            except Exception as e:
-                logger.warning(f"pdfplumber failed: {str(e)}, trying PyPDF2")
-            
-            # pdfplumber 실패 시 PyPDF2 시도
-            try:
-                pdf_reader = PdfReader(io.BytesIO(content))
-                text_parts = []
-                
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                
-                extracted_text = '\n'.join(text_parts)
-                
-                if len(extracted_text.strip()) > 50:
-                    logger.info(f"Successfully extracted {len(extracted_text)} characters using PyPDF2")
-                    return extracted_text
-                    
-            except Exception as e:
-                logger.warning(f"PyPDF2 failed: {str(e)}")
-            
-            # 텍스트 추출 실패 시 OCR 시도
-            logger.info("Attempting OCR extraction for scanned PDF")
-            return self._extract_text_with_ocr(content)
-            
-        except Exception as e:
-            logger.error(f"PDF text extraction failed: {str(e)}")
-            raise Exception(f"PDF 파일 처리 실패: {str(e)}")
-    
-    def _extract_text_with_ocr(self, content: bytes) -> str:
-        """OCR을 사용하여 스캔된 PDF에서 텍스트 추출"""
+    def get_ingestion_job(self, datasource: RAGDataSource, job_id: str) -> RAGIngestionJob:
+        """데이터소스의 수집 작업 조회"""
         try:
-            import io
-            from PIL import Image, ImageEnhance
-            import pytesseract
-            from pdf2image import convert_from_bytes
-            
-            logger.info("Starting OCR extraction from PDF")
-            
-            # PDF를 이미지로 변환
-            try:
-                images = convert_from_bytes(content, dpi=300)
-                logger.info(f"Converted PDF to {len(images)} images")
-            except Exception as e:
-                logger.error(f"Failed to convert PDF to images: {str(e)}")
-                # poppler가 설치되지 않은 경우 사용자에게 안내
-                if "poppler" in str(e).lower() or "pdftoppm" in str(e).lower():
-                    raise Exception("PDF를 이미지로 변환할 수 없습니다. OCR 기능을 사용하려면 poppler-utils를 설치해주세요. 설치 가이드: backend/OCR_SETUP.md 참조")
-                else:
-                    raise Exception(f"PDF를 이미지로 변환할 수 없습니다: {str(e)}")
-            
-            # 각 페이지에서 텍스트 추출
-            extracted_texts = []
-            
-            for i, image in enumerate(images):
-                try:
-                    # 이미지 전처리
-                    processed_image = self._preprocess_image_for_ocr(image)
-                    
-                    # OCR 수행
-                    page_text = pytesseract.image_to_string(
-                        processed_image, 
-                        lang='kor+eng',  # 한국어 + 영어
-                        config='--psm 3 --oem 3'  # 페이지 분할 모드와 OCR 엔진 모드
-                    )
-                    
-                    if page_text.strip():
-                        extracted_texts.append(page_text.strip())
-                        logger.info(f"OCR extracted {len(page_text)} characters from page {i+1}")
-                    
-                except Exception as e:
-                    logger.warning(f"OCR failed for page {i+1}: {str(e)}")
-                    continue
-            
-            if not extracted_texts:
-                raise Exception("OCR로 텍스트를 추출할 수 없습니다.")
-            
-            final_text = '\n\n'.join(extracted_texts)
-            logger.info(f"OCR extraction completed: {len(final_text)} total characters")
-            return final_text
-            
-        except ImportError as e:
-            logger.error(f"OCR dependencies not installed: {str(e)}")
-            raise Exception("OCR 기능을 사용하려면 pytesseract, Pillow, pdf2image 라이브러리가 필요합니다. 설치 가이드: backend/OCR_SETUP.md 참조")
-        except Exception as e:
-            logger.error(f"OCR extraction failed: {str(e)}")
-            raise Exception(f"OCR 처리 실패: {str(e)}")
+            job_uuid = uuid.UUID(str(job_id))
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="수집 작업을 찾을 수 없습니다.")
+        
+        job = self.db.query(RAGIngestionJob).filter(
+            RAGIngestionJob.id == job_uuid,
+            RAGIngestionJob.datasource_id == datasource.id
+        ).first()
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="수집 작업을 찾을 수 없습니다.")
+        return job
     
-    def _preprocess_image_for_ocr(self, image):
-        """OCR을 위한 이미지 전처리"""
-        try:
-            from PIL import ImageEnhance
-            
-            # 그레이스케일 변환
-            if image.mode != 'L':
-                image = image.convert('L')
-            
-            # 대비 조정
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(1.5)
-            
-            # 선명도 조정
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(1.2)
-            
-            return image
-            
-        except Exception as e:
-            logger.warning(f"Image preprocessing failed: {str(e)}")
-            return image  # 전처리 실패 시 원본 이미지 반환
+    def list_ingestion_jobs(self, datasource: RAGDataSource, limit: int = 20) -> List[RAGIngestionJob]:
+        """데이터소스의 최근 수집 작업 목록"""
+        return self.db.query(RAGIngestionJob).filter(
+            RAGIngestionJob.datasource_id == datasource.id
+        ).order_by(RAGIngestionJob.created_at.desc()).limit(limit).all()
     
-    def _get_file_type(self, filename: str) -> str:
-        """파일 확장자로 파일 타입 결정"""
-        if '.' not in filename:
-            return 'unknown'
-        
-        extension = filename.lower().split('.')[-1]
-        
-        type_mapping = {
-            'pdf': 'pdf',
-            'txt': 'text',
-            'md': 'markdown',
-            'py': 'python',
-            'js': 'javascript',
-            'html': 'html',
-            'css': 'css',
-            'json': 'json',
-            'xml': 'xml',
-            'csv': 'csv'
+    def serialize_ingestion_job(self, job: RAGIngestionJob, include_files: bool = True) -> Dict[str, Any]:
+        """수집 작업 응답 형식 변환"""
+        result = {
+            "job_id": str(job.id),
+            "datasource_id": job.datasource_id,
+            "status": job.status.value,
+            "attempts": job.attempts,
+            "total_files": job.total_files,
+            "processed_files": job.processed_files,
+            "failed_files": job.failed_files,
+            "total_chunks": job.total_chunks,
+            "processed_chunks": job.processed_chunks,
+            "error_message": job.error_message,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None
         }
-        
-        return type_mapping.get(extension, 'text')
+        if include_files:
+            result["files"] = [
+                {
+                    "filename": file.original_filename,
+                    "stored_filename": file.stored_filename,
+                    "file_size": file.file_size,
+                    "status": file.status,
+                    "chunks_total": file.chunks_total,
+                    "chunks_done": file.chunks_done,
+                    "error": file.error_message,
+                    "updated_at": file.updated_at.isoformat() if file.updated_at else None
+                }
+                for file in job.files
+            ]
+        return result
     
     async def delete_datasource(self, datasource: RAGDataSource, current_user: User) -> bool:
         """RAG 데이터소스 삭제 (파일 저장소 정리 포함)"""
@@ -622,6 +482,7 @@ class RAGDataSourceService:
                         "metadata": {
                             "filename": metadata.get("filename", "알 수 없음"),
                             "chunk_index": metadata.get("chunk_index", 0),
+                            "page_number": metadata.get("page_number"),
                             "upload_time": metadata.get("upload_time", ""),
                             "file_size": metadata.get("file_size", 0)
                         }
@@ -667,6 +528,11 @@ class RAGDataSourceService:
             success = self.chroma_service.clear_collection(datasource.chroma_collection_name)
             
             if success:
+                # 매니페스트도 비워야 같은 파일을 다시 올렸을 때 건너뛰지 않음
+                self.db.query(RAGDocumentManifest).filter(
+                    RAGDocumentManifest.datasource_id == datasource.id
+                ).delete(synchronize_session=False)
+                
                 # 데이터소스 문서 수 초기화
                 datasource.document_count = 0
                 datasource.last_updated = datetime.now()
@@ -769,6 +635,7 @@ class RAGDataSourceService:
                     "metadata": {
                         "filename": metadata.get("filename", "알 수 없음"),
                         "chunk_index": metadata.get("chunk_index", 0),
+                        "page_number": metadata.get("page_number"),
                         "upload_time": metadata.get("upload_time", ""),
                         "file_size": metadata.get("file_size", 0)
                     }
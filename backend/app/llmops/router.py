@@ -19,7 +19,10 @@ from ..routers.auth import get_current_user
 from .models import RAGDataSource, OwnerType, Flow, FlowExecutionLog, Secret, ExecutionStatus
 from ..services.chroma_service import ChromaService
 from .rag_service import RAGDataSourceService
+from .ingestion import shutdown_extraction_pool
+from .ingestion_jobs import ingestion_job_runner
 from .worker_manager import worker_manager
+from .admission import AdmissionRejected, AdmissionTicket, admission_controller
 
 import logging
 import os
@@ -32,6 +35,21 @@ router = APIRouter(
     tags=["LLMOps"]
 )
 
+
+@router.on_event("startup")
+async def start_llmops_workers():
+    """대기 워커 풀과 워커 하트비트, 문서 수집 작업 처리기 시작"""
+    worker_manager.start()
+    ingestion_job_runner.start()
+
+
+@router.on_event("shutdown")
+async def stop_llmops_workers():
+    """플로우 워커와 대기 워커, 문서 수집 작업 처리기와 추출 프로세스 풀 종료"""
+    await worker_manager.shutdown()
+    await ingestion_job_runner.shutdown()
+    shutdown_extraction_pool()
+
 # Pydantic 모델들
 class CreateDataSourceRequest(BaseModel):
     name: str
@@ -227,28 +245,32 @@ async def get_rag_datasource(
             detail="데이터소스 상세 정보 조회 중 오류가 발생했습니다."
         )
 
-@router.post("/rag-datasources/{source_id}/documents")
+@router.post("/rag-datasources/{source_id}/documents", status_code=status.HTTP_202_ACCEPTED)
 async def upload_documents(
     source_id: int,
     files: List[UploadFile] = File(...),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """RAG 데이터소스에 문서 업로드"""
+    """RAG 데이터소스에 문서 업로드 (파일 저장 후 수집 작업 등록, 진행 상황은 ingestion-jobs API로 조회)"""
     try:
         from .auth import LLMOpsAuthService
         auth_service = LLMOpsAuthService(db)
         datasource = auth_service.get_rag_datasource_with_permission(source_id, current_user)
         
         service = RAGDataSourceService(db)
-        result = await service.upload_documents(datasource, files, current_user)
+        result = await service.enqueue_documents(datasource, files, current_user)
+        job = result["job"]
+        if job is not None:
+            ingestion_job_runner.notify()
         
-        # 프론트엔드가 기대하는 형식으로 응답 변환
+        # 저장에 성공해 작업에 등록된 파일만 uploaded_files로 보고 (청크 진행 상황은 job_id로 조회)
         return {
-            "uploaded_files": result["total_files_processed"],
-            "processed_chunks": result["uploaded_documents"],
+            "uploaded_files": job.total_files if job is not None else 0,
             "failed_files": [f["filename"] for f in result["failed_files"]] if result["failed_files"] else [],
-            "success": result["success"]
+            "success": job is not None,
+            "job_id": str(job.id) if job is not None else None,
+            "job_status": job.status.value if job is not None else None
         }
         
     except HTTPException:
@@ -260,6 +282,60 @@ async def upload_documents(
             detail="문서 업로드 중 오류가 발생했습니다."
         )
 
+@router.get("/rag-datasources/{source_id}/ingestion-jobs")
+async def list_ingestion_jobs(
+    source_id: int,
+    limit: int = 20,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """RAG 데이터소스의 최근 문서 수집 작업 목록"""
+    try:
+        from .auth import LLMOpsAuthService
+        auth_service = LLMOpsAuthService(db)
+        datasource = auth_service.get_rag_datasource_with_permission(source_id, current_user)
+        
+        service = RAGDataSourceService(db)
+        jobs = service.list_ingestion_jobs(datasource, limit=min(max(limit, 1), 100))
+        return {
+            "jobs": [service.serialize_ingestion_job(job, include_files=False) for job in jobs]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error listing ingestion jobs: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="문서 수집 작업 목록 조회 중 오류가 발생했습니다."
+        )
+
+@router.get("/rag-datasources/{source_id}/ingestion-jobs/{job_id}")
+async def get_ingestion_job(
+    source_id: int,
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """문서 수집 작업 상태 (파일별 / 청크별 진행 상황과 실패 사유)"""
+    try:
+        from .auth import LLMOpsAuthService
+        auth_service = LLMOpsAuthService(db)
+        datasource = auth_service.get_rag_datasource_with_permission(source_id, current_user)
+        
+        service = RAGDataSourceService(db)
+        job = service.get_ingestion_job(datasource, job_id)
+        return service.serialize_ingestion_job(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting ingestion job: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="문서 수집 작업 조회 중 오류가 발생했습니다."
+        )
+
 @router.post("/rag-datasources/{source_id}/query")
 async def query_datasource(
     source_id: int,
@@ -1284,6 +1360,8 @@ async def get_worker_stats(
     """
     try:
         stats = await worker_manager.get_worker_stats()
+        # 승인 제어 지표 (대기열 길이/대기 시간) - 워커 수 산정에 함께 사용
+        stats["admission"] = admission_controller.get_stats()
         return {
             "success": True,
             "data": stats,
@@ -1342,6 +1420,24 @@ class FlowTestRequest(BaseModel):
     parameters: Optional[Dict[str, Any]] = None
     stream: bool = False
 
+async def admit_flow_execution(flow_id: str, current_user: User) -> AdmissionTicket:
+    """
+    플로우 실행 승인 (전역/플로우별/테넌트별 동시 실행 한도와 대기열)
+    테넌트는 사용자 그룹, 그룹이 없으면 사용자 단위
+    
+    Raises:
+        HTTPException: 429 (Retry-After 헤더 포함)
+    """
+    tenant_id = str(current_user.group_id or current_user.id)
+    try:
+        return await admission_controller.acquire(flow_id, tenant_id)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"실행 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요. ({e.detail})",
+            headers={"Retry-After": e.retry_after_header}
+        )
+
 @router.post("/run-flow/{flow_id}")
 async def run_flow_published(
     flow_id: str,
@@ -1362,9 +1458,13 @@ async def run_flow_published(
     Returns:
         플로우 실행 결과 또는 스트리밍 응답
     """
+    ticket = None
     try:
         logger.info(f"게시된 플로우 실행 요청: {flow_id} - 사용자: {current_user.email}")
         
+        # 승인 제어 (워커 생성/실행 전에 동시 실행 한도 적용)
+        ticket = await admit_flow_execution(flow_id, current_user)
+        
         # 사용자 그룹 정보 조회
         user_groups = [group.name for group in current_user.groups] if current_user.groups else []
         
@@ -1385,8 +1485,6 @@ async def run_flow_published(
         worker_url, worker_port = worker_result
         
         # 워커에 플로우 실행 요청
-        import httpx
-        
         execution_params = request.parameters or {}
         execution_params.update({
             "user_id": current_user.id,
@@ -1398,64 +1496,76 @@ async def run_flow_published(
         if request.stream:
             # 스트리밍 응답
             from fastapi.responses import StreamingResponse
+            from starlette.background import BackgroundTask
+            import json
+            
+            # 승인 슬롯은 스트림이 끝날 때 반환
+            stream_ticket, ticket = ticket, None
             
             async def stream_proxy():
-                async with httpx.AsyncClient() as client:
+                # 워커 SSE 바이트를 디코딩 없이 그대로 중계
+                # 클라이언트가 읽는 만큼만 워커 응답을 읽고(backpressure), 연결이 끊기면 워커 스트림도 닫힘
+                try:
+                    client = worker_manager.get_http_client(worker_port)
                     async with client.stream(
                         "POST",
                         f"{worker_url}/execute",
                         json={
                             "input_data": request.input_data,
                             "parameters": execution_params
-                        },
-                        timeout=120.0
+                        }
                     ) as response:
                         if response.status_code != 200:
-                            yield f"data: {{'type': 'error', 'error': '워커 실행 실패: {response.status_code}'}}\n\n"
+                            error_data = {'type': 'error', 'error': f'워커 실행 실패: {response.status_code}'}
+                            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n".encode("utf-8")
                             return
                         
-                        async for chunk in response.aiter_text():
+                        async for chunk in response.aiter_raw():
                             yield chunk
+                finally:
+                    stream_ticket.release()
             
             return StreamingResponse(
                 stream_proxy(),
-                media_type="text/plain",
+                background=BackgroundTask(stream_ticket.release),
+                media_type="text/event-stream",
                 headers={
                     "X-Flow-ID": flow_id,
                     "X-Worker-Port": str(worker_port),
                     "Cache-Control": "no-cache",
-                    "Connection": "keep-alive"
+                    "Connection": "keep-alive",
+                    "X-Accel-Buffering": "no"
                 }
             )
         else:
-            # 일반 응답
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{worker_url}/execute",
-                    json={
-                        "input_data": request.input_data,
-                        "parameters": execution_params
-                    },
-                    timeout=120.0
-                )
+            # 일반 응답 (워커 전용 keep-alive 연결 풀 사용)
+            client = worker_manager.get_http_client(worker_port)
+            response = await client.post(
+                f"{worker_url}/execute",
+                json={
+                    "input_data": request.input_data,
+                    "parameters": execution_params
+                },
+                timeout=120.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                logger.info(f"플로우 실행 완료: {flow_id}")
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"플로우 실행 완료: {flow_id}")
-                    
-                    return {
-                        "success": True,
-                        "flow_id": flow_id,
-                        "worker_port": worker_port,
-                        "result": result,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                else:
-                    logger.error(f"워커 플로우 실행 실패: {response.status_code} - {response.text}")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="플로우 실행 중 오류가 발생했습니다."
-                    )
+                return {
+                    "success": True,
+                    "flow_id": flow_id,
+                    "worker_port": worker_port,
+                    "result": result,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            else:
+                logger.error(f"워커 플로우 실행 실패: {response.status_code} - {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="플로우 실행 중 오류가 발생했습니다."
+                )
                 
     except HTTPException:
         raise
@@ -1465,6 +1575,9 @@ async def run_flow_published(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"플로우 실행 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        if ticket is not None:
+            ticket.release()
 
 @router.post("/test-flow")
 async def test_flow_execution(
@@ -1482,6 +1595,7 @@ async def test_flow_execution(
     Returns:
         플로우 실행 결과 또는 스트리밍 응답
     """
+    ticket = None
     try:
         logger.info(f"플로우 테스트 실행 요청 - 사용자: {current_user.email}")
         
@@ -1491,6 +1605,8 @@ async def test_flow_execution(
         
         # GraphBuilder를 직접 사용하여 테스트 실행
         from .graph_builder import GraphBuilder
+        from .runtime import ainvoke_runnable
+        from .tracing import verbose_payload_logging
         
         # 플로우 데이터 검증
         if not request.flow_data or 'nodes' not in request.flow_data or 'edges' not in request.flow_data:
@@ -1521,8 +1637,10 @@ async def test_flow_execution(
             chain_input = {"input": ""}
         
         # 파라미터 병합
+        # trace_verbose: 이 실행의 노드 입력/출력 내용을 로그로 남김 (실행 옵션이므로 입력에서 제외)
+        trace_verbose = bool(request.parameters and request.parameters.get("trace_verbose"))
         if request.parameters:
-            chain_input.update(request.parameters)
+            chain_input.update({k: v for k, v in request.parameters.items() if k != "trace_verbose"})
         
         # 사용자 정보 추가
         chain_input.update({
@@ -1531,12 +1649,19 @@ async def test_flow_execution(
             "user_name": current_user.real_name or current_user.display_name or current_user.email
         })
         
+        # 승인 제어 (테스트 실행은 사용자별 가상 플로우 키로 한도 적용)
+        ticket = await admit_flow_execution(f"test:{current_user.id}", current_user)
+        
         if request.stream:
             # 스트리밍 응답
             from fastapi.responses import StreamingResponse
+            from starlette.background import BackgroundTask
             import json
             import asyncio
             
+            # 승인 슬롯은 스트림이 끝날 때 반환
+            stream_ticket, ticket = ticket, None
+            
             async def stream_test_execution():
                 try:
                     # 시작 메시지
@@ -1565,16 +1690,16 @@ async def test_flow_execution(
                         step_start_times[step['node_id']] = step_start_time
                         step_data = {**step, 'start_time': step_start_time.isoformat()}
                         yield f"data: {json.dumps({'type': 'step_start', 'step': step_data})}\n\n"
-                        await asyncio.sleep(0.1)  # 단계별 지연
                     
                     # 스트리밍 실행 시도
                     if hasattr(chain, 'astream'):
-                        async for chunk in chain.astream(chain_input):
-                            chunk_data = {
-                                'type': 'chunk',
-                                'data': chunk if isinstance(chunk, (str, dict)) else str(chunk)
-                            }
-                            yield f"data: {json.dumps(chunk_data)}\n\n"
+                        with verbose_payload_logging(trace_verbose):
+                            async for chunk in chain.astream(chain_input):
+                                chunk_data = {
+                                    'type': 'chunk',
+                                    'data': chunk if isinstance(chunk, (str, dict)) else str(chunk)
+                                }
+                                yield f"data: {json.dumps(chunk_data)}\n\n"
                     elif hasattr(chain, 'stream'):
                         for chunk in chain.stream(chain_input):
                             chunk_data = {
@@ -1585,10 +1710,7 @@ async def test_flow_execution(
                             await asyncio.sleep(0)
                     else:
                         # 스트리밍을 지원하지 않는 경우 일반 실행
-                        if hasattr(chain, 'ainvoke'):
-                            result = await chain.ainvoke(chain_input)
-                        else:
-                            result = chain.invoke(chain_input)
+                        result = await ainvoke_runnable(chain, chain_input)
                         
                         result_data = {
                             'type': 'result',
@@ -1610,7 +1732,6 @@ async def test_flow_execution(
                             'duration_ms': duration_ms
                         }
                         yield f"data: {json.dumps({'type': 'step_complete', 'step': step_data})}\n\n"
-                        await asyncio.sleep(0.1)  # 단계별 지연
                     
                     # 완료 메시지
                     yield f"data: {json.dumps({'type': 'complete', 'message': '플로우 테스트 완료'})}\n\n"
@@ -1621,23 +1742,25 @@ async def test_flow_execution(
                         'error': str(e)
                     }
                     yield f"data: {json.dumps(error_data)}\n\n"
+                finally:
+                    stream_ticket.release()
             
             return StreamingResponse(
                 stream_test_execution(),
-                media_type="text/plain",
+                background=BackgroundTask(stream_ticket.release),
+                media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
-                    "Connection": "keep-alive"
+                    "Connection": "keep-alive",
+                    "X-Accel-Buffering": "no"
                 }
             )
         else:
             # 일반 응답
             try:
                 # 체인 실행
-                if hasattr(chain, 'ainvoke'):
-                    result = await chain.ainvoke(chain_input)
-                else:
-                    result = chain.invoke(chain_input)
+                with verbose_payload_logging(trace_verbose):
+                    result = await ainvoke_runnable(chain, chain_input)
                 
                 # 결과 포맷팅
                 formatted_result = {
@@ -1666,6 +1789,9 @@ async def test_flow_execution(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"플로우 테스트 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        if ticket is not None:
+            ticket.release()
 
 @router.post("/run/{project_id}/{flow_id}")
 async def run_flow_worker(
@@ -1687,9 +1813,13 @@ async def run_flow_worker(
     Returns:
         플로우 실행 결과
     """
+    ticket = None
     try:
         logger.info(f"레거시 플로우 실행 요청: {project_id}/{flow_id} - 사용자: {current_user.email}")
         
+        # 승인 제어 (워커 생성/실행 전에 동시 실행 한도 적용)
+        ticket = await admit_flow_execution(flow_id, current_user)
+        
         # 사용자 그룹 정보 조회
         user_groups = [group.name for group in current_user.groups] if current_user.groups else []
         
@@ -1709,41 +1839,39 @@ async def run_flow_worker(
         
         worker_url, worker_port = worker_result
         
-        # 워커에 플로우 실행 요청
-        import httpx
+        # 워커에 플로우 실행 요청 (워커 전용 keep-alive 연결 풀 사용)
+        client = worker_manager.get_http_client(worker_port)
+        response = await client.post(
+            f"{worker_url}/execute",
+            json={
+                "input_data": input_data,
+                "parameters": {
+                    "user_id": current_user.id,
+                    "user_email": current_user.email,
+                    "user_name": current_user.real_name or current_user.display_name or current_user.email
+                }
+            },
+            timeout=60.0
+        )
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{worker_url}/execute",
-                json={
-                    "input_data": input_data,
-                    "parameters": {
-                        "user_id": current_user.id,
-                        "user_email": current_user.email,
-                        "user_name": current_user.real_name or current_user.display_name or current_user.email
-                    }
-                },
-                timeout=60.0
-            )
+        if response.status_code == 200:
+            result = response.json()
+            logger.info(f"플로우 실행 완료: {project_id}/{flow_id}")
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"플로우 실행 완료: {project_id}/{flow_id}")
-                
-                return {
-                    "success": True,
-                    "project_id": project_id,
-                    "flow_id": flow_id,
-                    "worker_port": worker_port,
-                    "result": result,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                logger.error(f"워커 플로우 실행 실패: {response.status_code} - {response.text}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="플로우 실행 중 오류가 발생했습니다."
-                )
+            return {
+                "success": True,
+                "project_id": project_id,
+                "flow_id": flow_id,
+                "worker_port": worker_port,
+                "result": result,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        else:
+            logger.error(f"워커 플로우 실행 실패: {response.status_code} - {response.text}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="플로우 실행 중 오류가 발생했습니다."
+            )
                 
     except HTTPException:
         raise
@@ -1752,4 +1880,7 @@ async def run_flow_worker(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"플로우 실행 중 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+    finally:
+        if ticket is not None:
+            ticket.release() 
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Component Runtime for FlowRunner Pro
+
+컴포넌트 실행 프로토콜
+- ComponentRunnable: 동기(invoke) / 비동기(ainvoke) / 스트리밍(astream) 구현을 함께 제공
+- 동기 전용 코드는 크기가 제한된 스레드 풀에서 실행하여 워커 이벤트 루프를 막지 않음
+
+하나의 워커가 같은 플로우의 여러 실행을 동시에 처리할 수 있도록, LLM 호출은
+네이티브 async로, 블로킹 구간(Chroma 검색 등)만 스레드 풀로 보냄
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+try:
+    from langchain_core.runnables.base import Runnable
+except ImportError:
+    # langchain 라이브러리가 없는 경우 대체 구현
+    class Runnable:
+        """Runnable 기본 클래스 대체 구현"""
+        def invoke(self, input_data: Any) -> Any:
+            return input_data
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+_sync_pool: Optional[ThreadPoolExecutor] = None
+_sync_pool_lock = threading.Lock()
+
+
+def get_sync_pool() -> ThreadPoolExecutor:
+    """동기 컴포넌트 전용 스레드 풀 (최초 사용 시 생성)"""
+    global _sync_pool
+    if _sync_pool is None:
+        with _sync_pool_lock:
+            if _sync_pool is None:
+                _sync_pool = ThreadPoolExecutor(
+                    max_workers=settings.flow_sync_pool_size,
+                    thread_name_prefix="flow-sync"
+                )
+    return _sync_pool
+
+
+async def run_sync(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    동기 함수를 제한된 스레드 풀에서 실행합니다.
+    contextvars(verbose 로깅 설정 등)는 호출 시점의 값이 그대로 전달됩니다.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_sync_pool(), functools.partial(context.run, func, *args, **kwargs))
+
+
+async def ainvoke_runnable(runnable: Any, input_data: Any, config: Optional[Any] = None) -> Any:
+    """
+    Runnable을 비동기로 실행합니다.
+
+    async 네이티브(ComponentRunnable, DAGExecutor)는 ainvoke를 직접 await 하고,
+    그 외(RunnableLambda, 대체 구현 등)는 invoke를 제한된 스레드 풀에서 실행합니다.
+    """
+    if getattr(runnable, "is_async_native", False):
+        if config is not None:
+            return await runnable.ainvoke(input_data, config)
+        return await runnable.ainvoke(input_data)
+    return await run_sync(runnable.invoke, input_data)
+
+
+class ComponentRunnable(Runnable):
+    """
+    컴포넌트 Runnable
+
+    func(동기)는 필수이며, afunc(비동기)와 astream_func(비동기 스트리밍)가 없으면
+    각각 스레드 풀의 func 실행과 ainvoke 결과 1회 전달로 대체됩니다.
+    """
+
+    is_async_native = True
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        afunc: Optional[Callable[[Any], Awaitable[Any]]] = None,
+        astream_func: Optional[Callable[[Any], AsyncIterator[Any]]] = None
+    ):
+        self.name = name
+        self.func = func
+        self.afunc = afunc
+        self.astream_func = astream_func
+
+    @property
+    def supports_streaming(self) -> bool:
+        """청크 단위 스트리밍(astream_func) 구현 여부"""
+        return self.astream_func is not None
+
+    def invoke(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Any:
+        return self.func(input)
+
+    async def ainvoke(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Any:
+        if self.afunc is not None:
+            return await self.afunc(input)
+        return await run_sync(self.func, input)
+
+    async def astream(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        if self.astream_func is None:
+            yield await self.ainvoke(input, config)
+            return
+        async for chunk in self.astream_func(input):
+            yield chunk
+
+    def stream(self, input: Any, config: Optional[Any] = None, **kwargs: Any) -> Iterator[Any]:
+        yield self.invoke(input, config)
+
+
+def message_text(value: Any) -> Any:
+    """채팅 모델 응답(AIMessage/청크)은 본문 문자열로, 그 외는 그대로 반환"""
+    content = getattr(value, "content", None)
+    return content if isinstance(content, str) else value
+
+
+def llm_runnable(
+    name: str,
+    llm: Any,
+    prepare_input: Callable[[Any], Any],
+    parse_output: Callable[[Any], Any] = message_text
+) -> ComponentRunnable:
+    """
+    LLM 클라이언트를 ComponentRunnable로 감쌉니다.
+
+    LLM이 ainvoke/astream을 제공하면(langchain) 네이티브 async로 호출하고,
+    대체 구현처럼 invoke만 있으면 스레드 풀에서 실행합니다.
+    """
+    def invoke(input_data: Any) -> Any:
+        return parse_output(llm.invoke(prepare_input(input_data)))
+
+    afunc = None
+    if hasattr(llm, "ainvoke"):
+        async def afunc(input_data: Any) -> Any:
+            return parse_output(await llm.ainvoke(prepare_input(input_data)))
+
+    astream_func = None
+    if hasattr(llm, "astream"):
+        async def astream_func(input_data: Any) -> AsyncIterator[Any]:
+            async for chunk in llm.astream(prepare_input(input_data)):
+                yield parse_output(chunk)
+
+    return ComponentRunnable(name, invoke, afunc, astream_func)
@@ -0,0 +1,189 @@
+"""
+Flow Execution Tracing for FlowRunner Pro
+
+플로우 실행마다 노드별 span(시작/종료 시각, 입출력 크기, 오류)을 수집하여
+실행당 하나의 레코드로 링 버퍼에 보관하고 trace 로거로 내보냄
+
+노드 입력/출력 내용을 로그로 남기는 상세(verbose) 로깅은 실행 단위로 opt-in
+(실행 파라미터 trace_verbose)이며, 기본 경로에서는 페이로드 문자열 포맷팅을 하지 않음
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+# 실행 레코드 내보내기 전용 로거 (레벨/핸들러로 수집 여부 조절)
+trace_logger = logging.getLogger("app.llmops.trace")
+
+_verbose_payloads: ContextVar[bool] = ContextVar("flow_trace_verbose", default=False)
+
+TEMPLATE_FIELDS = ("system_message", "prompt", "template", "instruction")
+_TEMPLATE_VARIABLE = re.compile(r"{([^}]+)}")
+
+
+@contextmanager
+def verbose_payload_logging(enabled: bool = True) -> Iterator[None]:
+    """이 블록에서 실행되는 플로우의 노드 입력/출력 내용을 로그로 남깁니다."""
+    token = _verbose_payloads.set(enabled)
+    try:
+        yield
+    finally:
+        _verbose_payloads.reset(token)
+
+
+def is_verbose() -> bool:
+    return _verbose_payloads.get()
+
+
+def estimate_size(value: Any, depth: int = 0) -> int:
+    """
+    페이로드 크기 근사치 (문자열은 문자 수 기준)
+    직렬화 없이 상위 3단계까지만 훑으므로 큰 RAG 컨텍스트에도 비용이 거의 없음
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (bool, int, float)):
+        return 8
+    if depth >= 3:
+        return 0
+    if isinstance(value, dict):
+        return sum(len(str(key)) + estimate_size(item, depth + 1) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(estimate_size(item, depth + 1) for item in value)
+    return 0
+
+
+@dataclass
+class NodeSpan:
+    """노드 1회 실행 구간"""
+    node_id: str
+    node_type: str
+    started_at: float
+    duration_ms: float
+    input_bytes: int
+    output_bytes: int
+    status: str = "ok"  # ok | error | timeout
+    error: Optional[str] = None
+
+
+@dataclass
+class ExecutionTrace:
+    """플로우 1회 실행 레코드"""
+    flow_id: Optional[str]
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    first_token_ms: Optional[float] = None  # 스트리밍 실행의 첫 청크까지 걸린 시간
+    status: str = "ok"
+    spans: List[NodeSpan] = field(default_factory=list)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add_span(self, span: NodeSpan) -> None:
+        self.spans.append(span)
+        if span.status != "ok":
+            self.status = "degraded"
+
+    def mark_first_token(self) -> None:
+        self.first_token_ms = (time.perf_counter() - self._started) * 1000
+
+    def finish(self, status: Optional[str] = None) -> None:
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+        if status:
+            self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "flow_id": self.flow_id,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "first_token_ms": round(self.first_token_ms, 3) if self.first_token_ms is not None else None,
+            "status": self.status,
+            "spans": [asdict(span) for span in self.spans],
+        }
+
+
+class TraceBuffer:
+    """최근 실행 레코드 링 버퍼"""
+
+    def __init__(self, max_records: int = 256):
+        self._records: "deque[ExecutionTrace]" = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def record(self, trace: ExecutionTrace) -> None:
+        with self._lock:
+            self._records.append(trace)
+        if trace_logger.isEnabledFor(logging.INFO):
+            trace_logger.info(json.dumps(trace.to_dict(), ensure_ascii=False, default=str))
+
+    def recent(self, limit: int = 50, flow_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            records = list(self._records)
+        if flow_id:
+            records = [trace for trace in records if trace.flow_id == flow_id]
+        return [trace.to_dict() for trace in reversed(records[-limit:])]
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for trace in self._records:
+                if trace.run_id == run_id:
+                    return trace.to_dict()
+        return None
+
+
+# ---- verbose 모드 전용 페이로드 로깅 ----
+
+def _log_payload(prefix: str, data: Any) -> None:
+    if isinstance(data, dict):
+        logger.info(f"  ↳ {prefix} 키: {list(data.keys())}")
+        for key, value in data.items():
+            if isinstance(value, str) and len(value) > 100:
+                logger.info(f"  ↳ {key}: {value[:100]}... ({len(value)} 문자)")
+            else:
+                logger.info(f"  ↳ {key}: {value}")
+    elif isinstance(data, str) and len(data) <= 200:
+        logger.info(f"  ↳ {prefix}: {data}")
+    else:
+        logger.info(f"  ↳ {prefix}: {str(data)[:200]}...")
+
+
+def log_node_input(node_id: str, input_data: Any, field_values: Dict[str, Any]) -> None:
+    """노드 입력과 템플릿 변수 바인딩을 로그로 남깁니다 (verbose 모드)."""
+    logger.info(f"🚀 노드 실행 시작: {node_id} (입력 타입: {type(input_data).__name__})")
+    _log_payload("입력", input_data)
+
+    for field_name in TEMPLATE_FIELDS:
+        template_value = field_values.get(field_name)
+        if not isinstance(template_value, str) or "{" not in template_value:
+            continue
+        variables = _TEMPLATE_VARIABLE.findall(template_value)
+        logger.info(f"📝 템플릿 바인딩 감지: {node_id}.{field_name} (변수: {variables})")
+        if isinstance(input_data, dict):
+            bound_template = template_value
+            for var in variables:
+                if var in input_data:
+                    bound_template = bound_template.replace("{" + var + "}", str(input_data[var]))
+            logger.info(f"  ↳ 바인딩된 템플릿: {bound_template}")
+
+
+def log_node_output(node_id: str, result: Any, duration_ms: float) -> None:
+    """노드 출력을 로그로 남깁니다 (verbose 모드)."""
+    logger.info(f"✅ 노드 실행 완료: {node_id} ({duration_ms:.0f}ms, 출력 타입: {type(result).__name__})")
+    _log_payload("출력", result)
+
+
+# 전역 실행 레코드 버퍼
+trace_buffer = TraceBuffer(max_records=settings.flow_trace_buffer_size)
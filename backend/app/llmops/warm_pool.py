@@ -0,0 +1,227 @@
+"""
+Warm Worker Pool for LLMOps
+
+컴포넌트 모듈(FastAPI, LangChain, Chroma 등)을 미리 임포트한 대기(standby) 워커 프로세스 풀
+새 플로우 워커가 필요하면 대기 프로세스 하나에 플로우를 배정(제어 채널로 JSON 전송)하므로
+인터프리터 시작과 임포트 비용이 요청 경로에서 빠짐
+
+제어 채널
+- API -> 워커: 표준 입력 한 줄 (배정 메시지: project_id, flow_id, port, flow_data, plan)
+- 워커 -> API: 표준 출력의 CONTROL_PREFIX 줄 (standby / ready / failed 이벤트)
+  준비 여부는 헬스 체크 폴링 대신 ready 이벤트로 즉시 통지됨
+"""
+
+import asyncio
+import json
+import logging
+import subprocess
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+CONTROL_PREFIX = "@@flow-worker "
+
+# python -m app.llmops.worker 실행 기준 디렉토리 (backend)
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def emit_control_event(event: str, **data: Any) -> None:
+    """워커 -> API 제어 이벤트를 표준 출력으로 보냅니다 (워커 프로세스에서 호출)."""
+    sys.stdout.write(CONTROL_PREFIX + json.dumps({"event": event, **data}, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+class WorkerProcess:
+    """
+    워커 프로세스 핸들
+
+    표준 출력을 별도 스레드에서 계속 읽어(파이프가 가득 차 워커가 멈추지 않도록)
+    제어 이벤트를 이벤트 루프의 Future로 전달합니다.
+    """
+
+    EVENTS = ("standby", "ready")
+
+    def __init__(self, process: subprocess.Popen, loop: asyncio.AbstractEventLoop):
+        self.process = process
+        self._loop = loop
+        self._events: Dict[str, asyncio.Future] = {event: loop.create_future() for event in self.EVENTS}
+        self._reader = threading.Thread(
+            target=self._read_stdout,
+            name=f"flow-worker-{process.pid}",
+            daemon=True
+        )
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def is_standby(self) -> bool:
+        """컴포넌트 임포트를 마치고 배정을 기다리는 중인지 여부"""
+        future = self._events["standby"]
+        return future.done() and future.result()
+
+    def _read_stdout(self) -> None:
+        try:
+            for line in self.process.stdout:
+                if not line.startswith(CONTROL_PREFIX):
+                    continue
+                try:
+                    message = json.loads(line[len(CONTROL_PREFIX):])
+                except ValueError:
+                    continue
+                self._dispatch(self._on_event, message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._dispatch(self._on_exit)
+
+    def _dispatch(self, callback, *args: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (API 종료 중)
+            pass
+
+    def _resolve(self, event: str, value: bool) -> None:
+        future = self._events.get(event)
+        if future is not None and not future.done():
+            future.set_result(value)
+
+    def _on_event(self, message: Dict[str, Any]) -> None:
+        event = message.get("event")
+        if event == "failed":
+            logger.error(f"워커 플로우 로드 실패: PID {self.pid} - {message.get('error')}")
+            for name in self.EVENTS:
+                self._resolve(name, False)
+        else:
+            self._resolve(event, True)
+
+    def _on_exit(self) -> None:
+        for name in self.EVENTS:
+            self._resolve(name, False)
+
+    async def assign(self, assignment: Dict[str, Any]) -> bool:
+        """배정 메시지를 제어 채널(표준 입력)로 보내고 채널을 닫습니다."""
+        line = json.dumps(assignment, ensure_ascii=False) + "\n"
+
+        def write() -> None:
+            self.process.stdin.write(line)
+            self.process.stdin.close()
+
+        try:
+            await asyncio.to_thread(write)
+            logger.debug(f"워커 배정 메시지 전송: PID {self.pid} ({len(line)} 문자)")
+            return True
+        except (OSError, ValueError) as e:
+            logger.error(f"워커 배정 메시지 전송 실패: PID {self.pid} - {e}")
+            return False
+
+    async def wait_ready(self, timeout: float) -> bool:
+        """ready 이벤트(서버 리스닝 시작)까지 대기합니다. 종료/로드 실패/타임아웃이면 False."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._events["ready"]), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    def terminate(self, timeout: float = 5) -> None:
+        if not self.is_alive():
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def spawn_worker_process(loop: Optional[asyncio.AbstractEventLoop] = None) -> WorkerProcess:
+    """대기 모드 워커 프로세스를 시작합니다 (배정 전까지 포트를 점유하지 않음)."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.llmops.worker", "--standby"],
+        cwd=str(BACKEND_DIR),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=None,  # 워커 로그는 API 프로세스 로그로 그대로 출력
+        text=True,
+        bufsize=1
+    )
+    return WorkerProcess(process, loop or asyncio.get_running_loop())
+
+
+class WarmWorkerPool:
+    """
+    대기 워커 프로세스 풀
+
+    acquire()로 꺼낸 만큼 백그라운드에서 다시 채웁니다. 풀이 비어 있으면 None을 반환하며,
+    호출자는 새 프로세스를 바로 시작합니다(콜드 스타트).
+    """
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._idle: Deque[WorkerProcess] = deque()
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    def fill(self) -> None:
+        """부족한 대기 프로세스를 시작합니다 (이벤트 루프 안에서 호출)."""
+        if self._closed:
+            return
+        self._idle = deque(worker for worker in self._idle if worker.is_alive())
+        while len(self._idle) < self.size:
+            try:
+                worker = spawn_worker_process()
+            except Exception as e:
+                logger.error(f"대기 워커 프로세스 시작 실패: {e}")
+                return
+            self._idle.append(worker)
+            logger.info(f"대기 워커 프로세스 시작: PID {worker.pid} ({len(self._idle)}/{self.size})")
+
+    def acquire(self) -> Optional[WorkerProcess]:
+        """
+        대기 프로세스 하나를 꺼냅니다.
+        임포트를 마친(standby) 프로세스를 우선하고, 없으면 아직 준비 중인 프로세스라도 사용합니다.
+        """
+        alive: List[WorkerProcess] = [worker for worker in self._idle if worker.is_alive()]
+        worker = next((w for w in alive if w.is_standby), None) or (alive[0] if alive else None)
+        self._idle = deque(w for w in alive if w is not worker)
+
+        if worker is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self.size > 0:
+            self.fill()
+        return worker
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "standby": sum(1 for worker in self._idle if worker.is_standby),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def shutdown(self) -> None:
+        self._closed = True
+        while self._idle:
+            worker = self._idle.popleft()
+            try:
+                worker.terminate()
+            except Exception as e:
+                logger.warning(f"대기 워커 종료 실패: PID {worker.pid} - {e}")
+
+
+# 전역 대기 워커 풀
+warm_worker_pool = WarmWorkerPool(size=settings.flow_warm_pool_size)
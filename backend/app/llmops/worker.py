@@ -3,6 +3,9 @@ Stateful Worker for LLMOps
 
 워커 프로세스로 실행되어 특정 플로우를 담당하는 독립적인 FastAPI 서버
 표준 입력으로 플로우 JSON 데이터를 받아 로드하고 처리
+
+다중 플로우 모드(MultiFlowWorker)에서는 한 프로세스가 여러 플로우를 LRU로 상주시키고
+/flows/{flow_id}/load, /flows/{flow_id}/execute 로 적재/실행
 """
 
 import sys
@@ -10,13 +13,21 @@ import json
 import argparse
 import logging
 import asyncio
-from typing import Dict, Any, Optional, AsyncGenerator
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, AsyncGenerator, List, Tuple
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ..config import settings
+from .component_registry import COMPONENT_REGISTRY, get_component_class
 from .graph_builder import GraphBuilder
+from .flow_plan import CompiledFlowPlan
+from .runtime import ainvoke_runnable, run_sync
+from .tracing import trace_buffer, verbose_payload_logging
+from .warm_pool import emit_control_event
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,6 +36,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+    logging.warning("psutil을 가져올 수 없습니다. 상주 플로우 메모리는 JSON 크기로 추정합니다.")
+
 class FlowExecutionRequest(BaseModel):
     """플로우 실행 요청 모델"""
     input_data: Optional[Dict[str, Any]] = None
@@ -37,61 +54,103 @@ class FlowExecutionResponse(BaseModel):
     error: Optional[str] = None
     execution_time: Optional[float] = None
 
-class StatefulWorker:
+class FlowLoadRequest(BaseModel):
+    """다중 플로우 워커 적재 요청 모델"""
+    project_id: str
+    version: Optional[str] = None  # 게시 버전 문자열 (예: "1.0.0", 없으면 게시 레코드 ID)
+    flow_data: Dict[str, Any]
+    plan: Optional[Dict[str, Any]] = None
+
+class ReadySignalServer(uvicorn.Server):
+    """리스닝을 시작하면 워커 매니저에 ready 이벤트를 보내는 uvicorn 서버"""
+    
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started:
+            port = self.config.port
+            if self.servers and self.servers[0].sockets:
+                port = self.servers[0].sockets[0].getsockname()[1]
+            emit_control_event("ready", port=port)
+
+
+def preload_components() -> None:
+    """등록된 컴포넌트 모듈을 미리 임포트 (대기 워커가 배정 전에 수행)"""
+    for component_type in COMPONENT_REGISTRY:
+        try:
+            get_component_class(component_type)
+        except Exception as e:
+            logger.warning(f"컴포넌트 사전 로드 실패: {component_type} - {e}")
+
+
+def process_rss_bytes() -> int:
+    """현재 프로세스 RSS (psutil이 없으면 0)"""
+    if psutil is None:
+        return 0
+    return psutil.Process().memory_info().rss
+
+
+async def serve_app(app: FastAPI, port: int):
+    """워커 FastAPI 앱을 uvicorn으로 실행 (리스닝 시작 시 ready 이벤트 전송)"""
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="info",
+        access_log=True,
+        # API 프로세스의 연결 풀이 유휴 연결을 재사용할 수 있도록 keep-alive 연장
+        timeout_keep_alive=int(settings.flow_worker_keepalive_seconds)
+    )
+    
+    if port:
+        logger.info(f"Worker 서버 시작: http://127.0.0.1:{port}")
+    await ReadySignalServer(config).serve()
+
+
+class FlowRuntime:
     """
-    독립적인 플로우 처리 워커
-    FastAPI 서버를 내장하여 플로우 실행 요청을 처리
+    로드된 플로우 하나의 실행 상태
+    LCEL 체인 생성, 실행, 결과 포맷팅을 담당 (단일 플로우 워커와 다중 플로우 워커가 공유)
     """
     
-    def __init__(self, project_id: str, flow_id: str, port: int = 0):
+    def __init__(self, project_id: str, flow_id: str, version: Optional[str] = None):
         """
-        워커 초기화
-        
         Args:
             project_id: 프로젝트 ID
             flow_id: 플로우 ID
-            port: 서비스 포트 (0이면 자동 할당)
+            version: 게시 버전 (다중 플로우 워커의 상주 키)
         """
         self.project_id = project_id
         self.flow_id = flow_id
-        self.port = port
+        self.version = version
         self.flow_data = None
         self.flow_instance = None
-        
-        # FastAPI 앱 생성
-        self.app = FastAPI(
-            title=f"Flow Worker: {flow_id}",
-            description=f"Worker for project {project_id}, flow {flow_id}",
-            version="1.0.0"
-        )
-        
-        # 라우트 설정
-        self._setup_routes()
-        
-        logger.info(f"StatefulWorker 초기화 완료 - Project: {project_id}, Flow: {flow_id}")
+        self.memory_bytes = 0  # 로드 시 증가한 메모리 추정치 (상주 예산 계산용)
+        self.last_used = time.monotonic()
+        self.active_executions = 0
     
-    def load(self) -> bool:
+    def load_payload(self, payload: Dict[str, Any]) -> bool:
         """
-        표준 입력으로부터 플로우 JSON 데이터를 읽어서 로드
+        플로우 데이터(또는 flow_data/plan 묶음)로 플로우를 로드
         
+        Args:
+            payload: Flow JSON, 또는 워커 매니저가 보낸 {"flow_data": ..., "plan": ...}
+            
         Returns:
             로드 성공 여부
         """
         try:
-            # 표준 입력에서 전체 JSON 문자열 읽기
-            logger.info("표준 입력에서 플로우 데이터 읽기 시작...")
-            flow_json_string = sys.stdin.read()
-            
-            if not flow_json_string.strip():
-                logger.error("표준 입력에서 플로우 데이터를 읽을 수 없음")
-                return False
-            
-            # JSON 파싱
-            self.flow_data = json.loads(flow_json_string)
-            logger.info(f"플로우 데이터 파싱 완료: {len(flow_json_string)} 문자")
+            # 워커 매니저가 컴파일한 실행 계획이 함께 오면 재사용
+            plan = None
+            if isinstance(payload, dict) and "flow_data" in payload:
+                self.flow_data = payload["flow_data"]
+                if payload.get("plan"):
+                    plan = CompiledFlowPlan.from_dict(payload["plan"])
+            else:
+                self.flow_data = payload
+            logger.info(f"플로우 데이터 준비 완료 (실행 계획 {'포함' if plan else '없음'})")
             
             # 플로우 인스턴스 생성 (실제 langflow 연동 부분)
-            self.flow_instance = self._create_flow_instance(self.flow_data)
+            self.flow_instance = self._create_flow_instance(self.flow_data, plan)
             
             if self.flow_instance is None:
                 logger.error("플로우 인스턴스 생성 실패")
@@ -100,27 +159,28 @@ class StatefulWorker:
             logger.info("플로우 로드 완료")
             return True
             
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 실패: {e}")
-            return False
-            
         except Exception as e:
             logger.error(f"플로우 로드 실패: {e}")
             return False
     
-    def _create_flow_instance(self, flow_data: Dict[str, Any]) -> Optional[Any]:
+    def _create_flow_instance(
+        self,
+        flow_data: Dict[str, Any],
+        plan: Optional[CompiledFlowPlan] = None
+    ) -> Optional[Any]:
         """
         플로우 데이터로부터 실행 가능한 LCEL 체인 생성
         
         Args:
             flow_data: 플로우 JSON 데이터
+            plan: 컴파일된 실행 계획 (없으면 워커에서 컴파일)
             
         Returns:
             실행 가능한 LCEL 체인 또는 None
         """
         try:
             # GraphBuilder를 사용하여 LCEL 체인 생성
-            builder = GraphBuilder(flow_data)
+            builder = GraphBuilder(flow_data, flow_id=self.flow_id, plan=plan)
             chain = builder.build()
             
             logger.info("LCEL 체인 생성 완료")
@@ -130,76 +190,55 @@ class StatefulWorker:
             logger.error(f"LCEL 체인 생성 실패: {e}")
             return None
     
-    def _setup_routes(self):
-        """FastAPI 라우트 설정"""
-        
-        @self.app.get("/health")
-        async def health_check():
-            """헬스 체크 엔드포인트"""
-            return {
-                "status": "healthy",
-                "project_id": self.project_id,
-                "flow_id": self.flow_id,
-                "flow_loaded": self.flow_instance is not None
-            }
+    async def execute(self, request: FlowExecutionRequest):
+        """플로우 실행 요청 처리 (스트리밍 지원)"""
+        start_time = time.time()
         
-        @self.app.post("/execute")
-        async def execute_flow(request: FlowExecutionRequest):
-            """플로우 실행 엔드포인트 (스트리밍 지원)"""
-            import time
-            start_time = time.time()
+        try:
+            if self.flow_instance is None:
+                raise HTTPException(
+                    status_code=500, 
+                    detail="플로우가 로드되지 않았습니다"
+                )
             
-            try:
-                if self.flow_instance is None:
-                    raise HTTPException(
-                        status_code=500, 
-                        detail="플로우가 로드되지 않았습니다"
-                    )
-                
-                # 스트리밍 요청 확인
-                stream = request.parameters.get('stream', False) if request.parameters else False
-                
-                if stream:
-                    # 스트리밍 응답
-                    return StreamingResponse(
-                        self._execute_flow_stream(request.input_data, request.parameters),
-                        media_type="text/plain",
-                        headers={"X-Flow-ID": self.flow_id}
-                    )
-                else:
-                    # 일반 응답
-                    result = await self._execute_flow_logic(
-                        request.input_data, 
-                        request.parameters
-                    )
-                    
-                    execution_time = time.time() - start_time
-                    
-                    return FlowExecutionResponse(
-                        success=True,
-                        result=result,
-                        execution_time=execution_time
-                    )
+            # 스트리밍 요청 확인
+            stream = request.parameters.get('stream', False) if request.parameters else False
+            
+            if stream:
+                # 스트리밍 응답
+                return StreamingResponse(
+                    self._execute_flow_stream(request.input_data, request.parameters),
+                    media_type="text/event-stream",
+                    headers={
+                        "X-Flow-ID": self.flow_id,
+                        "Cache-Control": "no-cache",
+                        "X-Accel-Buffering": "no"
+                    }
+                )
+            else:
+                # 일반 응답
+                result = await self._execute_flow_logic(
+                    request.input_data, 
+                    request.parameters
+                )
                 
-            except Exception as e:
                 execution_time = time.time() - start_time
-                logger.error(f"플로우 실행 실패: {e}")
                 
                 return FlowExecutionResponse(
-                    success=False,
-                    error=str(e),
+                    success=True,
+                    result=result,
                     execution_time=execution_time
                 )
-        
-        @self.app.get("/info")
-        async def get_flow_info():
-            """플로우 정보 조회 엔드포인트"""
-            return {
-                "project_id": self.project_id,
-                "flow_id": self.flow_id,
-                "flow_loaded": self.flow_instance is not None,
-                "flow_data_size": len(json.dumps(self.flow_data)) if self.flow_data else 0
-            }
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            logger.error(f"플로우 실행 실패: {e}")
+            
+            return FlowExecutionResponse(
+                success=False,
+                error=str(e),
+                execution_time=execution_time
+            )
     
     async def _execute_flow_logic(
         self, 
@@ -228,18 +267,16 @@ class StatefulWorker:
             elif not chain_input:
                 chain_input = {"input": ""}
             
-            # 파라미터 병합
+            # 파라미터 병합 (trace_verbose는 실행 옵션이므로 입력에서 제외)
+            trace_verbose = bool(parameters and parameters.get("trace_verbose"))
             if parameters:
-                chain_input.update(parameters)
-            
+                chain_input.update({k: v for k, v in parameters.items() if k != "trace_verbose"})
+
             # LCEL 체인 실행
             try:
-                # 비동기 invoke 시도 (ainvoke가 있는 경우)
-                if hasattr(self.flow_instance, 'ainvoke'):
-                    result = await self.flow_instance.ainvoke(chain_input)
-                else:
-                    # 동기 invoke 사용
-                    result = self.flow_instance.invoke(chain_input)
+                with verbose_payload_logging(trace_verbose):
+                    # async 네이티브 체인은 ainvoke, 동기 전용 체인은 제한된 스레드 풀에서 invoke
+                    result = await ainvoke_runnable(self.flow_instance, chain_input)
             except AttributeError:
                 # invoke 메서드가 없는 경우 직접 호출
                 if callable(self.flow_instance):
@@ -333,6 +370,8 @@ class StatefulWorker:
         Yields:
             실행 결과 청크들
         """
+        started = time.perf_counter()
+        first_chunk_ms = None
         try:
             # 시작 메시지
             yield f"data: {json.dumps({'type': 'start', 'flow_id': self.flow_id})}\n\n"
@@ -347,19 +386,23 @@ class StatefulWorker:
             elif not chain_input:
                 chain_input = {"input": ""}
             
+            trace_verbose = bool(parameters and parameters.get("trace_verbose"))
             if parameters:
-                chain_input.update(parameters)
-            
+                chain_input.update({k: v for k, v in parameters.items() if k != "trace_verbose"})
+
             # 스트리밍 실행 시도
             try:
-                # astream 메서드가 있는 경우 (LangChain 스트리밍)
+                # astream 메서드가 있는 경우 (DAGExecutor는 LLM 노드 토큰 단위로 전달)
                 if hasattr(self.flow_instance, 'astream'):
-                    async for chunk in self.flow_instance.astream(chain_input):
-                        chunk_data = {
-                            'type': 'chunk',
-                            'data': chunk if isinstance(chunk, (str, dict)) else str(chunk)
-                        }
-                        yield f"data: {json.dumps(chunk_data)}\n\n"
+                    with verbose_payload_logging(trace_verbose):
+                        async for chunk in self.flow_instance.astream(chain_input):
+                            if first_chunk_ms is None:
+                                first_chunk_ms = round((time.perf_counter() - started) * 1000, 3)
+                            chunk_data = {
+                                'type': 'chunk',
+                                'data': chunk if isinstance(chunk, (str, dict)) else str(chunk)
+                            }
+                            yield f"data: {json.dumps(chunk_data)}\n\n"
                 
                 # stream 메서드가 있는 경우 (동기 스트리밍)
                 elif hasattr(self.flow_instance, 'stream'):
@@ -388,8 +431,13 @@ class StatefulWorker:
                 yield f"data: {json.dumps(error_data)}\n\n"
                 raise
             
-            # 완료 메시지
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            # 완료 메시지 (첫 청크까지 걸린 시간 포함)
+            complete_data = {
+                'type': 'complete',
+                'first_chunk_ms': first_chunk_ms,
+                'duration_ms': round((time.perf_counter() - started) * 1000, 3)
+            }
+            yield f"data: {json.dumps(complete_data)}\n\n"
             
         except Exception as e:
             logger.error(f"스트리밍 실행 실패: {e}")
@@ -398,28 +446,329 @@ class StatefulWorker:
                 'error': str(e)
             }
             yield f"data: {json.dumps(error_data)}\n\n"
+
+
+class StatefulWorker(FlowRuntime):
+    """
+    독립적인 플로우 처리 워커
+    FastAPI 서버를 내장하여 플로우 실행 요청을 처리
+    """
+    
+    def __init__(self, project_id: str, flow_id: str, port: int = 0):
+        """
+        워커 초기화
+        
+        Args:
+            project_id: 프로젝트 ID
+            flow_id: 플로우 ID
+            port: 서비스 포트 (0이면 자동 할당)
+        """
+        super().__init__(project_id, flow_id)
+        self.port = port
+        
+        # FastAPI 앱 생성
+        self.app = FastAPI(
+            title=f"Flow Worker: {flow_id}",
+            description=f"Worker for project {project_id}, flow {flow_id}",
+            version="1.0.0"
+        )
+        
+        # 라우트 설정
+        self._setup_routes()
+        
+        logger.info(f"StatefulWorker 초기화 완료 - Project: {project_id}, Flow: {flow_id}")
+    
+    def load(self) -> bool:
+        """
+        표준 입력으로부터 플로우 JSON 데이터를 읽어서 로드
+        
+        Returns:
+            로드 성공 여부
+        """
+        try:
+            # 표준 입력에서 전체 JSON 문자열 읽기
+            logger.info("표준 입력에서 플로우 데이터 읽기 시작...")
+            flow_json_string = sys.stdin.read()
+            
+            if not flow_json_string.strip():
+                logger.error("표준 입력에서 플로우 데이터를 읽을 수 없음")
+                return False
+            
+            payload = json.loads(flow_json_string)
+            logger.info(f"플로우 데이터 파싱 완료: {len(flow_json_string)} 문자")
+            return self.load_payload(payload)
+            
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON 파싱 실패: {e}")
+            return False
+    
+    def _setup_routes(self):
+        """FastAPI 라우트 설정"""
+        
+        @self.app.get("/health")
+        async def health_check():
+            """헬스 체크 엔드포인트"""
+            return {
+                "status": "healthy",
+                "project_id": self.project_id,
+                "flow_id": self.flow_id,
+                "flow_loaded": self.flow_instance is not None
+            }
+        
+        @self.app.post("/execute")
+        async def execute_flow(request: FlowExecutionRequest):
+            """플로우 실행 엔드포인트 (스트리밍 지원)"""
+            return await self.execute(request)
+        
+        @self.app.get("/info")
+        async def get_flow_info():
+            """플로우 정보 조회 엔드포인트"""
+            return {
+                "project_id": self.project_id,
+                "flow_id": self.flow_id,
+                "flow_loaded": self.flow_instance is not None,
+                "flow_data_size": len(json.dumps(self.flow_data)) if self.flow_data else 0
+            }
+        
+        @self.app.get("/traces")
+        async def get_traces(limit: int = 50):
+            """최근 실행 레코드 (노드별 span) 조회 엔드포인트"""
+            return {
+                "flow_id": self.flow_id,
+                "traces": trace_buffer.recent(limit=limit)
+            }
     
     async def start_server(self):
         """FastAPI 서버 시작"""
         try:
-            config = uvicorn.Config(
-                self.app,
-                host="127.0.0.1",
-                port=self.port,
-                log_level="info",
-                access_log=True
+            await serve_app(self.app, self.port)
+        except Exception as e:
+            logger.error(f"서버 시작 실패: {e}")
+            raise
+
+
+class MultiFlowWorker:
+    """
+    여러 플로우를 한 프로세스에 상주시키는 워커 (flow_worker_mode="multi")
+    
+    워커 매니저가 flow_id 해시로 고정 N개 워커 중 하나를 골라 플로우를 적재함.
+    상주 플로우는 (flow_id, version) 기준 LRU이며, 메모리 예산이나 최대 상주 수를 넘으면
+    가장 오래 사용하지 않은 플로우부터 내보냄. 내보낸 목록은 load 응답에 담겨
+    매니저의 상주 목록과 동기화됨 (내보내기는 적재 시에만 일어남)
+    
+    실행 중이거나 유예 시간 안에 사용된 플로우는 내보내지 않음 - 매니저가 방금 라우팅한
+    요청이 도착하기 전에 내보내지는 것을 막기 위한 것으로, 예산은 일시적으로 초과될 수 있음
+    (스트리밍 실행은 스트림이 끝날 때까지 실행 중으로 셈)
+    
+    상주 목록(self.flows)은 이벤트 루프에서만 변경하고, 스레드 풀에서는 체인 생성만 수행함
+    """
+    
+    def __init__(
+        self,
+        port: int = 0,
+        memory_budget_mb: Optional[int] = None,
+        max_resident_flows: Optional[int] = None
+    ):
+        """
+        Args:
+            port: 서비스 포트 (0이면 자동 할당)
+            memory_budget_mb: 상주 플로우 메모리 예산 (MB)
+            max_resident_flows: 최대 상주 플로우 수
+        """
+        self.port = port
+        self.memory_budget_bytes = (memory_budget_mb or settings.flow_worker_memory_budget_mb) * 1024 * 1024
+        self.max_resident_flows = max_resident_flows or settings.flow_worker_max_resident_flows
+        self.eviction_grace_seconds = settings.flow_worker_eviction_grace_seconds
+        self.flows: "OrderedDict[str, FlowRuntime]" = OrderedDict()
+        self.evictions = 0
+        self._load_lock = asyncio.Lock()
+        
+        self.app = FastAPI(
+            title="Flow Worker (multi-flow)",
+            description="Worker hosting many published flows",
+            version="1.0.0"
+        )
+        self._setup_routes()
+        
+        logger.info(
+            f"MultiFlowWorker 초기화 완료 - 메모리 예산: {self.memory_budget_bytes // (1024 * 1024)}MB, "
+            f"최대 상주: {self.max_resident_flows}"
+        )
+    
+    def resident_bytes(self) -> int:
+        return sum(runtime.memory_bytes for runtime in self.flows.values())
+    
+    async def load_flow(
+        self,
+        project_id: str,
+        flow_id: str,
+        version: Optional[str],
+        payload: Dict[str, Any]
+    ) -> Tuple[bool, List[str]]:
+        """
+        플로우를 적재하고 예산을 넘으면 LRU로 내보냄 (이벤트 루프에서 호출)
+        
+        Returns:
+            (적재 성공 여부, 내보낸 flow_id 목록)
+        """
+        async with self._load_lock:
+            current = self.flows.get(flow_id)
+            if current is not None and current.version == version:
+                self.flows.move_to_end(flow_id)
+                current.last_used = time.monotonic()
+                return True, []
+            
+            # 체인 생성은 스레드 풀에서 수행해 실행 중인 요청을 막지 않음
+            runtime = await run_sync(self._build_runtime, project_id, flow_id, version, payload)
+            if runtime is None:
+                return False, []
+            
+            # 같은 플로우의 이전 버전은 교체
+            self.flows.pop(flow_id, None)
+            self.flows[flow_id] = runtime
+            logger.info(
+                f"플로우 적재: {flow_id} v{version} ({runtime.memory_bytes / 1024:.0f}KB, 상주 {len(self.flows)}개)"
             )
-            
-            server = uvicorn.Server(config)
-            
-            # 실제 포트 번호 확인 (0으로 설정한 경우 자동 할당)
-            if self.port == 0:
-                # 서버 시작 후 실제 포트 번호 가져오기
-                await server.serve()
-            else:
-                logger.info(f"Worker 서버 시작: http://127.0.0.1:{self.port}")
-                await server.serve()
-                
+            return True, self._evict()
+    
+    @staticmethod
+    def _build_runtime(
+        project_id: str,
+        flow_id: str,
+        version: Optional[str],
+        payload: Dict[str, Any]
+    ) -> Optional[FlowRuntime]:
+        """플로우 체인 생성 (스레드 풀에서 실행, 상주 목록은 건드리지 않음)"""
+        runtime = FlowRuntime(project_id, flow_id, version)
+        rss_before = process_rss_bytes()
+        if not runtime.load_payload(payload):
+            return None
+        # RSS 증가분은 할당자 재사용으로 0이 될 수 있어 JSON 크기를 하한으로 사용
+        runtime.memory_bytes = max(
+            process_rss_bytes() - rss_before,
+            len(json.dumps(runtime.flow_data, ensure_ascii=False))
+        )
+        return runtime
+    
+    def _evict(self) -> List[str]:
+        """예산 초과분을 LRU 순서로 내보냄 (실행 중/최근 사용 플로우와 방금 적재한 플로우는 유지)"""
+        evicted = []
+        now = time.monotonic()
+        resident_bytes = self.resident_bytes()
+        for flow_id, runtime in list(self.flows.items())[:-1]:
+            if len(self.flows) <= self.max_resident_flows and resident_bytes <= self.memory_budget_bytes:
+                break
+            if runtime.active_executions or now - runtime.last_used < self.eviction_grace_seconds:
+                continue
+            del self.flows[flow_id]
+            resident_bytes -= runtime.memory_bytes
+            evicted.append(flow_id)
+            logger.info(f"상주 플로우 내보냄: {flow_id} v{runtime.version}")
+        self.evictions += len(evicted)
+        return evicted
+    
+    def unload_flow(self, flow_id: str) -> bool:
+        return self.flows.pop(flow_id, None) is not None
+    
+    def _get_runtime(self, flow_id: str) -> FlowRuntime:
+        runtime = self.flows.get(flow_id)
+        if runtime is None:
+            raise HTTPException(status_code=404, detail=f"플로우가 로드되지 않았습니다: {flow_id}")
+        self.flows.move_to_end(flow_id)
+        runtime.last_used = time.monotonic()
+        return runtime
+    
+    @staticmethod
+    async def _release_after_stream(runtime: FlowRuntime, body_iterator) -> AsyncGenerator:
+        """스트림이 끝나거나 클라이언트가 끊을 때 실행 중 카운터를 해제"""
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            runtime.active_executions -= 1
+            runtime.last_used = time.monotonic()
+    
+    def _setup_routes(self):
+        """FastAPI 라우트 설정"""
+        
+        @self.app.get("/health")
+        async def health_check():
+            """헬스 체크 엔드포인트"""
+            return {
+                "status": "healthy",
+                "mode": "multi",
+                "resident_flows": len(self.flows)
+            }
+        
+        @self.app.post("/flows/{flow_id}/load")
+        async def load_flow(flow_id: str, request: FlowLoadRequest):
+            """플로우 적재 엔드포인트 (체인 생성은 스레드 풀에서 수행해 실행 중인 요청을 막지 않음)"""
+            payload = {"flow_data": request.flow_data, "plan": request.plan}
+            loaded, evicted = await self.load_flow(request.project_id, flow_id, request.version, payload)
+            if not loaded:
+                raise HTTPException(status_code=422, detail=f"플로우 로드 실패: {flow_id}")
+            return {
+                "loaded": True,
+                "flow_id": flow_id,
+                "version": request.version,
+                "evicted": evicted,
+                "resident_flows": len(self.flows)
+            }
+        
+        @self.app.delete("/flows/{flow_id}")
+        async def unload_flow(flow_id: str):
+            """플로우 내리기 엔드포인트 (핫 리로딩)"""
+            return {"flow_id": flow_id, "unloaded": self.unload_flow(flow_id)}
+        
+        @self.app.post("/flows/{flow_id}/execute")
+        async def execute_flow(flow_id: str, request: FlowExecutionRequest):
+            """플로우 실행 엔드포인트 (스트리밍 지원)"""
+            runtime = self._get_runtime(flow_id)
+            runtime.active_executions += 1
+            streaming = False
+            try:
+                response = await runtime.execute(request)
+                if isinstance(response, StreamingResponse):
+                    # 스트리밍은 응답 객체를 만든 뒤에도 실행이 이어지므로 스트림이 끝날 때 해제
+                    response.body_iterator = self._release_after_stream(runtime, response.body_iterator)
+                    streaming = True
+                return response
+            finally:
+                if not streaming:
+                    runtime.active_executions -= 1
+        
+        @self.app.get("/info")
+        async def get_worker_info():
+            """상주 플로우 목록 조회 엔드포인트 (LRU 순서, 마지막이 최근 사용)"""
+            return {
+                "mode": "multi",
+                "resident_bytes": self.resident_bytes(),
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "max_resident_flows": self.max_resident_flows,
+                "evictions": self.evictions,
+                "flows": [
+                    {
+                        "project_id": runtime.project_id,
+                        "flow_id": runtime.flow_id,
+                        "version": runtime.version,
+                        "memory_bytes": runtime.memory_bytes
+                    }
+                    for runtime in self.flows.values()
+                ]
+            }
+        
+        @self.app.get("/traces")
+        async def get_traces(limit: int = 50, flow_id: Optional[str] = None):
+            """최근 실행 레코드 (노드별 span) 조회 엔드포인트"""
+            return {
+                "flow_id": flow_id,
+                "traces": trace_buffer.recent(limit=limit, flow_id=flow_id)
+            }
+    
+    async def start_server(self):
+        """FastAPI 서버 시작"""
+        try:
+            await serve_app(self.app, self.port)
         except Exception as e:
             logger.error(f"서버 시작 실패: {e}")
             raise
@@ -427,22 +776,62 @@ class StatefulWorker:
 def main():
     """메인 함수 - 커맨드 라인에서 실행"""
     parser = argparse.ArgumentParser(description="LLMOps Stateful Worker")
-    parser.add_argument("--project_id", required=True, help="프로젝트 ID")
-    parser.add_argument("--flow_id", required=True, help="플로우 ID")
+    parser.add_argument("--project_id", help="프로젝트 ID")
+    parser.add_argument("--flow_id", help="플로우 ID")
     parser.add_argument("--port", type=int, default=0, help="서비스 포트")
+    parser.add_argument(
+        "--standby",
+        action="store_true",
+        help="컴포넌트를 미리 임포트한 뒤 표준 입력의 배정 메시지(한 줄)를 기다림"
+    )
+    parser.add_argument(
+        "--multi",
+        action="store_true",
+        help="여러 플로우를 상주시키는 다중 플로우 워커로 실행 (플로우는 /flows/{flow_id}/load 로 적재)"
+    )
     
     args = parser.parse_args()
     
-    # 워커 생성
-    worker = StatefulWorker(
-        project_id=args.project_id,
-        flow_id=args.flow_id,
-        port=args.port
-    )
+    if args.standby:
+        # 대기 워커: 임포트를 마치고 배정 대기
+        preload_components()
+        emit_control_event("standby")
+        
+        assignment_line = sys.stdin.readline()
+        if not assignment_line.strip():
+            logger.info("배정 없이 제어 채널이 닫힘 - 대기 워커 종료")
+            sys.exit(0)
+        
+        assignment = json.loads(assignment_line)
+        if assignment.get("mode") == "multi":
+            worker = MultiFlowWorker(port=int(assignment.get("port", 0)))
+            loaded = True
+        else:
+            worker = StatefulWorker(
+                project_id=assignment["project_id"],
+                flow_id=assignment["flow_id"],
+                port=int(assignment.get("port", 0))
+            )
+            loaded = worker.load_payload(assignment)
+    elif args.multi:
+        worker = MultiFlowWorker(port=args.port)
+        loaded = True
+    else:
+        if not args.project_id or not args.flow_id:
+            parser.error("--standby/--multi 가 아니면 --project_id 와 --flow_id 가 필요합니다")
+        
+        # 워커 생성
+        worker = StatefulWorker(
+            project_id=args.project_id,
+            flow_id=args.flow_id,
+            port=args.port
+        )
+        loaded = worker.load()
     
     # 플로우 로드
-    if not worker.load():
+    if not loaded:
         logger.error("플로우 로드 실패 - 워커 종료")
+        emit_control_event("failed", error="flow load failed")
         sys.exit(1)
     
     # 서버 시작
@@ -3,35 +3,89 @@ Worker Pool Manager for LLMOps
 
 워커 풀을 관리하고, FlowProvider와 연동하여 동적으로 플로우를 로드하는 워커를 생성/관리
 핫 리로딩 기능을 통해 무중단 플로우 업데이트 지원
+
+레지스트리는 asyncio 단일 스레드에서만 변경되며, 워커 생성은 키(project_id:flow_id)별
+asyncio.Lock으로 직렬화됨 - 같은 플로우의 동시 콜드 스타트는 한 번의 생성으로 합쳐지고,
+서로 다른 플로우는 병렬로 진행됨. 헬스 체크는 요청 경로가 아닌 백그라운드 하트비트에서 수행
+
+flow_worker_mode="multi" 이면 플로우마다 프로세스를 띄우지 않고, flow_id 해시로 고정 N개
+다중 플로우 워커(MultiFlowWorker) 중 하나에 배정해 적재함. 워커가 LRU로 내보낸 플로우는
+load 응답으로 통지되어 매니저의 상주 목록(WorkerInfo.resident_flows)과 동기화됨
 """
 
 import os
-import sys
-import json
 import time
 import asyncio
 import subprocess
-import threading
 import logging
+import zlib
+from collections import OrderedDict
 from typing import Dict, Optional, Any, Tuple, List
-from pathlib import Path
-import psutil
+from urllib.parse import quote
 
+from ..config import settings
 from .flow_provider import flow_provider
+from .flow_plan import CompiledFlowPlan, flow_plan_cache
+from .warm_pool import WorkerProcess, spawn_worker_process, warm_worker_pool
 
 logger = logging.getLogger(__name__)
 
 class WorkerInfo:
     """워커 정보를 담는 클래스"""
     
-    def __init__(self, process: subprocess.Popen, port: int, project_id: str, flow_id: str):
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        port: int,
+        project_id: str,
+        flow_id: str,
+        handle: Optional[WorkerProcess] = None
+    ):
         self.process = process
+        self.handle = handle  # 제어 채널(ready 이벤트) 핸들
         self.port = port
         self.project_id = project_id
         self.flow_id = flow_id
         self.created_at = time.time()
         self.last_used = time.time()
-        self.status = "starting"  # starting, ready, error, terminated
+        self.status = "starting"  # starting, ready, unhealthy, error, terminated
+        self.failed_heartbeats = 0
+        # 다중 플로우 워커의 상주 플로우 (flow_id -> version, LRU 순서), 단일 플로우 워커는 None
+        self.resident_flows: Optional["OrderedDict[str, Optional[str]]"] = None
+        self._http_client = None
+        
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def get_http_client(self):
+        """
+        이 워커 전용 httpx.AsyncClient (keep-alive 연결 풀)
+        실행 요청과 헬스 체크가 같은 연결 풀을 재사용하므로 요청마다 TCP 연결을 새로 맺지 않음
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                base_url=self.url,
+                timeout=httpx.Timeout(120.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=settings.flow_worker_http_connections,
+                    max_keepalive_connections=settings.flow_worker_http_connections,
+                    # 워커(uvicorn)가 먼저 끊은 연결을 재사용하지 않도록 서버보다 짧게 유지
+                    keepalive_expiry=max(settings.flow_worker_keepalive_seconds - 1, 1)
+                )
+            )
+        return self._http_client
+    
+    def close_http_client(self):
+        """워커 제거 시 연결 풀 정리 (실행 중인 이벤트 루프가 있으면 비동기로 닫음)"""
+        client, self._http_client = self._http_client, None
+        if client is None or client.is_closed:
+            return
+        try:
+            asyncio.get_running_loop().create_task(client.aclose())
+        except RuntimeError:
+            pass
         
     def update_last_used(self):
         """마지막 사용 시간 업데이트"""
@@ -61,16 +115,29 @@ class WorkerPoolManager:
         """
         self.max_workers = max_workers
         self.worker_timeout = worker_timeout
-        self.workers: Dict[str, WorkerInfo] = {}  # key: f"{project_id}:{flow_id}"
-        self.port_pool = list(range(8100, 8100 + max_workers * 2))  # 사용 가능한 포트 풀
+        self.workers: Dict[str, WorkerInfo] = {}  # key: f"{project_id}:{flow_id}" (multi 모드는 f"slot:{n}")
+        
+        # multi 모드: CPU 코어 수만큼의 고정 워커에 flow_id 해시로 라우팅
+        self.multi_flow = settings.flow_worker_mode == "multi"
+        self.flow_slots = max(settings.flow_multi_workers or os.cpu_count() or 1, 1)
+        pool_size = max(max_workers, self.flow_slots) if self.multi_flow else max_workers
+        self.port_pool = list(range(8100, 8100 + pool_size * 2))  # 사용 가능한 포트 풀
         self.used_ports = set()
-        self.lock = threading.Lock()
         
-        # 워커 정리 태스크
-        self._cleanup_task = None
+        # 키별 생성 락 (같은 플로우의 동시 요청은 하나의 생성으로 합쳐짐)
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+        
+        # 하트비트(헬스 체크/유휴 정리) 태스크
+        self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown = False
         
-        logger.info(f"WorkerPoolManager 초기화 완료 - 최대 워커: {max_workers}, 타임아웃: {worker_timeout}초")
+        # 워커 프록시용 공유 HTTP 클라이언트 (keep-alive 연결 재사용)
+        self._http_client = None
+        
+        if self.multi_flow:
+            logger.info(f"WorkerPoolManager 초기화 완료 - 다중 플로우 모드, 워커: {self.flow_slots}개")
+        else:
+            logger.info(f"WorkerPoolManager 초기화 완료 - 최대 워커: {max_workers}, 타임아웃: {worker_timeout}초")
     
     async def get_or_create_worker(
         self, 
@@ -92,27 +159,205 @@ class WorkerPoolManager:
             (worker_url, port) 또는 None (실패 시)
         """
         worker_key = f"{project_id}:{flow_id}"
+        self._ensure_heartbeat()
         
-        with self.lock:
-            # 기존 워커 확인
+        if self.multi_flow:
+            return await self._get_or_load_resident_flow(project_id, flow_id, user_id, user_groups)
+        
+        # 빠른 경로: 하트비트가 정상으로 판정한 워커는 락/헬스 체크 없이 재사용
+        worker_info = self._get_ready_worker(worker_key)
+        if worker_info is not None:
+            return worker_info.url, worker_info.port
+        
+        async with self._get_key_lock(worker_key):
+            # 락을 기다리는 동안 다른 요청이 생성을 끝냈으면 그 워커를 사용
+            worker_info = self._get_ready_worker(worker_key)
+            if worker_info is not None:
+                return worker_info.url, worker_info.port
+            
             if worker_key in self.workers:
-                worker_info = self.workers[worker_key]
-                
-                # 워커 프로세스가 살아있는지 확인
-                if worker_info.process.poll() is None:
-                    worker_info.update_last_used()
-                    
-                    # 워커 상태 확인 (헬스 체크)
-                    if await self._health_check_worker(worker_info):
-                        logger.debug(f"기존 워커 재사용: {worker_key} (port: {worker_info.port})")
-                        return f"http://127.0.0.1:{worker_info.port}", worker_info.port
-                
-                # 죽은 워커 제거
-                logger.warning(f"죽은 워커 제거: {worker_key}")
-                self._remove_worker(worker_key)
+                # 죽었거나 하트비트에서 비정상으로 판정된 워커 제거
+                logger.warning(f"죽은 워커 제거: {worker_key} (상태: {self.workers[worker_key].status})")
+                await self._remove_worker(worker_key)
+            
+            # 새 워커 생성 (Cold Start)
+            return await self._create_new_worker(project_id, flow_id, user_id, user_groups)
+    
+    def _get_key_lock(self, worker_key: str) -> asyncio.Lock:
+        lock = self._key_locks.get(worker_key)
+        if lock is None:
+            lock = self._key_locks[worker_key] = asyncio.Lock()
+        return lock
+    
+    def _get_ready_worker(self, worker_key: str) -> Optional[WorkerInfo]:
+        """살아 있고 ready 상태인 워커 (사용 시각 갱신)"""
+        worker_info = self.workers.get(worker_key)
+        if worker_info is None or worker_info.status != "ready" or worker_info.process.poll() is not None:
+            return None
+        worker_info.update_last_used()
+        logger.debug(f"기존 워커 재사용: {worker_key} (port: {worker_info.port})")
+        return worker_info
+    
+    def _slot_key(self, flow_id: str) -> str:
+        """flow_id를 고정 워커 슬롯으로 매핑 (API 재시작 후에도 같은 슬롯이 되도록 안정 해시 사용)"""
+        return f"slot:{zlib.crc32(flow_id.encode('utf-8')) % self.flow_slots}"
+    
+    @staticmethod
+    def _flow_url(worker_info: WorkerInfo, flow_id: str) -> str:
+        """다중 플로우 워커에서 플로우별 엔드포인트 기준 URL (라우터는 뒤에 /execute를 붙여 호출)"""
+        return f"{worker_info.url}/flows/{quote(flow_id, safe='')}"
+    
+    async def _get_or_load_resident_flow(
+        self,
+        project_id: str,
+        flow_id: str,
+        user_id: str,
+        user_groups: List[str]
+    ) -> Optional[Tuple[str, int]]:
+        """
+        multi 모드: 담당 워커에 플로우가 상주하면 바로 반환하고, 없으면 권한 검사 후 적재
+        
+        Returns:
+            (flow_url, port) 또는 None
+        """
+        slot_key = self._slot_key(flow_id)
+        
+        # 빠른 경로: 이미 상주 중인 플로우
+        worker_info = self._get_ready_worker(slot_key)
+        if worker_info is not None and flow_id in worker_info.resident_flows:
+            worker_info.resident_flows.move_to_end(flow_id)
+            return self._flow_url(worker_info, flow_id), worker_info.port
+        
+        # 같은 플로우의 동시 적재는 하나로 합쳐짐 (락 순서: 플로우 키 -> 슬롯 키)
+        async with self._get_key_lock(f"{project_id}:{flow_id}"):
+            worker_info = await self._get_or_create_slot_worker(slot_key)
+            if worker_info is None:
+                return None
+            
+            if flow_id not in worker_info.resident_flows:
+                if not await self._load_flow_into_worker(worker_info, project_id, flow_id, user_id, user_groups):
+                    return None
+            
+            worker_info.resident_flows.move_to_end(flow_id)
+            return self._flow_url(worker_info, flow_id), worker_info.port
+    
+    async def _get_or_create_slot_worker(self, slot_key: str) -> Optional[WorkerInfo]:
+        """multi 모드 슬롯 워커를 가져오거나 새로 시작"""
+        worker_info = self._get_ready_worker(slot_key)
+        if worker_info is not None:
+            return worker_info
+        
+        async with self._get_key_lock(slot_key):
+            worker_info = self._get_ready_worker(slot_key)
+            if worker_info is not None:
+                return worker_info
+            
+            if slot_key in self.workers:
+                logger.warning(f"죽은 워커 제거: {slot_key} (상태: {self.workers[slot_key].status})")
+                await self._remove_worker(slot_key)
+            
+            port = self._allocate_port()
+            if port is None:
+                logger.error("사용 가능한 포트가 없음")
+                return None
+            
+            worker_process = await self._spawn_assigned_worker({"mode": "multi", "port": port}, slot_key)
+            if worker_process is None:
+                self._release_port(port)
+                return None
+            
+            worker_info = WorkerInfo(worker_process.process, port, "multi", slot_key, handle=worker_process)
+            worker_info.resident_flows = OrderedDict()
+            self.workers[slot_key] = worker_info
+            
+            if await self._wait_for_worker_ready(worker_info):
+                logger.info(f"다중 플로우 워커 시작 완료: {slot_key} (port: {port})")
+                return worker_info
+            
+            await self._remove_failed_worker(slot_key)
+            return None
+    
+    async def _load_flow_into_worker(
+        self,
+        worker_info: WorkerInfo,
+        project_id: str,
+        flow_id: str,
+        user_id: str,
+        user_groups: List[str]
+    ) -> bool:
+        """
+        권한 검사 후 플로우를 다중 플로우 워커에 적재하고 상주 목록을 갱신
+        
+        Returns:
+            적재 성공 여부
+        """
+        worker_key = f"{project_id}:{flow_id}"
+        prepared = await self._prepare_flow(worker_key, flow_id, user_id, user_groups)
+        if prepared is None:
+            return False
+        flow_data, version, plan = prepared
+        
+        try:
+            response = await worker_info.get_http_client().post(
+                f"/flows/{quote(flow_id, safe='')}/load",
+                json={
+                    "project_id": project_id,
+                    "version": version,
+                    "flow_data": flow_data,
+                    "plan": plan.to_dict() if plan is not None else None
+                },
+                timeout=settings.flow_worker_ready_timeout_seconds
+            )
+        except Exception as e:
+            logger.error(f"플로우 적재 요청 실패: {worker_key} -> port {worker_info.port} - {e}")
+            return False
+        
+        if response.status_code != 200:
+            logger.error(f"플로우 적재 실패: {worker_key} -> port {worker_info.port} ({response.status_code})")
+            return False
         
-        # 새 워커 생성 (Cold Start)
-        return await self._create_new_worker(project_id, flow_id, user_id, user_groups)
+        # 워커가 LRU로 내보낸 플로우를 상주 목록에서 제거
+        evicted = response.json().get("evicted", [])
+        for evicted_flow_id in evicted:
+            worker_info.resident_flows.pop(evicted_flow_id, None)
+        worker_info.resident_flows[flow_id] = version
+        
+        logger.info(
+            f"플로우 적재 완료: {worker_key} v{version} -> port {worker_info.port} "
+            f"(상주 {len(worker_info.resident_flows)}개, 내보냄 {len(evicted)}개)"
+        )
+        return True
+    
+    async def _prepare_flow(
+        self,
+        worker_key: str,
+        flow_id: str,
+        user_id: str,
+        user_groups: List[str]
+    ) -> Optional[Tuple[Dict[str, Any], Optional[str], CompiledFlowPlan]]:
+        """
+        권한 검사 후 게시된 플로우 데이터를 가져오고 실행 계획을 컴파일
+        
+        Returns:
+            (flow_data, version, plan) 또는 None
+        """
+        # FlowProvider로부터 권한 검사 후 플로우 데이터 가져오기
+        logger.info(f"FlowProvider에서 게시된 플로우 데이터 요청: {worker_key}, 사용자: {user_id}")
+        published = await flow_provider.get_published_flow_with_version(flow_id, user_id, user_groups)
+        
+        if published is None:
+            logger.error(f"플로우 데이터를 가져올 수 없음: {worker_key}")
+            return None
+        flow_data, version = published
+        
+        # 실행 계획 컴파일 (같은 배포 버전/내용이면 캐시 재사용) - 워커는 컴파일 없이 인스턴스화만 수행
+        try:
+            plan = flow_plan_cache.get_or_compile(flow_data, flow_id, version)
+        except (ValueError, RuntimeError) as e:
+            logger.error(f"플로우 실행 계획 컴파일 실패: {worker_key} - {e}")
+            return None
+        
+        return flow_data, version, plan
     
     async def _create_new_worker(
         self, 
@@ -139,13 +384,11 @@ class WorkerPoolManager:
                 # 가장 오래된 유휴 워커 제거
                 await self._cleanup_oldest_worker()
             
-            # FlowProvider로부터 권한 검사 후 플로우 데이터 가져오기
-            logger.info(f"FlowProvider에서 게시된 플로우 데이터 요청: {worker_key}, 사용자: {user_id}")
-            flow_data = await flow_provider.get_published_flow(flow_id, user_id, user_groups)
-            
-            if flow_data is None:
-                logger.error(f"플로우 데이터를 가져올 수 없음: {worker_key}")
+            # 권한 검사 후 플로우 데이터와 실행 계획 준비
+            prepared = await self._prepare_flow(worker_key, flow_id, user_id, user_groups)
+            if prepared is None:
                 return None
+            flow_data, version, plan = prepared
             
             # 사용 가능한 포트 할당
             port = self._allocate_port()
@@ -155,7 +398,7 @@ class WorkerPoolManager:
             
             # 워커 프로세스 시작
             worker_process = await self._start_worker_process(
-                project_id, flow_id, port, flow_data
+                project_id, flow_id, port, flow_data, plan
             )
             
             if worker_process is None:
@@ -163,15 +406,13 @@ class WorkerPoolManager:
                 return None
             
             # 워커 정보 등록
-            worker_info = WorkerInfo(worker_process, port, project_id, flow_id)
-            
-            with self.lock:
-                self.workers[worker_key] = worker_info
+            worker_info = WorkerInfo(worker_process.process, port, project_id, flow_id, handle=worker_process)
+            self.workers[worker_key] = worker_info
             
             # 워커 준비 대기
             if await self._wait_for_worker_ready(worker_info):
                 logger.info(f"새 워커 생성 완료: {worker_key} (port: {port})")
-                return f"http://127.0.0.1:{port}", port
+                return worker_info.url, port
             else:
                 # 워커 시작 실패
                 await self._remove_failed_worker(worker_key)
@@ -186,115 +427,92 @@ class WorkerPoolManager:
         project_id: str, 
         flow_id: str, 
         port: int, 
-        flow_data: Dict[str, Any]
-    ) -> Optional[subprocess.Popen]:
+        flow_data: Dict[str, Any],
+        plan: Optional[CompiledFlowPlan] = None
+    ) -> Optional[WorkerProcess]:
         """
         워커 프로세스 시작
         
+        대기 워커 풀에 미리 임포트를 마친 프로세스가 있으면 플로우를 배정하고,
+        없으면 새 프로세스를 시작해 곧바로 배정합니다(콜드 스타트).
+        
         Args:
             project_id: 프로젝트 ID
             flow_id: 플로우 ID
             port: 워커 포트
             flow_data: 플로우 JSON 데이터
+            plan: 컴파일된 실행 계획 (플로우 데이터와 함께 워커에 전달)
             
         Returns:
-            subprocess.Popen 객체 또는 None
+            WorkerProcess 핸들 또는 None
         """
-        try:
-            # 워커 스크립트 경로
-            worker_script = Path(__file__).parent / "worker.py"
-            
-            # 워커 프로세스 명령
-            cmd = [
-                sys.executable,
-                str(worker_script),
-                "--project_id", project_id,
-                "--flow_id", flow_id,
-                "--port", str(port)
-            ]
-            
-            logger.debug(f"워커 프로세스 시작: {' '.join(cmd)}")
-            
-            # 플로우 데이터를 JSON 문자열로 변환
-            flow_json_string = json.dumps(flow_data, ensure_ascii=False)
-            
-            # subprocess.Popen으로 워커 프로세스 시작 (stdin=PIPE 옵션 포함)
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=0  # 버퍼링 비활성화
-            )
-            
-            # 플로우 데이터를 워커의 표준 입력으로 전달 (비동기 처리)
-            await asyncio.to_thread(
-                self._send_flow_data_to_worker,
-                process,
-                flow_json_string
-            )
-            
-            logger.info(f"워커 프로세스 시작됨: PID {process.pid}, Port {port}")
-            return process
-            
-        except Exception as e:
-            logger.error(f"워커 프로세스 시작 실패: {e}")
-            return None
+        # 제어 채널로 보낼 배정 메시지 (실행 계획이 있으면 함께 전달)
+        assignment = {
+            "project_id": project_id,
+            "flow_id": flow_id,
+            "port": port,
+            "flow_data": flow_data,
+            "plan": plan.to_dict() if plan is not None else None
+        }
+        return await self._spawn_assigned_worker(assignment, f"{project_id}:{flow_id}")
     
-    def _send_flow_data_to_worker(
-        self, 
-        process: subprocess.Popen, 
-        flow_json_string: str
-    ):
+    async def _spawn_assigned_worker(self, assignment: Dict[str, Any], label: str) -> Optional[WorkerProcess]:
         """
-        워커 프로세스에 플로우 데이터 전송 (동기 함수)
+        대기 워커(없으면 새 프로세스)에 배정 메시지를 보냄
         
         Args:
-            process: 워커 프로세스
-            flow_json_string: 플로우 JSON 문자열
+            assignment: 배정 메시지 (단일 플로우 또는 {"mode": "multi", "port": ...})
+            label: 로그용 워커 키
+            
+        Returns:
+            WorkerProcess 핸들 또는 None
         """
+        port = assignment.get("port")
         try:
-            # 표준 입력으로 플로우 데이터 전송
-            process.stdin.write(flow_json_string)
-            process.stdin.close()  # EOF 전송
+            worker_process = warm_worker_pool.acquire()
+            if worker_process is not None:
+                logger.info(f"대기 워커에 배정: PID {worker_process.pid} -> {label}")
+            else:
+                worker_process = spawn_worker_process()
+                logger.info(f"대기 워커 없음 - 새 워커 프로세스 시작: PID {worker_process.pid}")
             
-            logger.debug(f"플로우 데이터 전송 완료: {len(flow_json_string)} 문자")
+            if not await worker_process.assign(assignment):
+                worker_process.terminate()
+                return None
+            
+            logger.info(f"워커 프로세스 시작됨: PID {worker_process.pid}, Port {port}")
+            return worker_process
             
         except Exception as e:
-            logger.error(f"플로우 데이터 전송 실패: {e}")
-            try:
-                process.terminate()
-            except:
-                pass
+            logger.error(f"워커 프로세스 시작 실패: {e}")
+            return None
     
-    async def _wait_for_worker_ready(self, worker_info: WorkerInfo, timeout: int = 30) -> bool:
+    async def _wait_for_worker_ready(self, worker_info: WorkerInfo, timeout: Optional[float] = None) -> bool:
         """
-        워커가 준비될 때까지 대기
+        워커가 준비될 때까지 대기 (워커가 보내는 ready 이벤트 기준, 폴링 없음)
         
         Args:
             worker_info: 워커 정보
-            timeout: 타임아웃 (초)
+            timeout: 타임아웃 (초), 기본값은 설정의 flow_worker_ready_timeout_seconds
             
         Returns:
             워커 준비 여부
         """
-        start_time = time.time()
+        timeout = timeout or settings.flow_worker_ready_timeout_seconds
+        started = time.perf_counter()
         
-        while time.time() - start_time < timeout:
-            # 프로세스가 종료되었는지 확인
-            if worker_info.process.poll() is not None:
-                logger.error(f"워커 프로세스가 종료됨: {worker_info.project_id}:{worker_info.flow_id}")
-                return False
-            
-            # 헬스 체크
-            if await self._health_check_worker(worker_info):
-                worker_info.status = "ready"
-                return True
-            
-            await asyncio.sleep(1)
+        if await worker_info.handle.wait_ready(timeout):
+            worker_info.status = "ready"
+            logger.info(
+                f"워커 준비 완료: {worker_info.project_id}:{worker_info.flow_id} "
+                f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+            )
+            return True
         
-        logger.error(f"워커 준비 타임아웃: {worker_info.project_id}:{worker_info.flow_id}")
+        if worker_info.process.poll() is not None:
+            logger.error(f"워커 프로세스가 종료됨: {worker_info.project_id}:{worker_info.flow_id}")
+        else:
+            logger.error(f"워커 준비 타임아웃: {worker_info.project_id}:{worker_info.flow_id}")
         return False
     
     async def _health_check_worker(self, worker_info: WorkerInfo) -> bool:
@@ -308,17 +526,11 @@ class WorkerPoolManager:
             헬스 체크 성공 여부
         """
         try:
-            import httpx
+            response = await worker_info.get_http_client().get("/health", timeout=5.0)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"http://127.0.0.1:{worker_info.port}/health",
-                    timeout=5.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("status") == "healthy"
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("status") == "healthy"
                 
         except Exception as e:
             logger.debug(f"워커 헬스 체크 실패: {worker_info.port} - {e}")
@@ -337,52 +549,109 @@ class WorkerPoolManager:
         """포트 해제"""
         self.used_ports.discard(port)
     
-    def _remove_worker(self, worker_key: str):
-        """워커 제거 (락 안에서 호출)"""
-        if worker_key in self.workers:
-            worker_info = self.workers[worker_key]
-            
-            # 프로세스 종료
+    async def _remove_worker(self, worker_key: str):
+        """
+        워커 제거
+        레지스트리/포트는 즉시 정리하고, 프로세스 종료 대기는 이벤트 루프를 막지 않도록 스레드에서 수행
+        """
+        worker_info = self.workers.pop(worker_key, None)
+        if worker_info is None:
+            return
+        worker_info.status = "terminated"
+        
+        # 연결 풀 정리 및 포트 해제
+        worker_info.close_http_client()
+        self._release_port(worker_info.port)
+        
+        # 프로세스 종료
+        try:
+            await asyncio.to_thread(self._terminate_process, worker_info.process)
+        except Exception as e:
+            logger.warning(f"워커 프로세스 종료 실패: {e}")
+        
+        logger.info(f"워커 제거 완료: {worker_key}")
+    
+    @staticmethod
+    def _terminate_process(process: subprocess.Popen):
+        if process.poll() is None:
+            process.terminate()
+            # 강제 종료 대기
             try:
-                if worker_info.process.poll() is None:
-                    worker_info.process.terminate()
-                    # 강제 종료 대기
-                    try:
-                        worker_info.process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        worker_info.process.kill()
-            except Exception as e:
-                logger.warning(f"워커 프로세스 종료 실패: {e}")
-            
-            # 포트 해제
-            self._release_port(worker_info.port)
-            
-            # 워커 풀에서 제거
-            del self.workers[worker_key]
-            
-            logger.info(f"워커 제거 완료: {worker_key}")
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
     
     async def _remove_failed_worker(self, worker_key: str):
         """실패한 워커 제거"""
-        with self.lock:
-            self._remove_worker(worker_key)
+        await self._remove_worker(worker_key)
     
     async def _cleanup_oldest_worker(self):
         """가장 오래된 유휴 워커 제거"""
         oldest_worker_key = None
         oldest_idle_time = 0
         
-        with self.lock:
-            for worker_key, worker_info in self.workers.items():
-                idle_time = worker_info.get_idle_time()
-                if idle_time > oldest_idle_time:
-                    oldest_idle_time = idle_time
-                    oldest_worker_key = worker_key
+        for worker_key, worker_info in self.workers.items():
+            idle_time = worker_info.get_idle_time()
+            if idle_time > oldest_idle_time:
+                oldest_idle_time = idle_time
+                oldest_worker_key = worker_key
         
         if oldest_worker_key:
             logger.info(f"가장 오래된 유휴 워커 제거: {oldest_worker_key} (유휴시간: {oldest_idle_time:.1f}초)")
-            with self.lock:
-                self._remove_worker(oldest_worker_key)
+            await self._remove_worker(oldest_worker_key)
+    
+    def _ensure_heartbeat(self):
+        """하트비트 태스크가 없으면 시작 (라우터 startup 이벤트 없이 사용되는 경우 대비)"""
+        if self._shutdown:
+            return
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.get_running_loop().create_task(self._heartbeat_loop())
+    
+    async def _heartbeat_loop(self):
+        """주기적으로 모든 워커를 헬스 체크하고 죽은/비정상/유휴 워커를 정리"""
+        interval = settings.flow_worker_heartbeat_seconds
+        logger.info(f"워커 하트비트 시작: {interval}초 간격")
+        while not self._shutdown:
+            try:
+                await self._heartbeat_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"워커 하트비트 실패: {e}")
+            await asyncio.sleep(interval)
+    
+    async def _heartbeat_once(self):
+        """하트비트 1회: 헬스 체크는 워커별로 동시에 수행"""
+        targets = [
+            (worker_key, worker_info)
+            for worker_key, worker_info in list(self.workers.items())
+            if worker_info.status in ("ready", "unhealthy")
+        ]
+        if not targets:
+            return
+        
+        results = await asyncio.gather(*(self._health_check_worker(info) for _, info in targets))
+        
+        for (worker_key, worker_info), healthy in zip(targets, results):
+            if self.workers.get(worker_key) is not worker_info:
+                continue  # 헬스 체크 중에 교체/제거됨
+            
+            if worker_info.process.poll() is not None:
+                logger.warning(f"워커 프로세스 종료 감지: {worker_key}")
+                await self._remove_worker(worker_key)
+            elif worker_info.resident_flows is None and worker_info.get_idle_time() > self.worker_timeout:
+                # 유휴 정리는 단일 플로우 워커만 (multi 모드 워커는 고정 슬롯)
+                logger.info(f"유휴 워커 정리: {worker_key} (유휴시간: {worker_info.get_idle_time():.0f}초)")
+                await self._remove_worker(worker_key)
+            elif healthy:
+                worker_info.failed_heartbeats = 0
+                worker_info.status = "ready"
+            else:
+                worker_info.failed_heartbeats += 1
+                if worker_info.failed_heartbeats >= settings.flow_worker_heartbeat_failures:
+                    # 다음 요청이 키 락 안에서 제거 후 재생성
+                    worker_info.status = "unhealthy"
+                    logger.warning(f"워커 헬스 체크 연속 실패: {worker_key} ({worker_info.failed_heartbeats}회)")
     
     async def reload_worker(self, project_id: str, flow_id: str) -> bool:
         """
@@ -398,14 +667,22 @@ class WorkerPoolManager:
         worker_key = f"{project_id}:{flow_id}"
         
         try:
-            # 1. FlowProvider 캐시 무효화 (현재는 캐시가 없으므로 스킵)
-            logger.info(f"플로우 캐시 무효화 (스킵): {worker_key}")
+            # 1. 실행 계획 캐시 무효화 (새 버전은 내용 해시가 달라 어차피 다시 컴파일됨)
+            flow_plan_cache.invalidate_flow(flow_id)
+            logger.info(f"플로우 실행 계획 캐시 무효화: {worker_key}")
+            
+            # 2. multi 모드: 담당 워커에서 플로우만 내림 (다음 요청이 새 버전을 적재)
+            if self.multi_flow:
+                async with self._get_key_lock(worker_key):
+                    await self._unload_resident_flow(flow_id)
+                logger.info(f"워커 리로딩 완료: {worker_key}")
+                return True
             
-            # 2. 기존 워커 제거
-            with self.lock:
+            # 2. 기존 워커 제거 (생성 중이면 생성이 끝난 뒤 제거)
+            async with self._get_key_lock(worker_key):
                 if worker_key in self.workers:
                     logger.info(f"기존 워커 종료: {worker_key}")
-                    self._remove_worker(worker_key)
+                    await self._remove_worker(worker_key)
                 else:
                     logger.info(f"리로딩할 워커가 없음: {worker_key}")
             
@@ -416,41 +693,97 @@ class WorkerPoolManager:
             logger.error(f"워커 리로딩 실패: {worker_key} - {e}")
             return False
     
+    async def _unload_resident_flow(self, flow_id: str):
+        """multi 모드: 담당 워커의 상주 목록과 워커 프로세스에서 플로우를 내림"""
+        worker_info = self.workers.get(self._slot_key(flow_id))
+        if worker_info is None or worker_info.resident_flows is None:
+            return
+        if worker_info.resident_flows.pop(flow_id, None) is None:
+            logger.info(f"리로딩할 상주 플로우가 없음: {flow_id}")
+            return
+        try:
+            await worker_info.get_http_client().delete(f"/flows/{quote(flow_id, safe='')}", timeout=5.0)
+            logger.info(f"상주 플로우 내림: {flow_id} (port: {worker_info.port})")
+        except Exception as e:
+            # 상주 목록에서는 이미 빠졌으므로 다음 적재 시 새 버전으로 교체됨
+            logger.warning(f"상주 플로우 내리기 실패: {flow_id} - {e}")
+    
     async def get_worker_stats(self) -> Dict[str, Any]:
         """워커 풀 통계 정보 반환"""
-        with self.lock:
-            stats = {
-                "total_workers": len(self.workers),
-                "max_workers": self.max_workers,
-                "used_ports": len(self.used_ports),
-                "available_ports": len(self.port_pool) - len(self.used_ports),
-                "workers": []
+        stats = {
+            "mode": "multi" if self.multi_flow else "per_flow",
+            "total_workers": len(self.workers),
+            "max_workers": self.max_workers,
+            "used_ports": len(self.used_ports),
+            "available_ports": len(self.port_pool) - len(self.used_ports),
+            "warm_pool": warm_worker_pool.get_stats(),
+            "workers": []
+        }
+        
+        for worker_key, worker_info in list(self.workers.items()):
+            worker_stats = {
+                "key": worker_key,
+                "project_id": worker_info.project_id,
+                "flow_id": worker_info.flow_id,
+                "port": worker_info.port,
+                "status": worker_info.status,
+                "failed_heartbeats": worker_info.failed_heartbeats,
+                "age_seconds": worker_info.get_age(),
+                "idle_seconds": worker_info.get_idle_time(),
+                "process_alive": worker_info.process.poll() is None
             }
-            
-            for worker_key, worker_info in self.workers.items():
-                worker_stats = {
-                    "key": worker_key,
-                    "project_id": worker_info.project_id,
-                    "flow_id": worker_info.flow_id,
-                    "port": worker_info.port,
-                    "status": worker_info.status,
-                    "age_seconds": worker_info.get_age(),
-                    "idle_seconds": worker_info.get_idle_time(),
-                    "process_alive": worker_info.process.poll() is None
-                }
-                stats["workers"].append(worker_stats)
+            if worker_info.resident_flows is not None:
+                worker_stats["resident_flows"] = list(worker_info.resident_flows.keys())
+            stats["workers"].append(worker_stats)
         
         return stats
     
+    def get_http_client(self, port: Optional[int] = None):
+        """
+        워커 요청 프록시에 사용할 httpx.AsyncClient를 반환합니다.
+        
+        Args:
+            port: 워커 포트 (해당 워커의 전용 연결 풀 사용)
+            
+        Returns:
+            워커 전용 클라이언트, 워커가 이미 제거된 경우 공유 클라이언트
+        """
+        if port is not None:
+            for worker_info in list(self.workers.values()):
+                if worker_info.port == port:
+                    return worker_info.get_http_client()
+        
+        if self._http_client is None or self._http_client.is_closed:
+            import httpx
+            self._http_client = httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=5.0))
+        return self._http_client
+    
+    def start_warm_pool(self):
+        """대기 워커 프로세스 풀 채우기 (API 시작 시 호출, 이후 acquire마다 자동 보충)"""
+        if warm_worker_pool.size > 0:
+            warm_worker_pool.fill()
+            logger.info(f"대기 워커 풀 시작: {warm_worker_pool.size}개")
+    
+    def start(self):
+        """대기 워커 풀과 하트비트 시작 (API 시작 시 호출)"""
+        self.start_warm_pool()
+        self._ensure_heartbeat()
+    
     async def shutdown(self):
         """워커 매니저 종료"""
         self._shutdown = True
+        warm_worker_pool.shutdown()
         
-        with self.lock:
-            logger.info(f"전체 워커 종료 시작: {len(self.workers)}개")
-            
-            for worker_key in list(self.workers.keys()):
-                self._remove_worker(worker_key)
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        
+        logger.info(f"전체 워커 종료 시작: {len(self.workers)}개")
+        await asyncio.gather(*(self._remove_worker(worker_key) for worker_key in list(self.workers.keys())))
         
         logger.info("WorkerPoolManager 종료 완료")
 
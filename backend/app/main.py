@@ -15,7 +15,7 @@ from .models.workspace import Workspace
 from .models.service import Service, ServiceCategory, UserServicePermission
 from .models.permission import Permission, Feature
 from .models.refresh_token import RefreshToken
-from .llmops.models import RAGDataSource, Flow, FlowExecution, FlowExecutionLog, Secret
+from .llmops.models import RAGDataSource, Flow, FlowExecution, FlowExecutionLog, Secret, RAGIngestionJob, RAGIngestionFile, RAGDocumentManifest
 # Flow Studio 모델 추가
 from .models.flow_studio import (
     Project, FlowStudioFlow, ComponentTemplate, 
@@ -40,7 +40,7 @@ from .routers import auth, workspace, jupyter, files, llm, service, admin, chrom
 # Flow Studio 라우터 추가
 from .routers import flow_studio
 # OAuth 2.0 라우터 추가
-from .api import oauth_simple, oauth_compatibility, llm_models, security_events
+from .api import oauth_simple, oauth_async, oauth_compatibility, llm_models, security_events
 # Group Tree 라우터 추가
 from .routers import group_tree
 
@@ -57,6 +57,10 @@ main_logger = logging.getLogger("app.main")
 # Import background tasks
 from .tasks.key_rotation import init_key_rotation_task
 from .tasks.nonce_cleanup import init_nonce_cleanup_task
+from .tasks.token_cleanup import init_token_cleanup_task
+from .tasks.token_revocation import init_token_revocation_task
+from .tasks.ollama_tags_refresh import init_ollama_tags_task
+from .utils.cache import initialize_cache, cleanup_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -67,6 +71,12 @@ async def lifespan(app: FastAPI):
     # Initialize OIDC background tasks
     init_key_rotation_task()
     init_nonce_cleanup_task()
+    init_token_cleanup_task()
+    init_token_revocation_task()
+    
+    # LLM 모델 캐시 (Redis 연결 실패 시 L1만 사용)
+    await initialize_cache()
+    init_ollama_tags_task()
     
     main_logger.info("Background tasks initialized")
     
@@ -74,6 +84,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     main_logger.info("Shutting down background tasks...")
+    await cleanup_cache()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -139,6 +150,9 @@ app.include_router(chroma.router, tags=["ChromaDB"])
 app.include_router(llm_chat.router, tags=["LLM Chat"])
 # OAuth 2.0 라우터 추가
 app.include_router(oauth_simple.router, prefix="/api/oauth", tags=["OAuth 2.0"])
+if settings.oauth_async_token_endpoint:
+    # asyncpg 기반 토큰 엔드포인트 (OAUTH_ASYNC_TOKEN_ENDPOINT=true)
+    app.include_router(oauth_async.router, prefix="/api/oauth", tags=["OAuth 2.0"])
 # OAuth compatibility router (for different logout URL patterns)
 app.include_router(oauth_compatibility.router, tags=["OAuth Compatibility"])
 # OAuth 2.0 관리 라우터 추가
@@ -8,6 +8,8 @@ from datetime import datetime
 from ..database import get_db
 from ..models import User, Role, Group, Permission, Feature
 from ..routers.auth import get_current_admin_user
+from ..utils.principal_cache import principal_cache
+from ..utils.cache import get_cache_metrics
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -484,6 +486,7 @@ async def approve_user(
         user.is_active = True
     
     db.commit()
+    principal_cache.invalidate_user(user.id)
     
     return {"message": f"사용자가 {request.approval_status}되었습니다."}
 
@@ -504,6 +507,7 @@ async def activate_user(
     
     user.is_active = request.is_active
     db.commit()
+    principal_cache.invalidate_user(user.id)
     
     status_text = "활성화" if request.is_active else "비활성화"
     return {"message": f"사용자 계정이 {status_text}되었습니다."}
@@ -864,6 +868,7 @@ async def update_user_info(
     print(f"업데이트 후 사용자 정보 - 그룹ID: {user.group_id}, Bio: {user.bio}")
     
     db.commit()
+    principal_cache.invalidate_user(user.id)
     
     print("데이터베이스 커밋 완료")
     
@@ -902,6 +907,7 @@ async def update_user_status(
         user.approved_at = datetime.utcnow()
     
     db.commit()
+    principal_cache.invalidate_user(user.id)
     
     return {"message": "사용자 상태가 업데이트되었습니다."}
 
@@ -1121,6 +1127,7 @@ async def update_role(
     
     db.commit()
     db.refresh(role)
+    principal_cache.invalidate_role(role_id)
     
     return RoleResponse(
         id=role.id,
@@ -1155,6 +1162,7 @@ async def delete_role(
     
     db.delete(role)
     db.commit()
+    principal_cache.invalidate_role(role_id)
     
     return {"message": "역할이 삭제되었습니다."}
 
@@ -1374,6 +1382,7 @@ async def update_group(
     
     db.commit()
     db.refresh(group)
+    principal_cache.invalidate_group(group.id)
     
     return GroupDetailResponse(
         id=str(group.id),
@@ -1419,6 +1428,7 @@ async def delete_group(
     
     db.delete(group)
     db.commit()
+    principal_cache.invalidate_group(group_id)
     
     return {"message": "그룹이 삭제되었습니다."}
 
@@ -1519,5 +1529,14 @@ async def update_user_group(
         message = "사용자의 그룹 할당이 해제되었습니다."
     
     db.commit()
+    principal_cache.invalidate_user(user.id)
     
-    return {"message": message} 
+    return {"message": message}
+
+# 캐시 통계 (L1/L2 hit/miss/latency, prefix별)
+@router.get("/cache/stats")
+async def get_cache_stats(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """캐시 계층 통계 조회"""
+    return get_cache_metrics()
@@ -151,9 +151,9 @@ def get_my_group(
     현재 사용자가 속한 그룹 정보 조회
     """
     try:
-        user = current_user_info["user"]
-        
-        if not user.group_id:
+        # current_user_info["user"]는 Principal 스냅샷이므로 가입일(created_at) 등은 User에서 조회
+        user = db.query(User).filter(User.id == current_user_info["user_id"]).first()
+        if not user or not user.group_id:
             return None
         
         group = db.query(Group).filter(Group.id == user.group_id).first()
@@ -7,6 +7,7 @@ from typing import List, Optional, Dict, Any
 
 from ..database import get_db
 from ..services.llm_chat_service import LLMChatService
+from ..services.ollama_tags_service import ollama_tags_service
 from ..schemas.llm_chat import (
     PersonaCreate, PersonaUpdate, PersonaResponse,
     PromptTemplateCreate, PromptTemplateUpdate, PromptTemplateResponse,
@@ -343,35 +344,30 @@ async def get_ollama_models(
 ):
     """Ollama 서버에서 사용 가능한 모델 목록 조회"""
     try:
-        ollama_url = f"http://{host}:{port}/api/tags"
+        # 메모리 캐시된 /api/tags 결과 사용 (최초 요청만 Ollama 호출)
+        tags = await ollama_tags_service.get_models(f"http://{host}:{port}")
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(ollama_url)
-            
-            if response.status_code == 200:
-                data = response.json()
-                models = []
-                
-                for model in data.get("models", []):
-                    models.append({
-                        "name": model.get("name", ""),
-                        "size": model.get("size", 0),
-                        "digest": model.get("digest", ""),
-                        "modified_at": model.get("modified_at", ""),
-                        "details": model.get("details", {})
-                    })
-                
-                return {
-                    "success": True,
-                    "models": models,
-                    "server": f"{host}:{port}"
-                }
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Ollama 서버 응답 오류: {response.text}"
-                )
+        models = []
+        for model in tags:
+            models.append({
+                "name": model.get("name", ""),
+                "size": model.get("size", 0),
+                "digest": model.get("digest", ""),
+                "modified_at": model.get("modified_at", ""),
+                "details": model.get("details", {})
+            })
+        
+        return {
+            "success": True,
+            "models": models,
+            "server": f"{host}:{port}"
+        }
                 
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Ollama 서버 응답 오류: {e.response.text}"
+        )
     except httpx.TimeoutException:
         raise HTTPException(
             status_code=408,
@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from ..database import get_db
 from ..utils.auth import get_current_user, require_service_auth
 from ..models import User
+from ..tasks.token_cleanup import get_token_cleanup_metrics
 import logging
 
 logger = logging.getLogger(__name__)
@@ -782,6 +783,15 @@ def get_refresh_token_stats(
         raise HTTPException(status_code=500, detail="Failed to get refresh token statistics")
 
 
+@router.get("/token-cleanup/metrics")
+def get_token_cleanup_metrics_endpoint(
+    current_user: User = Depends(get_current_user)
+):
+    """Get background token reaper metrics (rows purged, batch latency)"""
+    check_admin_permission(current_user)
+    return get_token_cleanup_metrics()
+
+
 @router.get("/statistics")
 def get_oauth_statistics(
     current_user: User = Depends(get_current_user),
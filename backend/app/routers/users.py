@@ -177,7 +177,9 @@ def get_my_profile(
     /api/auth/me와 유사하지만 더 상세한 정보 제공
     """
     try:
-        user = current_user_info["user"]
+        user = db.query(User).filter(User.id == current_user_info["user_id"]).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
         response = UserProfileResponse(
             id=str(user.id),
@@ -203,6 +205,8 @@ def get_my_profile(
         logger.info(f"User {user.email} accessed their profile")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting user profile: {str(e)}")
         raise HTTPException(status_code=500, detail="프로필 조회 중 오류가 발생했습니다")
@@ -11,6 +11,7 @@ import logging
 from ..models import User
 from ..database import SessionLocal
 from ..config import settings
+from ..utils.token_revocation import token_revocation_index
 
 logger = logging.getLogger(__name__)
 
@@ -343,6 +344,9 @@ class BatchLogoutService:
         stats['sessions'] = result.rowcount
         
         db.commit()
+        
+        # 실행 중인 API 프로세스에 즉시 반영 (이전에 발급된 모든 토큰)
+        token_revocation_index.revoke_users(user_ids)
         return stats
     
     def _execute_emergency_logout(
@@ -369,8 +373,10 @@ class BatchLogoutService:
         if preserve_service_tokens:
             query += " AND user_id IS NOT NULL"  # 서비스 토큰은 user_id가 NULL
         
-        result = db.execute(text(query), params)
-        stats['access_tokens_revoked'] = result.rowcount
+        query += " RETURNING token_hash, expires_at"
+        
+        revoked_access_tokens = db.execute(text(query), params).fetchall()
+        stats['access_tokens_revoked'] = len(revoked_access_tokens)
         
         # Refresh tokens 해지
         query = "UPDATE oauth_refresh_tokens SET revoked_at = NOW() WHERE revoked_at IS NULL"
@@ -391,6 +397,7 @@ class BatchLogoutService:
         stats['sessions_terminated'] = result.rowcount
         
         db.commit()
+        token_revocation_index.revoke_tokens(revoked_access_tokens)
         return stats
     
     def _record_affected_users(
@@ -690,10 +697,13 @@ class BatchLogoutService:
             return {"access_tokens_revoked": 0, "refresh_tokens_revoked": 0}
         
         # Access tokens 해지
-        access_result = db.execute(
-            text("UPDATE oauth_access_tokens SET revoked_at = NOW() WHERE id = ANY(:token_ids)"),
+        revoked_access_tokens = db.execute(
+            text("""
+                UPDATE oauth_access_tokens SET revoked_at = NOW() WHERE id = ANY(:token_ids)
+                RETURNING token_hash, expires_at
+            """),
             {"token_ids": token_ids}
-        )
+        ).fetchall()
         
         # Refresh tokens 해지  
         refresh_result = db.execute(
@@ -702,8 +712,9 @@ class BatchLogoutService:
         )
         
         db.commit()
+        token_revocation_index.revoke_tokens(revoked_access_tokens)
         return {
-            "access_tokens_revoked": access_result.rowcount,
+            "access_tokens_revoked": len(revoked_access_tokens),
             "refresh_tokens_revoked": refresh_result.rowcount
         }
     
@@ -713,13 +724,17 @@ class BatchLogoutService:
         refresh_tokens = [t['id'] for t in tokens if t['type'] == 'refresh']
         
         stats = {"access_tokens_revoked": 0, "refresh_tokens_revoked": 0}
+        revoked_access_tokens = []
         
         if access_tokens:
-            result = db.execute(
-                text("UPDATE oauth_access_tokens SET revoked_at = NOW() WHERE id = ANY(:token_ids)"),
+            revoked_access_tokens = db.execute(
+                text("""
+                    UPDATE oauth_access_tokens SET revoked_at = NOW() WHERE id = ANY(:token_ids)
+                    RETURNING token_hash, expires_at
+                """),
                 {"token_ids": access_tokens}
-            )
-            stats["access_tokens_revoked"] = result.rowcount
+            ).fetchall()
+            stats["access_tokens_revoked"] = len(revoked_access_tokens)
         
         if refresh_tokens:
             result = db.execute(
@@ -729,6 +744,7 @@ class BatchLogoutService:
             stats["refresh_tokens_revoked"] = result.rowcount
         
         db.commit()
+        token_revocation_index.revoke_tokens(revoked_access_tokens)
         return stats
     
     async def _process_conditional_logout(self, job_id: str, job: Dict, db: Session):
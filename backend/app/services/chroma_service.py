@@ -6,15 +6,17 @@ ChromaDB와의 모든 상호작용을 관리합니다.
 import os
 import uuid
 import re
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
 
 import chromadb
-from sentence_transformers import SentenceTransformer
 from fastapi import HTTPException
 
+from ..config import settings
 from ..schemas.chroma import ChromaCollectionCreate, ChromaCollectionResponse, ChromaDocumentAdd, ChromaQueryRequest
+from .embedding_service import get_embedding_service
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ class ChromaService:
     
     def __init__(self):
         self.client = None
+        self.embedding_service = None
         self.embedding_model = None
         self._initialize_client()
         self._initialize_embedding_model()
@@ -61,20 +64,129 @@ class ChromaService:
             raise HTTPException(status_code=500, detail="ChromaDB 연결에 실패했습니다.")
     
     def _initialize_embedding_model(self):
-        """임베딩 모델 초기화"""
-        try:
-            model_name = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-            logger.info(f"Loading embedding model: {model_name}")
-            self.embedding_model = SentenceTransformer(model_name)
-            logger.info(f"Embedding model loaded successfully: {model_name}")
-        except Exception as e:
-            logger.error(f"Failed to load embedding model: {str(e)}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
-            # 임베딩 모델 로딩 실패 시 None으로 설정 (기본 임베딩 사용)
-            self.embedding_model = None
-            logger.warning("Embedding model not loaded, will use default ChromaDB embeddings")
+        """임베딩 모델 초기화 (프로세스 공유 EmbeddingService - 모델은 한 번만 로드됨)"""
+        self.embedding_service = get_embedding_service()
+        # 임베딩 모델 로딩 실패 시 None (ChromaDB 기본 임베딩 사용)
+        self.embedding_model = self.embedding_service.model
+    
+    def _embed(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """문서/질의 임베딩 (모델이 없으면 None -> ChromaDB 기본 임베딩 사용)"""
+        if self.embedding_model is None:
+            return None
+        return self.embedding_service.encode(texts).tolist()
+    
+    def _add_batch_size(self) -> int:
+        """ChromaDB 한 번의 add/upsert 요청 크기"""
+        max_batch_size = getattr(self.client, "max_batch_size", None)
+        if max_batch_size:
+            return min(settings.chroma_add_batch_size, max_batch_size)
+        return settings.chroma_add_batch_size
+    
+    def _upsert_embedded(
+        self,
+        chroma_collection,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: List[Any]
+    ) -> None:
+        """이미 계산된 임베딩으로 배치 upsert (블로킹 - 스레드에서 호출)"""
+        add_batch_size = self._add_batch_size()
+        for start in range(0, len(documents), add_batch_size):
+            end = start + add_batch_size
+            chroma_collection.upsert(
+                documents=documents[start:end],
+                metadatas=metadatas[start:end],
+                ids=ids[start:end],
+                embeddings=embeddings[start:end]
+            )
+    
+    def _add_in_batches(
+        self,
+        chroma_collection,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        upsert: bool = False
+    ) -> None:
+        """
+        배치 단위로 임베딩 후 ChromaDB에 추가 (블로킹 - 스레드에서 호출)
+        인코딩 배치와 별도로 ChromaDB 한 번의 add 크기를 제한해 큰 업로드도 메모리/요청 크기가 일정함
+        upsert=True이면 같은 ID의 문서를 덮어씀 (중단된 수집을 다시 실행해도 중복되지 않음)
+        """
+        write = chroma_collection.upsert if upsert else chroma_collection.add
+        add_batch_size = self._add_batch_size()
+        
+        for start in range(0, len(documents), add_batch_size):
+            end = start + add_batch_size
+            batch_documents = documents[start:end]
+            embeddings = self._embed(batch_documents)
+            if embeddings is not None:
+                # 문서 추가 (임베딩 포함)
+                write(
+                    documents=batch_documents,
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                    embeddings=embeddings
+                )
+            else:
+                # 문서 추가 (ChromaDB 기본 임베딩 사용)
+                write(
+                    documents=batch_documents,
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+    
+    async def upsert_batch(
+        self,
+        chroma_collection,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> None:
+        """문서 배치 임베딩 + upsert (인코딩은 CPU 바운드이므로 이벤트 루프 밖에서 수행)"""
+        await asyncio.to_thread(self._add_in_batches, chroma_collection, documents, metadatas, ids, True)
+    
+    async def upsert_embedded(
+        self,
+        chroma_collection,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        embeddings: List[Any]
+    ) -> None:
+        """저장된 임베딩을 다른 ID로 복사할 때 사용 (재임베딩 없음)"""
+        await asyncio.to_thread(self._upsert_embedded, chroma_collection, documents, metadatas, ids, embeddings)
+    
+    async def get_chunks(self, chroma_collection, ids: List[str]) -> Dict[str, Any]:
+        """문서 본문/메타데이터/임베딩 조회"""
+        if not ids:
+            return {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+        return await asyncio.to_thread(
+            chroma_collection.get, ids=ids, include=["documents", "metadatas", "embeddings"]
+        )
+    
+    async def existing_ids(self, chroma_collection, ids: List[str]) -> set:
+        """컬렉션에 이미 있는 문서 ID (임베딩/문서 본문은 읽지 않음)"""
+        if not ids:
+            return set()
+        result = await asyncio.to_thread(chroma_collection.get, ids=ids, include=[])
+        return set(result.get("ids") or [])
+    
+    async def ids_where(self, chroma_collection, where: Dict[str, Any]) -> List[str]:
+        """메타데이터 조건에 맞는 문서 ID (임베딩/문서 본문은 읽지 않음)"""
+        result = await asyncio.to_thread(chroma_collection.get, where=where, include=[])
+        return list(result.get("ids") or [])
+    
+    async def update_metadatas(self, chroma_collection, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """기존 문서의 메타데이터만 갱신 (재임베딩 없음)"""
+        if ids:
+            await asyncio.to_thread(chroma_collection.update, ids=ids, metadatas=metadatas)
+    
+    async def delete_ids(self, chroma_collection, ids: List[str]) -> None:
+        """문서 ID 목록 삭제 (ChromaDB 요청 크기 제한에 맞춰 배치 단위로)"""
+        for start in range(0, len(ids), settings.chroma_add_batch_size):
+            await asyncio.to_thread(chroma_collection.delete, ids=ids[start:start + settings.chroma_add_batch_size])
     
     def _ensure_metadata_collection(self):
         """메타데이터 컬렉션 생성 (없는 경우)"""
@@ -504,16 +616,20 @@ class ChromaService:
             logger.error(f"Failed to delete collection: {str(e)}")
             raise HTTPException(status_code=500, detail="Collection 삭제에 실패했습니다.")
     
+    async def get_chroma_collection(self, collection_id: str):
+        """ID(또는 이름)로 ChromaDB 컬렉션 객체 조회"""
+        # 컬렉션 정보 조회
+        collection_info = await self.get_collection(collection_id)
+        if not collection_info:
+            raise HTTPException(status_code=404, detail="Collection을 찾을 수 없습니다.")
+        
+        # ChromaDB 컬렉션 가져오기
+        return self.client.get_collection(name=collection_info.name)
+    
     async def add_documents(self, collection_id: str, documents: ChromaDocumentAdd):
         """Collection에 문서 추가"""
         try:
-            # 컬렉션 정보 조회
-            collection_info = await self.get_collection(collection_id)
-            if not collection_info:
-                raise HTTPException(status_code=404, detail="Collection을 찾을 수 없습니다.")
-            
-            # ChromaDB 컬렉션 가져오기
-            chroma_collection = self.client.get_collection(name=collection_info.name)
+            chroma_collection = await self.get_chroma_collection(collection_id)
             
             # 문서 ID 생성 (제공되지 않은 경우)
             document_ids = documents.ids
@@ -522,25 +638,16 @@ class ChromaService:
             elif len(document_ids) != len(documents.documents):
                 raise HTTPException(status_code=400, detail="문서 수와 ID 수가 일치하지 않습니다.")
             
-            # 임베딩 생성 (사용자 정의 임베딩 모델이 있는 경우)
-            if self.embedding_model:
-                embeddings = self.embedding_model.encode(documents.documents).tolist()
-                # 문서 추가 (임베딩 포함)
-                chroma_collection.add(
-                    documents=documents.documents,
-                    metadatas=documents.metadatas or [{}] * len(documents.documents),
-                    ids=document_ids,
-                    embeddings=embeddings
-                )
-            else:
-                # 문서 추가 (ChromaDB 기본 임베딩 사용)
-                chroma_collection.add(
-                    documents=documents.documents,
-                    metadatas=documents.metadatas or [{}] * len(documents.documents),
-                    ids=document_ids
-                )
+            # 배치 임베딩 + 추가 (인코딩은 CPU 바운드이므로 이벤트 루프 밖에서 수행)
+            await asyncio.to_thread(
+                self._add_in_batches,
+                chroma_collection,
+                documents.documents,
+                documents.metadatas or [{}] * len(documents.documents),
+                document_ids
+            )
             
-            logger.info(f"Added {len(documents.documents)} documents to collection: {collection_info.name}")
+            logger.info(f"Added {len(documents.documents)} documents to collection: {chroma_collection.name}")
             
         except HTTPException:
             raise
@@ -559,9 +666,11 @@ class ChromaService:
             # ChromaDB 컬렉션 가져오기
             chroma_collection = self.client.get_collection(name=collection_info.name)
             
-            # 문서 검색
+            # 문서 검색 (문서와 같은 모델로 질의 임베딩)
+            query_embeddings = await asyncio.to_thread(self._embed, query.query_texts)
+            query_args = {"query_embeddings": query_embeddings} if query_embeddings is not None else {"query_texts": query.query_texts}
             results = chroma_collection.query(
-                query_texts=query.query_texts,
+                **query_args,
                 n_results=query.n_results or 10,
                 where=query.where,
                 include=query.include or ["documents", "metadatas", "distances"]
@@ -647,6 +756,13 @@ class ChromaService:
         except Exception:
             return 0.0
 
+    def _query_args(self, query: str) -> Dict[str, Any]:
+        """질의 임베딩 인자 (모델이 없으면 ChromaDB 기본 임베딩용 query_texts)"""
+        query_embeddings = self._embed([query])
+        if query_embeddings is None:
+            return {"query_texts": [query]}
+        return {"query_embeddings": query_embeddings}
+    
     # RAG 서비스 호환성을 위한 추가 메서드들
     def hybrid_search(self, collection_name: str, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """하이브리드 검색 (벡터 + 키워드 기반)"""
@@ -655,7 +771,7 @@ class ChromaService:
             
             # 벡터 검색
             vector_results = collection.query(
-                query_texts=[query],
+                **self._query_args(query),
                 n_results=n_results * 2,  # 더 많은 결과를 가져와서 하이브리드 점수로 재정렬
                 include=["documents", "metadatas", "distances"]
             )
@@ -710,7 +826,7 @@ class ChromaService:
             
             # 문서 검색
             results = collection.query(
-                query_texts=[query],
+                **self._query_args(query),
                 n_results=n_results,
                 include=["documents", "metadatas", "distances"]
             )
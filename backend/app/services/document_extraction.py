@@ -0,0 +1,397 @@
+"""
+문서 텍스트 추출 / 청킹
+RAG 문서 수집 파이프라인의 추출 단계 함수 모음
+
+- 모든 함수는 모듈 수준 함수로, ProcessPoolExecutor 자식 프로세스에서 실행할 수 있음 (pickle 가능)
+- 자식 프로세스는 파일 경로만 받아 직접 읽으므로 파일 바이트가 프로세스 간에 복사되지 않음
+- PDF는 페이지 범위 단위로 나눠 여러 프로세스에서 추출하고, 텍스트 레이어가 비어 있는 페이지만 OCR
+- pdfplumber / PyPDF2 / OCR 같은 무거운 의존성은 함수 안에서 import
+"""
+
+import bisect
+import hashlib
+import io
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+TEXT_EXTENSIONS = ['txt', 'md', 'py', 'js', 'html', 'css', 'json', 'xml']
+
+FILE_TYPE_MAPPING = {
+    'pdf': 'pdf',
+    'txt': 'text',
+    'md': 'markdown',
+    'py': 'python',
+    'js': 'javascript',
+    'html': 'html',
+    'css': 'css',
+    'json': 'json',
+    'xml': 'xml',
+    'csv': 'csv'
+}
+
+OCR_DPI = 300
+
+PdfSource = Union[str, bytes]
+
+
+def hash_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """파일 내용 SHA-256 (블록 단위로 읽어 큰 파일도 메모리 사용량이 일정함)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_file_type(filename: str) -> str:
+    """파일 확장자로 파일 타입 결정"""
+    if '.' not in filename:
+        return 'unknown'
+    return FILE_TYPE_MAPPING.get(filename.lower().split('.')[-1], 'text')
+
+
+def extract_text(content: bytes, filename: str) -> str:
+    """파일 타입에 따라 텍스트 추출"""
+    try:
+        file_extension = filename.lower().split('.')[-1] if '.' in filename else ''
+
+        if file_extension == 'pdf':
+            return extract_text_from_pdf(content)
+        elif file_extension in TEXT_EXTENSIONS:
+            # 텍스트 파일들은 여러 인코딩으로 시도
+            for encoding in ['utf-8', 'cp949', 'euc-kr', 'latin-1']:
+                try:
+                    return content.decode(encoding)
+                except UnicodeDecodeError:
+                    continue
+            # 모든 인코딩 실패 시 에러 처리
+            return content.decode('utf-8', errors='ignore')
+        else:
+            # 기본적으로 UTF-8로 시도, 실패하면 무시하고 디코딩
+            try:
+                return content.decode('utf-8')
+            except UnicodeDecodeError:
+                return content.decode('utf-8', errors='ignore')
+
+    except Exception as e:
+        logger.error(f"Failed to extract text from {filename}: {str(e)}")
+        raise Exception(f"텍스트 추출 실패: {str(e)}")
+
+
+def extract_text_from_pdf(content: bytes) -> str:
+    """PDF 파일에서 텍스트 추출 (텍스트 레이어가 없는 페이지는 OCR)"""
+    try:
+        pages = extract_pdf_pages(content)
+        text_parts = [page["text"] for page in pages if page["text"]]
+        if not text_parts:
+            raise Exception(_empty_pdf_error(pages))
+
+        extracted_text = '\n'.join(text_parts)
+        ocr_pages = sum(1 for page in pages if page["method"] == "ocr")
+        logger.info(f"Extracted {len(extracted_text)} characters from {len(pages)} PDF pages ({ocr_pages} via OCR)")
+        return extracted_text
+
+    except Exception as e:
+        logger.error(f"PDF text extraction failed: {str(e)}")
+        raise Exception(f"PDF 파일 처리 실패: {str(e)}")
+
+
+def _open_pdf_source(source: PdfSource):
+    """pdfplumber / PyPDF2가 각자 읽을 수 있도록 매번 새 스트림 (또는 경로) 반환"""
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def count_pdf_pages(source: PdfSource) -> int:
+    """PDF 페이지 수 (페이지 범위를 나누기 위해 본문은 파싱하지 않음)"""
+    from PyPDF2 import PdfReader
+
+    try:
+        return len(PdfReader(_open_pdf_source(source)).pages)
+    except Exception as e:
+        logger.warning(f"PyPDF2 failed to count pages: {str(e)}, trying pdfplumber")
+        import pdfplumber
+
+        try:
+            with pdfplumber.open(_open_pdf_source(source)) as pdf:
+                return len(pdf.pages)
+        except Exception as e:
+            raise Exception(f"PDF 파일 처리 실패: {str(e)}")
+
+
+def pdf_page_ranges(page_count: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    """1부터 시작하는 (first_page, last_page) 범위 목록 (last_page 포함)"""
+    pages_per_task = max(1, pages_per_task)
+    return [
+        (first, min(first + pages_per_task - 1, page_count))
+        for first in range(1, page_count + 1, pages_per_task)
+    ]
+
+
+def extract_pdf_pages(source: PdfSource, first_page: int = 1, last_page: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    PDF 페이지 범위에서 페이지별 텍스트 추출 (추출 프로세스 풀에서 범위 단위로 실행)
+
+    페이지마다 pdfplumber -> (텍스트 레이어가 비어 있으면) PyPDF2 -> OCR 순서로 시도하므로
+    텍스트 페이지는 한 번만 파싱하고, 스캔 페이지만 이미지로 렌더링해 OCR함
+
+    Returns:
+        [{"page": 페이지 번호(1부터), "text": 텍스트, "method": "pdfplumber" | "pypdf2" | "ocr" | "empty",
+          "ocr_error": OCR을 할 수 없었던 이유 (없으면 None)}, ...]
+    """
+    import pdfplumber
+
+    pages = []
+    fallback_reader = None
+    ocr_unavailable: Optional[str] = None
+
+    with pdfplumber.open(_open_pdf_source(source)) as pdf:
+        last_page = min(last_page or len(pdf.pages), len(pdf.pages))
+        for number in range(first_page, last_page + 1):
+            page = pdf.pages[number - 1]
+            method = "pdfplumber"
+            ocr_error = None
+            try:
+                text = page.extract_text() or ''
+            except Exception as e:
+                logger.warning(f"pdfplumber failed on page {number}: {str(e)}, trying PyPDF2")
+                text = ''
+
+            # pdfplumber가 못 읽은 페이지만 PyPDF2로 다시 시도
+            if not text.strip():
+                try:
+                    if fallback_reader is None:
+                        from PyPDF2 import PdfReader
+                        fallback_reader = PdfReader(_open_pdf_source(source))
+                    fallback_text = fallback_reader.pages[number - 1].extract_text() or ''
+                    if len(fallback_text.strip()) > len(text.strip()):
+                        text, method = fallback_text, "pypdf2"
+                except Exception as e:
+                    logger.warning(f"PyPDF2 failed on page {number}: {str(e)}")
+
+            # 텍스트 레이어가 비어 있는 (공백뿐인) 페이지만 OCR
+            # 페이지 번호/머리글처럼 짧은 텍스트만 있는 페이지는 텍스트 레이어를 그대로 사용
+            if not text.strip():
+                if ocr_unavailable is None:
+                    try:
+                        ocr_text = ocr_pdf_page(page)
+                        if ocr_text:
+                            text, method = ocr_text, "ocr"
+                    except ImportError as e:
+                        ocr_unavailable = f"OCR dependencies not installed: {str(e)}"
+                    except Exception as e:
+                        if "tesseract" in str(e).lower():
+                            ocr_unavailable = str(e)
+                        else:
+                            ocr_error = str(e)
+                            logger.warning(f"OCR failed for page {number}: {str(e)}")
+                if ocr_unavailable is not None:
+                    ocr_error = ocr_unavailable
+
+            if not text.strip():
+                text, method = '', "empty"
+            pages.append({"page": number, "text": text, "method": method, "ocr_error": ocr_error})
+
+            # 큰 PDF에서 파싱한 페이지 객체가 메모리에 쌓이지 않도록 정리
+            page.close()
+
+    if ocr_unavailable is not None:
+        logger.warning(f"Skipped OCR for scanned pages {first_page}-{last_page}: {ocr_unavailable}")
+    return pages
+
+
+def ocr_pdf_page(page) -> str:
+    """pdfplumber 페이지 하나를 이미지로 렌더링해 OCR (pypdfium2로 렌더링하므로 poppler 불필요)"""
+    import pytesseract
+
+    image = page.to_image(resolution=OCR_DPI).original
+    processed_image = preprocess_image_for_ocr(image)
+    page_text = pytesseract.image_to_string(
+        processed_image,
+        lang='kor+eng',  # 한국어 + 영어
+        config='--psm 3 --oem 3'  # 페이지 분할 모드와 OCR 엔진 모드
+    )
+    return page_text.strip()
+
+
+def _empty_pdf_error(pages: List[Dict[str, Any]]) -> str:
+    """텍스트를 하나도 얻지 못한 PDF의 오류 메시지 (OCR을 못 한 경우 설치 안내)"""
+    ocr_errors = [page["ocr_error"] for page in pages if page.get("ocr_error")]
+    if ocr_errors and any("not installed" in error or "tesseract" in error.lower() for error in ocr_errors):
+        return "OCR 기능을 사용하려면 pytesseract 라이브러리와 tesseract가 필요합니다. 설치 가이드: backend/OCR_SETUP.md 참조"
+    if ocr_errors:
+        return f"OCR 처리 실패: {ocr_errors[0]}"
+    return "OCR로 텍스트를 추출할 수 없습니다."
+
+
+def extract_text_with_ocr(content: bytes) -> str:
+    """OCR을 사용하여 스캔된 PDF에서 텍스트 추출"""
+    try:
+        import pytesseract
+        from pdf2image import convert_from_bytes
+
+        logger.info("Starting OCR extraction from PDF")
+
+        # PDF를 이미지로 변환
+        try:
+            images = convert_from_bytes(content, dpi=300)
+            logger.info(f"Converted PDF to {len(images)} images")
+        except Exception as e:
+            logger.error(f"Failed to convert PDF to images: {str(e)}")
+            # poppler가 설치되지 않은 경우 사용자에게 안내
+            if "poppler" in str(e).lower() or "pdftoppm" in str(e).lower():
+                raise Exception("PDF를 이미지로 변환할 수 없습니다. OCR 기능을 사용하려면 poppler-utils를 설치해주세요. 설치 가이드: backend/OCR_SETUP.md 참조")
+            else:
+                raise Exception(f"PDF를 이미지로 변환할 수 없습니다: {str(e)}")
+
+        # 각 페이지에서 텍스트 추출
+        extracted_texts = []
+
+        for i, image in enumerate(images):
+            try:
+                # 이미지 전처리
+                processed_image = preprocess_image_for_ocr(image)
+
+                # OCR 수행
+                page_text = pytesseract.image_to_string(
+                    processed_image,
+                    lang='kor+eng',  # 한국어 + 영어
+                    config='--psm 3 --oem 3'  # 페이지 분할 모드와 OCR 엔진 모드
+                )
+
+                if page_text.strip():
+                    extracted_texts.append(page_text.strip())
+                    logger.info(f"OCR extracted {len(page_text)} characters from page {i+1}")
+
+            except Exception as e:
+                logger.warning(f"OCR failed for page {i+1}: {str(e)}")
+                continue
+
+        if not extracted_texts:
+            raise Exception("OCR로 텍스트를 추출할 수 없습니다.")
+
+        final_text = '\n\n'.join(extracted_texts)
+        logger.info(f"OCR extraction completed: {len(final_text)} total characters")
+        return final_text
+
+    except ImportError as e:
+        logger.error(f"OCR dependencies not installed: {str(e)}")
+        raise Exception("OCR 기능을 사용하려면 pytesseract, Pillow, pdf2image 라이브러리가 필요합니다. 설치 가이드: backend/OCR_SETUP.md 참조")
+    except Exception as e:
+        logger.error(f"OCR extraction failed: {str(e)}")
+        raise Exception(f"OCR 처리 실패: {str(e)}")
+
+
+def preprocess_image_for_ocr(image):
+    """OCR을 위한 이미지 전처리"""
+    try:
+        from PIL import ImageEnhance
+
+        # 그레이스케일 변환
+        if image.mode != 'L':
+            image = image.convert('L')
+
+        # 대비 조정
+        enhancer = ImageEnhance.Contrast(image)
+        image = enhancer.enhance(1.5)
+
+        # 선명도 조정
+        enhancer = ImageEnhance.Sharpness(image)
+        image = enhancer.enhance(1.2)
+
+        return image
+
+    except Exception as e:
+        logger.warning(f"Image preprocessing failed: {str(e)}")
+        return image  # 전처리 실패 시 원본 이미지 반환
+
+
+def split_text(text: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> List[str]:
+    """RAGDataSourceService와 같은 설정으로 텍스트 청킹"""
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+    )
+    return splitter.split_text(text)
+
+
+def split_pdf_pages(pages: List[Dict[str, Any]], chunk_size: int = 1000, chunk_overlap: int = 200) -> Dict[str, Any]:
+    """
+    페이지별 추출 결과를 이어 붙여 청킹하고 청크마다 출처 페이지 범위를 계산 (추출 프로세스 풀에서 실행)
+
+    페이지 경계와 상관없이 기존과 같은 방식으로 전체 텍스트를 청킹하므로 청크 내용(= 청크 ID)은 그대로 유지됨
+
+    Returns:
+        {"chunks": [...], "chunk_pages": [(시작 페이지, 끝 페이지), ...], "characters": 추출된 문자 수,
+         "page_count": 페이지 수, "ocr_pages": OCR한 페이지 수}
+    """
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    pages = sorted(pages, key=lambda page: page["page"])
+    text_parts, page_starts, page_numbers = [], [], []
+    offset = 0
+    for page in pages:
+        if not page["text"]:
+            continue
+        page_starts.append(offset)
+        page_numbers.append(page["page"])
+        text_parts.append(page["text"])
+        offset += len(page["text"]) + 1  # '\n' 구분자
+
+    if not text_parts:
+        raise Exception(f"PDF 파일 처리 실패: {_empty_pdf_error(pages)}")
+
+    text_content = '\n'.join(text_parts)
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        add_start_index=True,
+    )
+    chunks, chunk_pages = [], []
+    for document in splitter.create_documents([text_content]):
+        chunk = document.page_content
+        start = max(document.metadata.get("start_index", 0), 0)
+        end = start + max(len(chunk) - 1, 0)
+        chunks.append(chunk)
+        chunk_pages.append((
+            page_numbers[bisect.bisect_right(page_starts, start) - 1],
+            page_numbers[bisect.bisect_right(page_starts, end) - 1]
+        ))
+
+    return {
+        "chunks": chunks,
+        "chunk_pages": chunk_pages,
+        "characters": len(text_content),
+        "page_count": len(pages),
+        "ocr_pages": sum(1 for page in pages if page["method"] == "ocr")
+    }
+
+
+def extract_and_split(file_path: str, filename: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> Dict[str, Any]:
+    """
+    저장된 파일을 읽어 텍스트 추출 후 청킹 (추출 프로세스 풀에서 실행)
+
+    Returns:
+        {"chunks": [...], "characters": 추출된 문자 수}
+        PDF는 split_pdf_pages 결과 (청크별 출처 페이지 포함)
+    """
+    if get_file_type(filename) == 'pdf':
+        return split_pdf_pages(extract_pdf_pages(file_path), chunk_size, chunk_overlap)
+
+    with open(file_path, "rb") as f:
+        content = f.read()
+
+    text_content = extract_text(content, filename)
+    del content
+    if not text_content.strip():
+        return {"chunks": [], "characters": 0}
+
+    return {
+        "chunks": split_text(text_content, chunk_size, chunk_overlap),
+        "characters": len(text_content)
+    }
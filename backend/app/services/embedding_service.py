@@ -0,0 +1,134 @@
+"""
+임베딩 서비스
+SentenceTransformer 모델을 프로세스당 한 번만 로드하고, 설정된 배치 크기로 인코딩합니다.
+
+- 요청마다 ChromaService()를 새로 만들어도 모델은 공유됨 (get_embedding_service 싱글턴)
+- 출력은 float32 NumPy 배열이며, 정규화는 인코딩 후 한 번에 in-place로 수행
+- 문서와 질의를 같은 모델로 임베딩해 Chroma에 embeddings= / query_embeddings= 로 명시 전달
+  (query_texts만 넘기면 Chroma 기본 임베더가 사용되어 EMBEDDING_MODEL과 어긋날 수 있음)
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """SentenceTransformer 기반 배치 임베딩 서비스"""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        device: Optional[str] = None
+    ):
+        self.model_name = model_name or settings.embedding_model
+        self.batch_size = batch_size or settings.embedding_batch_size
+        self.device = device or settings.embedding_device or None
+        self._model = None
+        self._load_failed = False
+        self._lock = threading.Lock()
+
+        # 지표
+        self.encoded_texts = 0
+        self.encode_seconds = 0.0
+
+    @property
+    def model(self):
+        """SentenceTransformer 모델 (최초 접근 시 로드, 실패하면 None)"""
+        if self._model is None and not self._load_failed:
+            with self._lock:
+                if self._model is None and not self._load_failed:
+                    self._load_model()
+        return self._model
+
+    def _load_model(self) -> None:
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Loading embedding model: {self.model_name} (batch_size={self.batch_size}, device={self.device or 'auto'})")
+            started = time.perf_counter()
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+            logger.info(f"Embedding model loaded successfully: {self.model_name} ({time.perf_counter() - started:.1f}s)")
+        except Exception as e:
+            logger.error(f"Failed to load embedding model: {str(e)}")
+            logger.warning("Embedding model not loaded, will use default ChromaDB embeddings")
+            self._load_failed = True
+
+    @property
+    def available(self) -> bool:
+        return self.model is not None
+
+    @property
+    def dimension(self) -> Optional[int]:
+        model = self.model
+        return model.get_sentence_embedding_dimension() if model is not None else None
+
+    def encode(self, texts: Sequence[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        텍스트 목록을 배치 단위로 인코딩합니다.
+
+        Returns:
+            (len(texts), dim) float32 배열, 각 행은 L2 정규화됨
+        """
+        model = self.model
+        if model is None:
+            raise RuntimeError(f"임베딩 모델을 사용할 수 없습니다: {self.model_name}")
+        if not texts:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+
+        started = time.perf_counter()
+        vectors = model.encode(
+            list(texts),
+            batch_size=batch_size or self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+            show_progress_bar=False
+        ).astype(np.float32, copy=False)
+        normalize_rows(vectors)
+
+        self.encoded_texts += len(texts)
+        self.encode_seconds += time.perf_counter() - started
+        return vectors
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """질의 하나를 인코딩합니다 (1 x dim)."""
+        return self.encode([query])
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "loaded": self._model is not None,
+            "batch_size": self.batch_size,
+            "encoded_texts": self.encoded_texts,
+            "texts_per_second": round(self.encoded_texts / self.encode_seconds, 1) if self.encode_seconds else None
+        }
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (in-place, 영벡터는 그대로 유지)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    vectors /= norms
+    return vectors
+
+
+_embedding_service_instance: Optional[EmbeddingService] = None
+_instance_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """EmbeddingService 싱글톤 인스턴스 반환"""
+    global _embedding_service_instance
+    if _embedding_service_instance is None:
+        with _instance_lock:
+            if _embedding_service_instance is None:
+                _embedding_service_instance = EmbeddingService()
+    return _embedding_service_instance
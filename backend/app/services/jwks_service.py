@@ -4,6 +4,9 @@ Manages RSA key pairs for signing and verifying ID tokens
 """
 import json
 import uuid
+import time
+import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from cryptography.hazmat.primitives import serialization
@@ -19,6 +22,99 @@ from ..utils.encryption import encrypt_data, decrypt_data
 
 logger = logging.getLogger(__name__)
 
+
+class SigningKeyring:
+    """
+    In-process cache of signing keys keyed by kid
+    
+    Holds decrypted private keys, the precomputed JWKS document and its ETag,
+    so signing an ID token or serving /jwks does not hit the database or
+    decrypt/parse PEM on every request. Entries are refreshed by the key
+    rotation task and expire after a short safety TTL so that rotations done
+    by another process are picked up.
+    """
+    
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._keys: Dict[str, Dict] = {}
+        self._active_kid: Optional[str] = None
+        self._jwks: Dict = {"keys": []}
+        self._etag: Optional[str] = None
+        self._loaded_at: float = 0.0
+    
+    def is_fresh(self) -> bool:
+        return self._loaded_at > 0 and (time.monotonic() - self._loaded_at) < self.ttl_seconds
+    
+    def invalidate(self) -> None:
+        """Drop cached keys so the next access reloads from the database"""
+        with self._lock:
+            self._loaded_at = 0.0
+    
+    def refresh(self, db: Session, service: "JWKSService") -> None:
+        """
+        Reload all active keys from the database
+        
+        Private keys are decrypted once per kid; keys already held in memory
+        are reused as-is.
+        """
+        result = db.execute(
+            text("""
+                SELECT kid, private_key, public_key, algorithm 
+                FROM oauth_signing_keys 
+                WHERE is_active = true 
+                AND expires_at > NOW()
+                ORDER BY created_at DESC
+            """)
+        )
+        rows = result.fetchall()
+        
+        with self._lock:
+            keys: Dict[str, Dict] = {}
+            for kid, encrypted_private_key, public_key_pem, algorithm in rows:
+                cached = self._keys.get(kid)
+                if cached and cached["public_key"] == public_key_pem:
+                    keys[kid] = cached
+                    continue
+                keys[kid] = {
+                    "kid": kid,
+                    "private_key": decrypt_data(encrypted_private_key),
+                    "public_key": public_key_pem,
+                    "algorithm": algorithm,
+                    "jwk": service._pem_to_jwk(public_key_pem, kid, algorithm)
+                }
+            
+            jwks = {"keys": [keys[row[0]]["jwk"] for row in rows]}
+            
+            self._keys = keys
+            self._active_kid = rows[0][0] if rows else None
+            self._jwks = jwks
+            self._etag = '"' + hashlib.sha256(
+                json.dumps(jwks, sort_keys=True).encode()
+            ).hexdigest()[:32] + '"'
+            self._loaded_at = time.monotonic()
+        
+        logger.debug(f"Signing keyring refreshed with {len(keys)} active key(s)")
+    
+    def ensure_fresh(self, db: Session, service: "JWKSService") -> None:
+        if not self.is_fresh():
+            self.refresh(db, service)
+    
+    def get_active_key(self) -> Optional[Dict]:
+        key = self._keys.get(self._active_kid) if self._active_kid else None
+        if not key:
+            return None
+        return {
+            "kid": key["kid"],
+            "private_key": key["private_key"],
+            "public_key": key["public_key"],
+            "algorithm": key["algorithm"]
+        }
+    
+    def get_jwks(self) -> Tuple[Dict, Optional[str]]:
+        return self._jwks, self._etag
+
+
 class JWKSService:
     """Service for managing JSON Web Keys"""
     
@@ -26,6 +122,9 @@ class JWKSService:
         self.key_size = 2048
         self.algorithm = "RS256"
         self.rotation_days = getattr(settings, 'oidc_key_rotation_days', 90)
+        self.keyring = SigningKeyring(
+            ttl_seconds=getattr(settings, 'oidc_keyring_ttl_seconds', 300)
+        )
         
     def generate_key_pair(self) -> Tuple[str, str, str]:
         """
@@ -104,6 +203,7 @@ class JWKSService:
                 }
             )
             db.commit()
+            self.keyring.invalidate()
             logger.info(f"Stored new key pair with kid: {kid}")
             return True
             
@@ -116,32 +216,17 @@ class JWKSService:
         """
         Get the current active signing key
         
+        Served from the in-process keyring; the database is only queried
+        when the keyring is stale.
+        
         Args:
             db: Database session
             
         Returns:
             Dictionary with key information or None
         """
-        result = db.execute(
-            text("""
-                SELECT kid, private_key, public_key, algorithm 
-                FROM oauth_signing_keys 
-                WHERE is_active = true 
-                AND expires_at > NOW()
-                ORDER BY created_at DESC 
-                LIMIT 1
-            """)
-        )
-        
-        key_data = result.first()
-        if key_data:
-            return {
-                "kid": key_data[0],
-                "private_key": decrypt_data(key_data[1]),
-                "public_key": key_data[2],
-                "algorithm": key_data[3]
-            }
-        return None
+        self.keyring.ensure_fresh(db, self)
+        return self.keyring.get_active_key()
     
     def get_public_keys_jwks(self, db: Session) -> Dict:
         """
@@ -153,26 +238,21 @@ class JWKSService:
         Returns:
             JWKS formatted dictionary
         """
-        # Get all active public keys
-        result = db.execute(
-            text("""
-                SELECT kid, public_key, algorithm 
-                FROM oauth_signing_keys 
-                WHERE is_active = true 
-                AND expires_at > NOW()
-                ORDER BY created_at DESC
-            """)
-        )
+        jwks, _ = self.get_public_keys_jwks_with_etag(db)
+        return jwks
+    
+    def get_public_keys_jwks_with_etag(self, db: Session) -> Tuple[Dict, Optional[str]]:
+        """
+        Get the precomputed JWKS document together with its ETag
         
-        keys = []
-        for row in result:
-            kid, public_key_pem, algorithm = row
+        Args:
+            db: Database session
             
-            # Convert PEM to JWK format
-            jwk_key = self._pem_to_jwk(public_key_pem, kid, algorithm)
-            keys.append(jwk_key)
-        
-        return {"keys": keys}
+        Returns:
+            Tuple of (JWKS dictionary, ETag header value)
+        """
+        self.keyring.ensure_fresh(db, self)
+        return self.keyring.get_jwks()
     
     def _pem_to_jwk(self, pem_key: str, kid: str, algorithm: str = "RS256") -> Dict:
         """
@@ -255,6 +335,7 @@ class JWKSService:
             )
             
             db.commit()
+            self.keyring.refresh(db, self)
             logger.info("Successfully rotated signing keys")
             return True
             
@@ -311,6 +392,7 @@ class JWKSService:
             db.commit()
             
             if deleted_count > 0:
+                self.keyring.invalidate()
                 logger.info(f"Cleaned up {deleted_count} expired keys")
                 
             return deleted_count
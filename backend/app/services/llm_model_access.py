@@ -0,0 +1,127 @@
+"""
+LLM Model Access Resolver
+Per-user resolution of accessible LLM models (ownership + grants), shared by
+/api/llm-models, the LLM chat service and llm_service, and cached through
+LLMModelCache so repeated model listings skip the permission OR-query.
+
+Cache entries are invalidated through CacheEvents: model create/update/delete
+and permission grant/revoke bump or drop the affected lists.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, Session
+
+from ..database import SessionLocal
+from ..models.llm_chat import MAXLLM_Model, MAXLLM_Model_Permission, OwnerType
+from ..utils.cache import LLMModelCache
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_group_ids(group_ids: Optional[Iterable[Any]]) -> List[str]:
+    return sorted({str(group_id) for group_id in (group_ids or []) if group_id})
+
+
+def build_accessible_models_query(db: Session, user_id: str, group_ids: Optional[Iterable[Any]] = None) -> Query:
+    """Active models the user owns, their groups own, or were granted to either"""
+    user_id = str(user_id)
+    group_ids = _normalize_group_ids(group_ids)
+
+    access_conditions = [
+        # 1. 사용자 소유 모델
+        and_(
+            MAXLLM_Model.owner_type == OwnerType.USER,
+            MAXLLM_Model.owner_id == user_id
+        ),
+        # 2. 직접 권한이 부여된 모델
+        MAXLLM_Model.id.in_(
+            db.query(MAXLLM_Model_Permission.model_id).filter(
+                and_(
+                    MAXLLM_Model_Permission.grantee_type == OwnerType.USER,
+                    MAXLLM_Model_Permission.grantee_id == user_id
+                )
+            )
+        )
+    ]
+
+    if group_ids:
+        access_conditions.extend([
+            # 3. 그룹 소유 모델
+            and_(
+                MAXLLM_Model.owner_type == OwnerType.GROUP,
+                MAXLLM_Model.owner_id.in_(group_ids)
+            ),
+            # 4. 그룹 권한이 부여된 모델
+            MAXLLM_Model.id.in_(
+                db.query(MAXLLM_Model_Permission.model_id).filter(
+                    and_(
+                        MAXLLM_Model_Permission.grantee_type == OwnerType.GROUP,
+                        MAXLLM_Model_Permission.grantee_id.in_(group_ids)
+                    )
+                )
+            )
+        ])
+
+    return db.query(MAXLLM_Model).filter(
+        MAXLLM_Model.is_active == True,
+        or_(*access_conditions)
+    )
+
+
+def model_to_dict(model: MAXLLM_Model) -> Dict[str, Any]:
+    """Cacheable snapshot of a model row (enums stored by value)"""
+    return {
+        "id": model.id,
+        "model_name": model.model_name,
+        "model_type": model.model_type.value,
+        "model_id": model.model_id,
+        "description": model.description,
+        "config": model.config,
+        "owner_type": model.owner_type.value,
+        "owner_id": model.owner_id,
+        "is_active": model.is_active,
+        "created_at": model.created_at,
+        "updated_at": model.updated_at,
+    }
+
+
+def load_accessible_models(user_id: str, group_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Query accessible models with a dedicated session
+    The cache may run this after the request that triggered it has finished
+    (stale-while-revalidate), so it must not borrow the request session.
+    """
+    db: Session = SessionLocal()
+    try:
+        models = build_accessible_models_query(db, user_id, group_ids)\
+            .order_by(MAXLLM_Model.created_at.desc())\
+            .all()
+        return [model_to_dict(model) for model in models]
+    finally:
+        db.close()
+
+
+async def get_accessible_models(
+    user_id: str,
+    group_ids: Optional[Iterable[Any]] = None
+) -> List[Dict[str, Any]]:
+    """Accessible models for a user, newest first (cached per user and group set)"""
+    user_id = str(user_id)
+    group_ids = _normalize_group_ids(group_ids)
+
+    async def load() -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(load_accessible_models, user_id, group_ids)
+
+    return await LLMModelCache.get_or_load_models_list(user_id, load, group_ids=group_ids)
+
+
+async def get_accessible_model_ids(
+    user_id: str,
+    group_ids: Optional[Iterable[Any]] = None
+) -> Set[str]:
+    """Ids of the models a user can access"""
+    return {model["id"] for model in await get_accessible_models(user_id, group_ids)}
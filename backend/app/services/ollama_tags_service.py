@@ -0,0 +1,97 @@
+"""
+Ollama Tags Service
+Keeps the Ollama /api/tags model list in memory per server so model dropdowns
+never wait on Ollama. The default server is refreshed by a background task;
+other servers are refreshed on demand (stale entries are served while a single
+refresh runs).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaTagsService:
+    """In-process cache of Ollama model tags keyed by server base URL"""
+
+    def __init__(self, refresh_seconds: int = 30, max_servers: int = 32, timeout: float = 10.0):
+        self.refresh_seconds = refresh_seconds
+        self.max_servers = max_servers
+        self.timeout = timeout
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _normalize(base_url: Optional[str]) -> str:
+        return (base_url or settings.ollama_base_url).rstrip("/")
+
+    async def _fetch(self, base_url: str) -> List[Dict[str, Any]]:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(f"{base_url}/api/tags")
+            response.raise_for_status()
+            models = response.json().get("models", [])
+
+        self._entries[base_url] = (time.monotonic(), models)
+        self._entries.move_to_end(base_url)
+        while len(self._entries) > self.max_servers:
+            self._entries.popitem(last=False)
+        return models
+
+    def _refresh_task(self, base_url: str) -> asyncio.Task:
+        """Start (or join) the single refresh for a server"""
+        task = self._inflight.get(base_url)
+        if task is None:
+            task = asyncio.create_task(self._fetch(base_url))
+            self._inflight[base_url] = task
+            task.add_done_callback(lambda t: self._on_refresh_done(base_url, t))
+        return task
+
+    def _on_refresh_done(self, base_url: str, task: asyncio.Task):
+        self._inflight.pop(base_url, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Ollama tags refresh failed for {base_url}: {task.exception()}")
+
+    async def refresh(self, base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch the tag list now (joins a refresh already in flight)"""
+        return await asyncio.shield(self._refresh_task(self._normalize(base_url)))
+
+    async def get_models(self, base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Model entries from /api/tags (name, size, digest, modified_at, details)
+
+        Served from memory when cached; a stale entry triggers one background
+        refresh. Only the very first request for a server waits on Ollama and
+        sees its errors (httpx exceptions).
+        """
+        base_url = self._normalize(base_url)
+        entry = self._entries.get(base_url)
+        if entry is None:
+            return await self.refresh(base_url)
+
+        fetched_at, models = entry
+        if time.monotonic() - fetched_at > self.refresh_seconds:
+            self._refresh_task(base_url)
+        return models
+
+    async def get_model_names(self, base_url: Optional[str] = None) -> List[str]:
+        return [model["name"] for model in await self.get_models(base_url)]
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "servers": {url: {"models": len(models), "age_seconds": now - fetched_at}
+                        for url, (fetched_at, models) in self._entries.items()},
+            "refreshing": list(self._inflight),
+        }
+
+
+# Global Ollama tags service instance
+ollama_tags_service = OllamaTagsService(refresh_seconds=settings.ollama_tags_refresh_seconds)
@@ -21,6 +21,7 @@ from ..models.security_event import (
     SecurityBlockType, SecurityActionType
 )
 from ..models.user import User
+from ..utils.principal_cache import principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -434,6 +435,7 @@ class SecurityMonitorService:
                 user.lock_reason = result.rule_name
                 
                 db.commit()
+                principal_cache.invalidate_user(user_id)
                 self.logger.warning(f"User {user_id} locked due to {result.rule_name}")
             
         except Exception as e:
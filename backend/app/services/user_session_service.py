@@ -9,6 +9,7 @@ import json
 from ..models import User
 from ..database import SessionLocal
 from .user_switch_security_service import user_switch_security_service
+from ..utils.token_revocation import token_revocation_index
 
 logger = logging.getLogger(__name__)
 
@@ -203,6 +204,9 @@ class UserSessionService:
             
             db.commit()
             
+            # 실행 중인 API 프로세스에 즉시 반영
+            token_revocation_index.revoke_users([user_id])
+            
             total_tokens_revoked = access_tokens_revoked + refresh_tokens_revoked
             
             logger.info(f"All sessions logged out for user {user_id}: {sessions_terminated} sessions, {total_tokens_revoked} tokens")
@@ -236,6 +240,7 @@ class UserSessionService:
             
             sessions_terminated = 0
             tokens_revoked = 0
+            revoked_access_tokens = []
             failed_sessions = []
             
             # 실제 세션 삭제
@@ -258,10 +263,12 @@ class UserSessionService:
                         WHERE user_id = :user_id 
                         AND session_id = ANY(:session_ids)
                         AND revoked_at IS NULL
+                        RETURNING token_hash, expires_at
                     """),
                     {"user_id": user_id, "session_ids": real_session_ids}
-                )
-                tokens_revoked += result.rowcount
+                ).fetchall()
+                revoked_access_tokens.extend(result)
+                tokens_revoked += len(result)
             
             # 토큰 기반 세션 처리
             if token_session_ids:
@@ -272,12 +279,15 @@ class UserSessionService:
                         WHERE user_id = :user_id 
                         AND id = ANY(:token_ids)
                         AND revoked_at IS NULL
+                        RETURNING token_hash, expires_at
                     """),
                     {"user_id": user_id, "token_ids": token_session_ids}
-                )
-                tokens_revoked += result.rowcount
+                ).fetchall()
+                revoked_access_tokens.extend(result)
+                tokens_revoked += len(result)
             
             db.commit()
+            token_revocation_index.revoke_tokens(revoked_access_tokens)
             
             logger.info(f"Specific sessions logged out for user {user_id}: {len(session_ids)} requested, {sessions_terminated} sessions, {tokens_revoked} tokens")
             
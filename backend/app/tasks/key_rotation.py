@@ -51,6 +51,9 @@ async def rotate_signing_keys():
                 deleted = jwks_service.cleanup_expired_keys(db)
                 if deleted > 0:
                     logger.info(f"Cleaned up {deleted} expired keys")
+                
+                # Reload the in-process keyring so signing and /jwks see the current key set
+                jwks_service.keyring.refresh(db, jwks_service)
                     
             finally:
                 db.close()
@@ -70,6 +73,7 @@ def init_key_rotation_task():
     db = SessionLocal()
     try:
         jwks_service.ensure_active_key_exists(db)
+        jwks_service.keyring.refresh(db, jwks_service)
     finally:
         db.close()
     
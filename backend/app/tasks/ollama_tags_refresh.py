@@ -0,0 +1,33 @@
+"""
+Background task for refreshing the Ollama model tag list
+Keeps model dropdowns served from memory instead of calling Ollama per request
+"""
+import asyncio
+from ..services.ollama_tags_service import ollama_tags_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def refresh_ollama_tags():
+    """
+    Background task keeping the default Ollama server's tag list warm
+    Runs every `ollama_tags_refresh_seconds`
+    """
+    while True:
+        try:
+            await ollama_tags_service.refresh()
+        except Exception as e:
+            # Ollama가 꺼져 있는 환경이 많으므로 debug 레벨로 기록
+            logger.debug(f"Ollama tags refresh error: {str(e)}")
+        
+        # Wait for next refresh
+        await asyncio.sleep(ollama_tags_service.refresh_seconds)
+
+def init_ollama_tags_task():
+    """
+    Initialize Ollama tags refresh task
+    Called during application startup
+    """
+    # Create background task
+    asyncio.create_task(refresh_ollama_tags())
+    logger.info("Ollama tags refresh background task started")
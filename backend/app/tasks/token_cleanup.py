@@ -0,0 +1,206 @@
+"""
+Background task for purging expired and revoked OAuth tokens
+Keeps token tables small without putting DELETEs on the /token request path
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..database import SessionLocal
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables swept by the reaper, in purge order, with their purge condition.
+# Revoked access tokens are kept until they expire so the revocation index
+# can be warmed up from them after a restart.
+TOKEN_TABLES = ("oauth_access_tokens", "oauth_refresh_tokens")
+PURGE_CONDITIONS = {
+    "oauth_access_tokens": "expires_at < NOW()",
+    "oauth_refresh_tokens": "expires_at < NOW() OR revoked_at IS NOT NULL",
+}
+
+# Reaper metrics (per process)
+_metrics: Dict[str, Any] = {
+    "runs": 0,
+    "batches": 0,
+    "rows_purged": 0,
+    "rows_purged_by_table": {table: 0 for table in TOKEN_TABLES},
+    "grace_tokens_revoked": 0,
+    "errors": 0,
+    "last_run_at": None,
+    "last_run_rows": 0,
+    "last_run_duration_ms": 0.0,
+    "last_batch_latency_ms": 0.0,
+    "max_batch_latency_ms": 0.0,
+    "total_batch_latency_ms": 0.0,
+}
+
+
+def purge_token_batch(db: Session, table: str, batch_size: int) -> int:
+    """
+    Delete one bounded batch of expired/revoked rows from a token table
+
+    Rows are picked with FOR UPDATE SKIP LOCKED so the reaper never waits on
+    rows that a concurrent token request is touching.
+    """
+    if table not in TOKEN_TABLES:
+        raise ValueError(f"Unsupported token table: {table}")
+
+    result = db.execute(
+        text(f"""
+            DELETE FROM {table}
+            WHERE id IN (
+                SELECT id FROM {table}
+                WHERE {PURGE_CONDITIONS[table]}
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+        """),
+        {"batch_size": batch_size}
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def revoke_expired_grace_batch(db: Session, batch_size: int) -> int:
+    """
+    Flip one bounded batch of 'rotating' refresh tokens whose grace period has
+    elapsed to 'revoked'
+
+    Refresh validation already treats these rows as invalid at read time, so
+    this sweep only keeps token_status accurate for reporting and purging.
+    """
+    result = db.execute(
+        text("""
+            UPDATE oauth_refresh_tokens
+            SET token_status = 'revoked', revoked_at = NOW()
+            WHERE id IN (
+                SELECT id FROM oauth_refresh_tokens
+                WHERE token_status = 'rotating'
+                AND rotation_grace_expires_at < NOW()
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+        """),
+        {"batch_size": batch_size}
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def _record_batch(table: str, rows: int, latency_ms: float):
+    _metrics["batches"] += 1
+    _metrics["rows_purged"] += rows
+    _metrics["rows_purged_by_table"][table] += rows
+    _metrics["last_batch_latency_ms"] = latency_ms
+    _metrics["total_batch_latency_ms"] += latency_ms
+    if latency_ms > _metrics["max_batch_latency_ms"]:
+        _metrics["max_batch_latency_ms"] = latency_ms
+
+
+def purge_expired_tokens(
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None
+) -> int:
+    """
+    Run one reaper sweep: expire elapsed rotation grace periods, then purge
+    expired/revoked rows from all token tables
+
+    Each table is purged in batches of `batch_size` rows until a short batch
+    is returned or `max_batches` is reached, so a single sweep has a bounded
+    cost even after a long outage.
+    """
+    batch_size = batch_size or settings.token_cleanup_batch_size
+    max_batches = max_batches or settings.token_cleanup_max_batches
+    total_deleted = 0
+
+    db: Session = SessionLocal()
+    try:
+        # Lazy status sweep for refresh tokens left in 'rotating'
+        for _ in range(max_batches):
+            try:
+                revoked = revoke_expired_grace_batch(db, batch_size)
+            except Exception as e:
+                db.rollback()
+                _metrics["errors"] += 1
+                logger.error(f"Grace period sweep error: {str(e)}")
+                break
+
+            _metrics["grace_tokens_revoked"] += revoked
+            if revoked < batch_size:
+                break
+
+        for table in TOKEN_TABLES:
+            for _ in range(max_batches):
+                started = time.perf_counter()
+                try:
+                    deleted = purge_token_batch(db, table, batch_size)
+                except Exception as e:
+                    db.rollback()
+                    _metrics["errors"] += 1
+                    logger.error(f"Token cleanup batch error on {table}: {str(e)}")
+                    break
+
+                _record_batch(table, deleted, (time.perf_counter() - started) * 1000)
+                total_deleted += deleted
+
+                if deleted < batch_size:
+                    break
+    finally:
+        db.close()
+
+    return total_deleted
+
+
+async def cleanup_expired_tokens():
+    """
+    Background task to purge expired/revoked access and refresh tokens
+    Runs every `token_cleanup_interval_seconds`
+    """
+    while True:
+        started = time.perf_counter()
+        try:
+            # Run the blocking sweep off the event loop
+            deleted = await asyncio.to_thread(purge_expired_tokens)
+
+            _metrics["runs"] += 1
+            _metrics["last_run_rows"] = deleted
+            if deleted > 0:
+                logger.info(f"Cleaned up {deleted} expired/revoked tokens")
+
+        except Exception as e:
+            _metrics["errors"] += 1
+            logger.error(f"Token cleanup task error: {str(e)}")
+
+        _metrics["last_run_at"] = datetime.utcnow().isoformat()
+        _metrics["last_run_duration_ms"] = (time.perf_counter() - started) * 1000
+
+        # Wait for next sweep
+        await asyncio.sleep(settings.token_cleanup_interval_seconds)
+
+
+def get_token_cleanup_metrics() -> Dict[str, Any]:
+    """Get token reaper metrics"""
+    metrics = dict(_metrics)
+    metrics["rows_purged_by_table"] = dict(_metrics["rows_purged_by_table"])
+    metrics["avg_batch_latency_ms"] = (
+        _metrics["total_batch_latency_ms"] / _metrics["batches"]
+        if _metrics["batches"] else 0.0
+    )
+    metrics["interval_seconds"] = settings.token_cleanup_interval_seconds
+    metrics["batch_size"] = settings.token_cleanup_batch_size
+    return metrics
+
+
+def init_token_cleanup_task():
+    """
+    Initialize token cleanup task
+    Called during application startup
+    """
+    # Create background task
+    asyncio.create_task(cleanup_expired_tokens())
+    logger.info("Token cleanup background task started")
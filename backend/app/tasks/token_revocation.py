@@ -0,0 +1,45 @@
+"""
+Background tasks for the in-process access token revocation index
+Warms the index up at startup, follows Redis fan-out and prunes expired entries
+"""
+import asyncio
+from sqlalchemy.orm import Session
+from ..database import SessionLocal
+from ..utils.token_revocation import token_revocation_index
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def prune_revocation_index():
+    """
+    Background task to drop expired entries from the revocation index
+    Runs every 10 minutes
+    """
+    while True:
+        await asyncio.sleep(600)  # 10 minutes
+        try:
+            removed = token_revocation_index.prune()
+            if removed > 0:
+                logger.info(f"Pruned {removed} expired revocation entries")
+        except Exception as e:
+            logger.error(f"Revocation index prune error: {str(e)}")
+
+def init_token_revocation_task():
+    """
+    Initialize token revocation index
+    Called during application startup
+    """
+    # Bulk warm-up from the database and persisted Redis cutoffs
+    db: Session = SessionLocal()
+    try:
+        stats = token_revocation_index.warm_up(db)
+        logger.info(f"Token revocation index warmed up: {stats}")
+    except Exception as e:
+        logger.error(f"Token revocation warm-up error: {str(e)}")
+    finally:
+        db.close()
+    
+    # Create background tasks
+    asyncio.create_task(token_revocation_index.listen())
+    asyncio.create_task(prune_revocation_index())
+    logger.info("Token revocation background tasks started")
@@ -9,9 +9,12 @@ from ..config import settings
 from ..database import get_db
 from ..models.user import User
 import logging
+import hashlib
 import secrets
 import uuid
 from .logging_config import get_auth_logger, log_auth_event, SecurityDataFilter
+from .token_revocation import token_revocation_index
+from .principal_cache import Principal, principal_cache
 
 logger = get_auth_logger()
 
@@ -160,17 +163,24 @@ def extract_token_from_request(request: Request) -> Optional[str]:
     
     return None
 
-def get_current_user(
-    request: Request,
-    token: Optional[str] = Depends(oauth2_scheme), 
-    db: Session = Depends(get_db)
-):
-    """Access Token으로부터 현재 사용자 정보 조회"""
-    credentials_exception = HTTPException(
+def is_token_revoked(token: str, payload: Dict[str, Any]) -> bool:
+    """In-process revocation check (no DB round-trip)"""
+    return token_revocation_index.is_revoked(
+        hashlib.sha256(token.encode()).digest(),
+        payload.get("sub"),
+        payload.get("iat")
+    )
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def decode_request_access_token(request: Request, token: Optional[str]) -> Dict[str, Any]:
+    """Request의 Access Token을 검증하고 payload 반환 (DB 조회 없음)"""
+    credentials_exception = _credentials_exception()
     
     try:
         # 토큰이 oauth2_scheme에서 오지 않았다면 request에서 직접 추출
@@ -214,6 +224,11 @@ def get_current_user(
         if user_id is None:
             logger.warning("No user ID in token payload")
             raise credentials_exception
+        
+        # 해지된 토큰 확인 (in-process revocation index)
+        if is_token_revoked(token, payload):
+            logger.info(f"Revoked token rejected for user: {user_id}")
+            raise credentials_exception
             
     except JWTError as e:
         logger.warning(f"JWT verification failed: {e}")
@@ -226,6 +241,56 @@ def get_current_user(
         logger.debug(f"Token validation failed: {e}")
         raise credentials_exception
     
+    return payload
+
+def load_active_principal(db: Session, user_id: str) -> Principal:
+    """principal cache에서 인증 주체 조회 (없거나 비활성화된 사용자는 401)"""
+    principal = principal_cache.load(db, user_id)
+    if principal is None:
+        logger.warning(f"User not found for ID: {user_id}")
+        raise _credentials_exception()
+    if not principal.is_active:
+        logger.warning(f"User {user_id} is not active")
+        raise _credentials_exception()
+    return principal
+
+def get_current_principal(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    Access Token으로부터 인증 주체(Principal) 조회
+    JWT 검증 + principal cache 조회만 수행하며, 캐시 미스 시에만 DB를 조회
+    """
+    payload = decode_request_access_token(request, token)
+    return load_active_principal(db, payload["sub"])
+
+def get_current_principal_optional(
+    request: Request,
+    db: Session = Depends(get_db)
+) -> Optional[Principal]:
+    """인증 주체 조회 (선택적) - 인증되지 않은 경우 None 반환"""
+    try:
+        return get_current_principal(request, None, db)
+    except HTTPException:
+        return None
+
+def get_current_user(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme), 
+    db: Session = Depends(get_db)
+):
+    """
+    Access Token으로부터 현재 사용자 정보 조회
+
+    관계 필드를 읽는 엔드포인트가 많아 ORM User를 반환하므로 요청마다 users 행을 조회함 (principal cache 미사용)
+    id/그룹/역할/관리자 여부만 필요한 엔드포인트는 get_current_principal을 사용
+    """
+    credentials_exception = _credentials_exception()
+    payload = decode_request_access_token(request, token)
+    user_id: str = payload["sub"]
+    
     # 사용자 조회
     user = get_user_by_id(db, user_id)
     if user is None:
@@ -272,6 +337,10 @@ def get_current_user_optional(
         user_id = payload.get("user_id") or payload.get("sub")
         if not user_id:
             return None
+        
+        # 해지된 토큰 확인
+        if is_token_revoked(token, payload):
+            return None
             
         # 데이터베이스에서 사용자 조회
         user = get_user_by_id(db, user_id)
@@ -293,40 +362,22 @@ def get_current_user_with_groups(
     token: Optional[str] = Depends(oauth2_scheme), 
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
-    """Access Token으로부터 현재 사용자 정보와 그룹 정보를 함께 조회"""
-    user = get_current_user(request, token, db)
-    
-    # 토큰에서 그룹 정보 추출
-    if not token:
-        token = extract_token_from_request(request)
-    
-    if token:
-        if token.startswith("Bearer "):
-            token = token[7:]
-        elif token.startswith("bearer "):
-            token = token[7:]
-        
-        user_info = extract_user_info_from_token(token)
-        if user_info:
-            return {
-                "user": user,
-                "user_id": user_info["user_id"],
-                "group_id": user_info["group_id"],
-                "group_name": user_info["group_name"],
-                "role_id": user_info["role_id"],
-                "role_name": user_info["role_name"],
-                "is_admin": user_info["is_admin"]
-            }
+    """
+    Access Token으로부터 현재 사용자 정보와 그룹 정보를 함께 조회
+    "user"는 ORM User가 아닌 Principal 스냅샷 (principal cache 사용)
+    """
+    payload = decode_request_access_token(request, token)
+    principal = load_active_principal(db, payload["sub"])
     
-    # 토큰에서 정보를 가져올 수 없는 경우 DB에서 조회
+    # 토큰 클레임 우선, 없으면 principal 스냅샷 사용
     return {
-        "user": user,
-        "user_id": str(user.id),
-        "group_id": str(user.group.id) if user.group else None,
-        "group_name": user.group.name if user.group else None,
-        "role_id": str(user.role.id) if user.role else None,
-        "role_name": user.role.name if user.role else None,
-        "is_admin": user.is_admin
+        "user": principal,
+        "user_id": principal.id,
+        "group_id": payload.get("group_id") or principal.group_id,
+        "group_name": payload.get("group_name") or principal.group_name,
+        "role_id": payload.get("role_id") or principal.role_id,
+        "role_name": payload.get("role_name") or principal.role_name,
+        "is_admin": payload.get("is_admin", principal.is_admin)
     }
 
 def get_current_user_optional(
@@ -1,12 +1,20 @@
 """
 Redis Caching Strategy - Wave 3 Implementation
 Provides intelligent caching for LLM model and permission queries
+
+Two tiers: a bounded in-process LRU (L1) in front of Redis (L2).
+get_or_compute() adds single-flight loading, stale-while-revalidate and
+probabilistic early expiration on top of both tiers.
 """
 
 import json
 import logging
 import hashlib
-from typing import Any, Optional, Dict, List, Callable, Union
+import math
+import random
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Optional, Dict, List, Callable, NamedTuple, Tuple, Union
 from datetime import datetime, timedelta
 from functools import wraps
 import asyncio
@@ -15,6 +23,7 @@ import redis.asyncio as redis
 from redis.exceptions import RedisError
 
 from ..config import settings
+from .cache_serializer import CacheSerializationError, create_serializer
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +44,94 @@ class CacheConfig:
     PREFIX_MODEL_COUNT = "llm:model_count"
     
     # Cache tags for invalidation
+    # Each tagged key is recorded in the Redis set "{PREFIX_TAG}:{tag}"
     TAG_MODEL = "model"
     TAG_PERMISSIONS = "permissions"
     TAG_USER = "user"
+    PREFIX_TAG = "cache:tag"
+    
+    # Versioned namespaces - bumping a namespace version orphans every key
+    # built under the old version (they expire via their own TTL)
+    PREFIX_NAMESPACE = "cache:ns"
+    NS_MODELS = "llm:models"          # model, permissions and user access entries
+    NS_MODEL_LISTS = "llm:model_lists"  # models lists and counts
+    
+    # Tag sets outlive the longest entry TTL they may reference
+    TAG_SET_TTL = VERY_LONG_TTL
+    
+    # Keys deleted per UNLINK call during tag invalidation
+    INVALIDATION_CHUNK_SIZE = 500
+    
+    # L1 (in-process) tier
+    L1_MAX_ENTRIES = settings.cache_l1_max_entries
+    L1_TTL = settings.cache_l1_ttl_seconds
+    NAMESPACE_VERSION_L1_TTL = 2  # seconds a namespace version is trusted locally
+    
+    # get_or_compute: serve stale values this long past expiry while one
+    # background refresh runs
+    STALE_TTL = settings.cache_stale_ttl_seconds
+    
+    # Probabilistic early expiration (XFetch) - higher refreshes earlier
+    EARLY_EXPIRY_BETA = 1.0
+
+
+class CachedValue(NamedTuple):
+    """Value stored by get_or_compute with its soft expiry and recompute cost"""
+    value: Any
+    expires_at: float       # epoch seconds; stale (but servable) after this
+    compute_seconds: float  # how long the loader took, drives early expiry
+
+
+class LocalCache:
+    """Bounded in-process LRU with per-entry TTL (L1 tier)"""
+    
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (found, value)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+    
+    def set(self, key: str, value: Any, ttl: float):
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _new_prefix_stats() -> Dict[str, Any]:
+    return {
+        "l1_hits": 0,
+        "l2_hits": 0,
+        "misses": 0,
+        "stale_hits": 0,
+        "early_refreshes": 0,
+        "singleflight_waits": 0,
+        "loads": 0,
+        "load_errors": 0,
+        "get_count": 0,
+        "get_latency_ms_total": 0.0,
+        "load_latency_ms_total": 0.0,
+    }
 
 class CacheManager:
     """Redis cache manager with intelligent caching strategies"""
@@ -45,6 +139,58 @@ class CacheManager:
     def __init__(self):
         self.redis_client = None
         self._connected = False
+        self.serializer = create_serializer()
+        self.local = LocalCache(CacheConfig.L1_MAX_ENTRIES)
+        self._namespace_versions: Dict[str, Tuple[float, int]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks = set()
+        self._stats: Dict[str, Dict[str, Any]] = defaultdict(_new_prefix_stats)
+        self._stat_prefixes: List[str] = []
+        for prefix in (
+            CacheConfig.PREFIX_MODEL, CacheConfig.PREFIX_MODELS_LIST, CacheConfig.PREFIX_PERMISSIONS,
+            CacheConfig.PREFIX_USER_ACCESS, CacheConfig.PREFIX_MODEL_COUNT
+        ):
+            self.register_prefix(prefix)
+    
+    # ---- statistics ----
+    
+    def register_prefix(self, prefix: str):
+        """Report keys starting with this prefix under their own stats bucket"""
+        if prefix not in self._stat_prefixes:
+            self._stat_prefixes.append(prefix)
+            # Longest prefix wins (llm:models_list before llm:model)
+            self._stat_prefixes.sort(key=len, reverse=True)
+    
+    def _stats_for(self, key: str) -> Dict[str, Any]:
+        for prefix in self._stat_prefixes:
+            if key.startswith(prefix):
+                return self._stats[prefix]
+        return self._stats[key.split(":", 1)[0]]
+    
+    def _record_get(self, stats: Dict[str, Any], outcome: str, started: float):
+        stats[outcome] += 1
+        stats["get_count"] += 1
+        stats["get_latency_ms_total"] += (time.perf_counter() - started) * 1000
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-prefix hit/miss/latency counters"""
+        prefixes = {}
+        for prefix, stats in self._stats.items():
+            lookups = stats["l1_hits"] + stats["l2_hits"] + stats["stale_hits"] + stats["misses"]
+            hits = lookups - stats["misses"]
+            prefixes[prefix] = {
+                **stats,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "avg_get_latency_ms": stats["get_latency_ms_total"] / stats["get_count"] if stats["get_count"] else 0.0,
+                "avg_load_latency_ms": stats["load_latency_ms_total"] / stats["loads"] if stats["loads"] else 0.0,
+            }
+        return {
+            "redis_connected": self._connected,
+            "l1_entries": len(self.local),
+            "l1_max_entries": self.local.max_entries,
+            "inflight_loads": len(self._inflight),
+            "prefixes": prefixes,
+        }
     
     async def connect(self):
         """Initialize Redis connection"""
@@ -52,8 +198,8 @@ class CacheManager:
             redis_url = getattr(settings, 'redis_url', 'redis://localhost:6379/0')
             self.redis_client = redis.from_url(
                 redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                # Payloads are binary envelopes (see cache_serializer)
+                decode_responses=False,
                 socket_timeout=5,
                 socket_connect_timeout=5
             )
@@ -73,6 +219,57 @@ class CacheManager:
             await self.redis_client.close()
             self._connected = False
     
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{CacheConfig.PREFIX_TAG}:{tag}"
+    
+    @staticmethod
+    def _namespace_key(namespace: str) -> str:
+        return f"{CacheConfig.PREFIX_NAMESPACE}:{namespace}"
+    
+    async def get_namespace_version(self, namespace: str) -> int:
+        """Get the current version of a cache namespace (briefly cached in-process)"""
+        if not self._connected:
+            return 0
+        
+        cached = self._namespace_versions.get(namespace)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        try:
+            version = await self.redis_client.get(self._namespace_key(namespace))
+            version = int(version) if version else 0
+            self._namespace_versions[namespace] = (
+                time.monotonic() + CacheConfig.NAMESPACE_VERSION_L1_TTL, version
+            )
+            return version
+        except RedisError as e:
+            logger.warning(f"Cache namespace version error for {namespace}: {e}")
+            return 0
+    
+    async def versioned_prefix(self, prefix: str, namespace: str) -> str:
+        """Return a key prefix bound to the current namespace version"""
+        version = await self.get_namespace_version(namespace)
+        return f"{prefix}:v{version}"
+    
+    async def bump_namespace(self, *namespaces: str) -> bool:
+        """Invalidate whole namespaces with one INCR each (single round-trip)"""
+        if not self._connected or not namespaces:
+            return False
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for namespace in namespaces:
+                    pipe.incr(self._namespace_key(namespace))
+                versions = await pipe.execute()
+            expires_at = time.monotonic() + CacheConfig.NAMESPACE_VERSION_L1_TTL
+            for namespace, version in zip(namespaces, versions):
+                self._namespace_versions[namespace] = (expires_at, int(version))
+            return True
+        except RedisError as e:
+            logger.warning(f"Cache namespace bump error for {namespaces}: {e}")
+            return False
+    
     def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate consistent cache key"""
         # Create a deterministic key from arguments
@@ -95,34 +292,75 @@ class CacheManager:
         return ":".join(key_parts)
     
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+        """
+        Get value from cache (L1, then Redis)
+        Values returned from L1 are shared - treat them as read-only.
+        """
+        started = time.perf_counter()
+        stats = self._stats_for(key)
+        
+        found, value = self.local.get(key)
+        if found:
+            self._record_get(stats, "l1_hits", started)
+            return value.value if isinstance(value, CachedValue) else value
+        
         if not self._connected:
+            self._record_get(stats, "misses", started)
             return None
         
         try:
             value = await self.redis_client.get(key)
             if value:
-                return json.loads(value)
+                value = self.serializer.loads(value)
+                if isinstance(value, dict) and value.keys() == {"v", "e", "d"}:
+                    # Written by get_or_compute
+                    value = value["v"]
+                self.local.set(key, value, CacheConfig.L1_TTL)
+                self._record_get(stats, "l2_hits", started)
+                return value
+            self._record_get(stats, "misses", started)
             return None
-        except (RedisError, json.JSONDecodeError) as e:
+        except (RedisError, CacheSerializationError) as e:
             logger.warning(f"Cache get error for key {key}: {e}")
+            self._record_get(stats, "misses", started)
             return None
     
-    async def set(self, key: str, value: Any, ttl: int = CacheConfig.MEDIUM_TTL) -> bool:
-        """Set value in cache with TTL"""
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = CacheConfig.MEDIUM_TTL,
+        tags: Optional[List[str]] = None
+    ) -> bool:
+        """Set value in cache with TTL, recording the key in each tag set"""
+        self.local.set(key, value, min(ttl, CacheConfig.L1_TTL))
+        return await self._set_l2(key, value, ttl, tags)
+    
+    async def _set_l2(self, key: str, value: Any, ttl: int, tags: Optional[List[str]] = None) -> bool:
         if not self._connected:
             return False
         
         try:
-            serialized_value = json.dumps(value, default=str)
-            await self.redis_client.setex(key, ttl, serialized_value)
+            serialized_value = self.serializer.dumps(value)
+            if not tags:
+                await self.redis_client.setex(key, ttl, serialized_value)
+                return True
+            
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, serialized_value)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    pipe.expire(tag_key, max(ttl, CacheConfig.TAG_SET_TTL))
+                await pipe.execute()
             return True
-        except (RedisError, json.JSONEncodeError) as e:
+        except (RedisError, CacheSerializationError) as e:
             logger.warning(f"Cache set error for key {key}: {e}")
             return False
     
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
+        self.local.delete(key)
         if not self._connected:
             return False
         
@@ -133,60 +371,239 @@ class CacheManager:
             logger.warning(f"Cache delete error for key {key}: {e}")
             return False
     
+    # ---- read-through loading ----
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = CacheConfig.MEDIUM_TTL,
+        tags: Optional[List[str]] = None,
+        stale_ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Read-through cache lookup
+        
+        - Fresh hit (L1 or Redis): returned directly; with a probability that
+          rises towards expiry (XFetch) one background refresh is started.
+        - Stale hit (expired less than `stale_ttl` ago): returned directly
+          while one background refresh runs.
+        - Miss: concurrent callers for the same key share a single loader call.
+        
+        `None` results are not cached.
+        """
+        stale_ttl = CacheConfig.STALE_TTL if stale_ttl is None else stale_ttl
+        started = time.perf_counter()
+        stats = self._stats_for(key)
+        
+        outcome = "l1_hits"
+        found, entry = self.local.get(key)
+        if not found or not isinstance(entry, CachedValue):
+            outcome = "l2_hits"
+            entry = await self._get_cached_value(key)
+            if entry is not None:
+                self._set_local_entry(key, entry, stale_ttl)
+        
+        if entry is not None:
+            now = time.time()
+            if now >= entry.expires_at:
+                self._record_get(stats, "stale_hits", started)
+                self._schedule_refresh(key, loader, ttl, tags, stale_ttl)
+            else:
+                self._record_get(stats, outcome, started)
+                if self._should_refresh_early(entry, now):
+                    stats["early_refreshes"] += 1
+                    self._schedule_refresh(key, loader, ttl, tags, stale_ttl)
+            return entry.value
+        
+        self._record_get(stats, "misses", started)
+        return await self._load(key, loader, ttl, tags, stale_ttl)
+    
+    @staticmethod
+    def _should_refresh_early(entry: CachedValue, now: float) -> bool:
+        # XFetch: now - delta * beta * ln(rand) >= expiry
+        if entry.compute_seconds <= 0:
+            return False
+        jitter = -entry.compute_seconds * CacheConfig.EARLY_EXPIRY_BETA * math.log(random.random() or 1e-12)
+        return now + jitter >= entry.expires_at
+    
+    def _set_local_entry(self, key: str, entry: CachedValue, stale_ttl: int):
+        remaining = entry.expires_at + stale_ttl - time.time()
+        self.local.set(key, entry, min(CacheConfig.L1_TTL, remaining))
+    
+    async def _get_cached_value(self, key: str) -> Optional[CachedValue]:
+        if not self._connected:
+            return None
+        
+        try:
+            raw = await self.redis_client.get(key)
+            if not raw:
+                return None
+            data = self.serializer.loads(raw)
+        except (RedisError, CacheSerializationError) as e:
+            logger.warning(f"Cache get error for key {key}: {e}")
+            return None
+        
+        if isinstance(data, dict) and data.keys() == {"v", "e", "d"}:
+            return CachedValue(data["v"], data["e"], data["d"])
+        # Plain value written by set(): treat as fresh
+        return CachedValue(data, time.time() + CacheConfig.L1_TTL, 0.0)
+    
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: Optional[List[str]],
+        stale_ttl: int
+    ) -> Any:
+        """Run the loader once per key; concurrent callers await the same result"""
+        stats = self._stats_for(key)
+        future = self._inflight.get(key)
+        if future is not None:
+            stats["singleflight_waits"] += 1
+            return await asyncio.shield(future)
+        
+        future = asyncio.get_running_loop().create_future()
+        # Avoid "exception was never retrieved" when nobody else waited
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            started = time.perf_counter()
+            try:
+                value = await loader()
+            except Exception:
+                stats["load_errors"] += 1
+                raise
+            compute_seconds = time.perf_counter() - started
+            stats["loads"] += 1
+            stats["load_latency_ms_total"] += compute_seconds * 1000
+            
+            if value is not None:
+                entry = CachedValue(value, time.time() + ttl, compute_seconds)
+                self._set_local_entry(key, entry, stale_ttl)
+                await self._set_l2(
+                    key,
+                    {"v": entry.value, "e": entry.expires_at, "d": entry.compute_seconds},
+                    ttl + stale_ttl,
+                    tags
+                )
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+    
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        tags: Optional[List[str]],
+        stale_ttl: int
+    ):
+        if key in self._inflight:
+            return
+        
+        async def refresh():
+            try:
+                await self._load(key, loader, ttl, tags, stale_ttl)
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for key {key}: {e}")
+        
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
     async def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern"""
+        """
+        Delete all keys matching pattern
+        Uses incremental SCAN, but still walks the whole keyspace - prefer
+        invalidate_tags() / bump_namespace() on request paths.
+        """
         if not self._connected:
             return 0
         
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                return await self.redis_client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=CacheConfig.INVALIDATION_CHUNK_SIZE):
+                self.local.delete(key.decode() if isinstance(key, bytes) else key)
+                batch.append(key)
+                if len(batch) >= CacheConfig.INVALIDATION_CHUNK_SIZE:
+                    deleted += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.unlink(*batch)
+            return deleted
         except RedisError as e:
             logger.warning(f"Cache delete pattern error for {pattern}: {e}")
             return 0
     
-    async def invalidate_model_cache(self, model_id: Optional[str] = None):
-        """Invalidate model-related cache entries"""
-        patterns = [
-            f"{CacheConfig.PREFIX_MODELS_LIST}:*",
-            f"{CacheConfig.PREFIX_MODEL_COUNT}:*"
-        ]
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every key recorded under the given tags
+        Cost is proportional to the number of tagged keys, not the keyspace.
+        """
+        if not self._connected or not tags:
+            return 0
         
+        try:
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                pipe.unlink(*tag_keys)
+                results = await pipe.execute()
+            
+            keys = set()
+            for members in results[:-1]:
+                keys.update(key.decode() if isinstance(key, bytes) else key for key in members)
+            if not keys:
+                return 0
+            
+            keys = list(keys)
+            for key in keys:
+                self.local.delete(key)
+            deleted = 0
+            chunk_size = CacheConfig.INVALIDATION_CHUNK_SIZE
+            for i in range(0, len(keys), chunk_size):
+                deleted += await self.redis_client.unlink(*keys[i:i + chunk_size])
+            return deleted
+        except RedisError as e:
+            logger.warning(f"Cache tag invalidation error for {tags}: {e}")
+            return 0
+    
+    async def invalidate_model_cache(self, model_id: Optional[str] = None):
+        """
+        Invalidate model-related cache entries
+        A single model drops its tagged keys; all models is one namespace bump.
+        Models lists and counts always go stale, so their namespace is bumped.
+        """
         if model_id:
-            patterns.extend([
-                f"{CacheConfig.PREFIX_MODEL}:{model_id}:*",
-                f"{CacheConfig.PREFIX_PERMISSIONS}:{model_id}:*",
-                f"{CacheConfig.PREFIX_USER_ACCESS}:*:{model_id}:*"
-            ])
-        else:
-            patterns.extend([
-                f"{CacheConfig.PREFIX_MODEL}:*",
-                f"{CacheConfig.PREFIX_PERMISSIONS}:*",
-                f"{CacheConfig.PREFIX_USER_ACCESS}:*"
-            ])
+            total_deleted = await self.invalidate_tags(f"{CacheConfig.TAG_MODEL}:{model_id}")
+            await self.bump_namespace(CacheConfig.NS_MODEL_LISTS)
+            logger.info(f"Invalidated {total_deleted} cache entries for model {model_id}")
+            return total_deleted
         
-        total_deleted = 0
-        for pattern in patterns:
-            deleted = await self.delete_pattern(pattern)
-            total_deleted += deleted
-        
-        logger.info(f"Invalidated {total_deleted} cache entries for model cache")
+        await self.bump_namespace(CacheConfig.NS_MODELS, CacheConfig.NS_MODEL_LISTS)
+        logger.info("Invalidated model cache namespaces")
+        return 0
+    
+    async def invalidate_permissions_cache(self):
+        """Invalidate every permission and user access entry"""
+        total_deleted = await self.invalidate_tags(CacheConfig.TAG_PERMISSIONS)
+        logger.info(f"Invalidated {total_deleted} cache entries for permissions")
         return total_deleted
     
     async def invalidate_user_cache(self, user_id: str):
         """Invalidate user-specific cache entries"""
-        patterns = [
-            f"{CacheConfig.PREFIX_USER_ACCESS}:{user_id}:*",
-            f"{CacheConfig.PREFIX_MODELS_LIST}:{user_id}:*"
-        ]
-        
-        total_deleted = 0
-        for pattern in patterns:
-            deleted = await self.delete_pattern(pattern)
-            total_deleted += deleted
-        
+        total_deleted = await self.invalidate_tags(f"{CacheConfig.TAG_USER}:{user_id}")
         logger.info(f"Invalidated {total_deleted} cache entries for user {user_id}")
         return total_deleted
 
@@ -207,9 +624,11 @@ def cache_result(
         prefix: Cache key prefix
         ttl: Time to live in seconds
         key_args: Specific arguments to include in cache key
-        invalidate_on: Events that should invalidate this cache
+        invalidate_on: Cache tags that should invalidate this cache
     """
     def decorator(func: Callable):
+        cache_manager.register_prefix(prefix)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Generate cache key
@@ -228,49 +647,74 @@ def cache_result(
             else:
                 cache_key = cache_manager._generate_cache_key(prefix, *args, **kwargs)
             
-            # Try to get from cache
-            cached_result = await cache_manager.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return cached_result
-            
-            # Execute function
-            result = await func(*args, **kwargs)
-            
-            # Cache the result
-            if result is not None:
-                await cache_manager.set(cache_key, result, ttl)
-                logger.debug(f"Cached result for key: {cache_key}")
-            
-            return result
+            # L1 -> Redis -> single-flight call of the wrapped function
+            return await cache_manager.get_or_compute(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                tags=invalidate_on
+            )
         
         return wrapper
     return decorator
 
 # Specific caching functions for LLM models
 class LLMModelCache:
-    """Specialized caching for LLM model operations"""
+    """
+    Specialized caching for LLM model operations
+    Keys are built under versioned namespaces and tagged with
+    model:{id} / user:{id} / permissions for targeted invalidation.
+    """
+    
+    @staticmethod
+    def _model_tag(model_id: str) -> str:
+        return f"{CacheConfig.TAG_MODEL}:{model_id}"
+    
+    @staticmethod
+    def _user_tag(user_id: str) -> str:
+        return f"{CacheConfig.TAG_USER}:{user_id}"
+    
+    @staticmethod
+    async def _model_key(model_id: str) -> str:
+        prefix = await cache_manager.versioned_prefix(CacheConfig.PREFIX_MODEL, CacheConfig.NS_MODELS)
+        return cache_manager._generate_cache_key(prefix, model_id)
+    
+    @staticmethod
+    async def _models_list_key(user_id: str, accessible_only: bool, group_ids: Optional[List[str]] = None) -> str:
+        prefix = await cache_manager.versioned_prefix(CacheConfig.PREFIX_MODELS_LIST, CacheConfig.NS_MODEL_LISTS)
+        if group_ids:
+            # Group membership is part of the key so a group change never reuses a stale list
+            return cache_manager._generate_cache_key(
+                prefix, user_id, accessible_only=accessible_only, groups=sorted(group_ids)
+            )
+        return cache_manager._generate_cache_key(prefix, user_id, accessible_only=accessible_only)
+    
+    @staticmethod
+    async def _permissions_key(model_id: str) -> str:
+        prefix = await cache_manager.versioned_prefix(CacheConfig.PREFIX_PERMISSIONS, CacheConfig.NS_MODELS)
+        return cache_manager._generate_cache_key(prefix, model_id)
+    
+    @staticmethod
+    async def _user_access_key(user_id: str, model_id: str) -> str:
+        prefix = await cache_manager.versioned_prefix(CacheConfig.PREFIX_USER_ACCESS, CacheConfig.NS_MODELS)
+        return cache_manager._generate_cache_key(prefix, user_id, model_id)
     
     @staticmethod
     async def get_model(model_id: str) -> Optional[Dict[str, Any]]:
         """Get cached model data"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_MODEL, model_id)
+        key = await LLMModelCache._model_key(model_id)
         return await cache_manager.get(key)
     
     @staticmethod
     async def set_model(model_id: str, model_data: Dict[str, Any], ttl: int = CacheConfig.LONG_TTL):
         """Cache model data"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_MODEL, model_id)
-        return await cache_manager.set(key, model_data, ttl)
+        key = await LLMModelCache._model_key(model_id)
+        return await cache_manager.set(key, model_data, ttl, tags=[LLMModelCache._model_tag(model_id)])
     
     @staticmethod
     async def get_models_list(user_id: str, accessible_only: bool = True) -> Optional[List[Dict[str, Any]]]:
         """Get cached models list for user"""
-        key = cache_manager._generate_cache_key(
-            CacheConfig.PREFIX_MODELS_LIST, 
-            user_id, 
-            accessible_only=accessible_only
-        )
+        key = await LLMModelCache._models_list_key(user_id, accessible_only)
         return await cache_manager.get(key)
     
     @staticmethod
@@ -281,17 +725,27 @@ class LLMModelCache:
         ttl: int = CacheConfig.MEDIUM_TTL
     ):
         """Cache models list for user"""
-        key = cache_manager._generate_cache_key(
-            CacheConfig.PREFIX_MODELS_LIST, 
-            user_id, 
-            accessible_only=accessible_only
+        key = await LLMModelCache._models_list_key(user_id, accessible_only)
+        return await cache_manager.set(key, models_data, ttl, tags=[LLMModelCache._user_tag(user_id)])
+    
+    @staticmethod
+    async def get_or_load_models_list(
+        user_id: str,
+        loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        accessible_only: bool = True,
+        ttl: int = CacheConfig.MEDIUM_TTL,
+        group_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read-through models list for user (single-flight, stale-while-revalidate)"""
+        key = await LLMModelCache._models_list_key(user_id, accessible_only, group_ids)
+        return await cache_manager.get_or_compute(
+            key, loader, ttl=ttl, tags=[LLMModelCache._user_tag(user_id)]
         )
-        return await cache_manager.set(key, models_data, ttl)
     
     @staticmethod
     async def get_model_permissions(model_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get cached model permissions"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_PERMISSIONS, model_id)
+        key = await LLMModelCache._permissions_key(model_id)
         return await cache_manager.get(key)
     
     @staticmethod
@@ -301,13 +755,29 @@ class LLMModelCache:
         ttl: int = CacheConfig.SHORT_TTL
     ):
         """Cache model permissions (shorter TTL as permissions change frequently)"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_PERMISSIONS, model_id)
-        return await cache_manager.set(key, permissions_data, ttl)
+        key = await LLMModelCache._permissions_key(model_id)
+        return await cache_manager.set(
+            key, permissions_data, ttl,
+            tags=[LLMModelCache._model_tag(model_id), CacheConfig.TAG_PERMISSIONS]
+        )
+    
+    @staticmethod
+    async def get_or_load_model_permissions(
+        model_id: str,
+        loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        ttl: int = CacheConfig.SHORT_TTL
+    ) -> List[Dict[str, Any]]:
+        """Read-through model permissions (single-flight, stale-while-revalidate)"""
+        key = await LLMModelCache._permissions_key(model_id)
+        return await cache_manager.get_or_compute(
+            key, loader, ttl=ttl,
+            tags=[LLMModelCache._model_tag(model_id), CacheConfig.TAG_PERMISSIONS]
+        )
     
     @staticmethod
     async def get_user_model_access(user_id: str, model_id: str) -> Optional[bool]:
         """Get cached user access to specific model"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_USER_ACCESS, user_id, model_id)
+        key = await LLMModelCache._user_access_key(user_id, model_id)
         return await cache_manager.get(key)
     
     @staticmethod
@@ -318,8 +788,15 @@ class LLMModelCache:
         ttl: int = CacheConfig.SHORT_TTL
     ):
         """Cache user access to specific model"""
-        key = cache_manager._generate_cache_key(CacheConfig.PREFIX_USER_ACCESS, user_id, model_id)
-        return await cache_manager.set(key, has_access, ttl)
+        key = await LLMModelCache._user_access_key(user_id, model_id)
+        return await cache_manager.set(
+            key, has_access, ttl,
+            tags=[
+                LLMModelCache._user_tag(user_id),
+                LLMModelCache._model_tag(model_id),
+                CacheConfig.TAG_PERMISSIONS
+            ]
+        )
 
 # Cache invalidation events
 class CacheEvents:
@@ -327,8 +804,8 @@ class CacheEvents:
     
     @staticmethod
     async def on_model_created(model_id: str):
-        """Handle model creation event"""
-        await cache_manager.invalidate_model_cache()
+        """Handle model creation event (a new model only changes lists and counts)"""
+        await cache_manager.bump_namespace(CacheConfig.NS_MODEL_LISTS)
     
     @staticmethod
     async def on_model_updated(model_id: str):
@@ -354,6 +831,10 @@ class CacheEvents:
         if user_id:
             await cache_manager.invalidate_user_cache(user_id)
 
+def get_cache_metrics() -> Dict[str, Any]:
+    """Get cache hit/miss/latency metrics per key prefix"""
+    return cache_manager.get_stats()
+
 # Startup and shutdown hooks
 async def initialize_cache():
     """Initialize cache on application startup"""
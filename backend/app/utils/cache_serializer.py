@@ -0,0 +1,348 @@
+"""
+Cache Payload Serialization
+Pluggable codecs (msgpack / orjson / json) for CacheManager payloads with
+type-preserving encoding, optional compression and a versioned envelope.
+
+Envelope layout (5-byte header + payload):
+
+    MAGIC (2 bytes) | envelope version | codec id | compression id | payload
+
+Payloads without the magic prefix are legacy plain-JSON values written
+before the envelope existed and are still decoded, so changing the codec
+or compression settings never requires flushing Redis.
+"""
+
+import json
+import logging
+import uuid
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional, Type
+
+import msgpack
+import orjson
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheSerializationError(ValueError):
+    """Raised when a cache payload cannot be encoded or decoded"""
+
+MAGIC = b"\xffC"  # 0xff never starts a valid UTF-8/JSON document
+ENVELOPE_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+# Enum classes that may be restored on decode, keyed by "module.QualName"
+_enum_registry: Dict[str, Type[Enum]] = {}
+
+
+def register_enum(enum_cls: Type[Enum]) -> Type[Enum]:
+    """Allow an Enum class to round-trip through the cache (usable as a decorator)"""
+    _enum_registry[f"{enum_cls.__module__}.{enum_cls.__qualname__}"] = enum_cls
+    return enum_cls
+
+
+def _enum_name(value: Enum) -> str:
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def _restore_enum(name: str, raw: Any) -> Any:
+    enum_cls = _enum_registry.get(name)
+    if enum_cls is None:
+        # Unregistered enums decode to their plain value
+        return raw
+    return enum_cls(raw)
+
+
+# =================
+# Codecs
+# =================
+
+class Codec:
+    """Encodes a Python value to bytes and back"""
+
+    codec_id: int = 0
+    name: str = ""
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+# Type tags used by the JSON-based codecs: {"$t": tag, "v": value}
+_TYPE_TAG = "$t"
+_TYPE_TAG_BYTES = b'"$t"'
+
+
+def _tag_value(obj: Any) -> Any:
+    """JSON `default` hook: wrap non-JSON types in a type tag"""
+    if isinstance(obj, datetime):
+        return {_TYPE_TAG: "dt", "v": obj.isoformat()}
+    if isinstance(obj, date):
+        return {_TYPE_TAG: "d", "v": obj.isoformat()}
+    if isinstance(obj, uuid.UUID):
+        return {_TYPE_TAG: "uuid", "v": str(obj)}
+    if isinstance(obj, Enum):
+        return {_TYPE_TAG: "enum", "n": _enum_name(obj), "v": obj.value}
+    if isinstance(obj, Decimal):
+        return {_TYPE_TAG: "dec", "v": str(obj)}
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # Same fallback as the previous json.dumps(default=str)
+    return str(obj)
+
+
+def _untag_dict(obj: Dict[str, Any]) -> Any:
+    tag = obj.get(_TYPE_TAG)
+    if tag is None or "v" not in obj:
+        return obj
+    if tag == "dt":
+        return datetime.fromisoformat(obj["v"])
+    if tag == "d":
+        return date.fromisoformat(obj["v"])
+    if tag == "uuid":
+        return uuid.UUID(obj["v"])
+    if tag == "enum":
+        return _restore_enum(obj.get("n", ""), obj["v"])
+    if tag == "dec":
+        return Decimal(obj["v"])
+    return obj
+
+
+def _untag_tree(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _untag_dict({k: _untag_tree(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_untag_tree(v) for v in value]
+    return value
+
+
+class JsonCodec(Codec):
+    """Standard library json - slowest, always available"""
+
+    codec_id = 1
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(_pretag(value), default=_tag_value, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data, object_hook=_untag_dict)
+
+
+class OrjsonCodec(Codec):
+    """
+    orjson - fast JSON
+    UUID/Enum/datetime are forced through the tagging hook; the decode-side
+    walk only runs when the payload actually contains type tags.
+    """
+
+    codec_id = 2
+    name = "orjson"
+
+    _OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(_pretag(value), default=_tag_value, option=self._OPTIONS)
+
+    def decode(self, data: bytes) -> Any:
+        value = orjson.loads(data)
+        if _TYPE_TAG_BYTES in data:
+            return _untag_tree(value)
+        return value
+
+
+def _pretag(value: Any) -> Any:
+    """
+    JSON encoders write UUID and str/int Enums natively as plain strings or
+    numbers, which would lose their type; tag them before encoding
+    """
+    if isinstance(value, dict):
+        return {k: _pretag(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_pretag(v) for v in value]
+    if isinstance(value, (uuid.UUID, Enum)):
+        return _tag_value(value)
+    return value
+
+
+# msgpack extension type codes
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_UUID = 3
+_EXT_ENUM = 4
+_EXT_DECIMAL = 5
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+    if isinstance(obj, uuid.UUID):
+        return msgpack.ExtType(_EXT_UUID, obj.bytes)
+    if isinstance(obj, Enum):
+        return msgpack.ExtType(
+            _EXT_ENUM,
+            msgpack.packb([_enum_name(obj), obj.value], default=_msgpack_default, use_bin_type=True)
+        )
+    if isinstance(obj, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(obj).encode())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, str):
+        # str subclasses (e.g. pydantic constrained strings)
+        return str(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    return str(obj)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == _EXT_ENUM:
+        name, raw = msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False)
+        return _restore_enum(name, raw)
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackCodec(Codec):
+    """msgpack - compact binary, type preservation through extension types"""
+
+    codec_id = 3
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        # strict_types routes str/int subclasses (Enums) and tuples to default
+        return msgpack.packb(value, default=_msgpack_default, use_bin_type=True, strict_types=True)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
+
+CODECS: Dict[str, Codec] = {codec.name: codec for codec in (JsonCodec(), OrjsonCodec(), MsgpackCodec())}
+_CODECS_BY_ID: Dict[int, Codec] = {codec.codec_id: codec for codec in CODECS.values()}
+
+
+# =================
+# Compression
+# =================
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lz4": COMPRESSION_LZ4}
+
+
+def _compress(compression_id: int, data: bytes) -> bytes:
+    if compression_id == COMPRESSION_ZLIB:
+        return zlib.compress(data, 1)
+    if compression_id == COMPRESSION_LZ4:
+        return lz4_frame.compress(data)
+    return data
+
+
+def _decompress(compression_id: int, data: bytes) -> bytes:
+    if compression_id == COMPRESSION_NONE:
+        return data
+    if compression_id == COMPRESSION_ZLIB:
+        return zlib.decompress(data)
+    if compression_id == COMPRESSION_LZ4:
+        if lz4_frame is None:
+            raise ValueError("lz4 payload found but the lz4 package is not installed")
+        return lz4_frame.decompress(data)
+    raise ValueError(f"Unknown cache compression id: {compression_id}")
+
+
+# =================
+# Serializer
+# =================
+
+class CacheSerializer:
+    """Encode/decode cache payloads into the versioned envelope"""
+
+    def __init__(self, codec: str = "msgpack", compression: str = "zlib", compression_threshold: int = 1024):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown cache codec: {codec} (expected one of {sorted(CODECS)})")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression} (expected one of {sorted(COMPRESSIONS)})")
+        if compression == "lz4" and lz4_frame is None:
+            logger.warning("lz4 is not installed; falling back to zlib for cache compression")
+            compression = "zlib"
+
+        self.codec = CODECS[codec]
+        self.compression_id = COMPRESSIONS[compression]
+        self.compression_threshold = compression_threshold
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            payload = self.codec.encode(value)
+        except Exception as e:
+            raise CacheSerializationError(f"{self.codec.name} encode failed: {e}") from e
+
+        compression_id = COMPRESSION_NONE
+        if self.compression_id != COMPRESSION_NONE and len(payload) >= self.compression_threshold:
+            compressed = _compress(self.compression_id, payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = self.compression_id
+        header = MAGIC + bytes((ENVELOPE_VERSION, self.codec.codec_id, compression_id))
+        return header + payload
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._loads(data)
+        except CacheSerializationError:
+            raise
+        except Exception as e:
+            raise CacheSerializationError(f"Cache payload decode failed: {e}") from e
+
+    def _loads(self, data: bytes) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        if not data.startswith(MAGIC):
+            # Legacy value written as plain JSON text
+            return json.loads(data)
+
+        version, codec_id, compression_id = data[len(MAGIC)], data[len(MAGIC) + 1], data[len(MAGIC) + 2]
+        if version != ENVELOPE_VERSION:
+            raise CacheSerializationError(f"Unsupported cache envelope version: {version}")
+        codec = _CODECS_BY_ID.get(codec_id)
+        if codec is None:
+            raise CacheSerializationError(f"Unknown cache codec id: {codec_id}")
+        return codec.decode(_decompress(compression_id, data[HEADER_SIZE:]))
+
+
+def create_serializer(
+    codec: Optional[str] = None,
+    compression: Optional[str] = None,
+    compression_threshold: Optional[int] = None
+) -> CacheSerializer:
+    """Build a serializer from settings, with optional overrides"""
+    from ..config import settings
+    return CacheSerializer(
+        codec=codec or settings.cache_serializer,
+        compression=compression or settings.cache_compression,
+        compression_threshold=(
+            settings.cache_compression_threshold if compression_threshold is None else compression_threshold
+        )
+    )
@@ -0,0 +1,120 @@
+"""
+Authenticated Principal Cache
+Per-process cache of slim, immutable user snapshots keyed by the token `sub`,
+so authenticating a request costs a JWT decode plus a dict lookup instead of
+a users-table query.
+
+Entries expire after a short TTL; admin user/group/role mutations invalidate
+them explicitly so permission changes apply immediately in this process.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import logging
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Immutable snapshot of the authenticated user"""
+    id: str
+    email: str
+    is_admin: bool
+    is_active: bool
+    group_id: Optional[str] = None
+    group_name: Optional[str] = None
+    role_id: Optional[str] = None
+    role_name: Optional[str] = None
+
+
+class PrincipalCache:
+    """Bounded TTL cache of Principal snapshots keyed by user id"""
+
+    def __init__(self, ttl_seconds: int = 30, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, principal: Principal) -> None:
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, db: Session, user_id: str) -> Optional[Principal]:
+        """Return the cached principal or load the slim snapshot from the database"""
+        user_id = str(user_id)
+        principal = self.get(user_id)
+        if principal is not None:
+            return principal
+
+        from ..models.user import User, Group, Role
+        row = db.query(
+            User.id, User.email, User.is_admin, User.is_active,
+            User.group_id, Group.name, User.role_id, Role.name
+        ).outerjoin(Group, Group.id == User.group_id) \
+         .outerjoin(Role, Role.id == User.role_id) \
+         .filter(User.id == user_id).first()
+        if row is None:
+            return None
+
+        principal = Principal(
+            id=str(row[0]),
+            email=row[1],
+            is_admin=bool(row[2]),
+            is_active=bool(row[3]),
+            group_id=str(row[4]) if row[4] else None,
+            group_name=row[5],
+            role_id=str(row[6]) if row[6] else None,
+            role_name=row[7]
+        )
+        self.put(principal)
+        return principal
+
+    # ---- invalidation hooks ----
+
+    def invalidate_user(self, user_id) -> None:
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def invalidate_group(self, group_id) -> None:
+        group_id = str(group_id)
+        with self._lock:
+            for key in [k for k, (_, p) in self._entries.items() if p.group_id == group_id]:
+                del self._entries[key]
+
+    def invalidate_role(self, role_id) -> None:
+        role_id = str(role_id)
+        with self._lock:
+            for key in [k for k, (_, p) in self._entries.items() if p.role_id == role_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    max_entries=settings.principal_cache_max_entries
+)
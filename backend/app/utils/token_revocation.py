@@ -0,0 +1,219 @@
+"""
+Access Token Revocation Index
+Keeps revoked access tokens in memory in every API process so that
+get_current_user() can reject revoked JWTs without a database round-trip.
+
+Two kinds of revocation are tracked:
+- individual tokens, by SHA-256 digest, until their expiry
+- "revoked-before" cutoffs per user: every token for that user issued before
+  the cutoff second is rejected (used by logout-all and batch logout). JWT iat
+  has whole-second precision, so the cutoff is a whole second too, and a token
+  issued in the same second as the logout (e.g. an immediate re-login) is kept
+
+Revocations are applied locally, persisted/published through Redis pub/sub so
+the other API processes pick them up, and warmed up from the database and
+Redis at startup.
+"""
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+import logging
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHANNEL = "auth:revocations"
+USER_CUTOFFS_KEY = "auth:revocations:users"
+
+
+def _to_timestamp(value) -> float:
+    if isinstance(value, datetime):
+        # Token timestamps are stored as naive UTC
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return float(value)
+
+
+class TokenRevocationIndex:
+    """In-process index of revoked access tokens and per-user cutoffs"""
+
+    def __init__(self):
+        # token digest (32 bytes) -> expiry timestamp
+        self._tokens: Dict[bytes, float] = {}
+        # user_id -> revoked-before timestamp (whole seconds, compared with iat)
+        self._user_cutoffs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        # Cutoffs older than the longest token lifetime can no longer match a live token
+        self.max_token_lifetime = max(
+            settings.access_token_expire_minutes * 60,
+            24 * 3600  # service tokens (client_credentials)
+        )
+
+    # ---- hot path ----
+
+    def is_revoked(self, token_digest: bytes, user_id: Optional[str], issued_at) -> bool:
+        """O(1) revocation check for a decoded access token"""
+        if user_id is not None and self._user_cutoffs:
+            cutoff = self._user_cutoffs.get(str(user_id))
+            if cutoff is not None and issued_at is not None and int(issued_at) < cutoff:
+                return True
+        return token_digest in self._tokens
+
+    # ---- local updates ----
+
+    def add_tokens(self, tokens: Iterable[Tuple[str, object]]) -> int:
+        """Add revoked tokens given as (sha256 hex digest, expires_at) pairs"""
+        now = time.time()
+        added = 0
+        with self._lock:
+            for token_hash, expires_at in tokens:
+                expires_ts = _to_timestamp(expires_at) if expires_at else now + self.max_token_lifetime
+                if expires_ts > now:
+                    self._tokens[bytes.fromhex(token_hash)] = expires_ts
+                    added += 1
+        return added
+
+    def add_user_cutoffs(self, cutoffs: Dict[str, int]) -> None:
+        with self._lock:
+            for user_id, cutoff in cutoffs.items():
+                if cutoff > self._user_cutoffs.get(user_id, 0):
+                    self._user_cutoffs[user_id] = cutoff
+
+    def prune(self) -> int:
+        """Drop tokens past their expiry and cutoffs older than any live token"""
+        now = time.time()
+        with self._lock:
+            before = len(self._tokens) + len(self._user_cutoffs)
+            self._tokens = {d: exp for d, exp in self._tokens.items() if exp > now}
+            oldest = now - self.max_token_lifetime
+            self._user_cutoffs = {u: c for u, c in self._user_cutoffs.items() if c > oldest}
+            return before - len(self._tokens) - len(self._user_cutoffs)
+
+    def stats(self) -> Dict[str, int]:
+        return {"revoked_tokens": len(self._tokens), "user_cutoffs": len(self._user_cutoffs)}
+
+    # ---- revocation API (called after the DB commit) ----
+
+    def revoke_tokens(self, rows: Iterable[Tuple[str, object]]) -> None:
+        """
+        Register revoked access tokens and fan them out to other processes
+
+        Args:
+            rows: (token_hash, expires_at) pairs, e.g. from UPDATE ... RETURNING
+        """
+        rows = [(row[0], row[1]) for row in rows if row[0]]
+        if not rows:
+            return
+        self.add_tokens(rows)
+        self._publish({
+            "type": "tokens",
+            "tokens": [
+                [token_hash, _to_timestamp(expires_at) if expires_at else None]
+                for token_hash, expires_at in rows
+            ]
+        })
+
+    def revoke_users(self, user_ids: Iterable[str], revoked_at: Optional[float] = None) -> None:
+        """Revoke every access token issued to the given users up to now"""
+        cutoff = int(revoked_at or time.time())
+        cutoffs = {str(user_id): cutoff for user_id in user_ids if user_id}
+        if not cutoffs:
+            return
+        self.add_user_cutoffs(cutoffs)
+        client = self._get_redis()
+        if client:
+            try:
+                client.hset(USER_CUTOFFS_KEY, mapping=cutoffs)
+            except redis.RedisError as e:
+                logger.warning(f"Failed to persist revocation cutoffs: {e}")
+        self._publish({"type": "users", "cutoffs": cutoffs})
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        if self._redis is None:
+            try:
+                self._redis = redis.Redis.from_url(
+                    settings.redis_url,
+                    decode_responses=True,
+                    socket_timeout=2,
+                    socket_connect_timeout=2
+                )
+            except Exception as e:
+                logger.warning(f"Revocation Redis client unavailable: {e}")
+                return None
+        return self._redis
+
+    def _publish(self, message: Dict) -> None:
+        client = self._get_redis()
+        if not client:
+            return
+        try:
+            client.publish(REVOCATION_CHANNEL, json.dumps(message))
+        except redis.RedisError as e:
+            # Other processes still converge on their next warm-up
+            logger.warning(f"Failed to publish token revocation: {e}")
+
+    # ---- startup / background sync ----
+
+    def apply_message(self, message: Dict) -> None:
+        message_type = message.get("type")
+        if message_type == "tokens":
+            self.add_tokens((token_hash, exp) for token_hash, exp in message.get("tokens", []))
+        elif message_type == "users":
+            self.add_user_cutoffs({u: int(float(c)) for u, c in message.get("cutoffs", {}).items()})
+
+    def warm_up(self, db: Session) -> Dict[str, int]:
+        """Bulk-load revoked, unexpired access tokens and persisted user cutoffs"""
+        result = db.execute(
+            text("""
+                SELECT token_hash, expires_at
+                FROM oauth_access_tokens
+                WHERE revoked_at IS NOT NULL
+                AND expires_at > NOW()
+            """)
+        )
+        self.add_tokens((row[0], row[1]) for row in result)
+
+        client = self._get_redis()
+        if client:
+            try:
+                cutoffs = client.hgetall(USER_CUTOFFS_KEY)
+                self.add_user_cutoffs({u: int(float(c)) for u, c in cutoffs.items()})
+            except redis.RedisError as e:
+                logger.warning(f"Failed to load revocation cutoffs: {e}")
+
+        self.prune()
+        return self.stats()
+
+    async def listen(self) -> None:
+        """Subscribe to revocation fan-out; reconnects on failure"""
+        while True:
+            try:
+                client = aioredis.from_url(settings.redis_url, decode_responses=True)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(REVOCATION_CHANNEL)
+                logger.info("Subscribed to token revocation channel")
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self.apply_message(json.loads(message["data"]))
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Ignoring malformed revocation message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Token revocation subscription error: {e}")
+            await asyncio.sleep(5)
+
+
+# Singleton instance
+token_revocation_index = TokenRevocationIndex()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Cache Serializer Micro-benchmark for MAX Platform
+Compares encode/decode time and payload size of the CacheManager codecs on
+LLMModelCache.set_models_list payloads (LLMModelResponse rows), against the
+previous json.dumps(default=str) encoding.
+
+    cd backend
+    python scripts/benchmark_cache_serializer.py --models 10 100 1000 --iterations 200
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.schemas.llm_chat import LLMModelResponse, ModelType, OwnerType  # noqa: E402
+from app.utils.cache_serializer import CODECS, COMPRESSIONS, CacheSerializer, register_enum  # noqa: E402
+
+register_enum(ModelType)
+register_enum(OwnerType)
+
+
+def build_models_list(count: int) -> list:
+    """Models list shaped like the /api/llm-models response cached per user"""
+    now = datetime.now(timezone.utc)
+    model_types = list(ModelType)
+    models = []
+    for i in range(count):
+        model = LLMModelResponse(
+            id=str(uuid.uuid4()),
+            model_name=f"model-{i}",
+            model_type=model_types[i % len(model_types)],
+            model_id=f"deployment-{i}",
+            description=f"Benchmark model {i} used for serializer comparison",
+            config={
+                "endpoint": f"https://example-{i % 7}.openai.azure.com/",
+                "api_version": "2024-02-15-preview",
+                "temperature": 0.7,
+                "max_tokens": 4096,
+                "top_p": 0.95,
+                "stop": ["</s>", "User:"],
+            },
+            owner_type=OwnerType.GROUP if i % 3 else OwnerType.USER,
+            owner_id=str(uuid.uuid4()),
+            is_active=True,
+            created_at=now - timedelta(days=i),
+            updated_at=now,
+        )
+        models.append(model.model_dump())
+    return models
+
+
+def time_call(func, iterations: int) -> float:
+    """Mean microseconds per call"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def benchmark(payload: list, iterations: int) -> list:
+    rows = []
+
+    legacy = json.dumps(payload, default=str).encode()
+    rows.append((
+        "legacy json(default=str)",
+        len(legacy),
+        time_call(lambda: json.dumps(payload, default=str).encode(), iterations),
+        time_call(lambda: json.loads(legacy), iterations),
+        False,
+    ))
+
+    for codec in CODECS:
+        for compression in COMPRESSIONS:
+            try:
+                serializer = CacheSerializer(codec, compression, compression_threshold=1024)
+            except ValueError:
+                continue
+            if compression == "lz4" and serializer.compression_id != COMPRESSIONS["lz4"]:
+                continue  # lz4 not installed
+            data = serializer.dumps(payload)
+            rows.append((
+                f"{codec}+{compression}",
+                len(data),
+                time_call(lambda: serializer.dumps(payload), iterations),
+                time_call(lambda: serializer.loads(data), iterations),
+                serializer.loads(data) == payload,
+            ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache payload serializers")
+    parser.add_argument("--models", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for count in args.models:
+        payload = build_models_list(count)
+        print(f"\n📊 models list with {count} models ({args.iterations} iterations)")
+        print(f"  {'codec':<26}{'bytes':>10}{'encode µs':>12}{'decode µs':>12}  round-trip")
+        for name, size, encode_us, decode_us, round_trip in benchmark(payload, args.iterations):
+            print(f"  {name:<26}{size:>10}{encode_us:>12.1f}{decode_us:>12.1f}  {'✅' if round_trip else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
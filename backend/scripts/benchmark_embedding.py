@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+RAG Embedding Ingest Benchmark for MAX Platform
+Measures ingest throughput (chunks/s) of the batched EmbeddingService against
+per-call encoding (one encode per chunk, as when Chroma embeds one call at a
+time), on a multi-MB corpus chunked like RAGDataSourceService (1000/200).
+
+With --chroma the chunks are also written to an in-memory Chroma collection,
+comparing explicit embeddings= (ChromaService._add_in_batches) against
+Chroma's default embedder.
+
+    cd backend
+    python scripts/benchmark_embedding.py --size-mb 4 --batch-sizes 16 32 64 128
+    python scripts/benchmark_embedding.py --corpus ./data/docs --chroma
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.embedding_service import EmbeddingService  # noqa: E402
+
+WORDS = (
+    "platform flow worker embedding vector chunk document search query model retrieval index "
+    "collection metadata latency throughput batch token context answer pipeline storage "
+    "플랫폼 문서 검색 임베딩 벡터 질의 모델 응답 데이터 소스 업로드 처리 결과 시간"
+).split()
+
+
+def load_corpus(corpus_dir: str) -> str:
+    texts = []
+    for path in sorted(Path(corpus_dir).rglob("*")):
+        if path.suffix.lower() in (".txt", ".md", ".csv", ".json") and path.is_file():
+            texts.append(path.read_text(encoding="utf-8", errors="ignore"))
+    return "\n\n".join(texts)
+
+
+def synthetic_corpus(size_mb: float, seed: int = 7) -> str:
+    """Paragraphs of mixed Korean/English words, roughly size_mb of UTF-8 text"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    paragraphs, size = [], 0
+    while size < target:
+        sentence_count = rng.randint(3, 8)
+        paragraph = " ".join(
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+            for _ in range(sentence_count)
+        )
+        paragraphs.append(paragraph)
+        size += len(paragraph.encode("utf-8")) + 2
+    return "\n\n".join(paragraphs)
+
+
+def split_chunks(text: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> list:
+    try:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        return RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=len
+        ).split_text(text)
+    except ImportError:
+        step = chunk_size - chunk_overlap
+        return [text[i:i + chunk_size] for i in range(0, len(text), step)]
+
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def bench_per_call(service: EmbeddingService, chunks: list) -> float:
+    """Previous behaviour: one encode call per chunk"""
+    return timed(lambda: [service.model.encode([chunk], show_progress_bar=False) for chunk in chunks])
+
+
+def bench_batched(service: EmbeddingService, chunks: list, batch_size: int) -> float:
+    return timed(lambda: service.encode(chunks, batch_size=batch_size))
+
+
+def bench_chroma(service: EmbeddingService, chunks: list, add_batch_size: int) -> list:
+    import chromadb
+
+    client = chromadb.EphemeralClient()
+    metadatas = [{"chunk_index": i} for i in range(len(chunks))]
+    rows = []
+
+    def ingest(explicit: bool) -> float:
+        collection = client.create_collection(name=f"bench-{uuid.uuid4().hex[:8]}", metadata={"hnsw:space": "cosine"})
+        ids = [str(uuid.uuid4()) for _ in chunks]
+
+        def run():
+            for start in range(0, len(chunks), add_batch_size):
+                end = start + add_batch_size
+                kwargs = {"documents": chunks[start:end], "metadatas": metadatas[start:end], "ids": ids[start:end]}
+                if explicit:
+                    kwargs["embeddings"] = service.encode(chunks[start:end]).tolist()
+                collection.add(**kwargs)
+
+        return timed(run)
+
+    rows.append(("chroma default embedder", ingest(explicit=False)))
+    rows.append((f"chroma + embeddings= (batch {service.batch_size})", ingest(explicit=True)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RAG embedding ingest throughput")
+    parser.add_argument("--corpus", help="directory of .txt/.md/.csv/.json files (default: synthetic corpus)")
+    parser.add_argument("--size-mb", type=float, default=4.0, help="synthetic corpus size")
+    parser.add_argument("--model", help="SentenceTransformer model (default: settings.embedding_model)")
+    parser.add_argument("--device", help="cpu | cuda | mps")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 32, 64, 128])
+    parser.add_argument("--per-call-limit", type=int, default=500, help="chunks encoded one by one for the baseline")
+    parser.add_argument("--chroma", action="store_true", help="also measure end-to-end Chroma ingest")
+    parser.add_argument("--chroma-limit", type=int, default=2000, help="chunks written to Chroma")
+    args = parser.parse_args()
+
+    text = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.size_mb)
+    chunks = split_chunks(text)
+    service = EmbeddingService(model_name=args.model, device=args.device)
+    if service.model is None:
+        sys.exit(f"embedding model could not be loaded: {service.model_name}")
+    service.encode(chunks[:8])  # warm-up (weights, kernels)
+
+    print(f"\n📊 corpus {len(text.encode('utf-8')) / 1024 / 1024:.1f} MB -> {len(chunks)} chunks, model {service.model_name}")
+    print(f"  {'mode':<40}{'chunks':>8}{'seconds':>10}{'chunks/s':>10}")
+
+    def report(name: str, count: int, seconds: float):
+        print(f"  {name:<40}{count:>8}{seconds:>10.2f}{count / seconds:>10.1f}")
+
+    baseline = chunks[:args.per_call_limit]
+    report("per-call encode (1 chunk/call)", len(baseline), bench_per_call(service, baseline))
+    for batch_size in args.batch_sizes:
+        report(f"EmbeddingService batch {batch_size}", len(chunks), bench_batched(service, chunks, batch_size))
+
+    if args.chroma:
+        subset = chunks[:args.chroma_limit]
+        for name, seconds in bench_chroma(service, subset, add_batch_size=512):
+            report(name, len(subset), seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+OAuth Token Endpoint Load Benchmark for MAX Platform
+Fires N concurrent client_credentials requests at /api/oauth/token and reports
+throughput and latency percentiles.
+
+Run it once against a server started with OAUTH_ASYNC_TOKEN_ENDPOINT=false
+(sync psycopg handler) and once with OAUTH_ASYNC_TOKEN_ENDPOINT=true (asyncpg
+handler), using the same --label for comparison:
+
+    python scripts/benchmark_oauth_token.py --concurrency 500 --requests 5000 --label sync
+    python scripts/benchmark_oauth_token.py --concurrency 500 --requests 5000 --label async
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run_benchmark(base_url: str, client_id: str, client_secret: str,
+                        concurrency: int, total_requests: int, timeout: float) -> dict:
+    """Run the load test and return summary statistics"""
+    latencies = []
+    status_counts = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        async def one_request():
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/oauth/token",
+                        data={
+                            "grant_type": "client_credentials",
+                            "client_id": client_id,
+                            "client_secret": client_secret,
+                        },
+                    )
+                    key = response.status_code
+                except httpx.HTTPError as e:
+                    key = type(e).__name__
+                latencies.append((time.perf_counter() - started) * 1000)
+                status_counts[key] = status_counts.get(key, 0) + 1
+
+        wall_started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(total_requests)))
+        wall_seconds = time.perf_counter() - wall_started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    return {
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "wall_seconds": wall_seconds,
+        "throughput_rps": total_requests / wall_seconds if wall_seconds else 0.0,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "status_counts": status_counts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/oauth/token under concurrent load")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--client-id", default="maxplatform-service")
+    parser.add_argument("--client-secret", default="service_maxplatform_2025_dev_secret")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--label", default="", help="Label printed with the results (e.g. sync/async)")
+    args = parser.parse_args()
+
+    print(f"🚀 Benchmarking {args.base_url}/api/oauth/token "
+          f"({args.requests} requests, concurrency {args.concurrency}) {args.label}")
+
+    result = asyncio.run(run_benchmark(
+        args.base_url, args.client_id, args.client_secret,
+        args.concurrency, args.requests, args.timeout
+    ))
+
+    print(f"\n📊 Results {args.label}")
+    print(f"  Wall time     : {result['wall_seconds']:.2f}s")
+    print(f"  Throughput    : {result['throughput_rps']:.1f} req/s")
+    print(f"  Latency mean  : {result['mean_ms']:.1f} ms")
+    print(f"  Latency p50   : {result['p50_ms']:.1f} ms")
+    print(f"  Latency p95   : {result['p95_ms']:.1f} ms")
+    print(f"  Latency p99   : {result['p99_ms']:.1f} ms")
+    print(f"  Status codes  : {result['status_counts']}")
+
+
+if __name__ == "__main__":
+    main()
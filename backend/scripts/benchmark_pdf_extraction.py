@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+RAG PDF Extraction Benchmark for MAX Platform
+Measures PDF text extraction throughput (pages/s) of the page-parallel
+extractor (document_extraction.extract_pdf_pages over page ranges in a spawn
+process pool, OCR only for pages without a text layer) against the previous
+whole-document extractor (pdfplumber over all pages, PyPDF2 over all pages,
+whole-document OCR only when the combined text is under 50 characters).
+
+The default input is a synthetic mixed PDF: text pages plus image-only
+"scanned" pages, generated with fpdf2 + Pillow (pip install fpdf2). Scanned
+pages are only OCR'd when pytesseract and the tesseract binary are installed;
+otherwise they are reported as empty pages.
+
+    cd backend
+    python scripts/benchmark_pdf_extraction.py --pages 64 --scanned-ratio 0.25 --workers 1 2 4
+    python scripts/benchmark_pdf_extraction.py --pdf ./data/manual.pdf --pages-per-task 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.document_extraction import (  # noqa: E402
+    count_pdf_pages,
+    extract_pdf_pages,
+    pdf_page_ranges,
+    split_pdf_pages,
+)
+
+WORDS = (
+    "platform flow worker embedding vector chunk document search query model retrieval index "
+    "collection metadata latency throughput batch token context answer pipeline storage page scan"
+).split()
+
+
+def synthetic_paragraphs(rng: random.Random, count: int) -> list:
+    return [
+        " ".join(" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + "." for _ in range(5))
+        for _ in range(count)
+    ]
+
+
+def scanned_page_image(lines: list, width: int = 1275, height: int = 1650):
+    """Letter page at 150 dpi with text drawn as pixels only (no text layer)"""
+    from PIL import Image, ImageDraw, ImageFont
+
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    try:
+        font = ImageFont.load_default(size=24)
+    except TypeError:
+        font = ImageFont.load_default()
+    y = 100
+    for line in lines:
+        draw.text((90, y), line, fill=0, font=font)
+        y += 40
+        if y > height - 100:
+            break
+    return image
+
+
+def synthetic_mixed_pdf(path: str, pages: int, scanned_ratio: float, seed: int = 7) -> int:
+    """Write a PDF whose pages are text or image-only; returns the scanned page count"""
+    try:
+        from fpdf import FPDF
+    except ImportError:
+        sys.exit("fpdf2 is required for the synthetic PDF (pip install fpdf2), or pass --pdf")
+
+    rng = random.Random(seed)
+    scanned = set(rng.sample(range(pages), int(round(pages * scanned_ratio))))
+    pdf = FPDF(format="letter")
+    pdf.set_auto_page_break(False)
+    for number in range(pages):
+        pdf.add_page()
+        paragraphs = synthetic_paragraphs(rng, 6)
+        if number in scanned:
+            lines = [paragraph[i:i + 80] for paragraph in paragraphs for i in range(0, len(paragraph), 80)]
+            pdf.image(scanned_page_image(lines), x=0, y=0, w=pdf.w, h=pdf.h)
+        else:
+            pdf.set_font("Helvetica", size=11)
+            pdf.set_xy(15, 15)
+            pdf.multi_cell(0, 5.5, "\n\n".join(paragraphs))
+    pdf.output(path)
+    return len(scanned)
+
+
+def legacy_extract(path: str) -> dict:
+    """Previous behaviour: whole-document passes, OCR only if the whole document is (nearly) empty"""
+    import pdfplumber
+    from PyPDF2 import PdfReader
+
+    with pdfplumber.open(path) as pdf:
+        texts = [page.extract_text() or "" for page in pdf.pages]
+    if len("\n".join(t for t in texts if t).strip()) > 50:
+        return {"text_pages": sum(1 for t in texts if t.strip()), "ocr_pages": 0}
+
+    texts = [page.extract_text() or "" for page in PdfReader(path).pages]
+    if len("\n".join(t for t in texts if t).strip()) > 50:
+        return {"text_pages": sum(1 for t in texts if t.strip()), "ocr_pages": 0}
+
+    from app.services.document_extraction import extract_text_with_ocr
+    with open(path, "rb") as f:
+        extract_text_with_ocr(f.read())
+    return {"text_pages": len(texts), "ocr_pages": len(texts)}
+
+
+def page_parallel_extract(pool: ProcessPoolExecutor, path: str, pages_per_task: int) -> dict:
+    """Same fan-out as IngestionPipeline._extract for PDFs"""
+    page_count = pool.submit(count_pdf_pages, path).result()
+    futures = [
+        pool.submit(extract_pdf_pages, path, first_page, last_page)
+        for first_page, last_page in pdf_page_ranges(page_count, pages_per_task)
+    ]
+    pages = [page for future in futures for page in future.result()]
+    result = pool.submit(split_pdf_pages, pages, 1000, 200).result()
+    return {
+        "text_pages": sum(1 for page in pages if page["text"]),
+        "ocr_pages": result["ocr_pages"],
+        "chunks": len(result["chunks"]),
+    }
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page-parallel PDF text extraction")
+    parser.add_argument("--pdf", help="existing PDF (default: synthetic mixed text/scanned PDF)")
+    parser.add_argument("--pages", type=int, default=48, help="synthetic PDF page count")
+    parser.add_argument("--scanned-ratio", type=float, default=0.25, help="share of image-only pages")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--pages-per-task", type=int, default=8, help="page range size per pool task")
+    parser.add_argument("--repeat", type=int, default=2, help="runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.pdf
+        scanned = "?"
+        if not path:
+            path = os.path.join(tmp, "mixed.pdf")
+            scanned = synthetic_mixed_pdf(path, args.pages, args.scanned_ratio)
+        page_count = count_pdf_pages(path)
+
+        try:
+            import pytesseract
+            pytesseract.get_tesseract_version()
+            ocr_note = "OCR available"
+        except Exception:
+            ocr_note = "OCR unavailable: scanned pages stay empty"
+
+        print(f"\n📊 {page_count} pages ({scanned} scanned), {os.path.getsize(path) / 1024 / 1024:.1f} MB, {ocr_note}")
+        print(f"  {'mode':<34}{'text pages':>11}{'ocr pages':>10}{'seconds':>9}{'pages/s':>9}")
+
+        def report(name: str, result: dict, seconds: float):
+            print(f"  {name:<34}{result['text_pages']:>11}{result['ocr_pages']:>10}{seconds:>9.2f}{page_count / seconds:>9.1f}")
+
+        runs = [timed(lambda: legacy_extract(path)) for _ in range(args.repeat)]
+        report("whole-document (previous)", runs[0][0], min(seconds for _, seconds in runs))
+
+        for workers in args.workers:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                # start the workers and import pdfplumber before timing (the app pool is long-lived)
+                list(pool.map(count_pdf_pages, [path] * workers))
+                runs = [timed(lambda: page_parallel_extract(pool, path, args.pages_per_task)) for _ in range(args.repeat)]
+            report(f"page-parallel, {workers} workers", runs[0][0], min(seconds for _, seconds in runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+API -> Flow Worker Proxy Micro-benchmark for MAX Platform
+Compares the per-request httpx.AsyncClient the router used to open for every
+flow execution / health check against the long-lived per-worker pooled client
+(WorkerInfo.get_http_client).
+
+By default a local keep-alive HTTP/1.1 stub stands in for the worker so only
+proxy overhead (TCP connect + client setup) is measured; pass --url to target
+a running worker instead (e.g. http://127.0.0.1:8100/health).
+
+    cd backend
+    python scripts/benchmark_worker_proxy.py --requests 500 --concurrency 1 16
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+
+class StubWorkerHandler(BaseHTTPRequestHandler):
+    """Answers like the worker /health endpoint, keeping connections alive"""
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes; avoid Nagle/delayed-ACK stalls on kept-alive sockets (uvicorn sets TCP_NODELAY too)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = json.dumps({"status": "healthy", "flow_loaded": True}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_worker() -> str:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWorkerHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/health"
+
+
+async def run_per_request(url: str, total: int, concurrency: int) -> list:
+    """Previous behaviour: a fresh AsyncClient (and TCP connection) per call"""
+    async def call() -> float:
+        started = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url, timeout=5.0)
+            response.raise_for_status()
+        return time.perf_counter() - started
+
+    return await run_load(call, total, concurrency)
+
+
+async def run_pooled(url: str, total: int, concurrency: int) -> list:
+    """New behaviour: one keep-alive client per worker, reused across calls"""
+    limits = httpx.Limits(max_connections=max(concurrency, 1), max_keepalive_connections=max(concurrency, 1))
+    async with httpx.AsyncClient(limits=limits) as client:
+        await client.get(url, timeout=5.0)  # warm the pool
+
+        async def call() -> float:
+            started = time.perf_counter()
+            response = await client.get(url, timeout=5.0)
+            response.raise_for_status()
+            return time.perf_counter() - started
+
+        return await run_load(call, total, concurrency)
+
+
+async def run_load(call, total: int, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            latencies.append(await call())
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def summarize(latencies: list, elapsed: float) -> tuple:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        statistics.mean(ordered) * 1000,
+        ordered[len(ordered) // 2] * 1000,
+        p99 * 1000,
+        len(ordered) / elapsed,
+    )
+
+
+async def benchmark(url: str, total: int, concurrency: int) -> list:
+    rows = []
+    for name, runner in (("per-request client", run_per_request), ("pooled client", run_pooled)):
+        started = time.perf_counter()
+        latencies = await runner(url, total, concurrency)
+        rows.append((name, *summarize(latencies, time.perf_counter() - started)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API -> worker proxy overhead")
+    parser.add_argument("--url", help="worker endpoint to call (default: local stub worker)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16])
+    args = parser.parse_args()
+
+    url = args.url or start_stub_worker()
+    for concurrency in args.concurrency:
+        print(f"\n📊 {args.requests} requests to {url} (concurrency {concurrency})")
+        print(f"  {'client':<22}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+        for name, mean_ms, p50_ms, p99_ms, rps in asyncio.run(benchmark(url, args.requests, concurrency)):
+            print(f"  {name:<22}{mean_ms:>10.2f}{p50_ms:>10.2f}{p99_ms:>10.2f}{rps:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
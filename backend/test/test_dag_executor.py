@@ -0,0 +1,87 @@
+"""
+DAG 실행기(DAGExecutor) 노드 실패/타임아웃 처리 테스트
+
+    cd backend
+    python -m pytest test/test_dag_executor.py
+"""
+
+import asyncio
+
+import pytest
+
+from app.llmops.dag_executor import DAGExecutor, NodeExecutionError
+from app.llmops.runtime import ComponentRunnable
+from app.llmops.tracing import trace_buffer
+
+EDGES = [{"source": "prompt", "target": "llm"}]
+
+
+def prompt_node() -> ComponentRunnable:
+    return ComponentRunnable("prompt", lambda data: f"Q: {data['input']}")
+
+
+def slow_llm_node() -> ComponentRunnable:
+    async def afunc(data):
+        await asyncio.sleep(5)
+        return "answer"
+
+    async def astream_func(data):
+        await asyncio.sleep(5)
+        yield "answer"
+
+    return ComponentRunnable("llm", lambda data: "answer", afunc=afunc, astream_func=astream_func)
+
+
+def make_executor() -> DAGExecutor:
+    return DAGExecutor(
+        nodes={"prompt": prompt_node(), "llm": slow_llm_node()},
+        edges=EDGES,
+        execution_order=["prompt", "llm"],
+        timeouts={"llm": 0.05},
+        flow_id="timeout-flow"
+    )
+
+
+def last_spans():
+    trace = trace_buffer.recent(limit=1, flow_id="timeout-flow")[0]
+    return {span["node_id"]: span for span in trace["spans"]}
+
+
+def test_node_timeout_on_invoke_records_timeout_span():
+    with pytest.raises(NodeExecutionError) as raised:
+        asyncio.run(make_executor().ainvoke({"input": "hi"}))
+
+    # 프롬프트(사용자 입력)가 응답으로 전달되지 않고 플로우가 실패함
+    assert raised.value.node_id == "llm"
+    assert raised.value.status == "timeout"
+    spans = last_spans()
+    assert spans["prompt"]["status"] == "ok"
+    assert spans["llm"]["status"] == "timeout"
+
+
+def test_node_timeout_on_stream_records_timeout_span():
+    async def collect():
+        return [chunk async for chunk in make_executor().astream({"input": "hi"})]
+
+    with pytest.raises(NodeExecutionError):
+        asyncio.run(collect())
+    assert last_spans()["llm"]["status"] == "timeout"
+
+
+def test_failure_outside_result_path_keeps_result():
+    def fail(data):
+        raise ValueError("side branch")
+
+    executor = DAGExecutor(
+        nodes={
+            "prompt": prompt_node(),
+            "side": ComponentRunnable("side", fail),
+            "answer": ComponentRunnable("answer", lambda data: f"A({data})")
+        },
+        edges=[{"source": "prompt", "target": "side"}, {"source": "prompt", "target": "answer"}],
+        execution_order=["prompt", "side", "answer"],
+        flow_id="timeout-flow"
+    )
+
+    assert asyncio.run(executor.ainvoke({"input": "hi"})) == "A(Q: hi)"
+    assert last_spans()["side"]["status"] == "error"
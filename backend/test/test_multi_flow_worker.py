@@ -0,0 +1,79 @@
+"""
+다중 플로우 워커(MultiFlowWorker) 적재/실행 테스트
+
+    cd backend
+    python -m pytest test/test_multi_flow_worker.py
+"""
+
+import json
+from typing import Tuple
+
+from fastapi.testclient import TestClient
+
+from app.llmops.worker import FlowLoadRequest, FlowRuntime, MultiFlowWorker
+
+FLOW_DATA = {"nodes": [], "edges": []}
+
+
+def fake_load_payload(self, payload):
+    """체인 생성 없이 로드 성공으로 처리"""
+    self.flow_data = payload["flow_data"]
+    self.flow_instance = object()
+    return True
+
+
+async def fake_stream(self, input_data, parameters):
+    yield f"data: {json.dumps({'type': 'chunk', 'data': 'a'})}\n\n"
+    yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+
+
+def make_client(monkeypatch) -> Tuple[MultiFlowWorker, TestClient]:
+    monkeypatch.setattr(FlowRuntime, "load_payload", fake_load_payload)
+    worker = MultiFlowWorker(memory_budget_mb=64, max_resident_flows=4)
+    return worker, TestClient(worker.app)
+
+
+def test_load_request_accepts_semver_version():
+    request = FlowLoadRequest(project_id="p1", version="1.0.0", flow_data=FLOW_DATA)
+    assert request.version == "1.0.0"
+
+
+def test_load_flow_with_string_version(monkeypatch):
+    worker, client = make_client(monkeypatch)
+
+    response = client.post("/flows/f1/load", json={"project_id": "p1", "version": "1.0.0", "flow_data": FLOW_DATA})
+    assert response.status_code == 200
+    assert response.json()["version"] == "1.0.0"
+    assert worker.flows["f1"].version == "1.0.0"
+
+    # 같은 버전 재적재는 기존 런타임 유지
+    runtime = worker.flows["f1"]
+    response = client.post("/flows/f1/load", json={"project_id": "p1", "version": "1.0.0", "flow_data": FLOW_DATA})
+    assert response.status_code == 200
+    assert worker.flows["f1"] is runtime
+
+    # 새 버전은 교체
+    response = client.post("/flows/f1/load", json={"project_id": "p1", "version": "1.1.0", "flow_data": FLOW_DATA})
+    assert response.status_code == 200
+    assert worker.flows["f1"].version == "1.1.0"
+    assert client.get("/info").json()["flows"][0]["version"] == "1.1.0"
+
+
+def test_streaming_execution_stays_active_until_stream_ends(monkeypatch):
+    worker, client = make_client(monkeypatch)
+    client.post("/flows/f1/load", json={"project_id": "p1", "version": "1.0.0", "flow_data": FLOW_DATA})
+    runtime = worker.flows["f1"]
+
+    observed = []
+
+    async def counting_stream(self, input_data, parameters):
+        async for event in fake_stream(self, input_data, parameters):
+            observed.append(runtime.active_executions)
+            yield event
+
+    monkeypatch.setattr(FlowRuntime, "_execute_flow_stream", counting_stream)
+    response = client.post("/flows/f1/execute", json={"input_data": {"text": "hi"}, "parameters": {"stream": True}})
+
+    assert response.status_code == 200
+    assert observed == [1, 1]
+    assert runtime.active_executions == 0
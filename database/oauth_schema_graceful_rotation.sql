@@ -24,6 +24,14 @@ ON oauth_refresh_tokens(token_status, rotation_grace_expires_at);
 CREATE INDEX IF NOT EXISTS idx_oauth_refresh_tokens_status 
 ON oauth_refresh_tokens(token_status);
 
+-- validate_refresh_token()의 token_hash 단건 조회는 기존 token_hash 유니크 인덱스를 사용
+-- (상태 조건은 조회 후 애플리케이션에서 판단하므로 별도 부분 인덱스를 두지 않음)
+
+-- grace period 만료 스윕용 부분 인덱스 (백그라운드 reaper 전용)
+CREATE INDEX IF NOT EXISTS idx_oauth_refresh_tokens_rotating_grace 
+ON oauth_refresh_tokens(rotation_grace_expires_at) 
+WHERE token_status = 'rotating';
+
 -- 만료된 grace period 토큰 정리를 위한 함수
 CREATE OR REPLACE FUNCTION cleanup_expired_grace_tokens()
 RETURNS INTEGER AS $$
@@ -86,5 +94,7 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- 자동 정리: 백엔드의 token cleanup 백그라운드 작업(app/tasks/token_cleanup.py)이 배치 단위로 수행
+-- 요청 경로에서는 더 이상 전역 UPDATE를 실행하지 않음
 -- 자동 정리를 위한 예약 작업 (PostgreSQL cron extension 필요 시)
 -- SELECT cron.schedule('cleanup-grace-tokens', '*/1 * * * *', 'SELECT cleanup_expired_grace_tokens();');
\ No newline at end of file
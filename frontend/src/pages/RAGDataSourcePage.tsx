@@ -31,9 +31,12 @@ import ragDataSourceService from '../services/ragDataSourceService';
 import {
   RAGDataSourceListItem,
   QueryResult,
-  CreateDataSourceData
+  CreateDataSourceData,
+  IngestionJob
 } from '../types/ragDataSource';
 
+const INGESTION_TOAST_ID = 'rag-ingestion-job';
+
 const RAGDataSourcePage: React.FC = () => {
   const [selectedDataSource, setSelectedDataSource] = useState<RAGDataSourceListItem | null>(null);
   const [isCreateModalOpen, setIsCreateModalOpen] = useState(false);
@@ -44,6 +47,7 @@ const RAGDataSourcePage: React.FC = () => {
   const [isSearching, setIsSearching] = useState(false);
   const [useHybridSearch, setUseHybridSearch] = useState(true);
   const [searchAnalytics, setSearchAnalytics] = useState(null);
+  const [ingestionJob, setIngestionJob] = useState<{ dataSourceId: number; jobId: string } | null>(null);
 
   const queryClient = useQueryClient();
 
@@ -86,12 +90,15 @@ const RAGDataSourcePage: React.FC = () => {
     ({ dataSourceId, files }: { dataSourceId: number; files: File[] }) => 
       ragDataSourceService.uploadDocuments(dataSourceId, files),
     {
-      onSuccess: (response) => {
+      onSuccess: (response, { dataSourceId }) => {
         queryClient.invalidateQueries('rag-datasources');
         setIsUploadModalOpen(false);
-        toast.success(
-          `${response.uploaded_files}개 파일이 업로드되어 ${response.processed_chunks}개 청크로 처리되었습니다.`
-        );
+        
+        // 청크 처리는 수집 작업에서 진행되므로 작업 상태를 조회하며 진행 상황 표시
+        if (response.job_id) {
+          toast.loading(`${response.uploaded_files}개 파일이 업로드되어 처리 대기 중입니다.`, { id: INGESTION_TOAST_ID });
+          setIngestionJob({ dataSourceId, jobId: response.job_id });
+        }
         
         if (response.failed_files && response.failed_files.length > 0) {
           toast.error(`일부 파일 업로드 실패: ${response.failed_files.join(', ')}`);
@@ -113,6 +120,49 @@ const RAGDataSourcePage: React.FC = () => {
     }
   );
 
+  // 업로드한 문서의 수집 작업 상태 조회 (끝날 때까지 주기적으로)
+  useQuery<IngestionJob>(
+    ['rag-ingestion-job', ingestionJob?.jobId],
+    () => ragDataSourceService.getIngestionJob(ingestionJob!.dataSourceId, ingestionJob!.jobId),
+    {
+      enabled: !!ingestionJob,
+      refetchInterval: 2000,
+      onSuccess: (job) => {
+        if (job.status === 'QUEUED') {
+          return;
+        }
+        if (job.status === 'RUNNING') {
+          toast.loading(
+            `문서 처리 중: 파일 ${job.processed_files}/${job.total_files}, 청크 ${job.processed_chunks}/${job.total_chunks}`,
+            { id: INGESTION_TOAST_ID }
+          );
+          return;
+        }
+        
+        setIngestionJob(null);
+        queryClient.invalidateQueries('rag-datasources');
+        if (job.status === 'SUCCESS') {
+          toast.success(
+            `${job.total_files}개 파일이 ${job.processed_chunks}개 청크로 처리되었습니다.`,
+            { id: INGESTION_TOAST_ID }
+          );
+        } else if (job.status === 'PARTIAL') {
+          toast.error(
+            `${job.total_files}개 중 ${job.failed_files}개 파일 처리 실패 (${job.processed_chunks}개 청크 처리됨)`,
+            { id: INGESTION_TOAST_ID }
+          );
+        } else {
+          toast.error(`문서 처리 실패: ${job.error_message || '모든 파일 처리에 실패했습니다.'}`, { id: INGESTION_TOAST_ID });
+        }
+      },
+      onError: (error: any) => {
+        console.error('Failed to fetch ingestion job:', error);
+        setIngestionJob(null);
+        toast.error('문서 처리 상태를 확인하지 못했습니다.', { id: INGESTION_TOAST_ID });
+      }
+    }
+  );
+
   // 데이터소스 삭제 뮤테이션
   const deleteDataSourceMutation = useMutation(
     ragDataSourceService.deleteDataSource,
@@ -10,6 +10,7 @@ import {
   QueryRequest,
   QueryResponse,
   UploadResponse,
+  IngestionJob,
   Workspace
 } from '../types/ragDataSource';
 
@@ -120,6 +121,21 @@ class RAGDataSourceService {
     }
   }
 
+  /**
+   * 문서 수집 작업 상태 조회 (업로드 후 파일/청크 처리 진행 상황)
+   */
+  async getIngestionJob(dataSourceId: number, jobId: string): Promise<IngestionJob> {
+    try {
+      const response = await axios.get(
+        `${API_BASE_URL}/rag-datasources/${dataSourceId}/ingestion-jobs/${jobId}`
+      );
+      return response.data;
+    } catch (error) {
+      console.error(`Failed to fetch ingestion job ${jobId}:`, error);
+      throw error;
+    }
+  }
+
   /**
    * 문서 검색
    */
@@ -74,10 +74,38 @@ export interface QueryResponse {
 
 export interface UploadResponse {
   success: boolean;
-  message: string;
   uploaded_files: number;
-  processed_chunks: number;
   failed_files?: string[];
+  job_id: string | null;
+  job_status: IngestionJobStatus | null;
+}
+
+export type IngestionJobStatus = 'QUEUED' | 'RUNNING' | 'SUCCESS' | 'PARTIAL' | 'FAILURE';
+
+export interface IngestionJob {
+  job_id: string;
+  datasource_id: number;
+  status: IngestionJobStatus;
+  attempts: number;
+  total_files: number;
+  processed_files: number;
+  failed_files: number;
+  total_chunks: number;
+  processed_chunks: number;
+  error_message?: string | null;
+  created_at?: string | null;
+  started_at?: string | null;
+  completed_at?: string | null;
+  files?: {
+    filename: string;
+    stored_filename: string;
+    file_size: number;
+    status: string;
+    chunks_total?: number | null;
+    chunks_done: number;
+    error?: string | null;
+    updated_at?: string | null;
+  }[];
 }
 
 export interface Workspace {